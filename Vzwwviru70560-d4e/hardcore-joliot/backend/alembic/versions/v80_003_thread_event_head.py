@@ -0,0 +1,46 @@
+"""
+Add event log head columns to threads for atomic sequence allocation.
+
+Revision ID: v80_003_thread_event_head
+Revises: v80_002_nova_conversations
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = 'v80_003_thread_event_head'
+down_revision = 'v80_002_nova_conversations'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'threads',
+        sa.Column('last_sequence_number', sa.Integer, server_default='0', nullable=False),
+    )
+    op.add_column(
+        'threads',
+        sa.Column('last_event_id', postgresql.UUID(as_uuid=True), nullable=True),
+    )
+
+    # Backfill from the newest event of each thread
+    op.execute(
+        """
+        UPDATE threads AS t
+        SET last_sequence_number = head.sequence_number,
+            last_event_id = head.id
+        FROM (
+            SELECT DISTINCT ON (thread_id) thread_id, id, sequence_number
+            FROM thread_events
+            ORDER BY thread_id, sequence_number DESC
+        ) AS head
+        WHERE head.thread_id = t.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('threads', 'last_event_id')
+    op.drop_column('threads', 'last_sequence_number')
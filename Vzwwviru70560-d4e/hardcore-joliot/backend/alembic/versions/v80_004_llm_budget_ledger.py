@@ -0,0 +1,31 @@
+"""
+Add llm_budget_ledger table for shared LLM token/cost budgets.
+
+Revision ID: v80_004_llm_budget_ledger
+Revises: v80_003_thread_event_head
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'v80_004_llm_budget_ledger'
+down_revision = 'v80_003_thread_event_head'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per (identity, window); see services/budget_ledger.py
+    op.create_table(
+        'llm_budget_ledger',
+        sa.Column('identity_id', sa.String(128), primary_key=True),
+        sa.Column('period', sa.String(16), primary_key=True),
+        sa.Column('allocated_tokens', sa.BigInteger, server_default='0', nullable=False),
+        sa.Column('allocated_cost_micros', sa.BigInteger, server_default='0', nullable=False),
+        sa.Column('used_tokens', sa.BigInteger, server_default='0', nullable=False),
+        sa.Column('used_cost_micros', sa.BigInteger, server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('llm_budget_ledger')
@@ -14,7 +14,7 @@ from typing import Optional, Dict, Any, List
 from uuid import UUID
 from datetime import datetime
 
-from ..core.synaptic import (
+from ...core.synaptic import (
     SynapticContext,
     ScopeType,
     HubType,
@@ -34,6 +34,10 @@ from ..core.synaptic import (
     NeedTag
 )
 
+# Longest a client may ask to wait for a busy provider
+MAX_EXECUTE_TIMEOUT_S = 30.0
+
+
 router = APIRouter(prefix="/api/v2/synaptic", tags=["Synaptic"])
 
 
@@ -90,6 +94,7 @@ class SwitchRequest(BaseModel):
 class RouteRequest(BaseModel):
     need_tag: str
     payload: Dict[str, Any] = {}
+    timeout_s: Optional[float] = Field(None, gt=0, description="Max wait for a busy provider, capped at 30s")
 
 
 class FireEdgeRequest(BaseModel):
@@ -339,6 +344,17 @@ async def fire_graph_edge(request: FireEdgeRequest) -> Dict[str, Any]:
     }
 
 
+@router.get("/graph/latency")
+async def get_graph_latency() -> Dict[str, Any]:
+    """Get per-edge fire latency histograms"""
+    graph = get_synaptic_graph()
+    stats = graph.get_latency_stats()
+    return {
+        "total": len(stats),
+        "edges": stats
+    }
+
+
 @router.get("/graph/mermaid")
 async def get_mermaid_diagram() -> Dict[str, Any]:
     """Get graph as Mermaid diagram"""
@@ -408,8 +424,12 @@ async def execute_need(request: RouteRequest) -> Dict[str, Any]:
     except ValueError:
         raise HTTPException(status_code=400, detail=f"Unknown need tag: {request.need_tag}")
     
+    timeout_s = request.timeout_s
+    if timeout_s is not None:
+        timeout_s = min(timeout_s, MAX_EXECUTE_TIMEOUT_S)
+    
     yp = get_yellow_pages()
-    result = await yp.execute(tag, request.payload)
+    result = await yp.execute(tag, request.payload, timeout_s=timeout_s)
     
     return result
 
@@ -421,6 +441,16 @@ async def get_yellowpages_stats() -> Dict[str, Any]:
     return yp.get_stats()
 
 
+@router.get("/yellowpages/providers")
+async def get_yellowpages_providers() -> Dict[str, Any]:
+    """Get provider load, health and latency per need"""
+    yp = get_yellow_pages()
+    return {
+        "policy": yp.policy.value,
+        "providers": yp.get_provider_stats()
+    }
+
+
 @router.get("/yellowpages/table")
 async def get_yellowpages_table() -> Dict[str, Any]:
     """Get yellow pages as table for documentation"""
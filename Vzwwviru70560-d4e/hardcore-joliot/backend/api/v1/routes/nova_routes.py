@@ -6,6 +6,7 @@ API endpoints for the Nova Multi-Lane Pipeline.
 
 ENDPOINTS:
 - POST /nova/process: Process request through full pipeline
+- POST /nova/process/stream: Same, streaming Lane F tokens as SSE
 - POST /nova/intent: Analyze intent only (Lane A)
 - POST /nova/checkpoint/{id}/approve: Approve pending checkpoint
 - POST /nova/checkpoint/{id}/reject: Reject pending checkpoint
@@ -20,12 +21,15 @@ R&D COMPLIANCE:
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from backend.core.exceptions import (
@@ -44,9 +48,13 @@ from backend.services.nova import (
     ExecutionStatus,
     PipelineLane,
 )
+from backend.services.llm_router import get_llm_router
 
 logger = logging.getLogger(__name__)
 
+# Max SSE events buffered between Lane F and a slow client
+SSE_BUFFER_SIZE = 64
+
 router = APIRouter(prefix="/api/v2/nova", tags=["Nova Pipeline"])
 
 
@@ -321,6 +329,123 @@ async def process_request(
         )
 
 
+@router.post(
+    "/process/stream",
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+    },
+)
+async def process_request_stream(
+    request: NovaProcessRequest,
+    identity_id: UUID = Depends(get_current_user_id),
+):
+    """
+    Process a request through the Nova Pipeline, streaming tokens as SSE.
+    
+    Events:
+    - token: one Lane F chunk (delta, index, output_tokens)
+    - checkpoint: approval required (same payload as the HTTP 423 detail)
+    - complete: final status, usage and audit summary
+    - error: pipeline failure
+    
+    Events go through a bounded buffer, so a slow client slows generation
+    instead of growing memory. Disconnecting cancels the pipeline and only
+    the tokens already generated are billed.
+    """
+    pipeline = NovaPipelineService(llm_router=get_llm_router())
+    
+    nova_request = NovaRequest(
+        identity_id=identity_id,
+        thread_id=request.thread_id,
+        sphere_type=request.sphere_type,
+        input_text=request.input_text,
+        input_data=request.input_data,
+        agent_id=request.agent_id,
+        agent_name=request.agent_name,
+        max_tokens=request.max_tokens,
+        temperature=request.temperature,
+        stream=True,
+    )
+    
+    buffer: asyncio.Queue = asyncio.Queue(maxsize=SSE_BUFFER_SIZE)
+    
+    async def run_pipeline():
+        try:
+            await buffer.put(await pipeline.process(nova_request, on_chunk=buffer.put))
+        except Exception as e:
+            await buffer.put(e)
+    
+    def sse(event: str, data: Dict[str, Any]) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+    
+    async def events():
+        task = asyncio.create_task(run_pipeline())
+        try:
+            while True:
+                item = await buffer.get()
+                
+                if isinstance(item, NovaPipelineResult):
+                    _stats["total_requests"] += 1
+                    if item.status == ExecutionStatus.COMPLETED:
+                        _stats["successful_requests"] += 1
+                    else:
+                        _stats["failed_requests"] += 1
+                    if item.execution:
+                        _stats["total_tokens_used"] += item.execution.total_tokens
+                        _stats["total_cost"] += item.execution.cost
+                    _stats["durations"].append(item.total_duration_ms)
+                    
+                    yield sse("complete", {
+                        "request_id": item.request_id,
+                        "status": item.status.value,
+                        "intent_type": item.intent.intent_type.value if item.intent else None,
+                        "total_tokens": item.execution.total_tokens if item.execution else 0,
+                        "total_cost": item.execution.cost if item.execution else 0.0,
+                        "duration_ms": item.total_duration_ms,
+                        "error": item.error,
+                    })
+                    return
+                
+                if isinstance(item, CheckpointRequiredError):
+                    _pending_checkpoints[item.checkpoint_id] = {
+                        "checkpoint_id": item.checkpoint_id,
+                        "checkpoint_type": item.checkpoint_type,
+                        "reason": item.reason,
+                        "action_preview": item.action_preview,
+                        "identity_id": identity_id,
+                        "original_request": request.model_dump(),
+                        "created_at": datetime.utcnow(),
+                    }
+                    _stats["checkpoint_triggers"] += 1
+                    
+                    yield sse("checkpoint", {
+                        "status": "checkpoint_required",
+                        "checkpoint_id": str(item.checkpoint_id),
+                        "checkpoint_type": item.checkpoint_type,
+                        "reason": item.reason,
+                        "action_preview": item.action_preview,
+                    })
+                    return
+                
+                if isinstance(item, Exception):
+                    logger.error(f"Nova stream failed: {item}")
+                    yield sse("error", {"error": str(item)})
+                    return
+                
+                if item.delta:
+                    yield sse("token", {
+                        "delta": item.delta,
+                        "index": item.index,
+                        "output_tokens": item.output_tokens,
+                    })
+        finally:
+            # Client gone or stream done: stop generating
+            if not task.done():
+                task.cancel()
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.post(
     "/intent",
     response_model=IntentAnalysisResponse,
@@ -49,6 +49,7 @@ from app.services.atom_services import (
     CausalNexusService, ResonanceEngine, GlobalSynapse, 
     GematriaService, HarmonicSynchronizer
 )
+from app.services.atom_graph_index import get_atom_graph_index
 
 router = APIRouter(prefix="/api/v2/atom", tags=["AT-OM Mapping"])
 
@@ -106,6 +107,8 @@ async def create_node(
     await session.commit()
     await session.refresh(node)
     
+    get_atom_graph_index().on_node_upserted(node.id, node.name, node.dimension, node.epoch)
+    
     return node
 
 
@@ -221,6 +224,8 @@ async def update_node(
     await session.commit()
     await session.refresh(node)
     
+    get_atom_graph_index().on_node_upserted(node.id, node.name, node.dimension, node.epoch)
+    
     return node
 
 
@@ -240,6 +245,8 @@ async def delete_node(
     
     await session.delete(node)
     await session.commit()
+    
+    get_atom_graph_index().on_node_removed(node_id)
 
 
 @router.post("/nodes/{node_id}/validate", response_model=ATOMNodeResponse)
@@ -470,6 +477,8 @@ async def create_harmonic_profile(
     await session.commit()
     await session.refresh(profile)
     
+    get_atom_graph_index().on_harmonic_added(profile.node_id, profile.numeric_signatures, profile.confidence)
+    
     return profile
 
 
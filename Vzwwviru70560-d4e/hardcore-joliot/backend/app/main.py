@@ -52,6 +52,8 @@ class Config:
     RESONANCE_CYCLE_SECONDS: float = 4.44
     ANCHOR_FREQUENCY_HZ: int = 444
     SECURITY_CODE: int = 741
+    ATOM_GRAPH_INDEX_ENABLED: bool = field(default_factory=lambda: os.getenv("ATOM_GRAPH_INDEX_ENABLED", "false").lower() == "true")
+    ATOM_GRAPH_INDEX_REFRESH_SECONDS: float = field(default_factory=lambda: float(os.getenv("ATOM_GRAPH_INDEX_REFRESH_SECONDS", "300")))
 
     CORS_ORIGINS: List[str] = field(default_factory=lambda: [
         "https://atom-arche.vercel.app",
@@ -226,6 +228,99 @@ async def close_database():
     except:
         pass
 
+# ===========================================================================================
+# AT·OM GRAPH INDEX (Optional - searches fall back to the DB when absent)
+# ===========================================================================================
+
+async def init_atom_graph_index():
+    if not (config.ATOM_GRAPH_INDEX_ENABLED and db_connected):
+        return
+    try:
+        from app.core.database import db_manager
+        from app.services.atom_graph_index import get_atom_graph_index
+        index = get_atom_graph_index()
+        # A snapshot that missed two refreshes is no longer trusted
+        index.max_age_s = config.ATOM_GRAPH_INDEX_REFRESH_SECONDS * 2
+        await index.start(db_manager.session, config.ATOM_GRAPH_INDEX_REFRESH_SECONDS)
+    except ImportError:
+        logger.warning("AT·OM graph index not available")
+    except Exception as e:
+        logger.error(f"AT·OM graph index load failed: {e}")
+
+async def close_atom_graph_index():
+    try:
+        from app.services.atom_graph_index import get_atom_graph_index
+        await get_atom_graph_index().stop()
+    except ImportError:
+        pass
+
+# ===========================================================================================
+# LLM ROUTER (Optional - background upkeep of the shared router)
+# ===========================================================================================
+
+async def init_llm_router():
+    try:
+        from backend.services.llm_router import get_llm_router
+        router = get_llm_router()
+        # Sweeps expired LLM response cache entries
+        await router.response_cache.start()
+        # Writes budget usage behind to the LLM_BUDGET_BACKEND store
+        router.budget_ledger.start()
+    except ImportError:
+        logger.warning("LLM router not available")
+    except Exception as e:
+        logger.error(f"LLM router start failed: {e}")
+
+async def close_llm_router():
+    try:
+        from backend.services.llm_router import get_llm_router
+        router = get_llm_router()
+        # Returns leased budget and flushes pending usage
+        await router.budget_ledger.stop()
+        await router.response_cache.stop()
+    except ImportError:
+        pass
+
+# ===========================================================================================
+# SYNAPTIC YELLOW PAGES (Optional - provider health probing)
+# ===========================================================================================
+
+async def init_yellow_pages():
+    try:
+        from backend.core.synaptic import get_yellow_pages
+        get_yellow_pages().start_health_checks()
+    except ImportError:
+        logger.warning("Synaptic yellow pages not available")
+    except Exception as e:
+        logger.error(f"Yellow pages health checks failed to start: {e}")
+
+async def close_yellow_pages():
+    try:
+        from backend.core.synaptic import get_yellow_pages
+        await get_yellow_pages().stop_health_checks()
+    except ImportError:
+        pass
+
+# ===========================================================================================
+# SEARCH INDEX (Optional - per-worker snapshot, written back on shutdown)
+# ===========================================================================================
+
+async def init_search_index():
+    try:
+        from routers.search import start_search_index
+        start_search_index()
+    except ImportError:
+        logger.warning("Search index not available")
+    except Exception as e:
+        logger.error(f"Search index load failed: {e}")
+
+async def close_search_index():
+    try:
+        from routers.search import stop_search_index
+        await stop_search_index()
+    except ImportError:
+        pass
+
 # ===========================================================================================
 # APPLICATION LIFESPAN
 # ===========================================================================================
@@ -241,6 +336,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     logger.info("=" * 70)
 
     await init_database()
+    await init_atom_graph_index()
+    await init_llm_router()
+    await init_yellow_pages()
+    await init_search_index()
     await resonance_engine.start()
 
     logger.info(f"Server listening on http://{config.HOST}:{config.PORT}")
@@ -250,6 +349,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
     logger.info("NOVA-999 Shutting Down...")
     await resonance_engine.stop()
+    await close_search_index()
+    await close_yellow_pages()
+    await close_llm_router()
+    await close_atom_graph_index()
     await close_database()
 
 # ===========================================================================================
@@ -370,6 +473,8 @@ register_router("app.routers.xr", "/api/v2/xr", ["XR"], "xr")
 register_router("api.v1.routes.tokenomics_routes", "/api/v2/tokenomics", ["Tokenomics"], "tokenomics")
 register_router("app.routers.neuromorphic", "/api/v2/neuromorphic", ["Neuromorphic"], "neuromorphic")
 register_router("app.routers.engines", "/api/v2/engines", ["Engines"], "engines")
+register_router("backend.api.routes.synaptic_routes", "", ["Synaptic"], "synaptic")
+register_router("routers.search", "/api/v2/search", ["Search"], "search")
 
 # ===========================================================================================
 # HEALTH ENDPOINTS
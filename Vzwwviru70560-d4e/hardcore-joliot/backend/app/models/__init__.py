@@ -1 +1,5 @@
 """CHE·NU V76 Models Package"""
+
+# Models whose relationship() targets are named by string: registering them
+# together lets the mappers configure whichever one is imported first.
+from app.models import governance, sphere, thread, user  # noqa: F401
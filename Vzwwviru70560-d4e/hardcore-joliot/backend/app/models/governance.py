@@ -117,7 +117,12 @@ class GovernanceCheckpoint(Base):
     )
     
     # Relationships
-    identity = relationship("User", back_populates="checkpoints")
+    identity = relationship(
+        "User",
+        back_populates="checkpoints",
+        primaryjoin="foreign(GovernanceCheckpoint.identity_id) == User.identity_id",
+        viewonly=True,
+    )
     thread = relationship("Thread", back_populates="checkpoints")
     
     def __repr__(self) -> str:
@@ -226,7 +231,12 @@ class AuditLog(Base):
     )
     
     # Relationships
-    identity = relationship("User", back_populates="audit_logs")
+    identity = relationship(
+        "User",
+        back_populates="audit_logs",
+        primaryjoin="foreign(AuditLog.identity_id) == User.identity_id",
+        viewonly=True,
+    )
     
     def __repr__(self) -> str:
         return f"<AuditLog(id={self.id}, action={self.action}, resource={self.resource_type})>"
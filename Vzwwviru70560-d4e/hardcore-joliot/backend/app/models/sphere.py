@@ -261,6 +261,13 @@ class Sphere(Base):
     )
     
     # Relationships
+    identity = relationship(
+        "User",
+        back_populates="spheres",
+        primaryjoin="foreign(Sphere.identity_id) == User.identity_id",
+        viewonly=True,
+    )
+    
     bureau_sections: Mapped[List["BureauSection"]] = relationship(
         "BureauSection",
         back_populates="sphere",
@@ -268,6 +268,25 @@ class Thread(Base):
         nullable=False,
     )
     
+    # ═══════════════════════════════════════════════════════════════════════════
+    # EVENT LOG HEAD (Allocated atomically on append)
+    # ═══════════════════════════════════════════════════════════════════════════
+    
+    # Sequence number of the newest event; appends reserve their range
+    # with one UPDATE ... RETURNING on this column
+    last_sequence_number: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    
+    # Newest event, parent of the next one appended
+    last_event_id: Mapped[Optional[str]] = mapped_column(
+        UUID(as_uuid=False),
+        nullable=True,
+    )
+    
     # ═══════════════════════════════════════════════════════════════════════════
     # TIMESTAMPS
     # ═══════════════════════════════════════════════════════════════════════════
@@ -337,7 +356,12 @@ class Thread(Base):
     )
     
     # Owner identity
-    identity = relationship("User", back_populates="threads")
+    identity = relationship(
+        "User",
+        back_populates="threads",
+        primaryjoin="foreign(Thread.identity_id) == User.identity_id",
+        viewonly=True,
+    )
     
     # Governance checkpoints for this thread
     checkpoints = relationship(
@@ -173,18 +173,44 @@ class User(Base):
     # ═══════════════════════════════════════════════════════════════════════════
     # RELATIONSHIPS
     # ═══════════════════════════════════════════════════════════════════════════
+    # Scoped by identity_id, which carries no foreign key: joins are explicit
+    # and read-only.
     
     # User's spheres (9 spheres per user)
-    spheres = relationship("Sphere", back_populates="identity", lazy="dynamic")
+    spheres = relationship(
+        "Sphere",
+        back_populates="identity",
+        lazy="dynamic",
+        primaryjoin="User.identity_id == foreign(Sphere.identity_id)",
+        viewonly=True,
+    )
     
     # User's threads
-    threads = relationship("Thread", back_populates="identity", lazy="dynamic")
+    threads = relationship(
+        "Thread",
+        back_populates="identity",
+        lazy="dynamic",
+        primaryjoin="User.identity_id == foreign(Thread.identity_id)",
+        viewonly=True,
+    )
     
     # User's governance checkpoints
-    checkpoints = relationship("GovernanceCheckpoint", back_populates="identity", lazy="dynamic")
+    checkpoints = relationship(
+        "GovernanceCheckpoint",
+        back_populates="identity",
+        lazy="dynamic",
+        primaryjoin="User.identity_id == foreign(GovernanceCheckpoint.identity_id)",
+        viewonly=True,
+    )
     
     # User's audit logs
-    audit_logs = relationship("AuditLog", back_populates="identity", lazy="dynamic")
+    audit_logs = relationship(
+        "AuditLog",
+        back_populates="identity",
+        lazy="dynamic",
+        primaryjoin="User.identity_id == foreign(AuditLog.identity_id)",
+        viewonly=True,
+    )
     
     # ═══════════════════════════════════════════════════════════════════════════
     # METHODS
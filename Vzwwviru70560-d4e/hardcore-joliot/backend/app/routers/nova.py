@@ -23,7 +23,7 @@ R&D Rules Compliance:
 - Rule #4: No AI-to-AI orchestration
 """
 
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Depends
+from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Depends, WebSocket, status
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any, Literal
 from uuid import UUID, uuid4
@@ -35,7 +35,9 @@ import logging
 import asyncio
 
 from app.core.database import get_db_optional
+from app.core.security import TokenVerificationError, verify_access_token
 from app.models.models import NovaConversation as ConversationModel
+from backend.services.websocket_service import websocket_handler
 
 logger = logging.getLogger("chenu.routers.nova")
 
@@ -682,6 +684,27 @@ async def nova_health():
     }
 
 
+
+@router.websocket("/ws")
+async def nova_websocket(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None),
+):
+    """
+    Real-time Nova channel.
+    
+    Browsers cannot set headers on a WebSocket, so the access token comes
+    as a query parameter. Send {"event": "nova.prompt", "data": {"prompt": ...}}
+    to stream a completion back token by token.
+    """
+    try:
+        payload = verify_access_token(token or "")
+    except TokenVerificationError:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket_handler(websocket, payload.sub)
+
 # ============================================================================
 # INTERNAL PIPELINE FUNCTIONS
 # ============================================================================
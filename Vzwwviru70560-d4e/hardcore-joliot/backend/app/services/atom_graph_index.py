@@ -0,0 +1,710 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+AT·OM GRAPH INDEX — Instantané en mémoire du graphe causal (CSR)
+═══════════════════════════════════════════════════════════════════════════════
+
+Même groupés par niveau, les parcours restent liés à la base: quelques
+allers-retours par requête, chacun payé en latence réseau.
+
+Cet index optionnel garde le graphe dans le processus:
+- identifiants entiers (UUID ↔ position) pour les nœuds
+- adjacence compressée (CSR) avant ET arrière: offsets + tableaux
+  parallèles cible / force / type / confiance, chaque ligne triée par
+  force décroissante (le fan-out est un préfixe de ligne)
+- métadonnées des nœuds (nom, dimension, époque) et fréquences de base
+  des signatures harmoniques
+
+Chargé en bloc au démarrage, il est tenu à jour par les événements
+d'écriture (liens ajoutés/supprimés, nœuds créés/modifiés/supprimés) via
+une couche de deltas, recompactée au-delà d'un seuil. Un événement qu'il ne
+sait pas appliquer le marque périmé: les appelants retombent alors sur la
+base jusqu'au prochain chargement.
+
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+from array import array
+from typing import Optional, List, Dict, Any, Set, Tuple, Iterable, Iterator, Callable, NamedTuple
+from uuid import UUID
+import asyncio
+import logging
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.atom_traversal import TraversalHit
+
+logger = logging.getLogger("atom.graph_index")
+
+# Taille de la couche de deltas au-delà de laquelle les CSR sont reconstruits
+COMPACT_THRESHOLD = 10_000
+
+# Intervalle de rechargement complet depuis la base
+REFRESH_INTERVAL_S = 300.0
+
+# (autre extrémité, code de type, force, confiance)
+Edge = Tuple[int, int, float, float]
+
+
+class IndexedNode(NamedTuple):
+    """Métadonnées d'un nœud, exposées comme un ATOMNode allégé."""
+    id: UUID
+    name: str
+    dimension: Optional[str]
+    epoch: Optional[str]
+
+
+class _CSR:
+    """Adjacence compressée d'une direction, lignes triées par force décroissante."""
+
+    __slots__ = ("offsets", "targets", "strengths", "types", "confidences")
+
+    def __init__(self, n_nodes: int, edges: List[Tuple[int, int, int, float, float]]):
+        # edges: (source, cible, type, force, confiance)
+        edges.sort(key=lambda e: (e[0], -e[3]))
+
+        counts = [0] * (n_nodes + 1)
+        for edge in edges:
+            counts[edge[0] + 1] += 1
+        for i in range(n_nodes):
+            counts[i + 1] += counts[i]
+
+        self.offsets = array("q", counts)
+        self.targets = array("q", (e[1] for e in edges))
+        self.types = array("H", (e[2] for e in edges))
+        self.strengths = array("d", (e[3] for e in edges))
+        self.confidences = array("d", (e[4] for e in edges))
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.offsets) - 1
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+
+class AtomGraphIndex:
+    """
+    Index en mémoire du graphe AT·OM.
+
+    Les requêtes (parcours, chaîne causale, harmoniques) sont synchrones et
+    ne touchent pas la base; is_fresh() dit si l'instantané peut servir.
+    max_age_s borne l'âge d'un instantané (les signatures harmoniques n'ont
+    pas d'événements: seul le rechargement les rafraîchit).
+    """
+
+    def __init__(
+        self,
+        max_age_s: Optional[float] = None,
+        compact_threshold: int = COMPACT_THRESHOLD,
+    ):
+        self.max_age_s = max_age_s
+        self.compact_threshold = compact_threshold
+
+        self._ids: List[UUID] = []
+        self._index: Dict[UUID, int] = {}
+        self._nodes: List[Optional[IndexedNode]] = []
+        self._type_names: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self._forward = _CSR(0, [])
+        self._backward = _CSR(0, [])
+        self._harmonics: Dict[Any, List[Tuple[int, float]]] = {}
+
+        # Couche de deltas
+        self._extra_forward: Dict[int, List[Edge]] = {}
+        self._extra_backward: Dict[int, List[Edge]] = {}
+        self._removed: Set[Tuple[int, int, int]] = set()
+        self._dead: Set[int] = set()
+        self._delta_size = 0
+
+        self._loaded_at: Optional[float] = None
+        self._stale = True
+        self._loading = False
+        self._pending: List[Tuple[Callable, tuple]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # ÉTAT
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def is_fresh(self) -> bool:
+        """Chargé, sans événement manqué et plus jeune que max_age_s."""
+        if self._loaded_at is None or self._stale:
+            return False
+        if self.max_age_s is not None and time.monotonic() - self._loaded_at > self.max_age_s:
+            return False
+        return True
+
+    def mark_stale(self, reason: str = "") -> None:
+        """Invalide l'instantané jusqu'au prochain chargement."""
+        if not self._stale:
+            logger.info(f"Graph index stale{': ' + reason if reason else ''}")
+        self._stale = True
+
+    def has_node(self, node_id: UUID) -> bool:
+        idx = self._index.get(node_id)
+        return idx is not None and idx not in self._dead
+
+    def get_node(self, node_id: UUID) -> Optional[IndexedNode]:
+        idx = self._index.get(node_id)
+        if idx is None or idx in self._dead:
+            return None
+        return self._nodes[idx]
+
+    def get_nodes(self, node_ids: Iterable[UUID]) -> Dict[UUID, IndexedNode]:
+        """Même contrat que AtomGraphTraversal.fetch_nodes: les absents sont omis."""
+        nodes = {}
+        for node_id in node_ids:
+            node = self.get_node(node_id)
+            if node is not None:
+                nodes[node_id] = node
+        return nodes
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.is_loaded,
+            "fresh": self.is_fresh(),
+            "age_s": round(time.monotonic() - self._loaded_at, 1) if self._loaded_at else None,
+            "nodes": len(self._ids) - len(self._dead),
+            "base_links": len(self._forward),
+            "link_types": list(self._type_names),
+            "harmonic_frequencies": len(self._harmonics),
+            "delta_size": self._delta_size,
+        }
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # CHARGEMENT
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    async def load(self, db: AsyncSession) -> None:
+        """
+        Charge un instantané complet (3 requêtes) puis le substitue à l'ancien.
+
+        Les événements reçus pendant le chargement sont rejoués ensuite.
+        """
+        from app.models.atom_mapping import ATOMNode, AtomHarmonicSignature, atom_causal_links
+
+        started = time.monotonic()
+        self._loading = True
+        try:
+            nodes = (await db.execute(
+                select(ATOMNode.id, ATOMNode.name, ATOMNode.dimension, ATOMNode.epoch)
+            )).all()
+            links = (await db.execute(
+                select(
+                    atom_causal_links.c.trigger_id,
+                    atom_causal_links.c.result_id,
+                    atom_causal_links.c.link_type,
+                    atom_causal_links.c.strength,
+                    atom_causal_links.c.confidence,
+                )
+            )).all()
+            signatures = (await db.execute(
+                select(
+                    AtomHarmonicSignature.node_id,
+                    AtomHarmonicSignature.numeric_signatures,
+                    AtomHarmonicSignature.confidence,
+                ).order_by(AtomHarmonicSignature.created_at)
+            )).all()
+        except Exception:
+            # Les événements en attente sont perdus pour l'ancien instantané
+            self.mark_stale("load failed")
+            raise
+        finally:
+            self._loading = False
+            pending, self._pending = self._pending, []
+
+        self._build(
+            [IndexedNode(row.id, row.name, row.dimension, row.epoch) for row in nodes],
+            [
+                (row.trigger_id, row.result_id, row.link_type, row.strength, row.confidence)
+                for row in links
+            ],
+            [(row.node_id, row.numeric_signatures, row.confidence) for row in signatures],
+        )
+
+        for handler, args in pending:
+            handler(*args)
+
+        logger.info(
+            f"Graph index loaded: {len(nodes)} nodes, {len(links)} links "
+            f"in {(time.monotonic() - started) * 1000:.0f}ms"
+        )
+
+    def _build(
+        self,
+        nodes: List[IndexedNode],
+        links: List[Tuple[UUID, UUID, str, float, float]],
+        signatures: List[Tuple[UUID, Optional[Dict], float]],
+    ) -> None:
+        """Construit un instantané depuis des lignes brutes."""
+        ids = [node.id for node in nodes]
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        type_names: List[str] = []
+        type_codes: Dict[str, int] = {}
+
+        forward_edges = []
+        backward_edges = []
+        for trigger_id, result_id, link_type, strength, confidence in links:
+            src = index.get(trigger_id)
+            dst = index.get(result_id)
+            if src is None or dst is None:
+                continue
+            code = type_codes.get(link_type)
+            if code is None:
+                code = type_codes[link_type] = len(type_names)
+                type_names.append(link_type)
+            forward_edges.append((src, dst, code, strength, confidence))
+            backward_edges.append((dst, src, code, strength, confidence))
+
+        harmonics: Dict[Any, List[Tuple[int, float]]] = {}
+        for node_id, numeric_signatures, confidence in signatures:
+            idx = index.get(node_id)
+            frequency = (numeric_signatures or {}).get("base_frequency")
+            if idx is not None and frequency is not None:
+                harmonics.setdefault(frequency, []).append((idx, confidence))
+
+        self._ids = ids
+        self._index = index
+        self._nodes = list(nodes)
+        self._type_names = type_names
+        self._type_codes = type_codes
+        self._forward = _CSR(len(ids), forward_edges)
+        self._backward = _CSR(len(ids), backward_edges)
+        self._harmonics = harmonics
+
+        self._extra_forward = {}
+        self._extra_backward = {}
+        self._removed = set()
+        self._dead = set()
+        self._delta_size = 0
+
+        self._loaded_at = time.monotonic()
+        self._stale = False
+
+    def _compact(self) -> None:
+        """Intègre la couche de deltas dans de nouveaux CSR."""
+        alive = [i for i in range(len(self._ids)) if i not in self._dead]
+        links = [
+            (self._ids[src], self._ids[dst], self._type_names[code], strength, confidence)
+            for src in alive
+            for dst, code, strength, confidence in self._neighbors(src, self._forward, self._extra_forward)
+            if dst not in self._dead
+        ]
+        signatures = [
+            (self._ids[idx], {"base_frequency": frequency}, confidence)
+            for frequency, entries in self._harmonics.items()
+            for idx, confidence in entries
+            if idx not in self._dead
+        ]
+
+        loaded_at, stale = self._loaded_at, self._stale
+        self._build([self._nodes[i] for i in alive], links, signatures)
+        # La compaction ne rafraîchit pas l'instantané
+        self._loaded_at, self._stale = loaded_at, stale
+
+    async def start(
+        self,
+        session_factory: Callable[[], Any],
+        refresh_interval_s: float = REFRESH_INTERVAL_S,
+    ) -> None:
+        """Charge l'index puis le recharge périodiquement en tâche de fond."""
+        if self._task is not None:
+            return
+        async with session_factory() as session:
+            await self.load(session)
+        self._task = asyncio.create_task(self._refresh_loop(session_factory, refresh_interval_s))
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_loop(self, session_factory: Callable[[], Any], interval_s: float) -> None:
+        while True:
+            try:
+                await asyncio.sleep(interval_s)
+                async with session_factory() as session:
+                    await self.load(session)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Graph index refresh failed: {e}")
+                self.mark_stale("refresh failed")
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # ÉVÉNEMENTS D'ÉCRITURE
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def _defer(self, handler: Callable, *args) -> bool:
+        """
+        True si l'événement ne s'applique pas maintenant: pendant un
+        chargement il est rejoué sur le nouvel instantané, avant le premier
+        chargement il est sans objet.
+        """
+        if self._loading:
+            self._pending.append((handler, args))
+            return True
+        return not self.is_loaded
+
+    def on_node_upserted(
+        self,
+        node_id: UUID,
+        name: str,
+        dimension: Optional[str] = None,
+        epoch: Optional[str] = None,
+    ) -> None:
+        """Nœud créé ou modifié."""
+        if self._defer(self.on_node_upserted, node_id, name, dimension, epoch):
+            return
+
+        node = IndexedNode(node_id, name, dimension, epoch)
+        idx = self._index.get(node_id)
+        if idx is None:
+            self._index[node_id] = len(self._ids)
+            self._ids.append(node_id)
+            self._nodes.append(node)
+        elif idx in self._dead:
+            self.mark_stale(f"node {node_id} reappeared after deletion")
+        else:
+            self._nodes[idx] = node
+
+    def on_node_removed(self, node_id: UUID) -> None:
+        """Nœud supprimé: ses liens et signatures disparaissent avec lui (CASCADE)."""
+        if self._defer(self.on_node_removed, node_id):
+            return
+
+        idx = self._index.get(node_id)
+        if idx is None or idx in self._dead:
+            return
+        self._dead.add(idx)
+        self._extra_forward.pop(idx, None)
+        self._extra_backward.pop(idx, None)
+        self._bump_delta()
+
+    def on_link_added(
+        self,
+        trigger_id: UUID,
+        result_id: UUID,
+        link_type: str,
+        strength: float = 1.0,
+        confidence: float = 0.5,
+    ) -> None:
+        """Lien inséré dans atom_causal_links."""
+        if self._defer(self.on_link_added, trigger_id, result_id, link_type, strength, confidence):
+            return
+
+        src = self._index.get(trigger_id)
+        dst = self._index.get(result_id)
+        if src is None or dst is None or src in self._dead or dst in self._dead:
+            self.mark_stale(f"link {trigger_id} → {result_id} references unknown node")
+            return
+
+        code = self._type_codes.get(link_type)
+        if code is None:
+            code = self._type_codes[link_type] = len(self._type_names)
+            self._type_names.append(link_type)
+
+        self._extra_forward.setdefault(src, []).append((dst, code, strength, confidence))
+        self._extra_backward.setdefault(dst, []).append((src, code, strength, confidence))
+        self._bump_delta()
+
+    def on_link_removed(
+        self,
+        trigger_id: UUID,
+        result_id: UUID,
+        link_type: Optional[str] = None,
+    ) -> None:
+        """Liens supprimés entre deux nœuds (d'un type donné, ou tous)."""
+        if self._defer(self.on_link_removed, trigger_id, result_id, link_type):
+            return
+
+        src = self._index.get(trigger_id)
+        dst = self._index.get(result_id)
+        if src is None or dst is None:
+            return
+
+        if link_type is None:
+            codes = range(len(self._type_names))
+        elif link_type in self._type_codes:
+            codes = [self._type_codes[link_type]]
+        else:
+            return
+
+        for code in codes:
+            self._removed.add((src, dst, code))
+            self._drop_extra(self._extra_forward, src, dst, code)
+            self._drop_extra(self._extra_backward, dst, src, code)
+        self._bump_delta()
+
+    def on_harmonic_added(
+        self,
+        node_id: UUID,
+        numeric_signatures: Optional[Dict[str, Any]],
+        confidence: float = 0.2,
+    ) -> None:
+        """Signature harmonique créée pour un nœud."""
+        if self._defer(self.on_harmonic_added, node_id, numeric_signatures, confidence):
+            return
+
+        frequency = (numeric_signatures or {}).get("base_frequency")
+        if frequency is None:
+            return
+        idx = self._index.get(node_id)
+        if idx is None or idx in self._dead:
+            self.mark_stale(f"harmonic signature references unknown node {node_id}")
+            return
+        self._harmonics.setdefault(frequency, []).append((idx, confidence))
+
+    @staticmethod
+    def _drop_extra(extra: Dict[int, List[Edge]], src: int, dst: int, code: int) -> None:
+        edges = extra.get(src)
+        if edges:
+            extra[src] = [e for e in edges if not (e[0] == dst and e[1] == code)]
+
+    def _bump_delta(self) -> None:
+        self._delta_size += 1
+        if self._delta_size >= self.compact_threshold:
+            self._compact()
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # ADJACENCE
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def _neighbors(
+        self,
+        idx: int,
+        csr: _CSR,
+        extra: Dict[int, List[Edge]],
+        type_codes: Optional[Set[int]] = None,
+        min_strength: float = 0.0,
+        max_fanout: Optional[int] = None,
+    ) -> List[Edge]:
+        """
+        Liens sortants de idx dans csr + deltas, par force décroissante.
+
+        Mêmes filtres que AtomGraphTraversal.fetch_links: types, force
+        minimale (si > 0), puis les max_fanout plus forts.
+        """
+        forward = csr is self._forward
+        removed = self._removed
+        dead = self._dead
+        added = extra.get(idx)
+        edges: List[Edge] = []
+
+        if idx < csr.n_nodes:
+            for k in range(csr.offsets[idx], csr.offsets[idx + 1]):
+                strength = csr.strengths[k]
+                if min_strength > 0 and strength < min_strength:
+                    break  # Ligne triée: le reste est plus faible
+                code = csr.types[k]
+                if type_codes is not None and code not in type_codes:
+                    continue
+                other = csr.targets[k]
+                if other in dead:
+                    continue
+                if removed and ((idx, other, code) if forward else (other, idx, code)) in removed:
+                    continue
+                edges.append((other, code, strength, csr.confidences[k]))
+                if max_fanout and not added and len(edges) >= max_fanout:
+                    break
+
+        if added:
+            for edge in added:
+                if min_strength > 0 and edge[2] < min_strength:
+                    continue
+                if type_codes is not None and edge[1] not in type_codes:
+                    continue
+                if edge[0] in dead:
+                    continue
+                edges.append(edge)
+            edges.sort(key=lambda e: -e[2])
+            if max_fanout:
+                del edges[max_fanout:]
+
+        return edges
+
+    def _adjacency(self, direction: str) -> Tuple[_CSR, Dict[int, List[Edge]]]:
+        if direction == "backward":
+            # Effet → Cause (UNITARITÉ)
+            return self._backward, self._extra_backward
+        return self._forward, self._extra_forward
+
+    def _codes(self, link_types: Optional[List[Any]]) -> Optional[Set[int]]:
+        if not link_types:
+            return None
+        names = (getattr(lt, "value", lt) for lt in link_types)
+        return {self._type_codes[name] for name in names if name in self._type_codes}
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # REQUÊTES
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def levels(
+        self,
+        start_id: UUID,
+        direction: str,
+        depth: int,
+        link_types: Optional[List[Any]] = None,
+        min_strength: float = 0.0,
+        max_fanout: Optional[int] = None,
+    ) -> Iterator[List[TraversalHit]]:
+        """
+        BFS niveau par niveau, mêmes résultats que AtomGraphTraversal en
+        mode LEVEL: chaque nouveau nœud garde le lien le plus fort du niveau.
+        """
+        start = self._index.get(start_id)
+        if start is None or start in self._dead:
+            return
+
+        csr, extra = self._adjacency(direction)
+        type_codes = self._codes(link_types)
+        ids = self._ids
+
+        visited = {start}
+        paths: Dict[int, List[UUID]] = {start: [start_id]}
+        frontier = [start]
+
+        for distance in range(1, depth + 1):
+            if not frontier:
+                return
+
+            best: Dict[int, Tuple[int, Edge]] = {}
+            for src in frontier:
+                for edge in self._neighbors(src, csr, extra, type_codes, min_strength, max_fanout):
+                    target = edge[0]
+                    if target in visited:
+                        continue
+                    current = best.get(target)
+                    if current is None or edge[2] > current[1][2]:
+                        best[target] = (src, edge)
+
+            if not best:
+                return
+
+            hits = []
+            for target, (src, (_, code, strength, confidence)) in best.items():
+                visited.add(target)
+                paths[target] = paths[src] + [ids[target]]
+                hits.append(TraversalHit(
+                    node_id=ids[target],
+                    node=self._nodes[target],
+                    distance=distance,
+                    path=paths[target],
+                    link_type=self._type_names[code],
+                    link_strength=strength,
+                    confidence=confidence,
+                ))
+
+            frontier = list(best)
+            yield hits
+
+    def shortest_path(
+        self,
+        from_id: UUID,
+        to_id: UUID,
+        max_depth: int = 5,
+        max_fanout: Optional[int] = None,
+    ) -> Optional[List[UUID]]:
+        """
+        BFS bidirectionnel: chemin from_id → to_id d'au plus 2 * max_depth
+        liens, ou None. max_fanout borne chaque expansion comme fetch_links.
+        """
+        source = self._index.get(from_id)
+        target = self._index.get(to_id)
+        if source is None or target is None or source in self._dead or target in self._dead:
+            return None
+
+        forward_parent: Dict[int, int] = {source: -1}
+        backward_parent: Dict[int, int] = {target: -1}
+        forward_frontier = [source]
+        backward_frontier = [target]
+
+        for _ in range(max_depth):
+            new_forward = []
+            for node in forward_frontier:
+                for edge in self._neighbors(node, self._forward, self._extra_forward, max_fanout=max_fanout):
+                    next_idx = edge[0]
+                    if next_idx not in forward_parent:
+                        forward_parent[next_idx] = node
+                        new_forward.append(next_idx)
+                        if next_idx in backward_parent:
+                            return self._join(next_idx, forward_parent, backward_parent)
+            forward_frontier = new_forward
+
+            new_backward = []
+            for node in backward_frontier:
+                for edge in self._neighbors(node, self._backward, self._extra_backward, max_fanout=max_fanout):
+                    prev_idx = edge[0]
+                    if prev_idx not in backward_parent:
+                        backward_parent[prev_idx] = node
+                        new_backward.append(prev_idx)
+                        if prev_idx in forward_parent:
+                            return self._join(prev_idx, forward_parent, backward_parent)
+            backward_frontier = new_backward
+
+            if not forward_frontier and not backward_frontier:
+                break
+
+        return None
+
+    def _join(self, meet: int, forward_parent: Dict[int, int], backward_parent: Dict[int, int]) -> List[UUID]:
+        path = []
+        node = meet
+        while node != -1:
+            path.append(node)
+            node = forward_parent[node]
+        path.reverse()
+        node = backward_parent[meet]
+        while node != -1:
+            path.append(node)
+            node = backward_parent[node]
+        return [self._ids[i] for i in path]
+
+    def find_by_harmonic(self, frequency: Any, limit: int = 20) -> List[Tuple[IndexedNode, float]]:
+        """(nœud, confiance) des signatures de fréquence de base donnée."""
+        results = []
+        for idx, confidence in self._harmonics.get(frequency, ()):
+            if idx in self._dead:
+                continue
+            results.append((self._nodes[idx], confidence))
+            if len(results) >= limit:
+                break
+        return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SINGLETON
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_graph_index: Optional[AtomGraphIndex] = None
+
+
+def get_atom_graph_index() -> AtomGraphIndex:
+    """Index du processus (non chargé tant que start() ou load() n'a pas tourné)."""
+    global _graph_index
+    if _graph_index is None:
+        _graph_index = AtomGraphIndex()
+    return _graph_index
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EXPORTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    "AtomGraphIndex",
+    "IndexedNode",
+    "get_atom_graph_index",
+    "COMPACT_THRESHOLD",
+    "REFRESH_INTERVAL_S",
+]
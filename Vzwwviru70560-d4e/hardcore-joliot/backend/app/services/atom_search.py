@@ -21,7 +21,7 @@ Ce service permet:
 """
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Set, Tuple
+from typing import Optional, List, Dict, Any, Set, Tuple, AsyncIterator
 from uuid import UUID
 from enum import Enum
 from dataclasses import dataclass, field
@@ -31,6 +31,9 @@ from sqlalchemy import select, and_, or_, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.services.atom_traversal import AtomGraphTraversal, TraversalMode, TraversalHit
+from app.services.atom_graph_index import AtomGraphIndex, get_atom_graph_index
+
 logger = logging.getLogger("atom.search")
 
 
@@ -122,10 +125,30 @@ class AtomUnitarySearch:
     - Chaque recherche peut être inversée
     - L'information ne se perd jamais
     - On peut remonter l'histoire depuis n'importe quel point
+
+    Les parcours passent par AtomGraphTraversal: chaque niveau BFS coûte
+    une requête de liens et une de nœuds (ou un seul WITH RECURSIVE).
+    Quand l'index en mémoire du processus est frais, parcours, chaînes
+    causales et harmoniques sont servis sans requête.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        traversal_mode: TraversalMode = TraversalMode.LEVEL,
+        max_fanout: Optional[int] = None,
+        max_results: Optional[int] = None,
+        graph_index: Optional[AtomGraphIndex] = None,
+    ):
         self.db = db
+        self.graph_index = graph_index if graph_index is not None else get_atom_graph_index()
+        self.traversal = AtomGraphTraversal(
+            db,
+            mode=traversal_mode,
+            max_fanout=max_fanout,
+            max_results=max_results,
+            graph_index=self.graph_index,
+        )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # RECHERCHE PAR MOT-CLÉ (Rapide)
@@ -256,6 +279,25 @@ class AtomUnitarySearch:
             "total_connections": len(causes) + len(effects),
         }
 
+    async def stream_graph(
+        self,
+        node_id: UUID,
+        direction: SearchDirection,
+        depth: int = 3,
+        link_types: Optional[List[LinkType]] = None,
+        min_strength: float = 0.0,
+    ) -> AsyncIterator[List[SearchResult]]:
+        """
+        Parcours en flux: produit les résultats niveau par niveau.
+
+        Borné par depth, et par le fan-out / nombre max de résultats du
+        service.
+        """
+        async for hits in self.traversal.stream(
+            node_id, direction.value, depth, link_types, min_strength
+        ):
+            yield [self._hit_to_result(hit, direction) for hit in hits]
+
     async def _traverse_graph(
         self,
         start_id: UUID,
@@ -267,102 +309,34 @@ class AtomUnitarySearch:
         """
         Traverse le graphe dans une direction donnée.
 
-        Utilise BFS (Breadth-First Search) pour explorer par niveaux.
+        Utilise BFS (Breadth-First Search) pour explorer par niveaux,
+        chaque niveau en une requête groupée.
         """
-        from app.models.atom_mapping import ATOMNode, atom_causal_links
-
-        visited: Set[UUID] = set()
         results: List[SearchResult] = []
-        current_level: Set[UUID] = {start_id}
-        current_depth = 0
-        paths: Dict[UUID, List[UUID]] = {start_id: [start_id]}
-
-        while current_level and current_depth < depth:
-            next_level: Set[UUID] = set()
-
-            for node_id in current_level:
-                if node_id in visited:
-                    continue
-                visited.add(node_id)
-
-                # Requête selon la direction
-                if direction == SearchDirection.FORWARD:
-                    # Cause → Effet
-                    stmt = select(
-                        atom_causal_links.c.result_id,
-                        atom_causal_links.c.link_type,
-                        atom_causal_links.c.strength,
-                        atom_causal_links.c.confidence,
-                    ).where(
-                        atom_causal_links.c.trigger_id == node_id
-                    )
-                else:
-                    # Effet → Cause (UNITARITÉ)
-                    stmt = select(
-                        atom_causal_links.c.trigger_id,
-                        atom_causal_links.c.link_type,
-                        atom_causal_links.c.strength,
-                        atom_causal_links.c.confidence,
-                    ).where(
-                        atom_causal_links.c.result_id == node_id
-                    )
-
-                # Filtrer par type de lien
-                if link_types:
-                    type_values = [lt.value for lt in link_types]
-                    stmt = stmt.where(
-                        atom_causal_links.c.link_type.in_(type_values)
-                    )
-
-                # Filtrer par force minimale
-                if min_strength > 0:
-                    stmt = stmt.where(
-                        atom_causal_links.c.strength >= min_strength
-                    )
-
-                result = await self.db.execute(stmt)
-                links = result.fetchall()
-
-                for link in links:
-                    target_id = link[0]
-                    link_type = link[1]
-                    strength = link[2]
-                    confidence = link[3]
-
-                    if target_id not in visited:
-                        next_level.add(target_id)
-
-                        # Construire le chemin
-                        new_path = paths.get(node_id, []) + [target_id]
-                        paths[target_id] = new_path
-
-                        # Récupérer les infos du nœud cible
-                        node_stmt = select(ATOMNode).where(ATOMNode.id == target_id)
-                        node_result = await self.db.execute(node_stmt)
-                        target_node = node_result.scalar_one_or_none()
-
-                        if target_node:
-                            results.append(SearchResult(
-                                node_id=target_id,
-                                name=target_node.name,
-                                dimension=target_node.dimension,
-                                epoch=target_node.epoch,
-                                distance=current_depth + 1,
-                                direction=direction.value,
-                                path=new_path,
-                                link_type=link_type,
-                                link_strength=strength,
-                                confidence=confidence,
-                            ))
-
-            current_level = next_level
-            current_depth += 1
+        async for level in self.stream_graph(
+            start_id, direction, depth, link_types, min_strength
+        ):
+            results.extend(level)
 
         # Trier par distance puis par force
         results.sort(key=lambda r: (r.distance, -r.link_strength))
 
         return results
 
+    def _hit_to_result(self, hit: TraversalHit, direction: SearchDirection) -> SearchResult:
+        return SearchResult(
+            node_id=hit.node_id,
+            name=hit.node.name,
+            dimension=hit.node.dimension,
+            epoch=hit.node.epoch,
+            distance=hit.distance,
+            direction=direction.value,
+            path=hit.path,
+            link_type=hit.link_type,
+            link_strength=hit.link_strength,
+            confidence=hit.confidence,
+        )
+
     # ═══════════════════════════════════════════════════════════════════════════
     # RECHERCHE PAR CHAÎNE CAUSALE
     # ═══════════════════════════════════════════════════════════════════════════
@@ -376,9 +350,17 @@ class AtomUnitarySearch:
         """
         Trouve une chaîne causale entre deux nœuds.
 
-        Utilise BFS bidirectionnel pour optimiser.
+        Utilise BFS bidirectionnel pour optimiser: une requête par côté et
+        par niveau, puis un seul chargement des nœuds du chemin (ou tout en
+        mémoire si l'index est frais).
         """
-        from app.models.atom_mapping import ATOMNode, atom_causal_links
+        if self.traversal.uses_index(from_id, to_id):
+            path = self.graph_index.shortest_path(
+                from_id, to_id, max_depth, self.traversal.max_fanout
+            )
+            if path is None:
+                return None
+            return await self._build_chain(path, self.graph_index.get_nodes(path))
 
         # BFS depuis les deux extrémités
         forward_visited: Dict[UUID, List[UUID]] = {from_id: [from_id]}
@@ -390,15 +372,14 @@ class AtomUnitarySearch:
         for depth in range(max_depth):
             # Expansion forward
             new_forward: Set[UUID] = set()
-            for node_id in forward_frontier:
-                stmt = select(atom_causal_links.c.result_id).where(
-                    atom_causal_links.c.trigger_id == node_id
+            if forward_frontier:
+                links = await self.traversal.fetch_links(
+                    forward_frontier, SearchDirection.FORWARD.value
                 )
-                result = await self.db.execute(stmt)
-
-                for (next_id,) in result:
+                for link in links:
+                    next_id = link.target_id
                     if next_id not in forward_visited:
-                        forward_visited[next_id] = forward_visited[node_id] + [next_id]
+                        forward_visited[next_id] = forward_visited[link.source_id] + [next_id]
                         new_forward.add(next_id)
 
                         # Vérifier intersection
@@ -411,15 +392,14 @@ class AtomUnitarySearch:
 
             # Expansion backward
             new_backward: Set[UUID] = set()
-            for node_id in backward_frontier:
-                stmt = select(atom_causal_links.c.trigger_id).where(
-                    atom_causal_links.c.result_id == node_id
+            if backward_frontier:
+                links = await self.traversal.fetch_links(
+                    backward_frontier, SearchDirection.BACKWARD.value
                 )
-                result = await self.db.execute(stmt)
-
-                for (prev_id,) in result:
+                for link in links:
+                    prev_id = link.target_id
                     if prev_id not in backward_visited:
-                        backward_visited[prev_id] = backward_visited[node_id] + [prev_id]
+                        backward_visited[prev_id] = backward_visited[link.source_id] + [prev_id]
                         new_backward.add(prev_id)
 
                         # Vérifier intersection
@@ -429,17 +409,23 @@ class AtomUnitarySearch:
 
             backward_frontier = new_backward
 
+            if not forward_frontier and not backward_frontier:
+                break
+
         return None  # Pas de chemin trouvé
 
-    async def _build_chain(self, path: List[UUID]) -> CausalChain:
+    async def _build_chain(
+        self,
+        path: List[UUID],
+        nodes: Optional[Dict[UUID, Any]] = None,
+    ) -> CausalChain:
         """Construit une CausalChain depuis un chemin."""
-        from app.models.atom_mapping import ATOMNode
+        if nodes is None:
+            nodes = await self.traversal.fetch_nodes(path)
 
         results = []
         for i, node_id in enumerate(path):
-            stmt = select(ATOMNode).where(ATOMNode.id == node_id)
-            result = await self.db.execute(stmt)
-            node = result.scalar_one_or_none()
+            node = nodes.get(node_id)
 
             if node:
                 results.append(SearchResult(
@@ -484,7 +470,19 @@ class AtomUnitarySearch:
         - 111 Hz: Yesod
         - 68 Hz: Malkuth
         """
-        from app.models.atom_mapping import ATOMNode, AtomHarmonicSignature
+        if self.traversal.uses_index():
+            return [
+                SearchResult(
+                    node_id=node.id,
+                    name=node.name,
+                    dimension=node.dimension,
+                    epoch=node.epoch,
+                    relevance_score=confidence,
+                )
+                for node, confidence in self.graph_index.find_by_harmonic(frequency, limit)
+            ]
+
+        from app.models.atom_mapping import AtomHarmonicSignature
 
         # Recherche dans les signatures harmoniques
         stmt = select(AtomHarmonicSignature).where(
@@ -499,11 +497,11 @@ class AtomUnitarySearch:
         result = await self.db.execute(stmt)
         signatures = result.scalars().all()
 
+        nodes = await self.traversal.fetch_nodes(sig.node_id for sig in signatures)
+
         results = []
         for sig in signatures:
-            node_stmt = select(ATOMNode).where(ATOMNode.id == sig.node_id)
-            node_result = await self.db.execute(node_stmt)
-            node = node_result.scalar_one_or_none()
+            node = nodes.get(sig.node_id)
 
             if node:
                 results.append(SearchResult(
@@ -570,9 +568,15 @@ class AtomUnitarySearch:
 # FACTORY FUNCTION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def get_atom_search(db: AsyncSession) -> AtomUnitarySearch:
+def get_atom_search(
+    db: AsyncSession,
+    traversal_mode: TraversalMode = TraversalMode.LEVEL,
+    max_fanout: Optional[int] = None,
+    max_results: Optional[int] = None,
+    graph_index: Optional[AtomGraphIndex] = None,
+) -> AtomUnitarySearch:
     """Factory pour créer le service de recherche."""
-    return AtomUnitarySearch(db)
+    return AtomUnitarySearch(db, traversal_mode, max_fanout, max_results, graph_index)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -585,6 +589,7 @@ __all__ = [
     "SearchDirection",
     "SearchResult",
     "CausalChain",
+    "TraversalMode",
     "LinkType",
     "Dimension",
 ]
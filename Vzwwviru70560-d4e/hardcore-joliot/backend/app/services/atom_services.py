@@ -33,6 +33,7 @@ from app.models.atom_models import (
     AtomResourceFootprint, AtomConceptualDrift,
     AtomLogisticsNetwork, AtomHarmonicSignature
 )
+from app.services.atom_graph_index import get_atom_graph_index
 
 logger = logging.getLogger(__name__)
 
@@ -277,6 +278,8 @@ class CausalNexusService:
         await self.session.execute(stmt)
         await self.session.commit()
         
+        get_atom_graph_index().on_link_added(trigger_id, result_id, link_type, strength, confidence)
+        
         return {
             "id": str(link_id),
             "trigger_id": str(trigger_id),
@@ -0,0 +1,419 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+AT·OM GRAPH TRAVERSAL — Parcours du graphe causal par niveaux, en lot
+═══════════════════════════════════════════════════════════════════════════════
+
+Un BFS naïf fait une requête de liens par nœud de la frontière, puis une
+requête par voisin pour charger le nœud: des milliers d'aller-retours dès
+qu'un hub est touché à profondeur 3.
+
+Ce moteur développe chaque niveau d'un bloc:
+- LEVEL:     un SELECT ... WHERE trigger_id IN (frontière) pour les liens,
+             puis un seul SELECT des nœuds découverts → 2 requêtes / niveau
+- RECURSIVE: un seul WITH RECURSIVE (PostgreSQL) pour tous les niveaux,
+             puis un chargement groupé des nœuds → 2 requêtes au total
+
+Les résultats sont bornés en profondeur, en fan-out (les N liens les plus
+forts par nœud) et en nombre total, et sont produits niveau par niveau.
+
+Si un AtomGraphIndex frais couvre le nœud de départ, le parcours se fait
+en mémoire, sans requête.
+
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Iterable, Sequence, AsyncIterator, TYPE_CHECKING
+from uuid import UUID
+from enum import Enum
+import logging
+
+from sqlalchemy import select, func, text, bindparam, String
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+if TYPE_CHECKING:
+    from app.services.atom_graph_index import AtomGraphIndex
+
+logger = logging.getLogger("atom.traversal")
+
+# Taille max d'une liste IN (...): les frontières plus grandes sont découpées
+IN_CHUNK_SIZE = 5000
+
+
+class TraversalMode(str, Enum):
+    """Stratégie de parcours."""
+    LEVEL = "level"            # Une requête IN (...) par niveau
+    RECURSIVE = "recursive"    # Un WITH RECURSIVE pour tout le parcours (PostgreSQL)
+
+
+@dataclass
+class TraversalHit:
+    """Nœud atteint par un parcours, avec le lien qui y mène."""
+    node_id: UUID
+    node: Any  # ATOMNode
+    distance: int
+    path: List[UUID] = field(default_factory=list)
+    link_type: Optional[str] = None
+    link_strength: float = 1.0
+    confidence: float = 0.5
+
+
+def _chunks(items: Sequence, size: Optional[int] = None) -> Iterable[Sequence]:
+    size = size or IN_CHUNK_SIZE
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _link_columns(direction: str):
+    """(colonne source, colonne cible) selon le sens de parcours."""
+    from app.models.atom_mapping import atom_causal_links
+
+    if direction == "backward":
+        # Effet → Cause (UNITARITÉ)
+        return atom_causal_links.c.result_id, atom_causal_links.c.trigger_id
+    # Cause → Effet
+    return atom_causal_links.c.trigger_id, atom_causal_links.c.result_id
+
+
+# Parcours complet en une requête. {source}/{target} viennent de _link_columns,
+# jamais de l'appelant. Le chemin sert de garde anti-cycle; DISTINCT ON garde
+# pour chaque nœud sa plus courte distance puis son lien le plus fort.
+_RECURSIVE_WALK = """
+WITH RECURSIVE
+links AS (
+    SELECT trigger_id, result_id, link_type, strength, confidence
+    FROM atom_causal_links
+    WHERE (cardinality(:link_types) = 0 OR link_type = ANY(:link_types))
+      AND strength >= :min_strength
+),
+walk(node_id, parent_id, distance, link_type, strength, confidence, path) AS (
+    SELECT l.{target}, l.{source}, 1, l.link_type, l.strength, l.confidence,
+           ARRAY[l.{source}, l.{target}]
+    FROM (
+        SELECT * FROM links
+        WHERE {source} = :start_id
+        ORDER BY strength DESC
+        LIMIT :max_fanout
+    ) AS l
+    UNION ALL
+    SELECT l.{target}, l.{source}, w.distance + 1, l.link_type, l.strength, l.confidence,
+           w.path || l.{target}
+    FROM walk AS w
+    CROSS JOIN LATERAL (
+        SELECT * FROM links
+        WHERE {source} = w.node_id
+        ORDER BY strength DESC
+        LIMIT :max_fanout
+    ) AS l
+    WHERE w.distance < :depth
+      AND NOT l.{target} = ANY(w.path)
+)
+SELECT DISTINCT ON (node_id) node_id, distance, link_type, strength, confidence, path
+FROM walk
+ORDER BY node_id, distance, strength DESC
+"""
+
+
+class AtomGraphTraversal:
+    """
+    Moteur de parcours du graphe AT·OM.
+
+    Les requêtes sont groupées par niveau (LEVEL) ou en un seul WITH
+    RECURSIVE (RECURSIVE, PostgreSQL uniquement; repli sur LEVEL ailleurs).
+    max_fanout garde les liens les plus forts de chaque nœud, max_results
+    arrête le parcours après ce nombre de nœuds. graph_index, s'il est
+    frais, remplace la base pour les parcours.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        mode: TraversalMode = TraversalMode.LEVEL,
+        max_fanout: Optional[int] = None,
+        max_results: Optional[int] = None,
+        graph_index: Optional["AtomGraphIndex"] = None,
+    ):
+        self.db = db
+        self.mode = mode
+        self.max_fanout = max_fanout
+        self.max_results = max_results
+        self.graph_index = graph_index
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # REQUÊTES GROUPÉES
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    async def fetch_links(
+        self,
+        frontier: Iterable[UUID],
+        direction: str,
+        link_types: Optional[List[Any]] = None,
+        min_strength: float = 0.0,
+    ) -> List[Any]:
+        """
+        Liens de toute la frontière en une requête (par tranche de IN_CHUNK_SIZE).
+
+        Chaque ligne expose source_id, target_id, link_type, strength, confidence.
+        """
+        from app.models.atom_mapping import atom_causal_links
+
+        source, target = _link_columns(direction)
+        frontier = list(frontier)
+        rows = []
+
+        for chunk in _chunks(frontier):
+            stmt = select(
+                source.label("source_id"),
+                target.label("target_id"),
+                atom_causal_links.c.link_type,
+                atom_causal_links.c.strength,
+                atom_causal_links.c.confidence,
+            ).where(source.in_(chunk))
+
+            # Filtrer par type de lien
+            if link_types:
+                stmt = stmt.where(
+                    atom_causal_links.c.link_type.in_(
+                        [getattr(lt, "value", lt) for lt in link_types]
+                    )
+                )
+
+            # Filtrer par force minimale
+            if min_strength > 0:
+                stmt = stmt.where(atom_causal_links.c.strength >= min_strength)
+
+            # Fan-out: les liens les plus forts de chaque nœud seulement
+            if self.max_fanout:
+                ranked = stmt.add_columns(
+                    func.row_number().over(
+                        partition_by=source,
+                        order_by=atom_causal_links.c.strength.desc(),
+                    ).label("rank")
+                ).subquery()
+                stmt = select(
+                    ranked.c.source_id,
+                    ranked.c.target_id,
+                    ranked.c.link_type,
+                    ranked.c.strength,
+                    ranked.c.confidence,
+                ).where(ranked.c.rank <= self.max_fanout)
+
+            result = await self.db.execute(stmt)
+            rows.extend(result.all())
+
+        return rows
+
+    async def fetch_nodes(self, node_ids: Iterable[UUID]) -> Dict[UUID, Any]:
+        """Charge des nœuds en une requête: id → ATOMNode (les absents sont omis)."""
+        from app.models.atom_mapping import ATOMNode
+
+        ids = list(dict.fromkeys(node_ids))
+        nodes: Dict[UUID, Any] = {}
+
+        for chunk in _chunks(ids):
+            result = await self.db.execute(
+                select(ATOMNode).where(ATOMNode.id.in_(chunk))
+            )
+            for node in result.scalars():
+                nodes[node.id] = node
+
+        return nodes
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # PARCOURS
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    async def stream(
+        self,
+        start_id: UUID,
+        direction: str,
+        depth: int,
+        link_types: Optional[List[Any]] = None,
+        min_strength: float = 0.0,
+    ) -> AsyncIterator[List[TraversalHit]]:
+        """
+        Produit les nœuds atteints niveau par niveau (distance 1, 2, ...).
+
+        Chaque niveau est trié par force de lien décroissante; le flux
+        s'arrête à depth niveaux ou après max_results nœuds.
+        """
+        if self.uses_index(start_id):
+            levels = self._indexed_levels(start_id, direction, depth, link_types, min_strength)
+        elif self.mode == TraversalMode.RECURSIVE and self._is_postgres():
+            levels = self._recursive_levels(start_id, direction, depth, link_types, min_strength)
+        else:
+            levels = self._batched_levels(start_id, direction, depth, link_types, min_strength)
+
+        remaining = self.max_results
+        async for hits in levels:
+            hits.sort(key=lambda h: -h.link_strength)
+            if remaining is not None:
+                hits = hits[:remaining]
+                remaining -= len(hits)
+            if hits:
+                yield hits
+            if remaining is not None and remaining <= 0:
+                return
+
+    async def traverse(
+        self,
+        start_id: UUID,
+        direction: str,
+        depth: int,
+        link_types: Optional[List[Any]] = None,
+        min_strength: float = 0.0,
+    ) -> List[TraversalHit]:
+        """Tous les nœuds atteints, par distance puis par force."""
+        hits: List[TraversalHit] = []
+        async for level in self.stream(start_id, direction, depth, link_types, min_strength):
+            hits.extend(level)
+        return hits
+
+    def uses_index(self, *node_ids: UUID) -> bool:
+        """L'index en mémoire est frais et connaît tous ces nœuds."""
+        index = self.graph_index
+        if index is None or not index.is_fresh():
+            return False
+        return all(index.has_node(node_id) for node_id in node_ids)
+
+    def _is_postgres(self) -> bool:
+        try:
+            dialect = self.db.get_bind().dialect.name
+        except Exception:
+            return False
+        if dialect != "postgresql":
+            logger.debug(f"Recursive traversal needs PostgreSQL, not {dialect}: using levels")
+            return False
+        return True
+
+    async def _indexed_levels(
+        self,
+        start_id: UUID,
+        direction: str,
+        depth: int,
+        link_types: Optional[List[Any]],
+        min_strength: float,
+    ) -> AsyncIterator[List[TraversalHit]]:
+        """Parcours en mémoire: mêmes niveaux que _batched_levels, sans requête."""
+        for hits in self.graph_index.levels(
+            start_id, direction, depth, link_types, min_strength, self.max_fanout
+        ):
+            yield hits
+
+    async def _batched_levels(
+        self,
+        start_id: UUID,
+        direction: str,
+        depth: int,
+        link_types: Optional[List[Any]],
+        min_strength: float,
+    ) -> AsyncIterator[List[TraversalHit]]:
+        """BFS: une requête de liens et une requête de nœuds par niveau."""
+        visited = {start_id}
+        paths: Dict[UUID, List[UUID]] = {start_id: [start_id]}
+        frontier: List[UUID] = [start_id]
+
+        for distance in range(1, depth + 1):
+            if not frontier:
+                return
+
+            # Lien le plus fort vers chaque nouveau nœud du niveau
+            best: Dict[UUID, Any] = {}
+            for link in await self.fetch_links(frontier, direction, link_types, min_strength):
+                if link.target_id in visited:
+                    continue
+                current = best.get(link.target_id)
+                if current is None or link.strength > current.strength:
+                    best[link.target_id] = link
+
+            if not best:
+                return
+
+            nodes = await self.fetch_nodes(best)
+
+            hits = []
+            for target_id, link in best.items():
+                visited.add(target_id)
+                paths[target_id] = paths[link.source_id] + [target_id]
+
+                node = nodes.get(target_id)
+                if node is not None:
+                    hits.append(TraversalHit(
+                        node_id=target_id,
+                        node=node,
+                        distance=distance,
+                        path=paths[target_id],
+                        link_type=link.link_type,
+                        link_strength=link.strength,
+                        confidence=link.confidence,
+                    ))
+
+            frontier = list(best)
+            yield hits
+
+    async def _recursive_levels(
+        self,
+        start_id: UUID,
+        direction: str,
+        depth: int,
+        link_types: Optional[List[Any]],
+        min_strength: float,
+    ) -> AsyncIterator[List[TraversalHit]]:
+        """
+        Parcours complet en un WITH RECURSIVE, puis un chargement des nœuds.
+
+        Le CTE énumère les chemins simples: sur un graphe dense, le borner
+        avec max_fanout.
+        """
+        if depth < 1:
+            return
+
+        source, target = _link_columns(direction)
+        stmt = text(
+            _RECURSIVE_WALK.format(source=source.name, target=target.name)
+        ).bindparams(
+            bindparam("start_id", type_=PGUUID(as_uuid=True)),
+            bindparam("link_types", type_=ARRAY(String)),
+        )
+
+        result = await self.db.execute(stmt, {
+            "start_id": start_id,
+            "link_types": [getattr(lt, "value", lt) for lt in link_types or []],
+            "min_strength": min_strength,
+            "max_fanout": self.max_fanout,
+            "depth": depth,
+        })
+        rows = result.all()
+
+        nodes = await self.fetch_nodes(row.node_id for row in rows)
+
+        levels: Dict[int, List[TraversalHit]] = {}
+        for row in rows:
+            node = nodes.get(row.node_id)
+            if node is None:
+                continue
+            levels.setdefault(row.distance, []).append(TraversalHit(
+                node_id=row.node_id,
+                node=node,
+                distance=row.distance,
+                path=list(row.path),
+                link_type=row.link_type,
+                link_strength=row.strength,
+                confidence=row.confidence,
+            ))
+
+        for distance in sorted(levels):
+            yield levels[distance]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EXPORTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+__all__ = [
+    "AtomGraphTraversal",
+    "TraversalMode",
+    "TraversalHit",
+    "IN_CHUNK_SIZE",
+]
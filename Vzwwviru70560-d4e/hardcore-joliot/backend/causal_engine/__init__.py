@@ -76,9 +76,13 @@ from .core import (
     DAGManager,
     StructureLearner,
     get_dag_manager,
+    SufficientStatistics,
+    PCAlgorithm,
+    PCResult,
     # Inference
     AdjustmentSetFinder,
     CausalEffectEstimator,
+    TotalEffectMatrix,
     SensitivityAnalyzer,
     CausalEngine,
 )
@@ -86,7 +90,11 @@ from .core import (
 # Counterfactual
 from .counterfactual import (
     CounterfactualEngine,
+    ScenarioBatchEvaluator,
     ScenarioComparator,
+    scenario_grid,
+    pareto_front,
+    StreamingParetoFront,
 )
 
 # Bridge
@@ -127,14 +135,22 @@ __all__ = [
     "DAGManager",
     "StructureLearner",
     "get_dag_manager",
+    "SufficientStatistics",
+    "PCAlgorithm",
+    "PCResult",
     # Inference
     "AdjustmentSetFinder",
     "CausalEffectEstimator",
+    "TotalEffectMatrix",
     "SensitivityAnalyzer",
     "CausalEngine",
     # Counterfactual
     "CounterfactualEngine",
+    "ScenarioBatchEvaluator",
     "ScenarioComparator",
+    "scenario_grid",
+    "pareto_front",
+    "StreamingParetoFront",
     # Bridge
     "DecisionStatus",
     "DecisionRecord",
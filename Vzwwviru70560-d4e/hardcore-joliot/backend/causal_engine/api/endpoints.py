@@ -11,6 +11,7 @@ Principle: GOUVERNANCE > EXÉCUTION
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 import logging
+import math
 
 from fastapi import APIRouter, HTTPException, Depends, Header
 from pydantic import BaseModel, Field
@@ -28,13 +29,16 @@ from ..core.models import (
 )
 from ..core.dag_builder import DAGBuilder, DAGManager, get_dag_manager
 from ..core.inference import CausalEngine
-from ..counterfactual.engine import CounterfactualEngine, ScenarioComparator
+from ..counterfactual.engine import CounterfactualEngine, ScenarioComparator, scenario_grid
 from ..bridge.human_decision import HumanDecisionBridge, DecisionPackage, DecisionRecord
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/causal", tags=["Causal Engine"])
 
+# ~1s of CPU for a few-outcome DAG; larger sweeps belong in a worker job
+MAX_GRID_SCENARIOS = 200_000
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
@@ -93,6 +97,18 @@ class ScenarioCompareRequest(BaseModel):
     scenario_names: Optional[List[str]] = Field(default=None)
 
 
+class ParetoRequest(BaseModel):
+    """Request for the Pareto frontier of scenarios (explicit list or grid)"""
+    dag_id: str = Field(...)
+    outcome_nodes: List[str] = Field(...)
+    scenarios: Optional[List[Dict[str, float]]] = Field(default=None)
+    scenario_names: Optional[List[str]] = Field(default=None)
+    grid: Optional[Dict[str, List[float]]] = Field(
+        default=None, description="{node: values}, every combination is evaluated"
+    )
+    chunk_size: int = Field(default=10_000, ge=1)
+
+
 class CreateDecisionPackageRequest(BaseModel):
     """Request to create decision package"""
     dag_id: str = Field(...)
@@ -434,6 +450,48 @@ async def compare_scenarios(
     return result
 
 
+@router.post("/counterfactual/pareto")
+def pareto_frontier(
+    request: ParetoRequest,
+    tenant_id: str = Depends(get_tenant_id),
+):
+    """
+    Pareto-optimal scenarios across several outcomes.
+    
+    CPU-bound, so a plain def: FastAPI runs it in the threadpool instead
+    of blocking the event loop.
+    """
+    manager = get_dag_manager()
+    dag = manager.get(request.dag_id)
+    
+    if dag is None:
+        raise HTTPException(404, f"DAG not found: {request.dag_id}")
+    
+    comparator = ScenarioComparator(dag)
+    
+    if request.grid:
+        grid_size = math.prod(len(values) for values in request.grid.values())
+        if grid_size > MAX_GRID_SCENARIOS:
+            raise HTTPException(
+                400, f"Grid has {grid_size} scenarios (max {MAX_GRID_SCENARIOS})"
+            )
+        return comparator.stream_pareto_frontier(
+            scenario_grid(request.grid),
+            variables=list(request.grid),
+            outcome_nodes=request.outcome_nodes,
+            chunk_size=request.chunk_size,
+        )
+    
+    if not request.scenarios:
+        raise HTTPException(400, "Provide scenarios or grid")
+    
+    return comparator.pareto_frontier(
+        scenarios=request.scenarios,
+        outcome_nodes=request.outcome_nodes,
+        scenario_names=request.scenario_names,
+    )
+
+
 # ============================================================================
 # DECISION BRIDGE ENDPOINTS
 # ============================================================================
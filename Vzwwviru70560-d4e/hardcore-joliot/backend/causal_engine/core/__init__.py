@@ -28,9 +28,16 @@ from .dag_builder import (
     get_dag_manager,
 )
 
+from .structure import (
+    SufficientStatistics,
+    PCAlgorithm,
+    PCResult,
+)
+
 from .inference import (
     AdjustmentSetFinder,
     CausalEffectEstimator,
+    TotalEffectMatrix,
     SensitivityAnalyzer,
     CausalEngine,
 )
@@ -57,9 +64,14 @@ __all__ = [
     "DAGManager",
     "StructureLearner",
     "get_dag_manager",
+    # Structure learning
+    "SufficientStatistics",
+    "PCAlgorithm",
+    "PCResult",
     # Inference
     "AdjustmentSetFinder",
     "CausalEffectEstimator",
+    "TotalEffectMatrix",
     "SensitivityAnalyzer",
     "CausalEngine",
 ]
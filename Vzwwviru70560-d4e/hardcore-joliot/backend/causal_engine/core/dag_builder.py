@@ -9,7 +9,7 @@ Principle: GOUVERNANCE > EXÉCUTION
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import logging
 import hashlib
 import json
@@ -23,6 +23,14 @@ from .models import (
     ConfidenceLevel,
     ValidationStatus,
 )
+from .structure import (
+    NUMPY_AVAILABLE,
+    PCAlgorithm,
+    PCResult,
+    SufficientStatistics,
+    consistent_order,
+    regression_coefficients,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +74,11 @@ class DAGBuilder:
         self._node_name_to_id[node.name] = node.id
         return self
     
+    def add_edge(self, edge: CausalEdge) -> "DAGBuilder":
+        """Add a pre-built edge (cycle-checked)"""
+        self._dag.add_edge(edge)
+        return self
+    
     def add_slot_node(
         self,
         name: str,
@@ -417,21 +430,32 @@ class DAGManager:
 
 
 # ============================================================================
-# STRUCTURE LEARNING (MOCK)
+# STRUCTURE LEARNING
 # ============================================================================
 
 class StructureLearner:
     """
     Learn causal structure from data.
     
-    NOTE: This is a simplified mock. Production would use:
-    - CausalNex for structure learning
-    - DoWhy for causal inference
-    - PC, FCI, GES algorithms
+    Uses the PC algorithm (Fisher-z tests on partial correlations) over
+    streaming sufficient statistics, so data can arrive in chunks. Edge
+    coefficients are linear-SEM regression weights. Edges PC cannot
+    orient are oriented consistently and marked as ASSOCIATION.
+    
+    Without NumPy it falls back to pairwise correlations oriented
+    alphabetically (a mock, for review only).
     """
     
-    def __init__(self, alpha: float = 0.05):
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        max_cond_size: Optional[int] = None,
+        n_jobs: int = 1,
+    ):
         self.alpha = alpha  # Significance level
+        self.max_cond_size = max_cond_size
+        self.n_jobs = n_jobs
+        self.last_result: Optional[PCResult] = None
     
     def learn_from_data(
         self,
@@ -448,6 +472,103 @@ class StructureLearner:
         Returns:
             CausalDAG with learned structure
         """
+        if not NUMPY_AVAILABLE:
+            return self._learn_by_correlation(data, prior_edges)
+        
+        return self.learn_from_statistics(SufficientStatistics.from_columns(data), prior_edges)
+    
+    def learn_from_stream(
+        self,
+        chunks: Iterable[Dict[str, Sequence[float]]],
+        prior_edges: Optional[List[Tuple[str, str]]] = None,
+    ) -> CausalDAG:
+        """
+        Learn DAG structure from data arriving in chunks of {variable: values}.
+        
+        Only the sufficient statistics are kept, so memory does not grow
+        with the number of rows.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("Streaming structure learning requires numpy")
+        
+        stats: Optional[SufficientStatistics] = None
+        for chunk in chunks:
+            if stats is None:
+                stats = SufficientStatistics(list(chunk))
+            stats.update_columns(chunk)
+        
+        if stats is None:
+            raise ValueError("No data to learn from")
+        return self.learn_from_statistics(stats, prior_edges)
+    
+    def learn_from_statistics(
+        self,
+        stats: SufficientStatistics,
+        prior_edges: Optional[List[Tuple[str, str]]] = None,
+    ) -> CausalDAG:
+        """Learn DAG structure from precomputed sufficient statistics"""
+        prior_edges = list(prior_edges or [])
+        result = PCAlgorithm(
+            alpha=self.alpha,
+            max_cond_size=self.max_cond_size,
+            n_jobs=self.n_jobs,
+        ).fit(stats, required_edges=prior_edges)
+        self.last_result = result
+        
+        builder = DAGBuilder("Learned DAG")
+        node_ids: Dict[str, str] = {}
+        std = stats.std()
+        for k, var_name in enumerate(stats.variables):
+            node = CausalNode(
+                name=var_name,
+                description=var_name,
+                observed_value=float(stats.mean[k]) if stats.n else None,
+                mean=float(stats.mean[k]) if stats.n else None,
+                std=float(std[k]) if stats.n > 1 else None,
+            )
+            builder.add_node(node)
+            node_ids[var_name] = node.id
+        
+        # Orient what PC left undirected along one consistent order
+        rank = consistent_order(result.variables, result.undirected)
+        priors = set(prior_edges)
+        edges = [(s, t, EdgeType.CAUSAL) for s, t in result.directed]
+        edges += [
+            (a, b, EdgeType.ASSOCIATION) if rank[a] < rank[b] else (b, a, EdgeType.ASSOCIATION)
+            for a, b in result.undirected
+        ]
+        
+        parents: Dict[str, List[str]] = {v: [] for v in stats.variables}
+        for source, target, _ in edges:
+            parents[target].append(source)
+        coefficients = regression_coefficients(stats, parents)
+        
+        for source, target, edge_type in edges:
+            edge = CausalEdge(
+                source_id=node_ids[source],
+                target_id=node_ids[target],
+                edge_type=edge_type,
+                coefficient=coefficients.get((source, target)),
+                confidence=(
+                    ConfidenceLevel.STRONG if (source, target) in priors
+                    else ConfidenceLevel.HYPOTHETICAL
+                ),
+                p_value=result.p_values.get(tuple(sorted((source, target)))),
+                evidence_source="pc_algorithm",
+            )
+            try:
+                builder.add_edge(edge)
+            except ValueError:
+                logger.warning(f"Skipping learned edge {source} → {target}: would create a cycle")
+        
+        return builder.build(validate=False)  # May have issues, needs human review
+    
+    def _learn_by_correlation(
+        self,
+        data: Dict[str, List[float]],
+        prior_edges: Optional[List[Tuple[str, str]]] = None,
+    ) -> CausalDAG:
+        """Mock structure from pairwise correlations (no NumPy)"""
         builder = DAGBuilder("Learned DAG")
         
         # Add nodes for each variable
@@ -467,7 +588,6 @@ class StructureLearner:
                 )
         
         # MOCK: Add some learned edges based on correlation
-        # In production, use proper structure learning algorithms
         variables = list(data.keys())
         for i, var1 in enumerate(variables):
             for var2 in variables[i+1:]:
@@ -116,6 +116,164 @@ class AdjustmentSetFinder:
         return mediators[:1] if mediators else None
 
 
+# ============================================================================
+# TOTAL EFFECT MATRIX
+# ============================================================================
+
+DEFAULT_EDGE_COEFFICIENT = 0.5  # Assumed effect of an edge without a coefficient
+
+
+def dag_version_key(dag: CausalDAG) -> Tuple:
+    """Key that changes whenever nodes, edges or edge coefficients change"""
+    return (
+        tuple((node_id, node.name) for node_id, node in dag.nodes.items()),
+        tuple((e.source_id, e.target_id, e.coefficient) for e in dag.edges),
+    )
+
+
+class TotalEffectMatrix:
+    """
+    Total causal effect of every node on every other node, for one DAG version.
+    
+    With edge coefficients B (linear SEM), the total effect of i on j is
+    the sum over directed paths of the product of their coefficients,
+    i.e. ((I - B)^-1 - I)[i, j]. It is computed once by dynamic programming
+    in reverse topological order, O(V·E); queries are then dict lookups.
+    
+    Graphs with cycles (confounded edges skip the cycle check) fall back
+    to enumerating simple paths of at most `max_path_length` nodes,
+    memoized per (source, target).
+    """
+    
+    def __init__(
+        self,
+        dag: CausalDAG,
+        max_path_length: int = 5,
+        key: Optional[Tuple] = None,
+    ):
+        self.key = key if key is not None else dag_version_key(dag)
+        self.max_path_length = max_path_length
+        
+        self._ids_by_name: Dict[str, str] = {}
+        for node_id, node in dag.nodes.items():
+            self._ids_by_name.setdefault(node.name, node_id)
+        
+        # First edge per (source, target) gives the coefficient of every
+        # parallel edge, as a direct edge lookup would
+        self._edges: Dict[Tuple[str, str], CausalEdge] = {}
+        self._children: Dict[str, List[Tuple[str, float]]] = {n: [] for n in dag.nodes}
+        for edge in dag.edges:
+            first = self._edges.setdefault((edge.source_id, edge.target_id), edge)
+            coefficient = first.coefficient
+            if coefficient is None:
+                coefficient = DEFAULT_EDGE_COEFFICIENT
+            self._children.setdefault(edge.source_id, []).append((edge.target_id, coefficient))
+            self._children.setdefault(edge.target_id, [])
+        
+        order = self._topological_order()
+        self.acyclic = len(order) == len(self._children)
+        self._effects: Dict[str, Dict[str, float]] = {}
+        self._path_cache: Dict[Tuple[str, str], Optional[float]] = {}
+        
+        if self.acyclic:
+            for node in reversed(order):
+                row: Dict[str, float] = {}
+                for child, coefficient in self._children[node]:
+                    row[child] = row.get(child, 0.0) + coefficient
+                    for target, effect in self._effects[child].items():
+                        row[target] = row.get(target, 0.0) + coefficient * effect
+                self._effects[node] = row
+    
+    def _topological_order(self) -> List[str]:
+        """Kahn's algorithm; shorter than the node count if there is a cycle"""
+        in_degree = {n: 0 for n in self._children}
+        for children in self._children.values():
+            for child, _ in children:
+                in_degree[child] += 1
+        
+        queue = [n for n, d in in_degree.items() if d == 0]
+        for node in queue:
+            for child, _ in self._children[node]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+        return queue
+    
+    def resolve(self, name_or_id: str) -> str:
+        """Resolve node name to ID"""
+        if name_or_id in self._children:
+            return name_or_id
+        return self._ids_by_name.get(name_or_id, name_or_id)
+    
+    def edge(self, source: str, target: str) -> Optional[CausalEdge]:
+        """Direct edge between nodes (names or IDs)"""
+        return self._edges.get((self.resolve(source), self.resolve(target)))
+    
+    def total_effect(self, source: str, target: str) -> Optional[float]:
+        """Total effect of source on target, None if no directed path"""
+        source_id = self.resolve(source)
+        target_id = self.resolve(target)
+        
+        if source_id == target_id:
+            return 1.0
+        if self.acyclic:
+            return self._effects.get(source_id, {}).get(target_id)
+        
+        pair = (source_id, target_id)
+        if pair not in self._path_cache:
+            self._path_cache[pair] = self._sum_paths(source_id, target_id)
+        return self._path_cache[pair]
+    
+    def total_effects(
+        self,
+        sources: List[str],
+        targets: List[str],
+    ) -> List[List[Optional[float]]]:
+        """Total effects of each source (rows) on each target (columns)"""
+        target_ids = [self.resolve(t) for t in targets]
+        return [
+            [self.total_effect(source_id, t) for t in target_ids]
+            for source_id in (self.resolve(s) for s in sources)
+        ]
+    
+    def effects_of(self, source: str) -> Dict[str, float]:
+        """All nodes reachable from source, with their total effects"""
+        source_id = self.resolve(source)
+        if self.acyclic:
+            return dict(self._effects.get(source_id, {}))
+        
+        effects = {}
+        for target in self._children:
+            if target != source_id:
+                effect = self.total_effect(source_id, target)
+                if effect is not None:
+                    effects[target] = effect
+        return effects
+    
+    def _sum_paths(self, source: str, target: str) -> Optional[float]:
+        """Sum of coefficient products over bounded simple paths"""
+        on_path = {source}
+        total = 0.0
+        found = False
+        
+        def walk(node: str, product: float, length: int) -> None:
+            nonlocal total, found
+            if node == target:
+                total += product
+                found = True
+                return
+            if length == self.max_path_length:
+                return
+            for child, coefficient in self._children.get(node, ()):
+                if child not in on_path:
+                    on_path.add(child)
+                    walk(child, product * coefficient, length + 1)
+                    on_path.discard(child)
+        
+        walk(source, 1.0, 1)
+        return total if found else None
+
+
 # ============================================================================
 # EFFECT ESTIMATOR
 # ============================================================================
@@ -131,6 +289,14 @@ class CausalEffectEstimator:
     def __init__(self, dag: CausalDAG):
         self.dag = dag
         self.adjustment_finder = AdjustmentSetFinder(dag)
+        self._matrix: Optional[TotalEffectMatrix] = None
+    
+    def effect_matrix(self) -> TotalEffectMatrix:
+        """Total-effect matrix of the current DAG version, rebuilt after changes"""
+        key = dag_version_key(self.dag)
+        if self._matrix is None or self._matrix.key != key:
+            self._matrix = TotalEffectMatrix(self.dag, key=key)
+        return self._matrix
     
     def estimate_ate(
         self,
@@ -143,6 +309,37 @@ class CausalEffectEstimator:
         
         ATE = E[Y | do(X=1)] - E[Y | do(X=0)]
         """
+        return self._estimate_ate(self.effect_matrix(), treatment, outcome, data)
+    
+    def estimate_ate_many(
+        self,
+        treatments: List[str],
+        outcomes: List[str],
+        data: Optional[Dict[str, List[float]]] = None,
+    ) -> Dict[Tuple[str, str], CausalEffect]:
+        """
+        Estimate the ATE of every treatment on every outcome.
+        
+        The effect matrix is looked up once for the whole batch; each
+        distinct (treatment, outcome) pair is estimated once.
+        """
+        matrix = self.effect_matrix()
+        effects: Dict[Tuple[str, str], CausalEffect] = {}
+        for treatment in treatments:
+            for outcome in outcomes:
+                if (treatment, outcome) not in effects:
+                    effects[(treatment, outcome)] = self._estimate_ate(
+                        matrix, treatment, outcome, data
+                    )
+        return effects
+    
+    def _estimate_ate(
+        self,
+        matrix: TotalEffectMatrix,
+        treatment: str,
+        outcome: str,
+        data: Optional[Dict[str, List[float]]],
+    ) -> CausalEffect:
         query = CausalQuery(
             dag_id=self.dag.id,
             query_type="ate",
@@ -158,7 +355,7 @@ class CausalEffectEstimator:
             logger.warning(f"No valid adjustment set for {treatment} -> {outcome}")
         
         # Get edge coefficient if available
-        edge = self._find_edge(treatment, outcome)
+        edge = matrix.edge(treatment, outcome)
         
         if edge and edge.coefficient is not None:
             # Use edge coefficient as effect estimate
@@ -166,7 +363,7 @@ class CausalEffectEstimator:
             std_error = abs(ate) * 0.1  # Mock: 10% standard error
         else:
             # Mock estimation from data
-            ate = self._mock_estimate(treatment, outcome, data)
+            ate = self._mock_estimate(treatment, outcome, data, matrix)
             std_error = abs(ate) * 0.2  # Higher uncertainty
         
         # Confidence interval (mock: 95% CI)
@@ -229,34 +426,23 @@ class CausalEffectEstimator:
     
     def _find_edge(self, source: str, target: str) -> Optional[CausalEdge]:
         """Find direct edge between nodes"""
-        source_id = self._resolve_id(source)
-        target_id = self._resolve_id(target)
-        
-        for edge in self.dag.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
-                return edge
-        return None
+        return self.effect_matrix().edge(source, target)
     
     def _resolve_id(self, name_or_id: str) -> str:
         """Resolve node name to ID"""
-        if name_or_id in self.dag.nodes:
-            return name_or_id
-        
-        for node_id, node in self.dag.nodes.items():
-            if node.name == name_or_id:
-                return node_id
-        
-        return name_or_id
+        return self.effect_matrix().resolve(name_or_id)
     
     def _mock_estimate(
         self,
         treatment: str,
         outcome: str,
         data: Optional[Dict[str, List[float]]],
+        matrix: Optional[TotalEffectMatrix] = None,
     ) -> float:
         """Mock ATE estimation when no edge coefficient"""
         # Use path analysis
-        path_coeff = self._compute_path_coefficient(treatment, outcome)
+        matrix = matrix or self.effect_matrix()
+        path_coeff = matrix.total_effect(treatment, outcome)
         if path_coeff is not None:
             return path_coeff
         
@@ -265,55 +451,7 @@ class CausalEffectEstimator:
     
     def _compute_path_coefficient(self, source: str, target: str) -> Optional[float]:
         """Compute total effect via all directed paths"""
-        source_id = self._resolve_id(source)
-        target_id = self._resolve_id(target)
-        
-        # BFS to find all paths
-        paths = self._find_all_paths(source_id, target_id)
-        
-        if not paths:
-            return None
-        
-        # Sum product of coefficients along each path
-        total_effect = 0.0
-        for path in paths:
-            path_coeff = 1.0
-            for i in range(len(path) - 1):
-                edge = self._find_edge(path[i], path[i + 1])
-                if edge and edge.coefficient is not None:
-                    path_coeff *= edge.coefficient
-                else:
-                    path_coeff *= 0.5  # Default assumption
-            total_effect += path_coeff
-        
-        return total_effect
-    
-    def _find_all_paths(
-        self,
-        source: str,
-        target: str,
-        max_length: int = 5,
-    ) -> List[List[str]]:
-        """Find all directed paths from source to target"""
-        paths = []
-        stack = [(source, [source])]
-        
-        while stack:
-            node, path = stack.pop()
-            
-            if len(path) > max_length:
-                continue
-            
-            if node == target:
-                paths.append(path)
-                continue
-            
-            children = self.dag.get_children(node)
-            for child in children:
-                if child not in path:  # Avoid cycles
-                    stack.append((child, path + [child]))
-        
-        return paths
+        return self.effect_matrix().total_effect(source, target)
     
     def _mock_p_value(self, effect: float, std_error: float) -> float:
         """Mock p-value calculation"""
@@ -0,0 +1,445 @@
+"""
+============================================================================
+CHE·NU™ V69 — CAUSAL STRUCTURE LEARNING
+============================================================================
+Version: 1.0.0
+Purpose: PC algorithm over streaming sufficient statistics
+Principle: GOUVERNANCE > EXÉCUTION - Learned structure is a proposal for review
+============================================================================
+
+Gaussian conditional-independence tests only need the sample size and the
+covariance matrix, so data is reduced to SufficientStatistics (count,
+means, centered cross-products) chunk by chunk: a million rows never have
+to be in memory at once.
+
+PCAlgorithm runs the order-independent ("stable") PC algorithm with
+Fisher-z tests on partial correlations:
+- level 0 is one vectorized pass over the correlation matrix
+- level 1 tests all candidate conditioning variables of an edge at once
+- higher levels invert the conditioning submatrix per test; the edges of
+  one level are independent and can be tested on a thread pool
+Edges are then oriented by v-structures and Meek's rules (CPDAG).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import combinations, islice
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+import math
+
+try:
+    import numpy as np
+except ImportError:  # Structure learning needs NumPy; callers fall back
+    np = None
+
+
+NUMPY_AVAILABLE = np is not None
+
+_R_LIMIT = 1.0 - 1e-12
+_BATCH_SETS = 256  # Conditioning sets tested per vectorized batch
+
+
+# ============================================================================
+# SUFFICIENT STATISTICS
+# ============================================================================
+
+class SufficientStatistics:
+    """
+    Count, means and centered cross-product matrix of a data stream.
+
+    Chunks are merged with the pairwise (Chan et al.) update, which stays
+    numerically stable for long streams.
+    """
+
+    def __init__(self, variables: Sequence[str]):
+        if np is None:
+            raise RuntimeError("SufficientStatistics requires numpy")
+        self.variables = list(variables)
+        width = len(self.variables)
+        self.n = 0
+        self.mean = np.zeros(width)
+        self.m2 = np.zeros((width, width))
+
+    @classmethod
+    def from_columns(cls, data: Dict[str, Sequence[float]]) -> "SufficientStatistics":
+        stats = cls(list(data))
+        stats.update_columns(data)
+        return stats
+
+    def update_columns(self, chunk: Dict[str, Sequence[float]]) -> None:
+        """Add a chunk given as {variable: values}"""
+        missing = [v for v in self.variables if v not in chunk]
+        if missing:
+            raise ValueError(f"Chunk is missing variables: {missing}")
+        lengths = {len(chunk[v]) for v in self.variables}
+        if len(lengths) > 1:
+            raise ValueError("All variables need the same number of samples")
+        self.update(np.column_stack([np.asarray(chunk[v], dtype=float) for v in self.variables]))
+
+    def update(self, rows) -> None:
+        """Add a chunk given as a (samples × variables) array"""
+        x = np.asarray(rows, dtype=float)
+        if x.ndim != 2 or x.shape[1] != len(self.variables):
+            raise ValueError(f"Chunk must have shape (n, {len(self.variables)})")
+        count = x.shape[0]
+        if count == 0:
+            return
+
+        mean = x.mean(axis=0)
+        centered = x - mean
+        m2 = centered.T @ centered
+
+        if self.n == 0:
+            self.n, self.mean, self.m2 = count, mean, m2
+            return
+
+        total = self.n + count
+        delta = mean - self.mean
+        self.m2 = self.m2 + m2 + np.outer(delta, delta) * (self.n * count / total)
+        self.mean = self.mean + delta * (count / total)
+        self.n = total
+
+    def covariance(self):
+        if self.n < 2:
+            return np.zeros_like(self.m2)
+        return self.m2 / (self.n - 1)
+
+    def std(self):
+        return np.sqrt(np.clip(np.diag(self.covariance()), 0.0, None))
+
+    def correlation(self):
+        """Correlation matrix; constant variables are uncorrelated with all others"""
+        cov = self.covariance()
+        std = self.std()
+        scale = np.where(std > 0, std, 1.0)
+        corr = cov / np.outer(scale, scale)
+        corr[std == 0, :] = 0.0
+        corr[:, std == 0] = 0.0
+        np.fill_diagonal(corr, 1.0)
+        return np.clip(corr, -1.0, 1.0)
+
+
+# ============================================================================
+# FISHER-Z TESTS
+# ============================================================================
+
+def fisher_z_pvalue(r, n: int, conditioning_size: int):
+    """Two-sided p-value of H0: (partial) correlation r == 0"""
+    dof = n - conditioning_size - 3
+    r = np.clip(np.asarray(r, dtype=float), -_R_LIMIT, _R_LIMIT)
+    if dof <= 0:
+        return np.ones_like(r)
+    z = np.abs(np.arctanh(r)) * math.sqrt(dof)
+    return _erfc(z / math.sqrt(2.0))
+
+
+def _erfc(x):
+    values = np.asarray(x, dtype=float)
+    return np.vectorize(math.erfc, otypes=[float])(values) if values.ndim else math.erfc(float(values))
+
+
+def partial_correlations(corr, i: int, j: int, conditioning_sets):
+    """Partial correlations of i and j given each row of an (m × k) index array"""
+    m = conditioning_sets.shape[0]
+    index = np.column_stack([np.full(m, i), np.full(m, j), conditioning_sets])
+    blocks = corr[index[:, :, None], index[:, None, :]]
+    try:
+        precision = np.linalg.inv(blocks)
+    except np.linalg.LinAlgError:
+        precision = np.linalg.pinv(blocks)
+    denominator = np.sqrt(np.abs(precision[:, 0, 0] * precision[:, 1, 1]))
+    safe = np.where(denominator > 0, denominator, 1.0)
+    return np.where(denominator > 0, -precision[:, 0, 1] / safe, 0.0)
+
+
+# ============================================================================
+# PC ALGORITHM
+# ============================================================================
+
+@dataclass
+class PCResult:
+    """Learned CPDAG; unordered pairs are listed in variable order"""
+    variables: List[str]
+    directed: List[Tuple[str, str]] = field(default_factory=list)
+    undirected: List[Tuple[str, str]] = field(default_factory=list)
+    separating_sets: Dict[Tuple[str, str], Tuple[str, ...]] = field(default_factory=dict)
+    p_values: Dict[Tuple[str, str], float] = field(default_factory=dict)  # max p of kept edges
+    tests: int = 0
+
+
+class PCAlgorithm:
+    """
+    Stable PC algorithm with Fisher-z tests.
+
+    Args:
+        alpha: Significance level; an edge is removed when a test cannot
+            reject independence at this level
+        max_cond_size: Largest conditioning set tried (None = no limit)
+        n_jobs: Threads testing the edges of one level in parallel
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        max_cond_size: Optional[int] = None,
+        n_jobs: int = 1,
+    ):
+        if np is None:
+            raise RuntimeError("PCAlgorithm requires numpy")
+        self.alpha = alpha
+        self.max_cond_size = max_cond_size
+        self.n_jobs = n_jobs
+
+    def fit(
+        self,
+        stats: SufficientStatistics,
+        required_edges: Iterable[Tuple[str, str]] = (),
+    ) -> PCResult:
+        """
+        Learn a CPDAG from sufficient statistics.
+
+        `required_edges` (source, target) are background knowledge: never
+        removed, and oriented as given.
+        """
+        names = stats.variables
+        position = {name: k for k, name in enumerate(names)}
+        required = [(position[s], position[t]) for s, t in required_edges]
+
+        skeleton = self._skeleton(stats.correlation(), stats.n, required)
+        adjacency, sepsets, p_values, tests = skeleton
+        directed, undirected = self._orient(adjacency, sepsets, required)
+
+        def pair_names(pair: Tuple[int, int]) -> Tuple[str, str]:
+            return names[pair[0]], names[pair[1]]
+
+        return PCResult(
+            variables=list(names),
+            directed=sorted(pair_names(p) for p in directed),
+            undirected=sorted(pair_names(tuple(sorted(p))) for p in undirected),
+            separating_sets={
+                pair_names(tuple(sorted(p))): tuple(names[k] for k in s)
+                for p, s in sepsets.items()
+            },
+            p_values={pair_names(tuple(sorted(p))): v for p, v in p_values.items()},
+            tests=tests,
+        )
+
+    # ------------------------------------------------------------------------
+    # Skeleton
+    # ------------------------------------------------------------------------
+
+    def _skeleton(self, corr, n: int, required: List[Tuple[int, int]]):
+        width = corr.shape[0]
+        keep = {frozenset(p) for p in required}
+        sepsets: Dict[FrozenSet[int], Tuple[int, ...]] = {}
+        p_max: Dict[FrozenSet[int], float] = {}
+
+        # Level 0: every pair in one pass
+        p_matrix = fisher_z_pvalue(corr, n, 0)
+        tests = width * (width - 1) // 2
+        adjacency: Dict[int, Set[int]] = {i: set() for i in range(width)}
+        for i in range(width):
+            for j in range(i + 1, width):
+                pair = frozenset((i, j))
+                if p_matrix[i, j] <= self.alpha or pair in keep:
+                    adjacency[i].add(j)
+                    adjacency[j].add(i)
+                    p_max[pair] = float(p_matrix[i, j])
+                else:
+                    sepsets[pair] = ()
+
+        level = 1
+        executor = ThreadPoolExecutor(self.n_jobs) if self.n_jobs > 1 else None
+        try:
+            while self.max_cond_size is None or level <= self.max_cond_size:
+                # Stable PC: conditioning sets come from this level's snapshot
+                snapshot = {i: frozenset(adj) for i, adj in adjacency.items()}
+                edges = [
+                    (i, j) for i in range(width) for j in snapshot[i]
+                    if i < j and frozenset((i, j)) not in keep
+                    and (len(snapshot[i]) > level or len(snapshot[j]) > level)
+                ]
+                if not edges:
+                    break
+
+                def test(edge):
+                    return self._test_edge(corr, n, edge, snapshot, level)
+
+                outcomes = executor.map(test, edges) if executor else map(test, edges)
+                for (i, j), (p_value, separator, count) in zip(edges, outcomes):
+                    tests += count
+                    pair = frozenset((i, j))
+                    if separator is None:
+                        p_max[pair] = max(p_max[pair], p_value)
+                    else:
+                        adjacency[i].discard(j)
+                        adjacency[j].discard(i)
+                        sepsets[pair] = separator
+                        del p_max[pair]
+                level += 1
+        finally:
+            if executor:
+                executor.shutdown()
+
+        return adjacency, sepsets, p_max, tests
+
+    def _test_edge(self, corr, n: int, edge: Tuple[int, int], snapshot, level: int):
+        """(max p-value, separating set or None, tests run) for one edge at one level"""
+        i, j = edge
+        best_p = 0.0
+        count = 0
+
+        if level == 1:
+            # r_ij.k for every candidate k at once
+            candidates = np.array(sorted((snapshot[i] | snapshot[j]) - {i, j}), dtype=int)
+            if not len(candidates):
+                return best_p, None, 0
+            r_ik = corr[i, candidates]
+            r_jk = corr[j, candidates]
+            denominator = np.sqrt(np.clip((1 - r_ik ** 2) * (1 - r_jk ** 2), 1e-300, None))
+            p_values = np.atleast_1d(fisher_z_pvalue((corr[i, j] - r_ik * r_jk) / denominator, n, 1))
+            best = int(np.argmax(p_values))
+            best_p = float(p_values[best])
+            if best_p > self.alpha:
+                return best_p, (int(candidates[best]),), len(candidates)
+            return best_p, None, len(candidates)
+
+        def separators() -> Iterator[Tuple[int, ...]]:
+            yield from combinations(sorted(snapshot[i] - {j}), level)
+            for separator in combinations(sorted(snapshot[j] - {i}), level):
+                if not set(separator) <= snapshot[i]:
+                    yield separator
+
+        # Test conditioning sets in batches; the first separating set wins
+        candidates = separators()
+        while True:
+            batch = list(islice(candidates, _BATCH_SETS))
+            if not batch:
+                return best_p, None, count
+            count += len(batch)
+            r = partial_correlations(corr, i, j, np.array(batch, dtype=int))
+            p_values = np.atleast_1d(fisher_z_pvalue(r, n, level))
+            separating = np.flatnonzero(p_values > self.alpha)
+            if len(separating):
+                first = int(separating[0])
+                return float(p_values[first]), batch[first], count
+            best_p = max(best_p, float(p_values.max()))
+
+    # ------------------------------------------------------------------------
+    # Orientation
+    # ------------------------------------------------------------------------
+
+    def _orient(self, adjacency, sepsets, required):
+        undirected: Set[FrozenSet[int]] = {
+            frozenset((i, j)) for i, adj in adjacency.items() for j in adj
+        }
+        directed: Set[Tuple[int, int]] = set()
+
+        def orient(a: int, b: int) -> bool:
+            pair = frozenset((a, b))
+            if pair not in undirected:
+                return False
+            undirected.discard(pair)
+            directed.add((a, b))
+            return True
+
+        def adjacent(a: int, b: int) -> bool:
+            return b in adjacency[a]
+
+        for source, target in required:
+            orient(source, target)
+
+        # V-structures: i → k ← j when i, j are separated without k
+        for k in sorted(adjacency):
+            for i, j in combinations(sorted(adjacency[k]), 2):
+                if adjacent(i, j):
+                    continue
+                if k in sepsets.get(frozenset((i, j)), ()):
+                    continue
+                if (k, i) not in directed and (k, j) not in directed:
+                    orient(i, k)
+                    orient(j, k)
+
+        # Meek rules R1-R3 until nothing changes
+        changed = True
+        while changed:
+            changed = False
+            for pair in sorted(undirected, key=sorted):
+                a, b = sorted(pair)
+                for x, y in ((a, b), (b, a)):
+                    if frozenset((x, y)) in undirected and self._meek(x, y, adjacency, directed, undirected):
+                        changed |= orient(x, y)
+
+        return directed, undirected
+
+    @staticmethod
+    def _meek(x: int, y: int, adjacency, directed, undirected) -> bool:
+        """Whether Meek's rules force x - y to become x → y"""
+        parents_x = [w for w in adjacency[x] if (w, x) in directed]
+        # R1: w → x - y, w and y not adjacent
+        if any(y not in adjacency[w] for w in parents_x if w != y):
+            return True
+        # R2: x → w → y
+        if any((x, w) in directed and (w, y) in directed for w in adjacency[x]):
+            return True
+        # R3: x - c → y, x - d → y, c and d not adjacent
+        sources = [
+            w for w in adjacency[x]
+            if frozenset((x, w)) in undirected and (w, y) in directed
+        ]
+        return any(d not in adjacency[c] for c, d in combinations(sources, 2))
+
+
+def consistent_order(variables: Sequence[str], undirected: Iterable[Tuple[str, str]]) -> Dict[str, int]:
+    """
+    Rank for orienting the undirected CPDAG edges (earlier → later).
+
+    Maximum cardinality search over the undirected part: its visit order
+    orients chordal chain components without new v-structures or cycles.
+    """
+    neighbours: Dict[str, Set[str]] = {v: set() for v in variables}
+    for a, b in undirected:
+        neighbours[a].add(b)
+        neighbours[b].add(a)
+
+    weight = {v: 0 for v in variables}
+    rank: Dict[str, int] = {}
+    remaining = list(variables)
+    while remaining:
+        node = max(remaining, key=lambda v: weight[v])
+        remaining.remove(node)
+        rank[node] = len(rank)
+        for other in neighbours[node]:
+            if other not in rank:
+                weight[other] += 1
+    return rank
+
+
+def regression_coefficients(
+    stats: SufficientStatistics,
+    parents: Dict[str, List[str]],
+) -> Dict[Tuple[str, str], float]:
+    """Linear-SEM coefficient of each parent → child edge (OLS from covariances)"""
+    cov = stats.covariance()
+    position = {name: k for k, name in enumerate(stats.variables)}
+    coefficients = {}
+    for child, child_parents in parents.items():
+        if not child_parents:
+            continue
+        p = [position[name] for name in child_parents]
+        beta = np.linalg.lstsq(cov[np.ix_(p, p)], cov[p, position[child]], rcond=None)[0]
+        for name, value in zip(child_parents, beta):
+            coefficients[(name, child)] = float(value)
+    return coefficients
+
+
+__all__ = [
+    "NUMPY_AVAILABLE",
+    "SufficientStatistics",
+    "fisher_z_pvalue",
+    "partial_correlations",
+    "PCResult",
+    "PCAlgorithm",
+    "consistent_order",
+    "regression_coefficients",
+]
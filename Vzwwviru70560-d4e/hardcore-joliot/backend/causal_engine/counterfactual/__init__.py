@@ -4,10 +4,23 @@ CHE·NU™ V69 — Counterfactual Analysis
 
 from .engine import (
     CounterfactualEngine,
+    ScenarioBatchEvaluator,
     ScenarioComparator,
+    scenario_grid,
+)
+
+from .pareto import (
+    dominates,
+    pareto_front,
+    StreamingParetoFront,
 )
 
 __all__ = [
     "CounterfactualEngine",
+    "ScenarioBatchEvaluator",
     "ScenarioComparator",
+    "scenario_grid",
+    "dominates",
+    "pareto_front",
+    "StreamingParetoFront",
 ]
@@ -9,10 +9,16 @@ Principle: Test impossible scenarios safely - SYNTHETIC ONLY
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice, product
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 import logging
 import math
 
+try:
+    import numpy as np
+except ImportError:  # Batch evaluation falls back to Python loops
+    np = None
+
 from ..core.models import (
     CausalDAG,
     CausalNode,
@@ -25,6 +31,7 @@ from ..core.models import (
     NodeType,
 )
 from ..core.inference import CausalEffectEstimator
+from .pareto import StreamingParetoFront, pareto_front
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +63,7 @@ class CounterfactualEngine:
         outcome_node: str,
         factual_value: Optional[float] = None,
         baseline_intervention_value: Optional[float] = None,
+        effect: Optional[CausalEffect] = None,
     ) -> CounterfactualResult:
         """
         Answer: "What if [node] had been [value]?"
@@ -66,6 +74,7 @@ class CounterfactualEngine:
             outcome_node: Outcome to evaluate
             factual_value: Actual observed outcome
             baseline_intervention_value: Actual intervention value (for comparison)
+            effect: Precomputed causal effect of intervention_node on outcome_node
         """
         query = CausalQuery(
             dag_id=self.dag.id,
@@ -93,7 +102,8 @@ class CounterfactualEngine:
         delta_intervention = intervention_value - baseline_intervention_value
         
         # Estimate causal effect
-        effect = self.estimator.estimate_ate(intervention_node, outcome_node)
+        if effect is None:
+            effect = self.estimator.estimate_ate(intervention_node, outcome_node)
         
         # Calculate counterfactual outcome
         # Y_cf = Y_factual + ATE * delta_intervention
@@ -166,6 +176,7 @@ class CounterfactualEngine:
         base_scenario: Dict[str, float],
         alternative_scenario: Dict[str, float],
         outcome_node: str,
+        effects: Optional[Dict[str, CausalEffect]] = None,
     ) -> Dict[str, CounterfactualResult]:
         """
         Compare two intervention scenarios.
@@ -174,9 +185,22 @@ class CounterfactualEngine:
             base_scenario: {node_name: value} for base case
             alternative_scenario: {node_name: value} for alternative
             outcome_node: Outcome to compare
+            effects: Precomputed {node_name: effect on outcome_node}
         """
         results = {}
         
+        if effects is None:
+            changed = [
+                node_name for node_name, value in alternative_scenario.items()
+                if node_name in base_scenario and base_scenario[node_name] != value
+            ]
+            effects = {
+                treatment: effect
+                for (treatment, _), effect in self.estimator.estimate_ate_many(
+                    changed, [outcome_node]
+                ).items()
+            }
+        
         for node_name in alternative_scenario:
             if node_name not in base_scenario:
                 continue
@@ -192,12 +216,56 @@ class CounterfactualEngine:
                 intervention_value=alt_value,
                 outcome_node=outcome_node,
                 baseline_intervention_value=base_value,
+                effect=effects.get(node_name),
             )
             
             results[node_name] = result
         
         return results
     
+    def batch_evaluator(
+        self,
+        variables: List[str],
+        outcome_nodes: List[str],
+        baseline: Optional[Dict[str, float]] = None,
+    ) -> "ScenarioBatchEvaluator":
+        """
+        Evaluator for scenario matrices over `variables`.
+        
+        Args:
+            variables: Intervened nodes, one matrix column each
+            outcome_nodes: Outcomes to predict
+            baseline: Factual values of variables (default: observed values)
+        """
+        baseline = baseline or {}
+        return ScenarioBatchEvaluator(
+            variables=variables,
+            outcome_nodes=outcome_nodes,
+            effects=self.estimator.estimate_ate_many(variables, outcome_nodes),
+            baseline_inputs=[
+                baseline[v] if v in baseline else self._get_node(v).observed_value or 0
+                for v in variables
+            ],
+            baseline_outcomes=[
+                self._get_node(o).observed_value or 0 for o in outcome_nodes
+            ],
+        )
+    
+    def evaluate_scenarios(
+        self,
+        scenarios: Sequence[Sequence[float]],
+        variables: List[str],
+        outcome_nodes: List[str],
+        baseline: Optional[Dict[str, float]] = None,
+    ) -> List[List[float]]:
+        """
+        What-if for many scenarios at once.
+        
+        Row i of `scenarios` sets variables[j] to scenarios[i][j]; row i of
+        the result holds the predicted value of each outcome node.
+        """
+        return self.batch_evaluator(variables, outcome_nodes, baseline).evaluate(scenarios)
+    
     def analyze_past_decision(
         self,
         decision_node: str,
@@ -347,6 +415,79 @@ class CounterfactualEngine:
         )
 
 
+# ============================================================================
+# BATCH SCENARIO EVALUATION
+# ============================================================================
+
+class ScenarioBatchEvaluator:
+    """
+    Linear what-if over a matrix of scenarios.
+    
+    Uses the what_if formula for every outcome k of every row:
+        outcome_k = observed_k + Σ_j ATE(variable_j, outcome_k) · (value_j − baseline_j)
+    i.e. one matrix product per batch. Effects are estimated once per
+    (variable, outcome) pair, when the evaluator is built.
+    """
+    
+    def __init__(
+        self,
+        variables: List[str],
+        outcome_nodes: List[str],
+        effects: Dict[Tuple[str, str], CausalEffect],
+        baseline_inputs: List[float],
+        baseline_outcomes: List[float],
+    ):
+        self.variables = list(variables)
+        self.outcome_nodes = list(outcome_nodes)
+        self.effects = [
+            [effects[(v, o)].ate or 0 for o in self.outcome_nodes]
+            for v in self.variables
+        ]
+        self.baseline_inputs = list(baseline_inputs)
+        self.baseline_outcomes = list(baseline_outcomes)
+        self._columns = {v: j for j, v in enumerate(self.variables)}
+    
+    def row(self, scenario: Dict[str, float]) -> List[float]:
+        """Scenario dict as a matrix row; variables it leaves out stay at baseline"""
+        unknown = [v for v in scenario if v not in self._columns]
+        if unknown:
+            raise ValueError(f"Variables not in batch: {unknown}")
+        return [
+            scenario.get(v, base)
+            for v, base in zip(self.variables, self.baseline_inputs)
+        ]
+    
+    def evaluate(self, scenarios: Sequence[Sequence[float]]) -> List[List[float]]:
+        """Predicted outcomes, one row per scenario row"""
+        width = len(self.variables)
+        
+        if np is not None:
+            matrix = np.asarray(scenarios, dtype=float)
+            if matrix.size == 0:
+                matrix = matrix.reshape(-1, width)
+            if matrix.ndim != 2 or matrix.shape[1] != width:
+                raise ValueError(f"Scenario rows must have {width} values")
+            effects = np.asarray(self.effects, dtype=float).reshape(width, len(self.outcome_nodes))
+            outcomes = (matrix - self.baseline_inputs) @ effects + self.baseline_outcomes
+            return outcomes.tolist()
+        
+        results = []
+        for row in scenarios:
+            if len(row) != width:
+                raise ValueError(f"Scenario rows must have {width} values")
+            deltas = [v - b for v, b in zip(row, self.baseline_inputs)]
+            results.append([
+                base + sum(d * self.effects[j][k] for j, d in enumerate(deltas))
+                for k, base in enumerate(self.baseline_outcomes)
+            ])
+        return results
+
+
+def scenario_grid(axes: Dict[str, Sequence[float]]) -> Iterator[Tuple[float, ...]]:
+    """Every combination of axis values, as rows ordered like axes' keys"""
+    return product(*axes.values())
+
+
 # ============================================================================
 # SCENARIO COMPARATOR
 # ============================================================================
@@ -380,6 +521,18 @@ class ScenarioComparator:
         results = []
         base_scenario = scenarios[0]
         
+        # One effect estimate per variable, shared by all scenarios
+        variables = list(dict.fromkeys(
+            node_name for scenario in scenarios[1:] for node_name in scenario
+            if node_name in base_scenario
+        ))
+        effects = {
+            treatment: effect
+            for (treatment, _), effect in self.cf_engine.estimator.estimate_ate_many(
+                variables, [outcome_node]
+            ).items()
+        }
+        
         for i, scenario in enumerate(scenarios):
             if i == 0:
                 # Base scenario
@@ -396,6 +549,7 @@ class ScenarioComparator:
                     base_scenario,
                     scenario,
                     outcome_node,
+                    effects=effects,
                 )
                 
                 # Sum all effects
@@ -463,51 +617,22 @@ class ScenarioComparator:
         if scenario_names is None:
             scenario_names = [f"Scenario {i+1}" for i in range(len(scenarios))]
         
-        # Evaluate all scenarios on all outcomes
-        evaluated = []
-        for i, scenario in enumerate(scenarios):
-            outcomes = {}
-            for out_node in outcome_nodes:
-                # Get base value and apply scenario
-                node = self._get_node(out_node)
-                outcomes[out_node] = node.observed_value or 0
-                
-                # Apply causal effects from scenario changes
-                for var, val in scenario.items():
-                    effect = self.cf_engine.estimator.estimate_ate(var, out_node)
-                    var_node = self._get_node(var)
-                    delta = val - (var_node.observed_value or 0)
-                    outcomes[out_node] += (effect.ate or 0) * delta
-            
-            evaluated.append({
+        # Evaluate all scenarios on all outcomes in one batch
+        variables = list(dict.fromkeys(var for scenario in scenarios for var in scenario))
+        evaluator = self.cf_engine.batch_evaluator(variables, outcome_nodes)
+        outcome_rows = evaluator.evaluate([evaluator.row(s) for s in scenarios])
+        
+        evaluated = [
+            {
                 "name": scenario_names[i],
                 "scenario": scenario,
-                "outcomes": outcomes,
-            })
+                "outcomes": dict(zip(outcome_nodes, outcome_rows[i])),
+            }
+            for i, scenario in enumerate(scenarios)
+        ]
         
         # Find Pareto frontier
-        pareto_optimal = []
-        for i, eval_i in enumerate(evaluated):
-            is_dominated = False
-            for j, eval_j in enumerate(evaluated):
-                if i == j:
-                    continue
-                
-                # Check if j dominates i (j is better on ALL outcomes)
-                j_dominates = all(
-                    eval_j["outcomes"][o] >= eval_i["outcomes"][o]
-                    for o in outcome_nodes
-                ) and any(
-                    eval_j["outcomes"][o] > eval_i["outcomes"][o]
-                    for o in outcome_nodes
-                )
-                
-                if j_dominates:
-                    is_dominated = True
-                    break
-            
-            if not is_dominated:
-                pareto_optimal.append(eval_i)
+        pareto_optimal = [evaluated[i] for i in pareto_front(outcome_rows)]
         
         return {
             "outcomes_evaluated": outcome_nodes,
@@ -517,3 +642,48 @@ class ScenarioComparator:
             "all_evaluated": evaluated,
             "synthetic": True,
         }
+    
+    def stream_pareto_frontier(
+        self,
+        scenarios: Iterable[Sequence[float]],
+        variables: List[str],
+        outcome_nodes: List[str],
+        chunk_size: int = 10_000,
+    ) -> Dict[str, Any]:
+        """
+        Pareto frontier of a scenario stream too large to hold at once,
+        e.g. scenario_grid() over several variables.
+        
+        Rows (values of `variables`) are evaluated chunk by chunk and
+        folded into a running frontier; only frontier rows are kept.
+        """
+        evaluator = self.cf_engine.batch_evaluator(variables, outcome_nodes)
+        front = StreamingParetoFront()
+        rows = iter(scenarios)
+        
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            start = front.seen
+            front.add(
+                evaluator.evaluate(chunk),
+                [(start + i, row) for i, row in enumerate(chunk)],
+            )
+        
+        pareto_optimal = [
+            {
+                "index": index,
+                "scenario": dict(zip(variables, row)),
+                "outcomes": dict(zip(outcome_nodes, point)),
+            }
+            for (index, row), point in front.items()
+        ]
+        
+        return {
+            "outcomes_evaluated": outcome_nodes,
+            "total_scenarios": front.seen,
+            "pareto_optimal_count": len(pareto_optimal),
+            "pareto_optimal": pareto_optimal,
+            "synthetic": True,
+        }
@@ -0,0 +1,179 @@
+"""
+============================================================================
+CHE·NU™ V69 — PARETO FRONTIER
+============================================================================
+Version: 1.0.0
+Purpose: Skyline (Pareto frontier) of scenario outcomes, batch and streaming
+Principle: Show every defensible option - humans pick among them
+============================================================================
+
+All objectives are maximized. A point dominates another when it is at
+least as good on every objective and strictly better on one; identical
+points never dominate each other, so both are kept.
+
+- 2 objectives: sort + sweep, O(n log n)
+- 3 objectives: sort on the first objective, staircase of the other two,
+  O(n log n) searches
+- k objectives: sort-filter-skyline, points sorted by decreasing sum so
+  a point is only compared against the frontier found so far
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+
+Point = Sequence[float]
+
+
+def dominates(a: Point, b: Point) -> bool:
+    """True if a is at least as good as b everywhere and better somewhere"""
+    better = False
+    for x, y in zip(a, b):
+        if x < y:
+            return False
+        if x > y:
+            better = True
+    return better
+
+
+def pareto_front(points: Sequence[Point]) -> List[int]:
+    """Indices (ascending) of the points no other point dominates"""
+    n = len(points)
+    if n == 0:
+        return []
+
+    k = len(points[0])
+    if k == 0:
+        return list(range(n))
+    if k == 1:
+        best = max(p[0] for p in points)
+        return [i for i, p in enumerate(points) if p[0] == best]
+    if k == 2:
+        return sorted(_front_2d(points, range(n), 0, 1))
+    if k == 3:
+        return _front_3d(points)
+    return _front_sweep(points)
+
+
+def _groups(points: Sequence[Point], order: List[int], dim: int) -> Iterable[List[int]]:
+    """Runs of `order` sharing the same value on `dim`"""
+    start = 0
+    while start < len(order):
+        value = points[order[start]][dim]
+        end = start + 1
+        while end < len(order) and points[order[end]][dim] == value:
+            end += 1
+        yield order[start:end]
+        start = end
+
+
+def _front_2d(points: Sequence[Point], indices: Iterable[int], a: int, b: int) -> List[int]:
+    """Frontier of `indices` on dimensions (a, b)"""
+    order = sorted(indices, key=lambda i: (-points[i][a], -points[i][b]))
+    front = []
+    best = float("-inf")
+
+    for group in _groups(points, order, a):
+        # Sorted by b descending inside the group: its head holds the max
+        top = points[group[0]][b]
+        if top > best:
+            for i in group:
+                if points[i][b] != top:
+                    break
+                front.append(i)
+            best = top
+
+    return front
+
+
+def _front_3d(points: Sequence[Point]) -> List[int]:
+    """Frontier on three dimensions"""
+    order = sorted(range(len(points)), key=lambda i: -points[i][0])
+    # 2D frontier of (y, z) over points with a strictly larger x:
+    # y ascending, z strictly descending
+    stair_y: List[float] = []
+    stair_z: List[float] = []
+    front = []
+
+    for group in _groups(points, order, 0):
+        candidates = _front_2d(points, group, 1, 2)
+
+        for i in candidates:
+            _, y, z = points[i]
+            j = bisect_left(stair_y, y)
+            # stair_z[j] is the best z among entries with y' >= y
+            if j == len(stair_y) or stair_z[j] < z:
+                front.append(i)
+
+        for i in candidates:
+            _, y, z = points[i]
+            j = bisect_left(stair_y, y)
+            if j < len(stair_y) and stair_z[j] >= z:
+                continue
+            end = bisect_right(stair_y, y)
+            start = end
+            while start > 0 and stair_z[start - 1] <= z:
+                start -= 1
+            stair_y[start:end] = [y]
+            stair_z[start:end] = [z]
+
+    return sorted(front)
+
+
+def _front_sweep(points: Sequence[Point]) -> List[int]:
+    """Sort-filter-skyline for any number of dimensions"""
+    # A dominating point has a larger sum, or an equal (rounded) sum and
+    # a lexicographically larger tuple, so it always comes first
+    order = sorted(
+        range(len(points)),
+        key=lambda i: (sum(points[i]), tuple(points[i])),
+        reverse=True,
+    )
+    front: List[int] = []
+    for i in order:
+        p = points[i]
+        if not any(dominates(points[j], p) for j in front):
+            front.append(i)
+    return sorted(front)
+
+
+class StreamingParetoFront:
+    """
+    Pareto frontier over points arriving in chunks.
+
+    Memory stays at frontier + one chunk: each chunk is merged with the
+    current frontier and only the survivors are kept, each with the
+    payload it was added with.
+    """
+
+    def __init__(self):
+        self.points: List[Point] = []
+        self.payloads: List[Any] = []
+        self.seen = 0
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def add(self, points: Sequence[Point], payloads: Optional[Sequence[Any]] = None) -> None:
+        if not len(points):
+            return
+        if payloads is None:
+            payloads = range(self.seen, self.seen + len(points))
+
+        merged = self.points + list(points)
+        merged_payloads = self.payloads + list(payloads)
+        keep = pareto_front(merged)
+        self.points = [merged[i] for i in keep]
+        self.payloads = [merged_payloads[i] for i in keep]
+        self.seen += len(points)
+
+    def items(self) -> List[Tuple[Any, Point]]:
+        """(payload, point) of the frontier, in arrival order"""
+        return list(zip(self.payloads, self.points))
+
+
+__all__ = [
+    "dominates",
+    "pareto_front",
+    "StreamingParetoFront",
+]
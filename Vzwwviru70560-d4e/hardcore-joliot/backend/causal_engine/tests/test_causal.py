@@ -21,9 +21,12 @@ from ..core.models import (
     Intervention,
     InterventionType,
 )
-from ..core.dag_builder import DAGBuilder, DAGManager, get_dag_manager
-from ..core.inference import CausalEngine, SensitivityAnalyzer
-from ..counterfactual.engine import CounterfactualEngine
+from ..core.dag_builder import DAGBuilder, DAGManager, StructureLearner, get_dag_manager
+from ..core.structure import NUMPY_AVAILABLE, PCAlgorithm, SufficientStatistics
+from ..core.inference import CausalEngine, CausalEffectEstimator, SensitivityAnalyzer
+from ..counterfactual import engine as counterfactual_engine
+from ..counterfactual.engine import CounterfactualEngine, ScenarioComparator, scenario_grid
+from ..counterfactual.pareto import StreamingParetoFront, dominates, pareto_front
 from ..bridge.human_decision import HumanDecisionBridge, DecisionStatus
 
 
@@ -89,6 +92,89 @@ class TestDAGBuilder:
         assert dag.hash == hash1
 
 
+# ============================================================================
+# STRUCTURE LEARNING TESTS
+# ============================================================================
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="structure learning needs numpy")
+class TestStructureLearner:
+    """Test PC structure learning"""
+    
+    @pytest.fixture
+    def collider_data(self):
+        """X → Z ← Y, Z → W"""
+        import numpy as np
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=4000)
+        y = rng.normal(size=4000)
+        z = x + y + 0.5 * rng.normal(size=4000)
+        w = 2 * z + rng.normal(size=4000)
+        return {"X": x, "Y": y, "Z": z, "W": w}
+    
+    @staticmethod
+    def _edges(dag):
+        names = {node_id: node.name for node_id, node in dag.nodes.items()}
+        return {(names[e.source_id], names[e.target_id]): e for e in dag.edges}
+    
+    def test_learns_and_orients_collider(self, collider_data):
+        """PC finds the skeleton, the v-structure and Meek's R1 orientation"""
+        learner = StructureLearner()
+        dag = learner.learn_from_data({k: list(v) for k, v in collider_data.items()})
+        edges = self._edges(dag)
+        
+        assert set(edges) == {("X", "Z"), ("Y", "Z"), ("Z", "W")}
+        assert edges[("Z", "W")].coefficient == pytest.approx(2.0, abs=0.1)
+        assert all(e.edge_type == EdgeType.CAUSAL for e in edges.values())
+        assert learner.last_result.separating_sets[("X", "W")] == ("Z",)
+        assert dag.is_valid_dag()
+    
+    def test_stream_matches_batch_statistics(self, collider_data):
+        """Chunked sufficient statistics equal the one-shot ones"""
+        whole = SufficientStatistics.from_columns(collider_data)
+        streamed = SufficientStatistics(list(collider_data))
+        for start in range(0, 4000, 700):
+            streamed.update_columns({k: v[start:start + 700] for k, v in collider_data.items()})
+        
+        assert streamed.n == whole.n
+        assert streamed.mean == pytest.approx(whole.mean)
+        assert streamed.correlation() == pytest.approx(whole.correlation())
+        
+        chunks = (
+            {k: v[start:start + 1000] for k, v in collider_data.items()}
+            for start in range(0, 4000, 1000)
+        )
+        assert set(self._edges(StructureLearner().learn_from_stream(chunks))) == {
+            ("X", "Z"), ("Y", "Z"), ("Z", "W"),
+        }
+    
+    def test_unorientable_chain_marked_as_association(self):
+        """A chain has no v-structure: its edges stay undirected in the CPDAG"""
+        import numpy as np
+        rng = np.random.default_rng(1)
+        a = rng.normal(size=3000)
+        b = a + rng.normal(size=3000)
+        c = b + rng.normal(size=3000)
+        
+        learner = StructureLearner()
+        dag = learner.learn_from_data({"A": a, "B": b, "C": c})
+        edges = self._edges(dag)
+        
+        assert sorted(learner.last_result.undirected) == [("A", "B"), ("B", "C")]
+        assert len(edges) == 2
+        assert all(e.edge_type == EdgeType.ASSOCIATION for e in edges.values())
+        assert dag.is_valid_dag()
+    
+    def test_prior_edges_and_parallel_tests(self, collider_data):
+        """Prior edges survive and are oriented; threads give the same CPDAG"""
+        stats = SufficientStatistics.from_columns(collider_data)
+        serial = PCAlgorithm().fit(stats, required_edges=[("W", "X")])
+        parallel = PCAlgorithm(n_jobs=4).fit(stats, required_edges=[("W", "X")])
+        
+        assert ("W", "X") in serial.directed
+        assert parallel.directed == serial.directed
+        assert parallel.undirected == serial.undirected
+
+
 # ============================================================================
 # CAUSAL ENGINE TESTS
 # ============================================================================
@@ -135,6 +221,90 @@ class TestCausalEngine:
         assert all(l.controllability >= 0 for l in levers)
 
 
+# ============================================================================
+# TOTAL EFFECT MATRIX TESTS
+# ============================================================================
+
+class TestTotalEffectMatrix:
+    """Test precomputed total effects"""
+    
+    @pytest.fixture
+    def chain_dag(self):
+        """A → B → C → D → E → F plus a shortcut A → C"""
+        builder = DAGBuilder("Chain")
+        for name in "ABCDEF":
+            builder.add_slot_node(name, observed_value=1)
+        for source, target in zip("ABCDE", "BCDEF"):
+            builder.add_causal_edge(source, target, coefficient=2.0)
+        builder.add_causal_edge("A", "C", coefficient=-1.0)
+        return builder.build(validate=False)
+    
+    def test_total_effect_sums_paths(self, chain_dag):
+        """Total effect is the sum of coefficient products over all paths"""
+        matrix = CausalEffectEstimator(chain_dag).effect_matrix()
+        
+        assert matrix.acyclic
+        assert matrix.total_effect("A", "C") == pytest.approx(2.0 * 2.0 - 1.0)
+        assert matrix.total_effect("A", "F") == pytest.approx(3.0 * 2.0 ** 3)
+        assert matrix.total_effect("F", "A") is None
+        assert matrix.total_effects(["A", "B"], ["C", "F"]) == [
+            [pytest.approx(3.0), pytest.approx(24.0)],
+            [pytest.approx(2.0), pytest.approx(16.0)],
+        ]
+    
+    def test_matrix_rebuilt_when_dag_changes(self, chain_dag):
+        """Adding an edge or changing a coefficient invalidates the matrix"""
+        estimator = CausalEffectEstimator(chain_dag)
+        matrix = estimator.effect_matrix()
+        assert estimator.effect_matrix() is matrix
+        
+        ids = {node.name: node_id for node_id, node in chain_dag.nodes.items()}
+        chain_dag.add_edge(CausalEdge(source_id=ids["B"], target_id=ids["F"], coefficient=1.0))
+        assert estimator.effect_matrix() is not matrix
+        assert estimator.effect_matrix().total_effect("B", "F") == pytest.approx(17.0)
+        
+        chain_dag.edges[0].coefficient = 0.0
+        assert estimator.effect_matrix().total_effect("A", "F") == pytest.approx(-8.0)
+    
+    def test_cyclic_graph_falls_back_to_paths(self):
+        """Confounded edges may close a cycle; bounded paths are used then"""
+        dag = (DAGBuilder("Cyclic")
+            .add_slot_node("X")
+            .add_slot_node("M")
+            .add_outcome_node("Y")
+            .add_causal_edge("X", "M", coefficient=2.0)
+            .add_causal_edge("M", "Y", coefficient=3.0)
+            .add_confounded_edge("Y", "X")
+            .build(validate=False))
+        
+        matrix = CausalEffectEstimator(dag).effect_matrix()
+        
+        assert not matrix.acyclic
+        assert matrix.total_effect("X", "Y") == pytest.approx(6.0)
+        assert matrix.total_effect("Y", "M") == pytest.approx(0.5 * 2.0)
+    
+    def test_batch_estimates_match_single(self, chain_dag):
+        """estimate_ate_many agrees with one-by-one estimate_ate"""
+        estimator = CausalEffectEstimator(chain_dag)
+        effects = estimator.estimate_ate_many(["A", "B"], ["C", "F"])
+        
+        assert len(effects) == 4
+        for (treatment, outcome), effect in effects.items():
+            assert effect.ate == pytest.approx(estimator.estimate_ate(treatment, outcome).ate)
+    
+    def test_pareto_frontier_uses_total_effects(self, chain_dag):
+        """Scenario outcomes follow the precomputed total effects"""
+        comparator = ScenarioComparator(chain_dag)
+        result = comparator.pareto_frontier(
+            scenarios=[{"A": 1}, {"A": 2}, {"B": 3}],
+            outcome_nodes=["F"],
+        )
+        
+        outcomes = [e["outcomes"]["F"] for e in result["all_evaluated"]]
+        assert outcomes == [pytest.approx(1.0), pytest.approx(25.0), pytest.approx(33.0)]
+        assert result["pareto_optimal_count"] == 1
+
+
 # ============================================================================
 # COUNTERFACTUAL TESTS
 # ============================================================================
@@ -183,6 +353,104 @@ class TestCounterfactual:
         assert result.factual_outcome == 20
 
 
+# ============================================================================
+# BATCH SCENARIO / PARETO TESTS
+# ============================================================================
+
+def _brute_force_front(points):
+    return [
+        i for i, p in enumerate(points)
+        if not any(dominates(q, p) for j, q in enumerate(points) if j != i)
+    ]
+
+
+class TestParetoFrontier:
+    """Test batch evaluation and skyline algorithms"""
+    
+    @pytest.fixture
+    def tradeoff_dag(self):
+        """Price raises margin but lowers volume; marketing raises volume"""
+        return (DAGBuilder("Tradeoff")
+            .add_slot_node("price", observed_value=10)
+            .add_slot_node("marketing", observed_value=0)
+            .add_outcome_node("margin")
+            .add_outcome_node("volume")
+            .add_outcome_node("cost")
+            .add_causal_edge("price", "margin", coefficient=2.0)
+            .add_causal_edge("price", "volume", coefficient=-3.0)
+            .add_causal_edge("marketing", "volume", coefficient=1.5)
+            .add_causal_edge("marketing", "cost", coefficient=-1.0)
+            .add_causal_edge("price", "cost", coefficient=0.0)
+            .add_causal_edge("marketing", "margin", coefficient=0.0)
+            .build(validate=False))
+    
+    @pytest.mark.parametrize("dims", [1, 2, 3, 4, 5])
+    def test_front_matches_brute_force(self, dims):
+        """Skyline algorithms agree with the O(n²) definition, ties included"""
+        import random
+        rng = random.Random(dims)
+        for _ in range(20):
+            points = [
+                tuple(float(rng.randint(0, 6)) for _ in range(dims))
+                for _ in range(rng.randint(1, 60))
+            ]
+            assert pareto_front(points) == _brute_force_front(points)
+    
+    def test_streaming_front_matches_batch(self):
+        """Merging chunks gives the same frontier as one batch"""
+        import random
+        rng = random.Random(7)
+        points = [(rng.random(), rng.random(), rng.random()) for _ in range(500)]
+        
+        front = StreamingParetoFront()
+        for start in range(0, len(points), 64):
+            front.add(points[start:start + 64])
+        
+        assert [index for index, _ in front.items()] == pareto_front(points)
+        assert front.seen == 500
+    
+    def test_batch_matches_what_if(self, tradeoff_dag):
+        """Batch outcomes follow the what_if formula, with or without NumPy"""
+        engine = CounterfactualEngine(tradeoff_dag)
+        rows = [[10, 0], [12, 1], [8, 4]]
+        
+        outcomes = engine.evaluate_scenarios(rows, ["price", "marketing"], ["margin", "volume"])
+        assert outcomes[1] == [pytest.approx(4.0), pytest.approx(-4.5)]
+        
+        for row, (margin, _) in zip(rows, outcomes):
+            result = engine.what_if("price", row[0], "margin", factual_value=0)
+            assert margin == pytest.approx(result.counterfactual_outcome)
+        
+        original = counterfactual_engine.np
+        counterfactual_engine.np = None
+        try:
+            python_outcomes = engine.evaluate_scenarios(rows, ["price", "marketing"], ["margin", "volume"])
+        finally:
+            counterfactual_engine.np = original
+        assert python_outcomes == [[pytest.approx(v) for v in row] for row in outcomes]
+    
+    def test_stream_grid_matches_pareto_frontier(self, tradeoff_dag):
+        """Streaming a grid finds the same frontier as the list API"""
+        comparator = ScenarioComparator(tradeoff_dag)
+        axes = {"price": [8.0, 9.0, 10.0, 11.0], "marketing": [0.0, 1.0, 2.0]}
+        outcomes = ["margin", "volume"]
+        
+        streamed = comparator.stream_pareto_frontier(
+            scenario_grid(axes), list(axes), outcomes, chunk_size=5
+        )
+        listed = comparator.pareto_frontier(
+            [dict(zip(axes, row)) for row in scenario_grid(axes)], outcomes
+        )
+        
+        assert streamed["total_scenarios"] == 12
+        assert [p["scenario"] for p in streamed["pareto_optimal"]] == [
+            p["scenario"] for p in listed["pareto_optimal"]
+        ]
+        # Marketing only helps volume, so only its top level survives
+        assert streamed["pareto_optimal_count"] == 4
+        assert all(p["scenario"]["marketing"] == 2.0 for p in streamed["pareto_optimal"])
+
+
 # ============================================================================
 # HUMAN DECISION BRIDGE TESTS
 # ============================================================================
@@ -46,6 +46,7 @@ from .synaptic_graph import (
     EdgeAction,
     EdgeFireEvent,
     StabilityGuard,
+    LatencyHistogram,
     ModuleID,
     Priority,
     get_synaptic_graph
@@ -57,6 +58,7 @@ from .yellow_pages import (
     NeedTag,
     GuardRequirement,
     FallbackService,
+    SelectionPolicy,
     RoutingDecision,
     ServiceHandler,
     get_yellow_pages
@@ -92,6 +94,7 @@ __all__ = [
     "EdgeTrigger",
     "EdgeAction",
     "EdgeFireEvent",
+    "LatencyHistogram",
     "ModuleID",
     "Priority",
     "get_synaptic_graph",
@@ -102,5 +105,6 @@ __all__ = [
     "NeedTag",
     "GuardRequirement",
     "FallbackService",
+    "SelectionPolicy",
     "get_yellow_pages"
 ]
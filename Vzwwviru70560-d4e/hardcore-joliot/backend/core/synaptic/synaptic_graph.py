@@ -7,17 +7,24 @@ Defines the edges between modules with:
 - Actions (what happens when edge fires)
 - Anti-loop protection (ttl, rate-limit, stability guards)
 
+Edges fired by one trigger run concurrently (bounded); loop detection
+follows each cascade through contextvars, so independent firings of the
+same path don't block each other.
+
 This is the neural network of CHE·NU™.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Set, Callable, Awaitable
+from typing import Optional, Dict, Any, List, Set, Tuple, FrozenSet, Callable, Awaitable
 from enum import Enum
 from datetime import datetime, timedelta
 from uuid import UUID, uuid4
+from contextvars import ContextVar
+from bisect import bisect_left
 import asyncio
 import logging
-from collections import defaultdict
+import time
+from collections import Counter, defaultdict
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +115,53 @@ class StabilityGuard:
     enabled: bool = True
 
 
+# Upper bounds (ms) of the latency histogram buckets; the last is +inf
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf")
+)
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram of edge fires"""
+    counts: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS_MS))
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+    
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (max for the last bucket)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(bound, self.max_ms)
+        return self.max_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+            "buckets": {
+                ("+inf" if bound == float("inf") else str(bound)): n
+                for bound, n in zip(LATENCY_BUCKETS_MS, self.counts)
+            }
+        }
+
+
 @dataclass
 class SynapticEdge:
     """A connection between two modules"""
@@ -123,6 +177,7 @@ class SynapticEdge:
     fire_count: int = 0
     last_fired: Optional[datetime] = None
     is_active: bool = True
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -134,7 +189,8 @@ class SynapticEdge:
             "action": self.action.to_dict() if self.action else None,
             "fire_count": self.fire_count,
             "last_fired": self.last_fired.isoformat() if self.last_fired else None,
-            "is_active": self.is_active
+            "is_active": self.is_active,
+            "latency": self.latency.to_dict()
         }
     
     def can_fire(self) -> bool:
@@ -174,15 +230,26 @@ class EdgeFireEvent:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
+# (source, target) paths of the cascade the current task is running in
+_cascade_paths: ContextVar[FrozenSet[Tuple[ModuleID, ModuleID]]] = ContextVar(
+    "synaptic_cascade_paths", default=frozenset()
+)
+
+
 class SynapticGraph:
     """
     The neural network of CHE·NU™.
     
     Manages connections between modules and routes signals
     while preventing infinite loops and cascades.
+    
+    A trigger fans out to its edges concurrently, at most
+    `max_concurrency` at a time.
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 8):
+        self.max_concurrency = max_concurrency
+        
         # All edges
         self._edges: Dict[UUID, SynapticEdge] = {}
         
@@ -192,14 +259,17 @@ class SynapticGraph:
         # Index: target -> [edges]
         self._incoming: Dict[ModuleID, List[SynapticEdge]] = defaultdict(list)
         
+        # Index: (source, trigger name) -> [edges]
+        self._by_trigger: Dict[Tuple[ModuleID, str], List[SynapticEdge]] = defaultdict(list)
+        
         # Edge handlers
         self._handlers: Dict[str, Callable[[EdgeFireEvent], Awaitable[Any]]] = {}
         
         # Event listeners
         self._listeners: List[Callable[[EdgeFireEvent], Awaitable[None]]] = []
         
-        # Loop detection
-        self._active_paths: Set[str] = set()
+        # Paths currently firing (loop detection itself is per cascade)
+        self._active_paths: Counter = Counter()
         
         # Initialize default graph
         self._init_default_edges()
@@ -438,6 +508,8 @@ class SynapticGraph:
         self._edges[edge.edge_id] = edge
         self._outgoing[source].append(edge)
         self._incoming[target].append(edge)
+        if trigger:
+            self._by_trigger[(source, trigger.name)].append(edge)
         
         logger.debug(f"Added edge: {source.value} -> {target.value} ({trigger.name})")
         
@@ -468,11 +540,9 @@ class SynapticGraph:
         return [e for e in self._edges.values() if e.priority == priority]
     
     def _check_loop(self, source: ModuleID, target: ModuleID) -> bool:
-        """Check if firing would create a loop"""
-        path_key = f"{source.value}->{target.value}"
-        
-        if path_key in self._active_paths:
-            logger.warning(f"Loop detected: {path_key}")
+        """Check if firing would create a loop in the current cascade"""
+        if (source, target) in _cascade_paths.get():
+            logger.warning(f"Loop detected: {source.value}->{target.value}")
             return True
         
         return False
@@ -496,16 +566,47 @@ class SynapticGraph:
         trigger_name: str,
         payload: Dict[str, Any] = None
     ) -> List[Any]:
-        """Fire all edges from source with matching trigger"""
-        results = []
+        """
+        Fire all edges from source with matching trigger.
+        
+        Edges run concurrently (at most max_concurrency at once); results
+        keep edge order. A handler error is raised after the other edges
+        have finished.
+        """
+        edges = self._by_trigger.get((source, trigger_name), [])
+        payload = payload or {}
+        
+        if len(edges) <= 1:
+            outcomes = [await self._fire(edge, payload) for edge in edges]
+        else:
+            outcomes = await self._fan_out(edges, payload)
+        
+        return [r for r in outcomes if r is not None]
+    
+    async def _fan_out(
+        self,
+        edges: List[SynapticEdge],
+        payload: Dict[str, Any]
+    ) -> List[Any]:
+        """Fire edges concurrently with bounded parallelism"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        outcomes: List[Any] = [None] * len(edges)
+        errors: List[BaseException] = []
         
-        for edge in self._outgoing.get(source, []):
-            if edge.trigger and edge.trigger.name == trigger_name:
-                result = await self._fire(edge, payload or {})
-                if result is not None:
-                    results.append(result)
+        async def run(index: int, edge: SynapticEdge) -> None:
+            async with semaphore:
+                try:
+                    outcomes[index] = await self._fire(edge, payload)
+                except Exception as e:
+                    errors.append(e)
         
-        return results
+        async with asyncio.TaskGroup() as group:
+            for index, edge in enumerate(edges):
+                group.create_task(run(index, edge))
+        
+        if errors:
+            raise errors[0]
+        return outcomes
     
     async def _fire(
         self,
@@ -523,9 +624,12 @@ class SynapticGraph:
         if self._check_loop(edge.source, edge.target):
             return None
         
-        # Mark path as active
+        # Mark path as active for this cascade (and its child tasks)
+        path = (edge.source, edge.target)
+        token = _cascade_paths.set(_cascade_paths.get() | {path})
         path_key = f"{edge.source.value}->{edge.target.value}"
-        self._active_paths.add(path_key)
+        self._active_paths[path_key] += 1
+        started = time.perf_counter()
         
         try:
             # Create event
@@ -547,11 +651,14 @@ class SynapticGraph:
             )
             
             # Notify listeners
-            for listener in self._listeners:
-                try:
-                    await listener(event)
-                except Exception as e:
-                    logger.error(f"Listener error: {e}")
+            if self._listeners:
+                outcomes = await asyncio.gather(
+                    *(listener(event) for listener in self._listeners),
+                    return_exceptions=True
+                )
+                for outcome in outcomes:
+                    if isinstance(outcome, Exception):
+                        logger.error(f"Listener error: {outcome}")
             
             # Execute handler
             result = None
@@ -566,7 +673,11 @@ class SynapticGraph:
             
         finally:
             # Clear path
-            self._active_paths.discard(path_key)
+            edge.latency.observe((time.perf_counter() - started) * 1000)
+            _cascade_paths.reset(token)
+            self._active_paths[path_key] -= 1
+            if not self._active_paths[path_key]:
+                del self._active_paths[path_key]
     
     def get_graph_summary(self) -> Dict[str, Any]:
         """Get summary of the graph"""
@@ -586,6 +697,22 @@ class SynapticGraph:
             "active_paths": list(self._active_paths)
         }
     
+    def get_latency_stats(self) -> List[Dict[str, Any]]:
+        """Per-edge fire latency, slowest p95 first"""
+        stats = [
+            {
+                "edge_id": str(e.edge_id),
+                "from": e.source.value,
+                "to": e.target.value,
+                "trigger": e.trigger.name if e.trigger else "",
+                **e.latency.to_dict()
+            }
+            for e in self._edges.values()
+            if e.latency.count
+        ]
+        stats.sort(key=lambda s: s["p95_ms"], reverse=True)
+        return stats
+    
     def export_edge_list(self) -> List[Dict[str, str]]:
         """Export edges as list for machine processing"""
         return [
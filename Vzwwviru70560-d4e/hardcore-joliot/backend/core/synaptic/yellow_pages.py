@@ -7,6 +7,12 @@ Maps needs (tags) to:
 - Guards (security requirements)
 
 The orchestrator uses this to route requests to the right module/service.
+
+A need can have several fallback providers. Requests go to the healthy
+provider with the least load (least outstanding requests, or the better
+of two random picks), provider latency and error rate are tracked as
+EWMAs, and when every provider is at capacity requests queue until a
+slot frees up or their deadline passes.
 """
 
 from dataclasses import dataclass, field
@@ -14,13 +20,25 @@ from typing import Optional, Dict, Any, List, Callable, Awaitable
 from enum import Enum
 from datetime import datetime
 from uuid import UUID, uuid4
+from contextlib import suppress
+import asyncio
 import logging
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
 
 from .synaptic_graph import ModuleID, Priority
 
 logger = logging.getLogger(__name__)
 
+# Smoothing factor of the latency / error-rate EWMAs
+EWMA_ALPHA = 0.2
+# Failed calls in a row before a provider is ejected until its next good probe
+MAX_CONSECUTIVE_FAILURES = 3
+HEALTH_CHECK_INTERVAL_S = 10.0
+HEALTH_CHECK_TIMEOUT_S = 2.0
+
 
 class NeedTag(str, Enum):
     """Tags representing user/system needs"""
@@ -76,6 +94,12 @@ class GuardRequirement(str, Enum):
     P1_INFRA = "p1_infra"
 
 
+class SelectionPolicy(str, Enum):
+    """How a fallback provider is picked among the healthy candidates"""
+    LEAST_OUTSTANDING = "least_outstanding"
+    POWER_OF_TWO = "power_of_two"
+
+
 @dataclass
 class FallbackService:
     """On-demand service that can handle requests"""
@@ -87,6 +111,20 @@ class FallbackService:
     max_concurrent: int = 10
     current_load: int = 0
     
+    # Health and usage stats
+    is_healthy: bool = True
+    ewma_latency_ms: float = 0.0
+    ewma_error_rate: float = 0.0
+    call_count: int = 0
+    error_count: int = 0
+    consecutive_failures: int = 0
+    last_health_check: Optional[datetime] = None
+    
+    def __post_init__(self):
+        # Guards current_load and the stats: handlers may release from
+        # worker threads as well as from the event loop
+        self._lock = threading.Lock()
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "service_id": self.service_id,
@@ -95,12 +133,60 @@ class FallbackService:
             "is_available": self.is_available,
             "cost_tokens": self.cost_tokens,
             "max_concurrent": self.max_concurrent,
-            "current_load": self.current_load
+            "current_load": self.current_load,
+            "is_healthy": self.is_healthy,
+            "ewma_latency_ms": self.ewma_latency_ms,
+            "ewma_error_rate": self.ewma_error_rate,
+            "call_count": self.call_count,
+            "error_count": self.error_count,
+            "last_health_check": self.last_health_check.isoformat() if self.last_health_check else None
         }
     
     @property
     def has_capacity(self) -> bool:
         return self.current_load < self.max_concurrent
+    
+    @property
+    def is_eligible(self) -> bool:
+        """Can be routed to: enabled and passing health checks"""
+        return self.is_available and self.is_healthy
+    
+    @property
+    def load_score(self) -> float:
+        """Expected cost of one more request: outstanding x latency, inflated by errors"""
+        latency = self.ewma_latency_ms or 1.0
+        return (self.current_load + 1) * latency / max(1.0 - self.ewma_error_rate, 0.01)
+    
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free (check and increment are atomic)"""
+        with self._lock:
+            if self.current_load >= self.max_concurrent:
+                return False
+            self.current_load += 1
+            return True
+    
+    def release(self, duration_ms: float, ok: bool) -> None:
+        """Give back a slot and fold the call outcome into the EWMAs"""
+        with self._lock:
+            self.current_load = max(self.current_load - 1, 0)
+            self.call_count += 1
+            if self.call_count == 1:
+                self.ewma_latency_ms = duration_ms
+            else:
+                self.ewma_latency_ms += EWMA_ALPHA * (duration_ms - self.ewma_latency_ms)
+            self.ewma_error_rate += EWMA_ALPHA * ((0.0 if ok else 1.0) - self.ewma_error_rate)
+            
+            if ok:
+                self.consecutive_failures = 0
+                return
+            self.error_count += 1
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= MAX_CONSECUTIVE_FAILURES and self.is_healthy:
+                self.is_healthy = False
+                logger.warning(
+                    f"Provider {self.service_id} ejected after "
+                    f"{self.consecutive_failures} consecutive failures"
+                )
 
 
 @dataclass
@@ -109,7 +195,8 @@ class YellowPageEntry:
     entry_id: UUID = field(default_factory=uuid4)
     need_tag: NeedTag = None
     authority_module: ModuleID = None
-    fallback_service: FallbackService = None
+    fallback_service: FallbackService = None  # Primary provider
+    providers: List[FallbackService] = field(default_factory=list)
     guards: List[GuardRequirement] = field(default_factory=list)
     priority: Priority = Priority.P2
     description: str = ""
@@ -117,7 +204,21 @@ class YellowPageEntry:
     # Usage stats
     call_count: int = 0
     last_called: Optional[datetime] = None
-    avg_response_ms: float = 0
+    avg_response_ms: float = 0  # EWMA
+    
+    def __post_init__(self):
+        if self.fallback_service and all(p is not self.fallback_service for p in self.providers):
+            self.providers.insert(0, self.fallback_service)
+        elif self.fallback_service is None and self.providers:
+            self.fallback_service = self.providers[0]
+    
+    def record_call(self, duration_ms: float) -> None:
+        self.call_count += 1
+        self.last_called = datetime.utcnow()
+        if self.call_count == 1:
+            self.avg_response_ms = duration_ms
+        else:
+            self.avg_response_ms += EWMA_ALPHA * (duration_ms - self.avg_response_ms)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -125,6 +226,7 @@ class YellowPageEntry:
             "need_tag": self.need_tag.value if self.need_tag else None,
             "authority_module": self.authority_module.value if self.authority_module else None,
             "fallback_service": self.fallback_service.to_dict() if self.fallback_service else None,
+            "providers": [p.to_dict() for p in self.providers],
             "guards": [g.value for g in self.guards],
             "priority": self.priority.value,
             "description": self.description,
@@ -204,9 +306,18 @@ class YellowPages:
     
     Routes needs to the right module or fallback service.
     Enforces guards and tracks usage.
+    
+    Fallback providers are load-balanced and health-checked; when all of
+    them are at capacity, requests wait in a bounded per-need queue until
+    a slot frees up or their deadline passes.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        policy: SelectionPolicy = SelectionPolicy.POWER_OF_TWO,
+        queue_timeout_s: float = 5.0,
+        max_queued: int = 100
+    ):
         # Registry entries
         self._entries: Dict[NeedTag, YellowPageEntry] = {}
         
@@ -216,6 +327,17 @@ class YellowPages:
         # Module availability
         self._module_status: Dict[ModuleID, bool] = {m: True for m in ModuleID}
         
+        # Provider selection and admission control
+        self.policy = policy
+        self.queue_timeout_s = queue_timeout_s
+        self.max_queued = max_queued
+        self._rng = random.Random()
+        self._waiting: Dict[NeedTag, int] = {}
+        self._slot_freed: Dict[NeedTag, asyncio.Condition] = {}
+        
+        # Background health probing
+        self._health_task: Optional[asyncio.Task] = None
+        
         # Initialize default entries
         self._init_default_entries()
     
@@ -398,13 +520,15 @@ class YellowPages:
         fallback_service: FallbackService,
         guards: List[GuardRequirement] = None,
         priority: Priority = Priority.P2,
-        description: str = ""
+        description: str = "",
+        providers: List[FallbackService] = None
     ) -> YellowPageEntry:
-        """Register a new entry"""
+        """Register a new entry (extra providers share the load of fallback_service)"""
         entry = YellowPageEntry(
             need_tag=need_tag,
             authority_module=authority_module,
             fallback_service=fallback_service,
+            providers=list(providers or []),
             guards=guards or [],
             priority=priority,
             description=description
@@ -412,16 +536,39 @@ class YellowPages:
         
         self._entries[need_tag] = entry
         
-        # Register default handler for fallback
-        if fallback_service.service_id not in self._handlers:
-            self._handlers[fallback_service.service_id] = DefaultServiceHandler(
-                fallback_service.service_id
-            )
+        # Register default handlers for fallbacks
+        for provider in entry.providers:
+            if provider.service_id not in self._handlers:
+                self._handlers[provider.service_id] = DefaultServiceHandler(
+                    provider.service_id
+                )
         
         logger.debug(f"Registered: {need_tag.value} -> {authority_module.value}")
         
         return entry
     
+    def add_provider(
+        self,
+        need_tag: NeedTag,
+        provider: FallbackService,
+        handler: Optional[ServiceHandler] = None
+    ) -> YellowPageEntry:
+        """Add a fallback provider to an existing entry"""
+        entry = self._entries.get(need_tag)
+        if not entry:
+            raise ValueError(f"No entry for need tag: {need_tag.value}")
+        
+        entry.providers.append(provider)
+        if entry.fallback_service is None:
+            entry.fallback_service = provider
+        
+        if handler is not None:
+            self._handlers[provider.service_id] = handler
+        elif provider.service_id not in self._handlers:
+            self._handlers[provider.service_id] = DefaultServiceHandler(provider.service_id)
+        
+        return entry
+    
     def register_handler(self, service_id: str, handler: ServiceHandler) -> None:
         """Register a custom service handler"""
         self._handlers[service_id] = handler
@@ -434,13 +581,32 @@ class YellowPages:
         """Lookup entry by need tag"""
         return self._entries.get(need_tag)
     
+    def select_provider(self, entry: YellowPageEntry) -> Optional[FallbackService]:
+        """Pick a healthy provider with a free slot according to the policy"""
+        candidates = [p for p in entry.providers if p.is_eligible and p.has_capacity]
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
+        
+        if self.policy == SelectionPolicy.POWER_OF_TWO:
+            a, b = self._rng.sample(candidates, 2)
+            return a if a.load_score <= b.load_score else b
+        
+        return min(
+            candidates,
+            key=lambda p: (p.current_load / p.max_concurrent, p.load_score)
+        )
+    
+    def queue_depth(self, need_tag: NeedTag) -> int:
+        """Requests waiting for a provider slot"""
+        return self._waiting.get(need_tag, 0)
+    
     def route(self, need_tag: NeedTag) -> RoutingDecision:
         """
         Route a need to the appropriate module or service.
         
         Routing priority:
         1. Authority module (if available)
-        2. Fallback service (if module unavailable)
+        2. Least-loaded healthy fallback provider (if module unavailable)
         """
         entry = self._entries.get(need_tag)
         
@@ -462,23 +628,25 @@ class YellowPages:
             )
         
         # Fallback to service
-        if entry.fallback_service and entry.fallback_service.is_available:
-            if entry.fallback_service.has_capacity:
-                return RoutingDecision(
-                    need_tag=need_tag,
-                    routed_to=entry.fallback_service.service_id,
-                    is_module=False,
-                    guards_required=entry.guards,
-                    reason="Module unavailable, routed to fallback service"
-                )
-            else:
-                return RoutingDecision(
-                    need_tag=need_tag,
-                    routed_to=entry.fallback_service.service_id,
-                    is_module=False,
-                    guards_required=entry.guards,
-                    reason="Fallback service at capacity"
-                )
+        provider = self.select_provider(entry)
+        if provider:
+            return RoutingDecision(
+                need_tag=need_tag,
+                routed_to=provider.service_id,
+                is_module=False,
+                guards_required=entry.guards,
+                reason="Module unavailable, routed to fallback service"
+            )
+        
+        eligible = [p for p in entry.providers if p.is_eligible]
+        if eligible:
+            return RoutingDecision(
+                need_tag=need_tag,
+                routed_to=min(eligible, key=lambda p: p.load_score).service_id,
+                is_module=False,
+                guards_required=entry.guards,
+                reason="Fallback services at capacity, request will queue"
+            )
         
         return RoutingDecision(
             need_tag=need_tag,
@@ -489,15 +657,17 @@ class YellowPages:
     async def execute(
         self,
         need_tag: NeedTag,
-        request: Dict[str, Any]
+        request: Dict[str, Any],
+        timeout_s: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Route and execute a request.
         
-        Returns response from module or fallback service.
+        Returns response from module or fallback service. When every
+        provider is busy the request waits up to timeout_s (default
+        queue_timeout_s) for a slot.
         """
-        import time
-        start = time.time()
+        start = time.monotonic()
         
         decision = self.route(need_tag)
         entry = self._entries.get(need_tag)
@@ -509,6 +679,7 @@ class YellowPages:
                 "decision": decision.to_dict()
             }
         
+        queued_ms = 0.0
         try:
             if decision.is_module:
                 # Module execution (stub - would integrate with actual module)
@@ -518,38 +689,37 @@ class YellowPages:
                     "result": f"Module {decision.routed_to} executed"
                 }
             else:
-                # Service execution
-                handler = self._handlers.get(decision.routed_to)
-                if handler:
-                    # Update load
-                    if entry and entry.fallback_service:
-                        entry.fallback_service.current_load += 1
-                    
-                    try:
-                        result = await handler.execute(request)
-                    finally:
-                        if entry and entry.fallback_service:
-                            entry.fallback_service.current_load -= 1
-                else:
-                    result = {
+                if self.queue_depth(need_tag) >= self.max_queued:
+                    return {
+                        "status": "error",
+                        "error": "Admission queue full",
+                        "decision": decision.to_dict()
+                    }
+                
+                timeout = self.queue_timeout_s if timeout_s is None else timeout_s
+                provider = await self._admit(entry, start + timeout)
+                queued_ms = (time.monotonic() - start) * 1000
+                
+                if provider is None:
+                    return {
                         "status": "error",
-                        "error": f"No handler for service {decision.routed_to}"
+                        "error": "Deadline exceeded waiting for a provider slot",
+                        "decision": decision.to_dict(),
+                        "queued_ms": queued_ms
                     }
+                
+                decision.routed_to = provider.service_id
+                result = await self._call_provider(entry, provider, request)
             
             # Update stats
             if entry:
-                entry.call_count += 1
-                entry.last_called = datetime.utcnow()
-                duration_ms = (time.time() - start) * 1000
-                entry.avg_response_ms = (
-                    (entry.avg_response_ms * (entry.call_count - 1) + duration_ms)
-                    / entry.call_count
-                )
+                entry.record_call((time.monotonic() - start) * 1000)
             
             return {
                 **result,
                 "decision": decision.to_dict(),
-                "duration_ms": (time.time() - start) * 1000
+                "queued_ms": queued_ms,
+                "duration_ms": (time.monotonic() - start) * 1000
             }
             
         except Exception as e:
@@ -560,6 +730,156 @@ class YellowPages:
                 "decision": decision.to_dict()
             }
     
+    # =========================================================================
+    # ADMISSION CONTROL
+    # =========================================================================
+    
+    def _acquire(self, entry: YellowPageEntry) -> Optional[FallbackService]:
+        """Select a provider and take one of its slots"""
+        # Another thread may take the selected slot first: retry a few times
+        for _ in range(len(entry.providers)):
+            provider = self.select_provider(entry)
+            if provider is None:
+                return None
+            if provider.try_acquire():
+                return provider
+        return None
+    
+    async def _admit(
+        self,
+        entry: YellowPageEntry,
+        deadline: float
+    ) -> Optional[FallbackService]:
+        """Take a provider slot, waiting for one until the (monotonic) deadline"""
+        provider = self._acquire(entry)
+        if provider:
+            return provider
+        
+        tag = entry.need_tag
+        if not self._waiting.get(tag):
+            # Fresh condition per burst so it binds to the current loop
+            self._slot_freed[tag] = asyncio.Condition()
+        cond = self._slot_freed[tag]
+        self._waiting[tag] = self._waiting.get(tag, 0) + 1
+        
+        try:
+            async with cond:
+                while True:
+                    provider = self._acquire(entry)
+                    if provider:
+                        return provider
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        # Pass on a wake-up this waiter may have swallowed
+                        cond.notify()
+                        return None
+                    with suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(cond.wait(), remaining)
+        finally:
+            self._waiting[tag] -= 1
+    
+    async def _call_provider(
+        self,
+        entry: YellowPageEntry,
+        provider: FallbackService,
+        request: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run the provider's handler on an acquired slot, then release it"""
+        start = time.monotonic()
+        ok = False
+        try:
+            handler = self._handlers.get(provider.service_id)
+            if handler is None:
+                return {
+                    "status": "error",
+                    "error": f"No handler for service {provider.service_id}"
+                }
+            result = await handler.execute(request)
+            ok = result.get("status") != "error"
+            return result
+        finally:
+            provider.release((time.monotonic() - start) * 1000, ok)
+            await self._notify_waiters(entry.need_tag)
+    
+    async def _notify_waiters(self, need_tag: NeedTag, all_waiters: bool = False) -> None:
+        if not self._waiting.get(need_tag):
+            return
+        cond = self._slot_freed[need_tag]
+        async with cond:
+            if all_waiters:
+                cond.notify_all()
+            else:
+                cond.notify()
+    
+    # =========================================================================
+    # HEALTH CHECKS
+    # =========================================================================
+    
+    async def probe_health(
+        self,
+        timeout_s: float = HEALTH_CHECK_TIMEOUT_S
+    ) -> Dict[str, bool]:
+        """Run every provider's health_check concurrently and update its status"""
+        by_service: Dict[str, List[FallbackService]] = {}
+        for entry in self._entries.values():
+            for provider in entry.providers:
+                by_service.setdefault(provider.service_id, []).append(provider)
+        
+        async def probe(service_id: str) -> bool:
+            handler = self._handlers.get(service_id)
+            if handler is None:
+                return False
+            try:
+                return bool(await asyncio.wait_for(handler.health_check(), timeout_s))
+            except Exception as e:
+                logger.warning(f"Health check failed for {service_id}: {e!r}")
+                return False
+        
+        results = await asyncio.gather(*(probe(sid) for sid in by_service))
+        
+        now = datetime.utcnow()
+        recovered = set()
+        for (service_id, providers), healthy in zip(by_service.items(), results):
+            for provider in providers:
+                if healthy and not provider.is_healthy:
+                    logger.info(f"Provider {service_id} healthy again")
+                    recovered.add(service_id)
+                if healthy:
+                    provider.consecutive_failures = 0
+                provider.is_healthy = healthy
+                provider.last_health_check = now
+        
+        # Requests queued behind ejected providers can now be admitted
+        if recovered:
+            for entry in self._entries.values():
+                if any(p.service_id in recovered for p in entry.providers):
+                    await self._notify_waiters(entry.need_tag, all_waiters=True)
+        
+        return dict(zip(by_service, results))
+    
+    async def _health_loop(self, interval_s: float) -> None:
+        while True:
+            try:
+                await self.probe_health()
+            except Exception as e:
+                logger.error(f"Health probing error: {e}")
+            await asyncio.sleep(interval_s)
+    
+    def start_health_checks(self, interval_s: float = HEALTH_CHECK_INTERVAL_S) -> None:
+        """Probe providers in the background (no-op if already running)"""
+        if self._health_task and not self._health_task.done():
+            return
+        self._health_task = asyncio.get_running_loop().create_task(
+            self._health_loop(interval_s)
+        )
+    
+    async def stop_health_checks(self) -> None:
+        task, self._health_task = self._health_task, None
+        if task and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    
     def get_all_entries(self) -> List[YellowPageEntry]:
         """Get all registry entries"""
         return list(self._entries.values())
@@ -574,6 +894,7 @@ class YellowPages:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get registry statistics"""
+        providers = [p for e in self._entries.values() for p in e.providers]
         return {
             "total_entries": len(self._entries),
             "by_priority": {
@@ -585,7 +906,20 @@ class YellowPages:
                 for m in ModuleID
             },
             "total_calls": sum(e.call_count for e in self._entries.values()),
-            "handlers_registered": len(self._handlers)
+            "handlers_registered": len(self._handlers),
+            "policy": self.policy.value,
+            "providers": len(providers),
+            "healthy_providers": sum(1 for p in providers if p.is_healthy),
+            "in_flight": sum(p.current_load for p in providers),
+            "queued": sum(self._waiting.values()),
+            "health_checks_running": bool(self._health_task and not self._health_task.done())
+        }
+    
+    def get_provider_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Per-need provider load, health and EWMA stats"""
+        return {
+            tag.value: [p.to_dict() for p in entry.providers]
+            for tag, entry in self._entries.items()
         }
     
     def export_table(self) -> List[Dict[str, str]]:
@@ -594,7 +928,7 @@ class YellowPages:
             {
                 "Need Tag": e.need_tag.value,
                 "Authority Module": e.authority_module.value,
-                "Fallback Service": e.fallback_service.name if e.fallback_service else "None",
+                "Fallback Service": ", ".join(p.name for p in e.providers) or "None",
                 "Guards": ", ".join(g.value for g in e.guards)
             }
             for e in self._entries.values()
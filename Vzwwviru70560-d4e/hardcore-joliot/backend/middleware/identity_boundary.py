@@ -11,18 +11,20 @@ This middleware is the first line of defense ensuring that
 user A cannot access user B's data under any circumstance.
 
 Author: CHE·NU Team
-Version: 1.0.0
+Version: 1.1.0
 """
 
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Deque, Dict, Generic, Iterator, List, Optional, Protocol, Set, Tuple, TypeVar
 from uuid import uuid4
 import asyncio
 import hashlib
 import json
 import logging
+import os
 import re
 import time
 
@@ -155,6 +157,357 @@ class AuditEntry:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# =============================================================================
+# AUDIT STORAGE
+# =============================================================================
+
+T = TypeVar("T")
+
+# Append-only audit file; empty disables persistence
+AUDIT_LOG_PATH = os.getenv("IDENTITY_AUDIT_LOG_PATH", "logs/identity_audit.jsonl")
+
+
+class RingLog(Generic[T]):
+    """
+    Fixed-capacity ring buffer with per-key secondary indexes
+    
+    - append() is O(1): the oldest record is overwritten once full
+    - Each index maps key -> deque of sequence numbers; evicted records are
+      always the oldest of their key, so cleanup is a popleft()
+    - Filtered reads only visit records of the requested key
+    """
+    
+    def __init__(self, capacity: int, indexes: Optional[Dict[str, Callable[[T], Any]]] = None):
+        self.capacity = capacity
+        self._slots: List[Optional[T]] = [None] * capacity
+        self._next_seq = 0
+        self._key_fns = indexes or {}
+        self._indexes: Dict[str, Dict[Any, Deque[int]]] = {name: {} for name in self._key_fns}
+    
+    def __len__(self) -> int:
+        return min(self._next_seq, self.capacity)
+    
+    def __iter__(self) -> Iterator[T]:
+        """Oldest to newest"""
+        for seq in range(self._next_seq - len(self), self._next_seq):
+            yield self._slots[seq % self.capacity]
+    
+    def append(self, record: T) -> None:
+        seq = self._next_seq
+        slot = seq % self.capacity
+        
+        evicted = self._slots[slot]
+        if evicted is not None:
+            for name, key_fn in self._key_fns.items():
+                key = key_fn(evicted)
+                if key is None:
+                    continue
+                seqs = self._indexes[name][key]
+                seqs.popleft()
+                if not seqs:
+                    del self._indexes[name][key]
+        
+        self._slots[slot] = record
+        for name, key_fn in self._key_fns.items():
+            key = key_fn(record)
+            if key is not None:
+                self._indexes[name].setdefault(key, deque()).append(seq)
+        self._next_seq += 1
+    
+    def latest(self, limit: int, **keys: Any) -> List[T]:
+        """
+        Newest `limit` records matching every given index key (None = any),
+        returned oldest first
+        """
+        keys = {name: key for name, key in keys.items() if key is not None}
+        if limit <= 0:
+            return []
+        
+        if keys:
+            postings = []
+            for name, key in keys.items():
+                seqs = self._indexes[name].get(key)
+                if not seqs:
+                    return []
+                postings.append((len(seqs), name, seqs))
+            # Walk the most selective index, check the others per record
+            _, driver, seqs = min(postings, key=lambda p: p[0])
+            others = [(self._key_fns[n], keys[n]) for n in keys if n != driver]
+            candidates = reversed(seqs)
+        else:
+            others = []
+            candidates = range(self._next_seq - 1, self._next_seq - 1 - len(self), -1)
+        
+        records = []
+        for seq in candidates:
+            record = self._slots[seq % self.capacity]
+            if all(key_fn(record) == key for key_fn, key in others):
+                records.append(record)
+                if len(records) >= limit:
+                    break
+        records.reverse()
+        return records
+
+
+class AuditSink(Protocol):
+    """Durable destination for audit records (file, database, ...)"""
+    
+    def write_batch(self, records: List[Dict[str, Any]]) -> None:
+        ...
+    
+    def read_tail(self, limit: int, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        ...
+
+
+class JsonlAuditSink:
+    """
+    Append-only JSON Lines file, one record per line
+    
+    Past max_bytes the file is renamed to `<path>.<UTC timestamp>` (digits
+    only, so names sort chronologically) and a new one is started; rotated
+    files are never deleted here. read_tail() restores the newest records
+    at startup, reading backwards from the end of the newest file and only
+    as far into the rotated files as it needs.
+    """
+    
+    READ_BLOCK_BYTES = 64 * 1024
+    
+    def __init__(self, path: str, max_bytes: int = 100 * 1024 * 1024, fsync: bool = False):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.fsync = fsync
+    
+    def rotated_files(self) -> List[str]:
+        """Rotated files, oldest first"""
+        directory = os.path.dirname(self.path) or "."
+        prefix = os.path.basename(self.path) + "."
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return []
+        suffixes = sorted(
+            (name[len(prefix):] for name in names
+             if name.startswith(prefix) and name[len(prefix):].isdigit()),
+            key=lambda suffix: (len(suffix), suffix),
+        )
+        return [f"{self.path}.{suffix}" for suffix in suffixes]
+    
+    def _rotate(self) -> None:
+        stamp = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
+        target = f"{self.path}.{stamp}"
+        while os.path.exists(target):
+            target += "0"
+        os.replace(self.path, target)
+    
+    def write_batch(self, records: List[Dict[str, Any]]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        lines = "".join(
+            json.dumps(record, separators=(",", ":"), default=str) + "\n"
+            for record in records
+        )
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            size = f.tell()
+        
+        if size > self.max_bytes:
+            self._rotate()
+    
+    def _reverse_lines(self, path: str) -> Iterator[bytes]:
+        """Lines of one file, last first, read in blocks from the end"""
+        with open(path, "rb") as f:
+            position = f.seek(0, os.SEEK_END)
+            partial = b""
+            while position > 0:
+                step = min(self.READ_BLOCK_BYTES, position)
+                position -= step
+                f.seek(position)
+                lines = (f.read(step) + partial).split(b"\n")
+                # The first piece may continue in the previous block
+                partial = lines.pop(0)
+                for line in reversed(lines):
+                    if line:
+                        yield line
+            if partial:
+                yield partial
+    
+    def iter_reverse(self) -> Iterator[Dict[str, Any]]:
+        """Records newest first, across the live and rotated files"""
+        for path in reversed(self.rotated_files() + [self.path]):
+            try:
+                for line in self._reverse_lines(path):
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # Torn last line after a crash
+            except FileNotFoundError:
+                continue
+    
+    def read_tail(self, limit: int, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """The newest `limit` records (only those of `kind` if given), oldest first"""
+        records: List[Dict[str, Any]] = []
+        if limit <= 0:
+            return records
+        for record in self.iter_reverse():
+            if kind is not None and record.get("kind") != kind:
+                continue
+            records.append(record)
+            if len(records) >= limit:
+                break
+        records.reverse()
+        return records
+
+
+class AuditWriter:
+    """
+    Background batched writer
+    
+    submit() only appends to an in-memory queue; a task flushes the queue to
+    the sink in bulk (every flush_interval_s, or sooner once batch_size
+    records are waiting), with the blocking I/O in a worker thread.
+    
+    The queue holds at most max_pending records. Past that the oldest are
+    dropped rather than blocking requests; drops are counted (`dropped`,
+    audit_dropped in the service stats) and logged.
+    """
+    
+    def __init__(
+        self,
+        sink: AuditSink,
+        batch_size: int = 1000,
+        flush_interval_s: float = 1.0,
+        max_pending: int = 100000,
+    ):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.max_pending = max_pending
+        
+        self._pending: Deque[Tuple[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        
+        self.written = 0
+        self.dropped = 0
+        self.failures = 0
+        self._unreported_drops = 0
+    
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+    
+    def submit(self, kind: str, record: Any) -> None:
+        """Queue a record (O(1)); the oldest is dropped if the sink falls far behind"""
+        if len(self._pending) >= self.max_pending:
+            self._pending.popleft()
+            self.dropped += 1
+            if not self._unreported_drops:
+                logger.warning(
+                    f"Audit queue full ({self.max_pending} records): dropping oldest records"
+                )
+            self._unreported_drops += 1
+        self._pending.append((kind, record))
+        
+        if self._task is None:
+            self._start()
+        elif len(self._pending) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+    
+    def _start(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop yet: records wait for the next call made from one
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = loop.create_task(self._run())
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_s)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            # A flush in progress completes even if the writer is stopped
+            await asyncio.shield(self.flush())
+    
+    async def flush(self) -> int:
+        """Write every queued record, batch by batch"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        
+        if self._unreported_drops:
+            logger.error(f"Dropped {self._unreported_drops} audit records (queue full)")
+            self._unreported_drops = 0
+        
+        written = 0
+        async with self._flush_lock:
+            while self._pending:
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(self.batch_size, len(self._pending)))
+                ]
+                try:
+                    await asyncio.to_thread(self._write, batch)
+                except Exception as e:
+                    # Keep the batch for the next attempt
+                    self._pending.extendleft(reversed(batch))
+                    self.failures += 1
+                    logger.error(f"Audit flush failed ({len(batch)} records): {e}")
+                    break
+                written += len(batch)
+        
+        self.written += written
+        return written
+    
+    def _write(self, batch: List[Tuple[str, Any]]) -> None:
+        self.sink.write_batch([_encode_record(kind, record) for kind, record in batch])
+    
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+def _encode_record(kind: str, record: Any) -> Dict[str, Any]:
+    data = asdict(record)
+    for key, value in data.items():
+        if isinstance(value, Enum):
+            data[key] = value.value
+        elif isinstance(value, datetime):
+            data[key] = value.isoformat()
+    data["kind"] = kind
+    return data
+
+
+def _decode_record(data: Dict[str, Any]) -> Tuple[Optional[str], Any]:
+    data = dict(data)
+    kind = data.pop("kind", None)
+    try:
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        if kind == "audit":
+            data["action"] = AuditAction(data["action"])
+            return kind, AuditEntry(**data)
+        if kind == "violation":
+            data["violation_type"] = ViolationType(data["violation_type"])
+            return kind, ViolationEvent(**data)
+    except (KeyError, TypeError, ValueError):
+        pass
+    return None, None
+
+
 # =============================================================================
 # IDENTITY BOUNDARY SERVICE
 # =============================================================================
@@ -168,20 +521,75 @@ class IdentityBoundaryService:
     - Validate identity ownership of resources
     - Detect cross-identity access attempts
     - Log violations with full audit trail
+    
+    Audit entries and violations live in fixed-size ring buffers indexed by
+    identity; with a sink they are also written out in batches and the
+    newest ones are restored at startup.
     """
     
-    def __init__(self):
-        self._violations: List[ViolationEvent] = []
-        self._audit_log: List[AuditEntry] = []
+    def __init__(
+        self,
+        max_audit_entries: int = 50000,
+        max_violations: int = 10000,
+        audit_sink: Optional[AuditSink] = None,
+    ):
+        self._max_violations = max_violations
+        self._max_audit_entries = max_audit_entries
+        self._violations: RingLog[ViolationEvent] = RingLog(max_violations, {
+            "identity": lambda v: v.requesting_identity,
+            "type": lambda v: v.violation_type,
+        })
+        self._audit_log: RingLog[AuditEntry] = RingLog(max_audit_entries, {
+            "identity": lambda e: e.identity_id,
+        })
         self._identity_cache: Dict[str, IdentityContext] = {}
         self._resource_ownership: Dict[str, str] = {}  # resource_id -> identity_id
-        self._max_violations = 10000
-        self._max_audit_entries = 50000
         
         # Statistics
         self._total_requests = 0
         self._total_violations = 0
         self._violations_by_type: Dict[str, int] = {}
+        
+        # Persistence
+        self._writer: Optional[AuditWriter] = None
+        if audit_sink is not None:
+            self._restore(audit_sink)
+            self._writer = AuditWriter(audit_sink)
+    
+    def _restore(self, sink: AuditSink) -> None:
+        """
+        Reload the newest persisted entries into the ring buffers
+        
+        Each kind is read up to its own capacity, so a burst of audit
+        entries cannot push the rarer violations out of the restore.
+        """
+        restored = 0
+        for kind, log, limit in (
+            ("violation", self._violations, self._max_violations),
+            ("audit", self._audit_log, self._max_audit_entries),
+        ):
+            try:
+                records = sink.read_tail(limit, kind=kind)
+            except OSError as e:
+                logger.error(f"Audit history restore failed: {e}")
+                return
+            for data in records:
+                decoded_kind, record = _decode_record(data)
+                if decoded_kind == kind:
+                    log.append(record)
+                    restored += 1
+        
+        if restored:
+            logger.info(f"Restored {restored} identity audit records")
+    
+    async def flush_audit(self) -> int:
+        """Write queued audit records now"""
+        return await self._writer.flush() if self._writer else 0
+    
+    async def close(self) -> None:
+        """Stop the background writer after a final flush"""
+        if self._writer:
+            await self._writer.stop()
     
     # =========================================================================
     # IDENTITY EXTRACTION
@@ -434,9 +842,8 @@ class IdentityBoundaryService:
             f"on {violation.resource_path}"
         )
         
-        # Trim if too many
-        if len(self._violations) > self._max_violations:
-            self._violations = self._violations[-self._max_violations:]
+        if self._writer:
+            self._writer.submit("violation", violation)
     
     def get_violations(
         self,
@@ -445,21 +852,11 @@ class IdentityBoundaryService:
         violation_type: Optional[ViolationType] = None,
     ) -> List[ViolationEvent]:
         """Get recorded violations with optional filters"""
-        violations = self._violations
-        
-        if identity_id:
-            violations = [
-                v for v in violations
-                if v.requesting_identity == identity_id
-            ]
-        
-        if violation_type:
-            violations = [
-                v for v in violations
-                if v.violation_type == violation_type
-            ]
-        
-        return violations[-limit:]
+        return self._violations.latest(
+            limit,
+            identity=identity_id or None,
+            type=violation_type,
+        )
     
     # =========================================================================
     # AUDIT LOGGING
@@ -495,9 +892,8 @@ class IdentityBoundaryService:
         self._audit_log.append(entry)
         self._total_requests += 1
         
-        # Trim if too many
-        if len(self._audit_log) > self._max_audit_entries:
-            self._audit_log = self._audit_log[-self._max_audit_entries:]
+        if self._writer:
+            self._writer.submit("audit", entry)
     
     def get_audit_log(
         self,
@@ -505,12 +901,7 @@ class IdentityBoundaryService:
         identity_id: Optional[str] = None,
     ) -> List[AuditEntry]:
         """Get audit log entries"""
-        entries = self._audit_log
-        
-        if identity_id:
-            entries = [e for e in entries if e.identity_id == identity_id]
-        
-        return entries[-limit:]
+        return self._audit_log.latest(limit, identity=identity_id or None)
     
     # =========================================================================
     # STATISTICS
@@ -527,6 +918,10 @@ class IdentityBoundaryService:
             "pending_violations": len([
                 v for v in self._violations if not v.resolved
             ]),
+            "audit_entries": len(self._audit_log),
+            "audit_pending_writes": self._writer.pending if self._writer else 0,
+            "audit_written": self._writer.written if self._writer else 0,
+            "audit_dropped": self._writer.dropped if self._writer else 0,
         }
 
 
@@ -547,7 +942,20 @@ class IdentityBoundaryMiddleware(BaseHTTPMiddleware):
     
     def __init__(self, app, service: Optional[IdentityBoundaryService] = None):
         super().__init__(app)
-        self.service = service or _default_service
+        self.service = service or get_identity_boundary_service()
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            # Flush and stop the audit writer when the app shuts down
+            async def receive_closing():
+                message = await receive()
+                if message["type"] == "lifespan.shutdown":
+                    await self.service.close()
+                return message
+            
+            await self.app(scope, receive_closing, send)
+            return
+        await super().__call__(scope, receive, send)
     
     async def dispatch(
         self,
@@ -716,10 +1124,18 @@ def get_identity_boundary_service() -> IdentityBoundaryService:
     """Get or create the identity boundary service singleton"""
     global _default_service
     if _default_service is None:
-        _default_service = IdentityBoundaryService()
+        _default_service = IdentityBoundaryService(
+            audit_sink=JsonlAuditSink(AUDIT_LOG_PATH) if AUDIT_LOG_PATH else None,
+        )
     return _default_service
 
 
+async def close_identity_boundary_service() -> None:
+    """Flush and stop the singleton's audit writer (for apps without the middleware)"""
+    if _default_service is not None:
+        await _default_service.close()
+
+
 def get_current_identity(request: Request) -> IdentityContext:
     """
     Dependency to get current identity from request
@@ -808,8 +1224,13 @@ __all__ = [
     "AuditEntry",
     "IdentityBoundaryService",
     "IdentityBoundaryMiddleware",
+    "RingLog",
+    "AuditSink",
+    "JsonlAuditSink",
+    "AuditWriter",
     # Functions
     "get_identity_boundary_service",
+    "close_identity_boundary_service",
     "get_current_identity",
     # Router
     "router",
@@ -5,22 +5,26 @@ Advanced rate limiting for API protection:
 - Per-user rate limits
 - Per-endpoint rate limits
 - IP-based rate limits
-- Sliding window algorithm
-- Redis-compatible storage
+- Sliding window counter, sliding log, fixed window and GCRA strategies
+- Bounded per-key state with background expiry
+- Redis-compatible storage (atomic Lua script, one round-trip per check)
 
 @version V72.0
 @phase Phase 2 - Authentication Security
 """
 
 import time
+import math
 import hashlib
 import asyncio
+import threading
+from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Tuple, Callable, List
+from typing import Optional, Dict, Any, Tuple, Callable, List, Deque
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
-from collections import defaultdict
+from collections import defaultdict, deque
 import json
 
 
@@ -62,6 +66,14 @@ class RateLimitConfig:
     # Lockout settings
     LOCKOUT_THRESHOLD = 10  # Failed attempts before lockout
     LOCKOUT_DURATION = 900  # 15 minutes
+    
+    # In-memory storage
+    STORAGE_SHARDS = 16
+    SWEEP_INTERVAL_SECONDS = 60
+
+
+# Absorbs float rounding on epoch timestamps (seconds)
+CLOCK_TOLERANCE = 1e-3
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -69,11 +81,25 @@ class RateLimitConfig:
 # ═══════════════════════════════════════════════════════════════════════════
 
 class RateLimitStrategy(Enum):
-    """Rate limiting strategies."""
+    """
+    Rate limiting strategies.
+    
+    Token and leaky bucket are served by GCRA, which is equivalent to both
+    with a single timestamp of state per key.
+    """
     FIXED_WINDOW = "fixed_window"
-    SLIDING_WINDOW = "sliding_window"
+    SLIDING_WINDOW = "sliding_window"  # Weighted counter over two windows
+    SLIDING_WINDOW_LOG = "sliding_window_log"  # Exact; state bounded by the limit
+    GCRA = "gcra"
     TOKEN_BUCKET = "token_bucket"
     LEAKY_BUCKET = "leaky_bucket"
+    
+    @property
+    def algorithm(self) -> str:
+        """Algorithm name understood by the storage backends."""
+        if self in (RateLimitStrategy.TOKEN_BUCKET, RateLimitStrategy.LEAKY_BUCKET):
+            return RateLimitStrategy.GCRA.value
+        return self.value
 
 
 class RateLimitScope(Enum):
@@ -101,24 +127,70 @@ class RateLimitRule:
     burst_limit: Optional[int] = None
     burst_window: Optional[int] = None
     
+    def __post_init__(self):
+        _check_limit(self.name, self.limit, self.window_seconds)
+        if self.burst_limit:
+            _check_limit(f"{self.name} burst", self.burst_limit, self.burst_window or 1)
+    
     def get_key(self, identifier: str, endpoint: Optional[str] = None) -> str:
-        """Generate rate limit key."""
-        parts = [self.name, identifier]
+        """
+        Generate rate limit key.
+        
+        The identifier is a Redis Cluster hash tag, so a rule and its burst
+        key land in the same slot and can be checked by one script.
+        """
+        parts = [self.name, f"{{{identifier}}}"]
         if endpoint and self.scope in [RateLimitScope.ENDPOINT, 
                                         RateLimitScope.USER_ENDPOINT, 
                                         RateLimitScope.IP_ENDPOINT]:
             parts.append(endpoint)
         return ":".join(parts)
+    
+    def get_specs(self, identifier: str, endpoint: Optional[str] = None) -> List["RateLimitSpec"]:
+        """Limits to evaluate for one request: the rule itself, then its burst limit."""
+        key = self.get_key(identifier, endpoint)
+        specs = [RateLimitSpec(key, self.strategy, self.limit, self.window_seconds)]
+        if self.burst_limit:
+            specs.append(RateLimitSpec(
+                f"{key}:burst",
+                self.strategy,
+                self.burst_limit,
+                self.burst_window or 1,
+            ))
+        return specs
+
+
+@dataclass
+class RateLimitSpec:
+    """One limit applied to one storage key."""
+    key: str
+    strategy: RateLimitStrategy
+    limit: int
+    window_seconds: float
+    
+    def __post_init__(self):
+        _check_limit(self.key, self.limit, self.window_seconds)
+
+
+def _check_limit(name: str, limit: int, window_seconds: float) -> None:
+    """Reject limits the algorithms would divide by (GCRA interval, retry-after)."""
+    if limit <= 0:
+        raise ValueError(f"Rate limit {name!r} needs a positive limit, got {limit}")
+    if window_seconds <= 0:
+        raise ValueError(f"Rate limit {name!r} needs a positive window, got {window_seconds}")
 
 
 @dataclass
 class RateLimitEntry:
-    """Rate limit tracking entry."""
+    """Rate limit tracking entry (constant size, except the bounded sliding log)."""
     key: str
-    count: int
-    window_start: float
-    requests: List[float] = field(default_factory=list)  # For sliding window
-    tokens: float = 0.0  # For token bucket
+    count: int = 0
+    window_start: float = 0.0  # Fixed window
+    window_index: int = -1  # Sliding window counter
+    previous_count: int = 0  # Sliding window counter
+    tat: float = 0.0  # GCRA theoretical arrival time
+    requests: Optional[Deque[float]] = None  # Sliding log, maxlen = limit
+    expires_at: float = 0.0
 
 
 @dataclass
@@ -131,171 +203,443 @@ class RateLimitResult:
     retry_after: Optional[int] = None
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# ALGORITHMS
+# ═══════════════════════════════════════════════════════════════════════════
+#
+# Two phases so that several limits (rule + burst, per-IP + per-user) are
+# all-or-nothing: _evaluate() decides whether one more request fits, then
+# _consume() records it only if every limit allowed it. Mirrored by the
+# Lua script in RedisStorage.
+
+def _evaluate(entry: RateLimitEntry, spec: RateLimitSpec, now: float) -> Tuple[bool, float, float, float]:
+    """
+    Roll expired window state forward and decide one more request.
+    
+    Returns (allowed, used, reset_at, retry_after_seconds).
+    """
+    algorithm = spec.strategy.algorithm
+    limit = spec.limit
+    window = spec.window_seconds
+    
+    if algorithm == "gcra":
+        interval = window / limit
+        tat = max(entry.tat, now)
+        used = (tat - now) / interval
+        allowed = tat + interval - now <= window + CLOCK_TOLERANCE
+        return allowed, used, tat, tat + interval - window - now
+    
+    if algorithm == "sliding_window_log":
+        requests = entry.requests
+        if requests is None or requests.maxlen != limit:
+            requests = entry.requests = deque(requests or (), maxlen=limit)
+        while requests and requests[0] <= now - window:
+            requests.popleft()
+        oldest = requests[0] if requests else now
+        return len(requests) < limit, len(requests), oldest + window, oldest + window - now
+    
+    if algorithm == "sliding_window":
+        index = int(now // window)
+        if entry.window_index != index:
+            entry.previous_count = entry.count if entry.window_index == index - 1 else 0
+            entry.count = 0
+            entry.window_index = index
+        window_end = (index + 1) * window
+        weight = (window_end - now) / window
+        used = entry.previous_count * weight + entry.count
+        
+        if used + 1 <= limit + CLOCK_TOLERANCE:
+            return True, used, window_end, 0.0
+        if entry.count + 1 <= limit:
+            # Wait for the previous window's weight to decay enough
+            retry = window * (1 - (limit - entry.count - 1) / entry.previous_count) - (now - index * window)
+        else:
+            # Wait for the next window, then for this one to decay
+            retry = window_end - now + window * (1 - (limit - 1) / entry.count)
+        return False, used, window_end, retry
+    
+    # Fixed window
+    if now - entry.window_start >= window:
+        entry.count = 0
+        entry.window_start = now
+    reset_at = entry.window_start + window
+    return entry.count < limit, entry.count, reset_at, reset_at - now
+
+
+def _consume(entry: RateLimitEntry, spec: RateLimitSpec, now: float):
+    """Record one request after _evaluate() allowed it."""
+    algorithm = spec.strategy.algorithm
+    window = spec.window_seconds
+    
+    if algorithm == "gcra":
+        entry.tat = max(entry.tat, now) + window / spec.limit
+        entry.expires_at = entry.tat
+    elif algorithm == "sliding_window_log":
+        entry.requests.append(now)
+        entry.expires_at = now + window
+    elif algorithm == "sliding_window":
+        entry.count += 1
+        entry.expires_at = (entry.window_index + 2) * window
+    else:
+        entry.count += 1
+        entry.expires_at = entry.window_start + window
+
+
+def _to_result(
+    spec: RateLimitSpec,
+    allowed: bool,
+    consumed: bool,
+    used: float,
+    reset_at: float,
+    retry_after: float,
+) -> RateLimitResult:
+    remaining = spec.limit - used - (1 if consumed else 0)
+    return RateLimitResult(
+        allowed=allowed,
+        limit=spec.limit,
+        remaining=max(0, int(math.floor(remaining + CLOCK_TOLERANCE))),
+        reset_at=reset_at,
+        retry_after=None if allowed else max(1, math.ceil(retry_after)),
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # STORAGE BACKENDS
 # ═══════════════════════════════════════════════════════════════════════════
 
-class RateLimitStorage:
+class RateLimitStorage(ABC):
     """Base class for rate limit storage."""
     
-    async def get(self, key: str) -> Optional[RateLimitEntry]:
-        raise NotImplementedError
-    
-    async def set(self, key: str, entry: RateLimitEntry, ttl: int):
-        raise NotImplementedError
+    @abstractmethod
+    async def hit(self, specs: List[RateLimitSpec], consume: bool = True) -> List[RateLimitResult]:
+        """
+        Evaluate every spec atomically, in one round-trip.
+        
+        When consume is set, the request is recorded against every spec
+        only if all of them allow it.
+        """
     
-    async def increment(self, key: str, window_seconds: int) -> Tuple[int, float]:
-        raise NotImplementedError
+    @abstractmethod
+    async def delete(self, *keys: str):
+        pass
     
-    async def delete(self, key: str):
-        raise NotImplementedError
+    async def close(self):
+        pass
 
 
 class InMemoryStorage(RateLimitStorage):
-    """In-memory storage for rate limits (development/single instance)."""
-    
-    def __init__(self):
-        self._data: Dict[str, RateLimitEntry] = {}
-        self._lock = asyncio.Lock()
-    
-    async def get(self, key: str) -> Optional[RateLimitEntry]:
-        async with self._lock:
-            entry = self._data.get(key)
-            if entry:
-                # Check if expired
-                now = time.time()
-                # Entries expire after 2x window time
-                return entry
-            return None
-    
-    async def set(self, key: str, entry: RateLimitEntry, ttl: int):
-        async with self._lock:
-            self._data[key] = entry
-    
-    async def increment(self, key: str, window_seconds: int) -> Tuple[int, float]:
-        """Increment counter, return (count, window_start)."""
-        async with self._lock:
-            now = time.time()
-            entry = self._data.get(key)
-            
-            if entry is None:
-                # New entry
-                entry = RateLimitEntry(
-                    key=key,
-                    count=1,
-                    window_start=now,
-                    requests=[now]
-                )
-                self._data[key] = entry
-                return 1, now
-            
-            # Check if window expired (fixed window)
-            if now - entry.window_start >= window_seconds:
-                # Reset window
-                entry.count = 1
-                entry.window_start = now
-                entry.requests = [now]
-                return 1, now
-            
-            # Increment
-            entry.count += 1
-            entry.requests.append(now)
-            
-            return entry.count, entry.window_start
+    """
+    In-memory storage for rate limits (development/single instance).
     
-    async def delete(self, key: str):
-        async with self._lock:
-            self._data.pop(key, None)
+    Keys are spread over shards with their own lock, so unrelated keys
+    never contend; a background task sweeps expired entries shard by shard.
+    """
     
-    async def cleanup_expired(self, max_age: int = 3600):
-        """Remove expired entries."""
-        async with self._lock:
+    def __init__(
+        self,
+        shards: int = RateLimitConfig.STORAGE_SHARDS,
+        sweep_interval_seconds: float = RateLimitConfig.SWEEP_INTERVAL_SECONDS,
+    ):
+        self._shards: List[Dict[str, RateLimitEntry]] = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._sweep_interval = sweep_interval_seconds
+        self._sweeper: Optional[asyncio.Task] = None
+    
+    def _shard(self, key: str) -> int:
+        return hash(key) % len(self._shards)
+    
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+    
+    async def hit(self, specs: List[RateLimitSpec], consume: bool = True) -> List[RateLimitResult]:
+        if self._sweeper is None:
+            self._start_sweeper()
+        
+        # Lock every shard involved, in a fixed order
+        shard_ids = sorted({self._shard(spec.key) for spec in specs})
+        for shard_id in shard_ids:
+            self._locks[shard_id].acquire()
+        try:
             now = time.time()
-            expired_keys = [
-                key for key, entry in self._data.items()
-                if now - entry.window_start > max_age
+            entries = []
+            decisions = []
+            for spec in specs:
+                shard = self._shards[self._shard(spec.key)]
+                entry = shard.get(spec.key)
+                if entry is None or entry.expires_at <= now:
+                    entry = RateLimitEntry(key=spec.key)
+                entries.append(entry)
+                decisions.append(_evaluate(entry, spec, now))
+            
+            consumed = consume and all(allowed for allowed, _, _, _ in decisions)
+            if consumed:
+                for spec, entry in zip(specs, entries):
+                    _consume(entry, spec, now)
+                    self._shards[self._shard(spec.key)][spec.key] = entry
+            
+            return [
+                _to_result(spec, allowed, consumed, used, reset_at, retry_after)
+                for spec, (allowed, used, reset_at, retry_after) in zip(specs, decisions)
             ]
-            for key in expired_keys:
-                del self._data[key]
+        finally:
+            for shard_id in reversed(shard_ids):
+                self._locks[shard_id].release()
+    
+    async def delete(self, *keys: str):
+        for key in keys:
+            shard_id = self._shard(key)
+            with self._locks[shard_id]:
+                self._shards[shard_id].pop(key, None)
+    
+    async def cleanup_expired(self) -> int:
+        """Remove expired entries, one shard at a time."""
+        removed = 0
+        for shard, lock in zip(self._shards, self._locks):
+            now = time.time()
+            with lock:
+                expired_keys = [
+                    key for key, entry in shard.items()
+                    if entry.expires_at <= now
+                ]
+                for key in expired_keys:
+                    del shard[key]
+            removed += len(expired_keys)
+            await asyncio.sleep(0)
+        return removed
+    
+    def _start_sweeper(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._sweeper = loop.create_task(self._sweep_loop())
+    
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(self._sweep_interval)
+            await self.cleanup_expired()
+    
+    async def close(self):
+        if self._sweeper:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
 
 
 class RedisStorage(RateLimitStorage):
-    """Redis storage for rate limits (production/distributed)."""
+    """
+    Redis storage for rate limits (production/distributed).
+    
+    Every check is one EVALSHA of a script that evaluates all limits and
+    records the request only if all of them allow it, using the Redis
+    server clock so that workers agree on time.
+    
+    A script may only touch keys of one cluster slot. Keys carry their
+    identifier as a hash tag, so one identifier's limits are one call.
+    Limits of several identifiers (check_many) are first evaluated per
+    slot without consuming, then consumed per slot if all allowed; a
+    concurrent request may still win a slot between the two passes.
+    """
+    
+    # KEYS: one per limit. ARGV: consume flag, then (algorithm, limit, window)
+    # per key. Returns (allowed, used, reset_at, retry_after) per key.
+    _HIT_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local tolerance = tonumber(ARGV[2])
+local consume = ARGV[1] == '1'
+local all_allowed = true
+local state = {}
+local out = {}
+
+for i, key in ipairs(KEYS) do
+    local algorithm = ARGV[i * 3]
+    local limit = tonumber(ARGV[i * 3 + 1])
+    local window = tonumber(ARGV[i * 3 + 2])
+    local s = {algorithm = algorithm, limit = limit, window = window}
+    local allowed, used, reset_at, retry
+
+    if algorithm == 'gcra' then
+        local interval = window / limit
+        local tat = tonumber(redis.call('HGET', key, 'tat')) or 0
+        if tat < now then tat = now end
+        used = (tat - now) / interval
+        allowed = tat + interval - now <= window + tolerance
+        reset_at = tat
+        retry = tat + interval - window - now
+        s.tat = tat + interval
+    elseif algorithm == 'sliding_window_log' then
+        local head = tonumber(redis.call('LINDEX', key, 0))
+        while head and head <= now - window do
+            redis.call('LPOP', key)
+            head = tonumber(redis.call('LINDEX', key, 0))
+        end
+        used = redis.call('LLEN', key)
+        allowed = used < limit
+        local oldest = head or now
+        reset_at = oldest + window
+        retry = oldest + window - now
+    elseif algorithm == 'sliding_window' then
+        local fields = redis.call('HMGET', key, 'count', 'previous', 'index')
+        local count = tonumber(fields[1]) or 0
+        local previous = tonumber(fields[2]) or 0
+        local stored = tonumber(fields[3]) or -1
+        local index = math.floor(now / window)
+        if stored ~= index then
+            if stored == index - 1 then previous = count else previous = 0 end
+            count = 0
+        end
+        local window_end = (index + 1) * window
+        used = previous * (window_end - now) / window + count
+        reset_at = window_end
+        retry = 0
+        allowed = used + 1 <= limit + tolerance
+        if not allowed then
+            if count + 1 <= limit then
+                retry = window * (1 - (limit - count - 1) / previous) - (now - index * window)
+            else
+                retry = window_end - now + window * (1 - (limit - 1) / count)
+            end
+        end
+        s.count = count
+        s.previous = previous
+        s.index = index
+    else
+        local fields = redis.call('HMGET', key, 'count', 'start')
+        local count = tonumber(fields[1]) or 0
+        local start = tonumber(fields[2]) or 0
+        if now - start >= window then
+            count = 0
+            start = now
+        end
+        used = count
+        allowed = count < limit
+        reset_at = start + window
+        retry = reset_at - now
+        s.count = count
+        s.start = start
+    end
+
+    if not allowed then all_allowed = false end
+    state[i] = s
+    out[#out + 1] = allowed and '1' or '0'
+    out[#out + 1] = tostring(used)
+    out[#out + 1] = tostring(reset_at)
+    out[#out + 1] = tostring(retry)
+end
+
+if consume and all_allowed then
+    for i, key in ipairs(KEYS) do
+        local s = state[i]
+        local ttl
+        if s.algorithm == 'gcra' then
+            redis.call('HSET', key, 'tat', tostring(s.tat))
+            ttl = s.tat - now
+        elseif s.algorithm == 'sliding_window_log' then
+            redis.call('RPUSH', key, tostring(now))
+            redis.call('LTRIM', key, -s.limit, -1)
+            ttl = s.window
+        elseif s.algorithm == 'sliding_window' then
+            redis.call('HSET', key, 'count', s.count + 1, 'previous', s.previous, 'index', s.index)
+            ttl = (s.index + 2) * s.window - now
+        else
+            redis.call('HSET', key, 'count', s.count + 1, 'start', tostring(s.start))
+            ttl = s.start + s.window - now
+        end
+        redis.call('PEXPIRE', key, math.max(1, math.ceil(ttl * 1000)))
+    end
+end
+
+out[#out + 1] = (consume and all_allowed) and '1' or '0'
+return out
+"""
     
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(self, redis_url: str = "redis://localhost:6379", client=None):
         self._redis_url = redis_url
-        self._client = None
+        self._client = client
+        self._script = None
     
     async def _get_client(self):
         """Get or create Redis client."""
         if self._client is None:
             try:
-                import aioredis
-                self._client = await aioredis.from_url(self._redis_url)
+                from redis import asyncio as aioredis
             except ImportError:
-                raise RuntimeError("aioredis package required for Redis storage")
+                try:
+                    import aioredis
+                except ImportError:
+                    raise RuntimeError("redis (or aioredis) package required for Redis storage")
+            self._client = aioredis.from_url(self._redis_url)
         return self._client
     
-    async def get(self, key: str) -> Optional[RateLimitEntry]:
+    def _key(self, key: str) -> str:
+        return f"ratelimit:{key}"
+    
+    @staticmethod
+    def _hash_tag(key: str) -> str:
+        start = key.find("{")
+        end = key.find("}", start + 1)
+        if start == -1 or end <= start + 1:
+            return key
+        return key[start + 1:end]
+    
+    async def hit(self, specs: List[RateLimitSpec], consume: bool = True) -> List[RateLimitResult]:
+        groups: Dict[str, List[int]] = {}
+        for i, spec in enumerate(specs):
+            groups.setdefault(self._hash_tag(spec.key), []).append(i)
+        if len(groups) == 1:
+            return await self._hit_slot(specs, consume)
+        
+        async def run(consume_slot: bool) -> List[RateLimitResult]:
+            results: List[Optional[RateLimitResult]] = [None] * len(specs)
+            for indexes in groups.values():
+                slot_results = await self._hit_slot([specs[i] for i in indexes], consume_slot)
+                for i, result in zip(indexes, slot_results):
+                    results[i] = result
+            return results
+        
+        results = await run(False)
+        if consume and all(result.allowed for result in results):
+            results = await run(True)
+        return results
+    
+    async def _hit_slot(self, specs: List[RateLimitSpec], consume: bool) -> List[RateLimitResult]:
+        """One script call over keys that share a hash tag."""
         client = await self._get_client()
-        data = await client.get(f"ratelimit:{key}")
-        if data:
-            entry_dict = json.loads(data)
-            return RateLimitEntry(**entry_dict)
-        return None
-    
-    async def set(self, key: str, entry: RateLimitEntry, ttl: int):
+        if self._script is None:
+            self._script = client.register_script(self._HIT_SCRIPT)
+        
+        args: List[Any] = ["1" if consume else "0", repr(CLOCK_TOLERANCE)]
+        for spec in specs:
+            args.extend([spec.strategy.algorithm, spec.limit, spec.window_seconds])
+        reply = await self._script(keys=[self._key(spec.key) for spec in specs], args=args)
+        
+        consumed = reply[-1] in (b"1", "1")
+        results = []
+        for i, spec in enumerate(specs):
+            allowed, used, reset_at, retry_after = reply[i * 4:i * 4 + 4]
+            results.append(_to_result(
+                spec,
+                allowed in (b"1", "1"),
+                consumed,
+                float(used),
+                float(reset_at),
+                float(retry_after),
+            ))
+        return results
+    
+    async def delete(self, *keys: str):
         client = await self._get_client()
-        data = json.dumps({
-            "key": entry.key,
-            "count": entry.count,
-            "window_start": entry.window_start,
-            "requests": entry.requests[-100:],  # Keep last 100 requests
-            "tokens": entry.tokens,
-        })
-        await client.setex(f"ratelimit:{key}", ttl, data)
-    
-    async def increment(self, key: str, window_seconds: int) -> Tuple[int, float]:
-        """Increment using Redis INCR with expiry."""
-        client = await self._get_client()
-        full_key = f"ratelimit:{key}"
-        
-        # Use Lua script for atomic operation
-        script = """
-        local current = redis.call('GET', KEYS[1])
-        local now = tonumber(ARGV[1])
-        local window = tonumber(ARGV[2])
-        
-        if current then
-            local data = cjson.decode(current)
-            if now - data.window_start >= window then
-                -- Reset window
-                data.count = 1
-                data.window_start = now
-            else
-                data.count = data.count + 1
-            end
-            redis.call('SETEX', KEYS[1], window * 2, cjson.encode(data))
-            return {data.count, data.window_start}
-        else
-            -- New entry
-            local data = {count = 1, window_start = now, requests = {}, tokens = 0}
-            redis.call('SETEX', KEYS[1], window * 2, cjson.encode(data))
-            return {1, now}
-        end
-        """
-        
-        now = time.time()
-        count = await client.incr(full_key)
-        
-        if count == 1:
-            await client.expire(full_key, window_seconds * 2)
-        
-        return count, now
+        await client.delete(*(self._key(key) for key in keys))
     
-    async def delete(self, key: str):
-        client = await self._get_client()
-        await client.delete(f"ratelimit:{key}")
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -384,72 +728,61 @@ class RateLimiter:
             rule_name: Name of rate limit rule
             identifier: User ID, IP address, or other identifier
             endpoint: Optional endpoint name
-            consume: Whether to consume a request (increment counter)
+            consume: Whether to consume a request (record it against the limit)
         
         Returns:
             RateLimitResult with allowed status and metadata
         """
-        rule = self._rules.get(rule_name, self._rules["default"])
-        key = rule.get_key(identifier, endpoint)
-        
-        if consume:
-            count, window_start = await self._storage.increment(
-                key, 
-                rule.window_seconds
-            )
-        else:
-            entry = await self._storage.get(key)
-            if entry:
-                count = entry.count
-                window_start = entry.window_start
-            else:
-                count = 0
-                window_start = time.time()
-        
-        now = time.time()
-        reset_at = window_start + rule.window_seconds
-        remaining = max(0, rule.limit - count)
-        allowed = count <= rule.limit
-        
-        # Check burst limit if configured
-        if allowed and rule.burst_limit:
-            burst_result = await self._check_burst(
-                key, 
-                rule.burst_limit, 
-                rule.burst_window or 1
-            )
-            if not burst_result:
-                allowed = False
-                remaining = 0
-        
-        retry_after = None
-        if not allowed:
-            retry_after = int(reset_at - now) + 1
-        
-        return RateLimitResult(
-            allowed=allowed,
-            limit=rule.limit,
-            remaining=remaining,
-            reset_at=reset_at,
-            retry_after=retry_after
-        )
+        results = await self.check_many([(rule_name, identifier, endpoint)], consume=consume)
+        return results[0]
     
-    async def _check_burst(
-        self, 
-        key: str, 
-        burst_limit: int, 
-        burst_window: int
-    ) -> bool:
-        """Check burst rate limit."""
-        burst_key = f"{key}:burst"
-        count, _ = await self._storage.increment(burst_key, burst_window)
-        return count <= burst_limit
+    async def check_many(
+        self,
+        checks: List[Tuple[str, str, Optional[str]]],
+        consume: bool = True
+    ) -> List[RateLimitResult]:
+        """
+        Check several rules in a single storage round-trip.
+        
+        Each rule's burst limit is checked along with it. When consuming,
+        the request counts against every rule only if all of them allow it.
+        
+        Args:
+            checks: (rule_name, identifier, endpoint) tuples
+            consume: Whether to consume a request
+        
+        Returns:
+            One RateLimitResult per check, in order
+        """
+        spans = []
+        specs: List[RateLimitSpec] = []
+        for rule_name, identifier, endpoint in checks:
+            rule = self._rules.get(rule_name, self._rules["default"])
+            rule_specs = rule.get_specs(identifier, endpoint)
+            spans.append((len(specs), len(rule_specs)))
+            specs.extend(rule_specs)
+        
+        decisions = await self._storage.hit(specs, consume=consume)
+        
+        results = []
+        for offset, count in spans:
+            result, *bursts = decisions[offset:offset + count]
+            for burst in bursts:
+                if not burst.allowed:
+                    result.allowed = False
+                    result.remaining = 0
+                    result.retry_after = max(result.retry_after or 0, burst.retry_after)
+            results.append(result)
+        return results
     
     async def reset(self, rule_name: str, identifier: str, endpoint: Optional[str] = None):
         """Reset rate limit for identifier."""
         rule = self._rules.get(rule_name, self._rules["default"])
-        key = rule.get_key(identifier, endpoint)
-        await self._storage.delete(key)
+        await self._storage.delete(*(spec.key for spec in rule.get_specs(identifier, endpoint)))
+    
+    async def close(self):
+        """Release storage resources (sweeper task, Redis connection)."""
+        await self._storage.close()
     
     def get_headers(self, result: RateLimitResult) -> Dict[str, str]:
         """Get rate limit response headers."""
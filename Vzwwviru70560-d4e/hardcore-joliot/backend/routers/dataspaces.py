@@ -7,6 +7,8 @@ DataSpace management for files, documents, and data organization.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import String, column, insert, select, table
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from typing import Optional, List
@@ -16,10 +18,43 @@ import uuid
 from config import get_db
 from schemas.base import BaseResponse, PaginatedResponse, PaginationMeta
 from routers.auth import require_auth
+from services.search_index import SearchDocument, get_search_index
 
 router = APIRouter()
 
 
+# Rows of models.dataspace.DataSpace: the store of record for ownership.
+# The search index is only a per-worker projection of it.
+_dataspaces = table(
+    "dataspaces",
+    column("id", UUID(as_uuid=False)),
+    column("user_id", UUID(as_uuid=False)),
+    column("name"),
+    column("description"),
+    column("dataspace_type"),
+    column("sphere_id"),
+    column("parent_id", UUID(as_uuid=False)),
+    column("status"),
+    column("tags", ARRAY(String)),
+    column("metadata", JSONB),
+    column("created_at"),
+    column("updated_at"),
+)
+
+
+async def _ensure_can_modify(db: AsyncSession, dataspace_id: str, user: dict) -> None:
+    """Refuse writes to a missing DataSpace or one that belongs to another identity."""
+    try:
+        uuid.UUID(dataspace_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="DataSpace not found")
+    owner = await db.scalar(select(_dataspaces.c.user_id).where(_dataspaces.c.id == dataspace_id))
+    if owner is None:
+        raise HTTPException(status_code=404, detail="DataSpace not found")
+    if owner != user["id"]:
+        raise HTTPException(status_code=403, detail="Cannot modify another identity's DataSpace")
+
+
 # ============================================================================
 # SCHEMAS
 # ============================================================================
@@ -190,6 +225,34 @@ async def create_dataspace(
         updated_at=now,
     )
     
+    await db.execute(insert(_dataspaces).values(
+        id=dataspace.id,
+        user_id=user["id"],
+        name=dataspace.name,
+        description=dataspace.description,
+        dataspace_type=dataspace.dataspace_type,
+        sphere_id=dataspace.sphere_id,
+        parent_id=dataspace.parent_id,
+        status=dataspace.status,
+        tags=dataspace.tags,
+        metadata=dataspace.metadata,
+        created_at=now,
+        updated_at=now,
+    ))
+    
+    get_search_index().upsert(SearchDocument(
+        id=dataspace.id,
+        resource_type="dataspace",
+        title=dataspace.name,
+        description=dataspace.description,
+        tags=dataspace.tags,
+        sphere_id=dataspace.sphere_id,
+        identity_id=user["id"],
+        url=f"/dataspaces/{dataspace.id}",
+        created_at=dataspace.created_at.isoformat(),
+        updated_at=dataspace.updated_at.isoformat(),
+    ))
+    
     return BaseResponse(success=True, data=dataspace)
 
 
@@ -201,6 +264,7 @@ async def update_dataspace(
     db: AsyncSession = Depends(get_db),
 ):
     """Update DataSpace."""
+    await _ensure_can_modify(db, dataspace_id, user)
     now = datetime.utcnow()
     
     dataspace = DataSpace(
@@ -215,6 +279,15 @@ async def update_dataspace(
         updated_at=now,
     )
     
+    get_search_index().patch(
+        dataspace_id,
+        identity_id=user["id"],
+        title=request.name,
+        description=request.description,
+        tags=request.tags,
+        updated_at=now.isoformat(),
+    )
+    
     return BaseResponse(success=True, data=dataspace)
 
 
@@ -225,6 +298,9 @@ async def archive_dataspace(
     db: AsyncSession = Depends(get_db),
 ):
     """Archive a DataSpace."""
+    await _ensure_can_modify(db, dataspace_id, user)
+    get_search_index().remove(dataspace_id, identity_id=user["id"])
+    
     return BaseResponse(
         success=True,
         data={"id": dataspace_id, "status": "archived"},
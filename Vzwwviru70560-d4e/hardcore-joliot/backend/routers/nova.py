@@ -238,3 +238,4 @@ async def get_conversation_history(
     ]
     
     return BaseResponse(success=True, data=history[:limit])
+
@@ -20,6 +20,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from routers.auth import get_current_user
+from services.search_index import SearchDocument, SearchIndex, get_search_index
+
 router = APIRouter()
 
 
@@ -136,6 +139,42 @@ MOCK_SEARCH_RESULTS = [
 ]
 
 
+# ============================================================================
+# INDEX
+# ============================================================================
+
+def start_search_index() -> SearchIndex:
+    """
+    Warm-start the shared index from its snapshot, seed the mock records as
+    shared documents and start autosave. Called from the app lifespan.
+    """
+    index = get_search_index()
+    index.load()
+    for item in MOCK_SEARCH_RESULTS:
+        if item["id"] not in index:
+            index.upsert(SearchDocument.from_record(item))
+    index.start_autosave()
+    return index
+
+
+async def stop_search_index() -> None:
+    """Stop autosave and flush pending changes. Called from the app lifespan."""
+    await get_search_index().stop_autosave()
+
+
+def _identity(user: Optional[dict]) -> Optional[str]:
+    return user["id"] if user else None
+
+
+def _facets(facets: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    return {
+        "by_type": facets["resource_type"],
+        "by_sphere": facets["sphere_id"],
+        "by_domain": facets["domain_id"],
+        "by_tag": facets["tag"],
+    }
+
+
 # ============================================================================
 # SEARCH
 # ============================================================================
@@ -148,90 +187,53 @@ async def search(
     domain_id: Optional[str] = None,
     tag: Optional[str] = None,
     limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    user: Optional[dict] = Depends(get_current_user),
 ):
     """
     Global search across all resources.
     
     GOUVERNANCE: Returns only results for current identity.
     """
-    query_lower = q.lower()
-    
-    results = []
-    for item in MOCK_SEARCH_RESULTS:
-        # Text match simulation
-        if query_lower in item["title"].lower() or query_lower in (item.get("description") or "").lower():
-            results.append(item)
-    
-    # Filter by types
-    if types:
-        type_list = types.split(",")
-        results = [r for r in results if r["resource_type"] in type_list]
-    
-    # Filter by sphere
-    if sphere_id:
-        results = [r for r in results if r["sphere_id"] == sphere_id]
-    
-    # Filter by domain
-    if domain_id:
-        results = [r for r in results if r.get("domain_id") == domain_id]
-    
-    # Filter by tag
-    if tag:
-        results = [r for r in results if tag in r.get("tags", [])]
-    
-    # Sort by score
-    results.sort(key=lambda x: x["score"], reverse=True)
-    
-    # Limit
-    results = results[:limit]
+    found = get_search_index().search(
+        q,
+        identity_id=_identity(user),
+        resource_types=types.split(",") if types else None,
+        sphere_ids=[sphere_id] if sphere_id else None,
+        domain_ids=[domain_id] if domain_id else None,
+        tags=[tag] if tag else None,
+        limit=limit,
+        offset=offset,
+    )
     
     return {
         "success": True,
         "data": {
             "query": q,
-            "results": results,
-            "total": len(results),
-            "facets": {
-                "by_type": _count_by_field(results, "resource_type"),
-                "by_sphere": _count_by_field(results, "sphere_id"),
-            },
+            "results": found["results"],
+            "total": found["total"],
+            "facets": _facets(found["facets"]),
         },
     }
 
 
 @router.post("", response_model=dict)
-async def advanced_search(data: SearchQuery):
+async def advanced_search(
+    data: SearchQuery,
+    user: Optional[dict] = Depends(get_current_user),
+):
     """
     Advanced search with filters.
     """
-    query_lower = data.query.lower()
-    
-    results = []
-    for item in MOCK_SEARCH_RESULTS:
-        if query_lower in item["title"].lower() or query_lower in (item.get("description") or "").lower():
-            results.append(item)
-    
-    # Filter by resource types
-    if data.resource_types:
-        results = [r for r in results if r["resource_type"] in data.resource_types]
-    
-    # Filter by spheres
-    if data.sphere_ids:
-        results = [r for r in results if r["sphere_id"] in data.sphere_ids]
-    
-    # Filter by domains
-    if data.domain_ids:
-        results = [r for r in results if r.get("domain_id") in data.domain_ids]
-    
-    # Filter by tags
-    if data.tags:
-        results = [r for r in results if any(t in r.get("tags", []) for t in data.tags)]
-    
-    # Sort by score
-    results.sort(key=lambda x: x["score"], reverse=True)
-    
-    # Limit
-    results = results[:data.limit]
+    found = get_search_index().search(
+        data.query,
+        identity_id=_identity(user),
+        resource_types=data.resource_types,
+        sphere_ids=data.sphere_ids,
+        domain_ids=data.domain_ids,
+        tags=data.tags,
+        limit=data.limit,
+    )
     
     return {
         "success": True,
@@ -243,44 +245,22 @@ async def advanced_search(data: SearchQuery):
                 "domain_ids": data.domain_ids,
                 "tags": data.tags,
             },
-            "results": results,
-            "total": len(results),
+            "results": found["results"],
+            "total": found["total"],
+            "facets": _facets(found["facets"]),
         },
     }
 
 
 @router.get("/suggestions", response_model=dict)
-async def get_suggestions(q: str = Query(..., min_length=1, max_length=100)):
+async def get_suggestions(
+    q: str = Query(..., min_length=1, max_length=100),
+    user: Optional[dict] = Depends(get_current_user),
+):
     """
     Get search suggestions (autocomplete).
     """
-    query_lower = q.lower()
-    
-    suggestions = []
-    seen = set()
-    
-    for item in MOCK_SEARCH_RESULTS:
-        # Title suggestions
-        if query_lower in item["title"].lower():
-            if item["title"] not in seen:
-                suggestions.append({
-                    "text": item["title"],
-                    "type": item["resource_type"],
-                    "id": item["id"],
-                })
-                seen.add(item["title"])
-        
-        # Tag suggestions
-        for tag in item.get("tags", []):
-            if query_lower in tag.lower() and tag not in seen:
-                suggestions.append({
-                    "text": tag,
-                    "type": "tag",
-                    "id": None,
-                })
-                seen.add(tag)
-    
-    suggestions = suggestions[:10]
+    suggestions = get_search_index().suggest(q, identity_id=_identity(user), limit=10)
     
     return {
         "success": True,
@@ -335,12 +315,3 @@ async def get_searchable_types():
         },
     }
 
-
-def _count_by_field(results: List[dict], field: str) -> Dict[str, int]:
-    """Count results by field."""
-    counts = {}
-    for r in results:
-        val = r.get(field)
-        if val:
-            counts[val] = counts.get(val, 0) + 1
-    return counts
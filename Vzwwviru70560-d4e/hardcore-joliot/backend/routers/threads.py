@@ -9,6 +9,8 @@ RÈGLE: Thread = APPEND-ONLY
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from sqlalchemy import column, insert, select, table
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from typing import Optional, List
@@ -18,10 +20,41 @@ import uuid
 from config import get_db
 from schemas.base import BaseResponse, PaginatedResponse, PaginationMeta, ThreadStatus
 from routers.auth import require_auth
+from services.search_index import SearchDocument, get_search_index
 
 router = APIRouter()
 
 
+# Rows of models.thread.Thread: the store of record for ownership. The
+# search index is only a per-worker projection of it.
+_threads = table(
+    "threads",
+    column("id", UUID(as_uuid=False)),
+    column("user_id", UUID(as_uuid=False)),
+    column("title"),
+    column("founding_intent"),
+    column("sphere_id"),
+    column("bureau_id"),
+    column("status"),
+    column("last_activity"),
+    column("created_at"),
+    column("updated_at"),
+)
+
+
+async def _ensure_can_modify(db: AsyncSession, thread_id: str, user: dict) -> None:
+    """Refuse writes to a missing thread or one that belongs to another identity."""
+    try:
+        uuid.UUID(thread_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Thread not found")
+    owner = await db.scalar(select(_threads.c.user_id).where(_threads.c.id == thread_id))
+    if owner is None:
+        raise HTTPException(status_code=404, detail="Thread not found")
+    if owner != user["id"]:
+        raise HTTPException(status_code=403, detail="Cannot modify another identity's thread")
+
+
 # ============================================================================
 # SCHEMAS
 # ============================================================================
@@ -217,7 +250,30 @@ async def create_thread(
         updated_at=now,
     )
     
-    # TODO: Save to database
+    await db.execute(insert(_threads).values(
+        id=thread.id,
+        user_id=user["id"],
+        title=thread.title,
+        founding_intent=thread.founding_intent,
+        sphere_id=thread.sphere_id,
+        bureau_id=thread.bureau_id,
+        status=thread.status.value,
+        last_activity=now,
+        created_at=now,
+        updated_at=now,
+    ))
+    
+    get_search_index().upsert(SearchDocument(
+        id=thread.id,
+        resource_type="thread",
+        title=thread.title,
+        description=thread.founding_intent,
+        sphere_id=thread.sphere_id,
+        identity_id=user["id"],
+        url=f"/threads/{thread.id}",
+        created_at=thread.created_at.isoformat(),
+        updated_at=thread.updated_at.isoformat(),
+    ))
     
     return BaseResponse(success=True, data=thread)
 
@@ -234,6 +290,7 @@ async def update_thread(
     
     RÈGLE: founding_intent is IMMUTABLE and cannot be changed.
     """
+    await _ensure_can_modify(db, thread_id, user)
     now = datetime.utcnow()
     
     # TODO: Fetch and update in database
@@ -250,6 +307,13 @@ async def update_thread(
         updated_at=now,
     )
     
+    get_search_index().patch(
+        thread_id,
+        identity_id=user["id"],
+        title=request.title,
+        updated_at=now.isoformat(),
+    )
+    
     return BaseResponse(success=True, data=thread)
 
 
@@ -260,8 +324,12 @@ async def archive_thread(
     db: AsyncSession = Depends(get_db),
 ):
     """Archive a thread (requires governance check)."""
+    await _ensure_can_modify(db, thread_id, user)
+    
     # TODO: Implement with governance check
     
+    get_search_index().remove(thread_id, identity_id=user["id"])
+    
     return BaseResponse(
         success=True,
         data={"id": thread_id, "status": "archived"},
@@ -331,6 +399,7 @@ async def add_thread_event(
     
     Events can only be added, never modified or deleted.
     """
+    await _ensure_can_modify(db, thread_id, user)
     now = datetime.utcnow()
     
     event = ThreadEvent(
@@ -346,4 +415,6 @@ async def add_thread_event(
     
     # TODO: Save to database
     
+    get_search_index().append(thread_id, request.content, identity_id=user["id"])
+    
     return BaseResponse(success=True, data=event)
@@ -0,0 +1,690 @@
+"""
+BUDGET LEDGER
+=============
+
+Concurrency-safe token/cost budgets for the LLM Router.
+
+A request reserves its estimated tokens and cost before it is sent,
+commits the actual usage when it completes, or refunds the reservation
+if it fails. Reservations can never overshoot a limit, across
+coroutines and across worker processes.
+
+Leases keep the hot path sub-millisecond. Each process atomically
+leases a slice of an identity's remaining budget from the shared
+backend, then serves reservations from that slice in memory. A new slice
+is leased only when the local one runs out. Unused slices go back to
+the backend when a window rolls over and on shutdown, so at most one
+slice per identity is stranded if a process dies.
+
+Actual usage is written behind in batches.
+
+Windows are calendar based: a day is a date and a month is a calendar
+month in the ledger's timezone (UTC by default). They are not rolling
+24h/30d spans from the first request.
+
+Backends (create_ledger_backend() picks one from LLM_BUDGET_BACKEND):
+- InMemoryLedgerBackend: single process ("memory", default)
+- SQLLedgerBackend: SQLite/Postgres through backend.core.database
+  (table created by alembic revision v80_004_llm_budget_ledger) ("sql")
+- RedisLedgerBackend: Redis through backend.core.redis (Lua for atomicity)
+  ("redis")
+
+VERSION: 1.1.0
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, tzinfo
+from decimal import Decimal, ROUND_CEILING
+from uuid import uuid4
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+# Costs are stored as integer micro-USD so every backend can add atomically
+MICROS_PER_USD = 1_000_000
+
+# (day period, month period), e.g. ("D:2025-03-31", "M:2025-03")
+Periods = Tuple[str, str]
+
+
+def to_micros(cost: Decimal) -> int:
+    """USD -> micro-USD, rounded up so reservations never under-count."""
+    return int((Decimal(cost) * MICROS_PER_USD).to_integral_value(rounding=ROUND_CEILING))
+
+
+def from_micros(micros: int) -> Decimal:
+    return Decimal(micros) / MICROS_PER_USD
+
+
+# =============================================================================
+# MODELS
+# =============================================================================
+
+class BudgetExhaustedError(Exception):
+    """Reservation does not fit in the remaining budget"""
+    pass
+
+
+@dataclass
+class BudgetLimits:
+    """Per-identity limits (defaults match TokenBudget)"""
+    daily_tokens: int = 100000
+    monthly_tokens: int = 1000000
+    daily_cost: Decimal = Decimal("10.0")
+    monthly_cost: Decimal = Decimal("100.0")
+
+    def for_periods(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """((day tokens, day micros), (month tokens, month micros))"""
+        return (
+            (self.daily_tokens, to_micros(self.daily_cost)),
+            (self.monthly_tokens, to_micros(self.monthly_cost)),
+        )
+
+
+@dataclass
+class Reservation:
+    """Budget held for one in-flight request"""
+    reservation_id: str
+    identity_id: str
+    periods: Periods
+    tokens: int
+    cost_micros: int
+    settled: bool = False
+
+
+@dataclass
+class _Lease:
+    """Local slice of an identity's budget for one (day, month) window"""
+    periods: Periods
+    tokens: int = 0
+    cost_micros: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class LedgerBackend(ABC):
+    """
+    Shared allocation store.
+
+    `allocated` counters enforce limits (they include leased but unused
+    budget); `used` counters record actual consumption for reporting.
+    """
+
+    @abstractmethod
+    async def acquire(
+        self,
+        identity_id: str,
+        periods: Periods,
+        want_tokens: int,
+        want_cost_micros: int,
+        limits: BudgetLimits
+    ) -> Tuple[int, int]:
+        """Atomically allocate up to the wanted amounts; returns the grant."""
+
+    @abstractmethod
+    async def release(
+        self,
+        identity_id: str,
+        periods: Periods,
+        tokens: int,
+        cost_micros: int
+    ) -> None:
+        """Return unused allocation (negative amounts allocate more)."""
+
+    @abstractmethod
+    async def record_usage(self, entries: List[Tuple[str, str, int, int]]) -> None:
+        """Add (identity_id, period, tokens, cost_micros) usage rows."""
+
+    @abstractmethod
+    async def usage(self, identity_id: str, period: str) -> Tuple[int, int]:
+        """(used tokens, used cost micros) of a period."""
+
+
+def _grant(
+    want: Tuple[int, int],
+    allocated: List[Tuple[int, int]],
+    limits: Tuple[Tuple[int, int], Tuple[int, int]]
+) -> Tuple[int, int]:
+    """Largest grant that keeps every window within its limits."""
+    tokens = min([want[0]] + [lim[0] - alloc[0] for alloc, lim in zip(allocated, limits)])
+    cost = min([want[1]] + [lim[1] - alloc[1] for alloc, lim in zip(allocated, limits)])
+    return max(tokens, 0), max(cost, 0)
+
+
+class InMemoryLedgerBackend(LedgerBackend):
+    """Process-local backend (no cross-worker enforcement)."""
+
+    def __init__(self):
+        # (identity_id, period) -> [allocated_tokens, allocated_micros, used_tokens, used_micros]
+        self._rows: Dict[Tuple[str, str], List[int]] = {}
+
+    def _row(self, identity_id: str, period: str) -> List[int]:
+        row = self._rows.get((identity_id, period))
+        if row is None:
+            row = self._rows[(identity_id, period)] = [0, 0, 0, 0]
+        return row
+
+    async def acquire(self, identity_id, periods, want_tokens, want_cost_micros, limits):
+        rows = [self._row(identity_id, p) for p in periods]
+        tokens, cost = _grant(
+            (want_tokens, want_cost_micros),
+            [(r[0], r[1]) for r in rows],
+            limits.for_periods()
+        )
+        for row in rows:
+            row[0] += tokens
+            row[1] += cost
+        return tokens, cost
+
+    async def release(self, identity_id, periods, tokens, cost_micros):
+        for period in periods:
+            row = self._row(identity_id, period)
+            row[0] -= tokens
+            row[1] -= cost_micros
+
+    async def record_usage(self, entries):
+        for identity_id, period, tokens, cost_micros in entries:
+            row = self._row(identity_id, period)
+            row[2] += tokens
+            row[3] += cost_micros
+
+    async def usage(self, identity_id, period):
+        row = self._rows.get((identity_id, period))
+        return (row[2], row[3]) if row else (0, 0)
+
+
+class SQLLedgerBackend(LedgerBackend):
+    """
+    SQLite/Postgres backend on the shared async engine.
+
+    acquire() locks both window rows with a no-op UPDATE (a row lock on
+    Postgres, the write lock on SQLite), computes the grant and applies it
+    in the same transaction. Rows are always locked day-then-month, so
+    concurrent acquisitions cannot deadlock.
+
+    The table is created by alembic revision v80_004_llm_budget_ledger.
+    """
+
+    TABLE = "llm_budget_ledger"
+
+    def __init__(self, session_factory: Optional[Callable] = None):
+        self._session_factory = session_factory
+
+    def _sessions(self) -> Callable:
+        if self._session_factory is None:
+            from backend.core.database import async_session_factory
+            self._session_factory = async_session_factory
+        return self._session_factory
+
+    async def acquire(self, identity_id, periods, want_tokens, want_cost_micros, limits):
+        from sqlalchemy import text
+
+        async with self._sessions()() as session:
+            async with session.begin():
+                allocated = []
+                for period in periods:
+                    await session.execute(
+                        text(
+                            f"INSERT INTO {self.TABLE} (identity_id, period) "
+                            "VALUES (:identity_id, :period) ON CONFLICT DO NOTHING"
+                        ),
+                        {"identity_id": identity_id, "period": period}
+                    )
+                    result = await session.execute(
+                        text(
+                            f"UPDATE {self.TABLE} SET allocated_tokens = allocated_tokens "
+                            "WHERE identity_id = :identity_id AND period = :period "
+                            "RETURNING allocated_tokens, allocated_cost_micros"
+                        ),
+                        {"identity_id": identity_id, "period": period}
+                    )
+                    row = result.one()
+                    allocated.append((int(row[0]), int(row[1])))
+
+                tokens, cost = _grant(
+                    (want_tokens, want_cost_micros), allocated, limits.for_periods()
+                )
+                if tokens or cost:
+                    await self._add(session, identity_id, periods, tokens, cost, "allocated")
+        return tokens, cost
+
+    async def _add(self, session, identity_id, periods, tokens, cost_micros, kind) -> None:
+        from sqlalchemy import text
+        for period in periods:
+            await session.execute(
+                text(
+                    f"UPDATE {self.TABLE} SET "
+                    f"{kind}_tokens = {kind}_tokens + :tokens, "
+                    f"{kind}_cost_micros = {kind}_cost_micros + :cost "
+                    "WHERE identity_id = :identity_id AND period = :period"
+                ),
+                {"identity_id": identity_id, "period": period,
+                 "tokens": tokens, "cost": cost_micros}
+            )
+
+    async def release(self, identity_id, periods, tokens, cost_micros):
+        async with self._sessions()() as session:
+            async with session.begin():
+                await self._add(session, identity_id, periods, -tokens, -cost_micros, "allocated")
+
+    async def record_usage(self, entries):
+        if not entries:
+            return
+        async with self._sessions()() as session:
+            async with session.begin():
+                for identity_id, period, tokens, cost_micros in entries:
+                    await self._add(session, identity_id, (period,), tokens, cost_micros, "used")
+
+    async def usage(self, identity_id, period):
+        from sqlalchemy import text
+        async with self._sessions()() as session:
+            result = await session.execute(
+                text(
+                    f"SELECT used_tokens, used_cost_micros FROM {self.TABLE} "
+                    "WHERE identity_id = :identity_id AND period = :period"
+                ),
+                {"identity_id": identity_id, "period": period}
+            )
+            row = result.first()
+        return (int(row[0]), int(row[1])) if row else (0, 0)
+
+
+class RedisLedgerBackend(LedgerBackend):
+    """
+    Redis backend; one hash per (identity, period).
+
+    The grant is computed and applied by a Lua script, so it is atomic
+    across all workers sharing the Redis instance.
+    """
+
+    PREFIX = "chenu:llm_budget"
+    DAY_TTL_SECONDS = 3 * 86400
+    MONTH_TTL_SECONDS = 40 * 86400
+
+    _ACQUIRE_SCRIPT = """
+local grant_t = tonumber(ARGV[1])
+local grant_c = tonumber(ARGV[2])
+for i = 1, 2 do
+    local alloc_t = tonumber(redis.call('HGET', KEYS[i], 'alloc_t') or '0')
+    local alloc_c = tonumber(redis.call('HGET', KEYS[i], 'alloc_c') or '0')
+    grant_t = math.min(grant_t, tonumber(ARGV[1 + 2 * i]) - alloc_t)
+    grant_c = math.min(grant_c, tonumber(ARGV[2 + 2 * i]) - alloc_c)
+end
+if grant_t < 0 then grant_t = 0 end
+if grant_c < 0 then grant_c = 0 end
+for i = 1, 2 do
+    redis.call('HINCRBY', KEYS[i], 'alloc_t', grant_t)
+    redis.call('HINCRBY', KEYS[i], 'alloc_c', grant_c)
+    redis.call('EXPIRE', KEYS[i], ARGV[6 + i])
+end
+return {grant_t, grant_c}
+"""
+
+    def __init__(self, client_factory: Optional[Callable] = None):
+        self._client_factory = client_factory
+        self._script = None
+
+    async def _client(self):
+        if self._client_factory is None:
+            from backend.core.redis import get_redis
+            self._client_factory = get_redis
+        return await self._client_factory()
+
+    def _key(self, identity_id: str, period: str) -> str:
+        # The hash tag keeps an identity's day and month keys in one Redis
+        # Cluster slot, as the acquire script needs both
+        return f"{self.PREFIX}:{{{identity_id}}}:{period}"
+
+    async def acquire(self, identity_id, periods, want_tokens, want_cost_micros, limits):
+        client = await self._client()
+        if self._script is None:
+            self._script = client.register_script(self._ACQUIRE_SCRIPT)
+        (day_t, day_c), (month_t, month_c) = limits.for_periods()
+        tokens, cost = await self._script(
+            keys=[self._key(identity_id, p) for p in periods],
+            args=[
+                want_tokens, want_cost_micros,
+                day_t, day_c, month_t, month_c,
+                self.DAY_TTL_SECONDS, self.MONTH_TTL_SECONDS,
+            ]
+        )
+        return int(tokens), int(cost)
+
+    async def release(self, identity_id, periods, tokens, cost_micros):
+        client = await self._client()
+        async with client.pipeline(transaction=True) as pipe:
+            for period in periods:
+                key = self._key(identity_id, period)
+                pipe.hincrby(key, "alloc_t", -tokens)
+                pipe.hincrby(key, "alloc_c", -cost_micros)
+            await pipe.execute()
+
+    async def record_usage(self, entries):
+        if not entries:
+            return
+        client = await self._client()
+        async with client.pipeline(transaction=False) as pipe:
+            for identity_id, period, tokens, cost_micros in entries:
+                key = self._key(identity_id, period)
+                pipe.hincrby(key, "used_t", tokens)
+                pipe.hincrby(key, "used_c", cost_micros)
+            await pipe.execute()
+
+    async def usage(self, identity_id, period):
+        client = await self._client()
+        used_t, used_c = await client.hmget(self._key(identity_id, period), "used_t", "used_c")
+        return int(used_t or 0), int(used_c or 0)
+
+
+# =============================================================================
+# LEDGER
+# =============================================================================
+
+def create_ledger_backend(name: Optional[str] = None) -> LedgerBackend:
+    """
+    Backend named by `name`, or by LLM_BUDGET_BACKEND when omitted:
+    "memory" (default), "sql" or "redis".
+    """
+    name = (name or os.getenv("LLM_BUDGET_BACKEND", "memory")).lower()
+    if name == "memory":
+        return InMemoryLedgerBackend()
+    if name == "sql":
+        return SQLLedgerBackend()
+    if name == "redis":
+        return RedisLedgerBackend()
+    raise ValueError(f"Unknown budget ledger backend: {name}")
+
+
+class BudgetLedger:
+    """
+    Reserve / commit / refund against leased budget slices.
+
+    reserve() only awaits the backend when the local lease cannot cover
+    the request; commit() and refund() never await. Usage is queued and
+    written to the backend by flush(), periodically once start() is called.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[LedgerBackend] = None,
+        default_limits: Optional[BudgetLimits] = None,
+        lease_fraction: float = 0.05,
+        flush_interval_seconds: float = 1.0,
+        max_pending: int = 1000,
+        tz: tzinfo = timezone.utc
+    ):
+        self.backend = backend or InMemoryLedgerBackend()
+        self.default_limits = default_limits or BudgetLimits()
+        self.lease_fraction = lease_fraction
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self.tz = tz
+
+        self._limits: Dict[str, BudgetLimits] = {}
+        self._leases: Dict[str, _Lease] = {}
+        self._released: List[Tuple[str, Periods, int, int]] = []
+
+        # Write-behind usage: (identity_id, period) -> [tokens, cost_micros]
+        self._pending: Dict[Tuple[str, str], List[int]] = {}
+        # Usage committed by this process in the current windows:
+        # (identity_id, period) -> [tokens, cost_micros]
+        self._local_usage: Dict[Tuple[str, str], List[int]] = {}
+        self._local_periods: Optional[Periods] = None
+
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        self.stats = {"reservations": 0, "rejections": 0, "lease_acquisitions": 0, "flushes": 0}
+
+    # -------------------------------------------------------------------------
+    # WINDOWS & LIMITS
+    # -------------------------------------------------------------------------
+
+    def periods(self, now: Optional[datetime] = None) -> Periods:
+        """Calendar day and month keys for `now` in the ledger timezone."""
+        now = (now or datetime.now(timezone.utc)).astimezone(self.tz)
+        return f"D:{now:%Y-%m-%d}", f"M:{now:%Y-%m}"
+
+    def get_limits(self, identity_id: str) -> BudgetLimits:
+        return self._limits.get(identity_id, self.default_limits)
+
+    def set_limits(self, identity_id: str, limits: BudgetLimits) -> None:
+        self._limits[identity_id] = limits
+
+    def _lease_for(self, identity_id: str, periods: Periods) -> _Lease:
+        lease = self._leases.get(identity_id)
+        if lease is None or lease.periods != periods:
+            if lease is not None and (lease.tokens > 0 or lease.cost_micros > 0):
+                # Window rolled over: hand the old slice back
+                self._released.append(
+                    (identity_id, lease.periods, max(lease.tokens, 0), max(lease.cost_micros, 0))
+                )
+            lease = self._leases[identity_id] = _Lease(periods=periods)
+        return lease
+
+    # -------------------------------------------------------------------------
+    # RESERVE / COMMIT / REFUND
+    # -------------------------------------------------------------------------
+
+    async def reserve(self, identity_id: str, tokens: int, cost: Decimal) -> Reservation:
+        """
+        Hold `tokens` and `cost` for a request.
+
+        Raises:
+            BudgetExhaustedError: If the remaining budget cannot cover it
+        """
+        cost_micros = to_micros(cost)
+        periods = self.periods()
+        lease = self._lease_for(identity_id, periods)
+
+        if lease.tokens < tokens or lease.cost_micros < cost_micros:
+            async with lease.lock:
+                if lease.tokens < tokens or lease.cost_micros < cost_micros:
+                    await self._extend_lease(identity_id, lease, tokens, cost_micros)
+
+            if lease.tokens < tokens or lease.cost_micros < cost_micros:
+                self.stats["rejections"] += 1
+                raise BudgetExhaustedError(
+                    f"Budget exhausted for identity {identity_id}"
+                )
+
+        lease.tokens -= tokens
+        lease.cost_micros -= cost_micros
+        self.stats["reservations"] += 1
+
+        return Reservation(
+            reservation_id=str(uuid4()),
+            identity_id=identity_id,
+            periods=periods,
+            tokens=tokens,
+            cost_micros=cost_micros
+        )
+
+    async def _extend_lease(
+        self,
+        identity_id: str,
+        lease: _Lease,
+        tokens: int,
+        cost_micros: int
+    ) -> None:
+        limits = self.get_limits(identity_id)
+        (day_tokens, day_micros), _ = limits.for_periods()
+        want_tokens = max(tokens - lease.tokens, int(day_tokens * self.lease_fraction))
+        want_micros = max(cost_micros - lease.cost_micros, int(day_micros * self.lease_fraction))
+
+        granted_tokens, granted_micros = await self.backend.acquire(
+            identity_id, lease.periods, want_tokens, want_micros, limits
+        )
+        lease.tokens += granted_tokens
+        lease.cost_micros += granted_micros
+        self.stats["lease_acquisitions"] += 1
+
+    def commit(self, reservation: Reservation, tokens: int, cost: Decimal) -> None:
+        """Settle a reservation with the actual usage."""
+        if reservation.settled:
+            return
+        reservation.settled = True
+        cost_micros = to_micros(cost)
+
+        unused_tokens = reservation.tokens - tokens
+        unused_micros = reservation.cost_micros - cost_micros
+
+        lease = self._leases.get(reservation.identity_id)
+        if lease is not None and lease.periods == reservation.periods:
+            # Over- or under-estimate goes back to (or comes out of) the slice
+            lease.tokens += unused_tokens
+            lease.cost_micros += unused_micros
+        elif unused_tokens or unused_micros:
+            # The reservation's window rolled over and its slice was handed
+            # back: settle the difference against that window directly
+            self._released.append((
+                reservation.identity_id, reservation.periods, unused_tokens, unused_micros
+            ))
+
+        current = self._current_local_periods()
+        for period in reservation.periods:
+            tables = (self._pending, self._local_usage) if period in current else (self._pending,)
+            for table in tables:
+                usage = table.setdefault((reservation.identity_id, period), [0, 0])
+                usage[0] += tokens
+                usage[1] += cost_micros
+
+        if len(self._pending) >= self.max_pending and self._task is not None:
+            asyncio.ensure_future(self.flush())
+
+    def refund(self, reservation: Reservation) -> None:
+        """Release a reservation that used nothing."""
+        self.commit(reservation, 0, Decimal("0"))
+
+    def _current_local_periods(self) -> Periods:
+        """Current windows; local usage of past windows is dropped on rollover."""
+        periods = self.periods()
+        if periods != self._local_periods:
+            self._local_periods = periods
+            self._local_usage = {
+                key: usage for key, usage in self._local_usage.items() if key[1] in periods
+            }
+        return periods
+
+    # -------------------------------------------------------------------------
+    # WRITE-BEHIND
+    # -------------------------------------------------------------------------
+
+    async def flush(self) -> None:
+        """Write queued usage and returned lease slices to the backend."""
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            released, self._released = self._released, []
+            try:
+                await self.backend.record_usage([
+                    (identity_id, period, usage[0], usage[1])
+                    for (identity_id, period), usage in pending.items()
+                ])
+                for identity_id, periods, tokens, cost_micros in released:
+                    await self.backend.release(identity_id, periods, tokens, cost_micros)
+            except Exception as e:
+                logger.error(f"Budget ledger flush failed: {e}")
+                # Keep the data for the next attempt
+                for key, usage in pending.items():
+                    current = self._pending.setdefault(key, [0, 0])
+                    current[0] += usage[0]
+                    current[1] += usage[1]
+                self._released.extend(released)
+                return
+            self.stats["flushes"] += 1
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    def start(self) -> None:
+        """Start periodic write-behind."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop write-behind, return all leases and flush."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for identity_id, lease in self._leases.items():
+            if lease.tokens > 0 or lease.cost_micros > 0:
+                self._released.append(
+                    (identity_id, lease.periods, max(lease.tokens, 0), max(lease.cost_micros, 0))
+                )
+        self._leases.clear()
+        await self.flush()
+
+    # -------------------------------------------------------------------------
+    # QUERIES
+    # -------------------------------------------------------------------------
+
+    def local_usage(self, identity_id: str) -> Dict[str, Any]:
+        """Usage committed by this process in the current windows."""
+        day, month = self.periods()
+        day_usage = self._local_usage.get((identity_id, day), [0, 0])
+        month_usage = self._local_usage.get((identity_id, month), [0, 0])
+        return {
+            "daily_tokens": day_usage[0],
+            "daily_cost": from_micros(day_usage[1]),
+            "monthly_tokens": month_usage[0],
+            "monthly_cost": from_micros(month_usage[1]),
+        }
+
+    async def usage(self, identity_id: str) -> Dict[str, Any]:
+        """Usage of all processes in the current windows (flushes first)."""
+        await self.flush()
+        day, month = self.periods()
+        day_tokens, day_micros = await self.backend.usage(identity_id, day)
+        month_tokens, month_micros = await self.backend.usage(identity_id, month)
+        return {
+            "daily_tokens": day_tokens,
+            "daily_cost": from_micros(day_micros),
+            "monthly_tokens": month_tokens,
+            "monthly_cost": from_micros(month_micros),
+        }
+
+    def window_starts(self, now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+        """Start of the current day and month windows."""
+        now = (now or datetime.now(timezone.utc)).astimezone(self.tz)
+        day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return day, day.replace(day=1)
+
+    @property
+    def identities(self) -> int:
+        return len(set(self._limits) | set(self._leases))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "backend": type(self.backend).__name__,
+            "active_leases": len(self._leases),
+            "pending_usage_rows": len(self._pending),
+        }
+
+
+__all__ = [
+    "BudgetLedger",
+    "BudgetLimits",
+    "Reservation",
+    "BudgetExhaustedError",
+    "LedgerBackend",
+    "InMemoryLedgerBackend",
+    "SQLLedgerBackend",
+    "RedisLedgerBackend",
+    "create_ledger_backend",
+]
@@ -12,21 +12,32 @@ Features:
 - Human gate result caching (short TTL)
 - Checkpoint caching (pending states)
 - Multi-level cache (hot/warm)
+- O(1) LRU eviction with optional W-TinyLFU admission
+- Byte budgets and per-namespace quotas
+- Sharded (lock-striped) L1 with timing-wheel expiry sweeps
+- Indexed pattern invalidation and O(1) epoch invalidation
+- Single-flight loading with stale-while-revalidate and XFetch early refresh
 
 R&D Compliance:
 - Rule #3: Cache keys scoped by identity
 - Rule #6: All cache operations logged
 """
 
-from typing import Optional, Any, Dict, List, Callable, TypeVar, Union
+from typing import Optional, Any, Awaitable, Dict, List, Callable, Tuple, TypeVar, Union
 from datetime import datetime, timedelta
 from uuid import UUID
+from collections import OrderedDict
 import json
 import hashlib
 import asyncio
 import logging
+import math
+import random
+import sys
+import time
+from fnmatch import fnmatchcase
 from functools import wraps
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -34,6 +45,9 @@ logger = logging.getLogger(__name__)
 # Type variable for generic caching
 T = TypeVar('T')
 
+# Marks values stored by CacheService.get_or_compute (value + refresh metadata)
+_ENVELOPE_MARKER = "__chenu_swr__"
+
 
 class CacheTier(str, Enum):
     """Cache tier levels."""
@@ -56,13 +70,27 @@ class CacheNamespace(str, Enum):
     STATS = "stats"
 
 
+class EvictionPolicy(str, Enum):
+    """Eviction policies for the in-memory cache."""
+    LRU = "lru"              # Plain least-recently-used
+    TINY_LFU = "tiny_lfu"    # W-TinyLFU: LRU window + frequency-gated main area
+
+
 @dataclass
 class CacheConfig:
     """Configuration for cache behavior."""
     default_ttl: int = 300  # 5 minutes
     hot_ttl: int = 60       # 1 minute
     warm_ttl: int = 900     # 15 minutes
-    max_size: int = 10000   # Max entries per namespace
+    max_size: int = 10000   # Max entries in the L1 cache
+    max_bytes: Optional[int] = None  # Estimated byte budget (None = unbounded)
+    eviction_policy: EvictionPolicy = EvictionPolicy.LRU
+    tiny_lfu_window_ratio: float = 0.01  # Share of max_size kept as LRU window
+    # Max entries per namespace, e.g. {CacheNamespace.LLM: 2000}
+    namespace_quotas: Dict[CacheNamespace, int] = field(default_factory=dict)
+    l1_shards: int = 1               # >1 enables the lock-striped sharded L1
+    expiry_tick_seconds: float = 1.0  # Timing wheel resolution
+    sweep_interval_seconds: float = 1.0  # Background expiry sweep period
     enable_stats: bool = True
     compress_threshold: int = 1024  # Compress if larger than 1KB
 
@@ -78,6 +106,8 @@ class CacheEntry:
     identity_id: Optional[str] = None
     hits: int = 0
     size_bytes: int = 0
+    deadline: float = 0.0  # time.monotonic() value at which the entry expires
+    epoch: Tuple[int, int] = (0, 0)  # (namespace, identity) generations at set
 
 
 @dataclass
@@ -88,6 +118,8 @@ class CacheStats:
     sets: int = 0
     deletes: int = 0
     evictions: int = 0
+    rejections: int = 0  # New entries refused by TinyLFU admission
+    expirations: int = 0  # Entries removed by the expiry sweeper
     total_size_bytes: int = 0
     namespaces: Dict[str, int] = field(default_factory=dict)
     
@@ -158,34 +190,468 @@ class CacheKeyBuilder:
         return hashlib.md5(sorted_params.encode()).hexdigest()[:12]
 
 
+# ==================== Eviction Engine ====================
+
+_SIZE_SAMPLE = 32  # Children inspected before extrapolating a container size
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Cheap size estimate of a cached value in bytes.
+    
+    Uses sys.getsizeof on the value and its direct children instead of
+    serializing it. Large containers are sampled and extrapolated, so the
+    cost is bounded regardless of the value size.
+    """
+    size = sys.getsizeof(value)
+    
+    if isinstance(value, dict):
+        count = len(value)
+        sampled = 0
+        child_size = 0
+        for k, v in value.items():
+            child_size += sys.getsizeof(k) + sys.getsizeof(v)
+            sampled += 1
+            if sampled >= _SIZE_SAMPLE:
+                break
+        if sampled:
+            size += child_size * count // sampled
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        count = len(value)
+        sampled = 0
+        child_size = 0
+        for item in value:
+            child_size += sys.getsizeof(item)
+            sampled += 1
+            if sampled >= _SIZE_SAMPLE:
+                break
+        if sampled:
+            size += child_size * count // sampled
+    
+    return size
+
+
+class FrequencySketch:
+    """
+    Count-Min sketch with 4-bit saturating counters.
+    
+    Estimates how often a key was seen recently. Counters are halved every
+    `sample_size` increments so old popularity fades out (TinyLFU aging).
+    """
+    
+    DEPTH = 4
+    MAX_COUNT = 15
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+    _MASK64 = 0xFFFFFFFFFFFFFFFF
+    _HALVE = bytes(i >> 1 for i in range(256))
+    
+    def __init__(self, capacity: int):
+        # ~4 counters per cached key keeps collision overestimates low
+        width = 16
+        while width < 4 * capacity:
+            width <<= 1
+        self._shift = 64 - (width.bit_length() - 1)
+        self._rows = [bytearray(width) for _ in range(self.DEPTH)]
+        self._sample_size = 10 * max(capacity, 16)
+        self._additions = 0
+    
+    def _indexes(self, key: str) -> List[int]:
+        # Multiplicative hashing with one odd constant per row; the top
+        # bits of the product depend on every bit of the key hash
+        h = hash(key) & self._MASK64
+        return [((h * seed) & self._MASK64) >> self._shift for seed in self._SEEDS]
+    
+    def increment(self, key: str) -> None:
+        """Record one occurrence of key."""
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+        
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+    
+    def frequency(self, key: str) -> int:
+        """Estimated recent frequency of key (0-15)."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+    
+    def _reset(self) -> None:
+        """Halve every counter to age out stale popularity."""
+        self._rows = [bytearray(row.translate(self._HALVE)) for row in self._rows]
+        self._additions //= 2
+    
+    def clear(self) -> None:
+        for row in self._rows:
+            row[:] = bytes(len(row))
+        self._additions = 0
+
+
+class LRUPolicy:
+    """Least-recently-used ordering over cache keys, O(1) per operation."""
+    
+    def __init__(self):
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+    
+    def on_insert(self, key: str) -> None:
+        self._order[key] = None
+    
+    def on_access(self, key: str) -> None:
+        self._order.move_to_end(key)
+    
+    def on_miss(self, key: str) -> None:
+        pass
+    
+    def on_remove(self, key: str) -> None:
+        self._order.pop(key, None)
+    
+    def victim(self) -> Tuple[Optional[str], bool]:
+        """Return (key to evict, whether it is a refused newcomer)."""
+        return next(iter(self._order), None), False
+    
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class TinyLFUPolicy:
+    """
+    W-TinyLFU eviction.
+    
+    New keys land in a small LRU window. Keys pushed out of the window
+    become admission candidates for the main area: when the cache is
+    full, a candidate only stays if the frequency sketch says it is more
+    popular than the main area's LRU victim. This keeps one-hit wonders
+    (scans, unique LLM prompts) from flushing the hot set.
+    """
+    
+    def __init__(self, capacity: int, window_ratio: float = 0.01):
+        self._window_capacity = max(1, int(capacity * window_ratio))
+        self._window: "OrderedDict[str, None]" = OrderedDict()
+        self._main: "OrderedDict[str, None]" = OrderedDict()
+        self._candidate: Optional[str] = None
+        self.sketch = FrequencySketch(capacity)
+    
+    def on_insert(self, key: str) -> None:
+        self.sketch.increment(key)
+        self._window[key] = None
+        
+        if len(self._window) > self._window_capacity:
+            promoted, _ = self._window.popitem(last=False)
+            self._main[promoted] = None
+            self._candidate = promoted
+    
+    def on_access(self, key: str) -> None:
+        self.sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        else:
+            self._main.move_to_end(key)
+            if key == self._candidate:
+                self._candidate = None
+    
+    def on_miss(self, key: str) -> None:
+        self.sketch.increment(key)
+    
+    def on_remove(self, key: str) -> None:
+        if key in self._window:
+            del self._window[key]
+        else:
+            self._main.pop(key, None)
+        if key == self._candidate:
+            self._candidate = None
+    
+    def victim(self) -> Tuple[Optional[str], bool]:
+        """Return (key to evict, whether it is a refused newcomer)."""
+        main_victim = next(iter(self._main), None)
+        candidate = self._candidate
+        
+        if candidate is not None and main_victim is not None and candidate != main_victim:
+            self._candidate = None
+            if self.sketch.frequency(candidate) > self.sketch.frequency(main_victim):
+                return main_victim, False
+            return candidate, True
+        
+        if main_victim is not None:
+            return main_victim, False
+        return next(iter(self._window), None), False
+    
+    def clear(self) -> None:
+        self._window.clear()
+        self._main.clear()
+        self._candidate = None
+        self.sketch.clear()
+
+
+# ==================== Expiry ====================
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel for TTL expiry.
+    
+    Keys are bucketed by expiry tick across `levels` wheels of `slots`
+    slots each (level n covers slots**(n+1) ticks). Advancing the wheel
+    only visits the buckets whose time has come and cascades coarser
+    buckets down as their range is reached, so scheduling and expiring
+    a key are both O(1) amortized.
+    
+    Cancellation is lazy: the wheel remembers the latest deadline per
+    key and skips stale bucket members when they come up.
+    """
+    
+    def __init__(
+        self,
+        tick: float = 1.0,
+        slots: int = 64,
+        levels: int = 3,
+        now: Optional[float] = None
+    ):
+        self._tick = tick
+        self._slots = slots
+        self._levels = levels
+        self._wheels: List[List[set]] = [
+            [set() for _ in range(slots)] for _ in range(levels)
+        ]
+        self._deadlines: Dict[str, float] = {}
+        self._current = int((time.monotonic() if now is None else now) / tick)
+    
+    def __len__(self) -> int:
+        return len(self._deadlines)
+    
+    def _tick_of(self, deadline: float) -> int:
+        return math.ceil(deadline / self._tick)
+    
+    def _place(self, key: str, expiry_tick: int) -> None:
+        delta = expiry_tick - self._current
+        span = self._slots
+        for level in range(self._levels):
+            if delta < span or level == self._levels - 1:
+                index = (expiry_tick // (span // self._slots)) % self._slots
+                self._wheels[level][index].add(key)
+                return
+            span *= self._slots
+    
+    def schedule(self, key: str, deadline: float) -> None:
+        """Schedule (or reschedule) key to expire at a monotonic deadline."""
+        self._deadlines[key] = deadline
+        self._place(key, max(self._tick_of(deadline), self._current + 1))
+    
+    def cancel(self, key: str) -> None:
+        """Forget key; its bucket slot is cleaned up lazily."""
+        self._deadlines.pop(key, None)
+    
+    def advance(self, now: float) -> List[str]:
+        """Move the wheel to `now` and return keys whose deadline has passed."""
+        target = int(now / self._tick)
+        due: List[str] = []
+        
+        while self._current < target:
+            self._current += 1
+            
+            # Cascade coarser wheels whose range starts at this tick,
+            # coarsest first so keys can fall through several levels
+            spans = []
+            span = self._slots
+            for level in range(1, self._levels):
+                if self._current % span:
+                    break
+                spans.append((level, span))
+                span *= self._slots
+            
+            for level, span in reversed(spans):
+                index = (self._current // span) % self._slots
+                bucket = self._wheels[level][index]
+                self._wheels[level][index] = set()
+                for key in bucket:
+                    deadline = self._deadlines.get(key)
+                    if deadline is None:
+                        continue
+                    expiry_tick = self._tick_of(deadline)
+                    if expiry_tick <= self._current:
+                        del self._deadlines[key]
+                        due.append(key)
+                    else:
+                        self._place(key, expiry_tick)
+            
+            index = self._current % self._slots
+            bucket = self._wheels[0][index]
+            self._wheels[0][index] = set()
+            for key in bucket:
+                deadline = self._deadlines.get(key)
+                # Skip cancelled keys and keys rescheduled to a later tick
+                if deadline is not None and self._tick_of(deadline) <= self._current:
+                    del self._deadlines[key]
+                    due.append(key)
+        
+        return due
+    
+    def clear(self) -> None:
+        for wheel in self._wheels:
+            for bucket in wheel:
+                bucket.clear()
+        self._deadlines.clear()
+
+
+# ==================== Key Index ====================
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+class KeyIndex:
+    """
+    Segment index over cache keys.
+    
+    Keys built by CacheKeyBuilder (chenu:{namespace}:{identity}:{resource}...)
+    are filed under namespace -> identity -> resource head. Pattern lookups
+    walk the literal leading segments of the pattern and only glob-match
+    the keys below the deepest node reached, so namespace and identity
+    invalidation cost is proportional to the matching keys rather than
+    the whole keyspace.
+    """
+    
+    DEPTH = 3  # namespace, identity, resource head
+    
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+        self._other: set = set()  # Keys not in CacheKeyBuilder format
+    
+    def _path(self, key: str) -> Optional[List[str]]:
+        parts = key.split(":", self.DEPTH + 1)
+        if len(parts) <= self.DEPTH or parts[0] != CacheKeyBuilder.PREFIX:
+            return None
+        return parts[1:self.DEPTH + 1]
+    
+    def add(self, key: str) -> None:
+        path = self._path(key)
+        if path is None:
+            self._other.add(key)
+            return
+        
+        node = self._root
+        for segment in path[:-1]:
+            node = node.setdefault(segment, {})
+        node.setdefault(path[-1], set()).add(key)
+    
+    def remove(self, key: str) -> None:
+        path = self._path(key)
+        if path is None:
+            self._other.discard(key)
+            return
+        
+        nodes = [self._root]
+        for segment in path[:-1]:
+            child = nodes[-1].get(segment)
+            if child is None:
+                return
+            nodes.append(child)
+        
+        leaf = nodes[-1].get(path[-1])
+        if leaf is None:
+            return
+        leaf.discard(key)
+        
+        # Prune empty branches bottom-up
+        if not leaf:
+            del nodes[-1][path[-1]]
+            for depth in range(len(nodes) - 1, 0, -1):
+                if nodes[depth]:
+                    break
+                del nodes[depth - 1][path[depth - 1]]
+    
+    def match(self, pattern: str) -> List[str]:
+        """Return indexed keys matching a glob pattern."""
+        parts = pattern.split(":", self.DEPTH + 1)
+        node: Any = self._root
+        
+        if parts[0] == CacheKeyBuilder.PREFIX:
+            for segment in parts[1:self.DEPTH + 1]:
+                if _GLOB_CHARS.intersection(segment):
+                    break
+                node = node.get(segment)
+                if node is None:
+                    node = {}
+                    break
+        elif _GLOB_CHARS.intersection(parts[0]):
+            pass  # Leading glob: every indexed key is a candidate
+        else:
+            node = {}
+        
+        matches = [k for k in self._iter_keys(node) if fnmatchcase(k, pattern)]
+        matches.extend(k for k in self._other if fnmatchcase(k, pattern))
+        return matches
+    
+    @staticmethod
+    def _iter_keys(node: Any):
+        if isinstance(node, set):
+            yield from node
+            return
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for child in current.values():
+                if isinstance(child, set):
+                    yield from child
+                else:
+                    stack.append(child)
+    
+    def clear(self) -> None:
+        self._root.clear()
+        self._other.clear()
+
+
 class InMemoryCache:
     """
     In-memory cache for development/testing.
     Also serves as L1 cache in front of Redis.
+    
+    Eviction is driven by an ordered-map policy (LRU or W-TinyLFU), so
+    get/set/evict are O(1). Limits are enforced on entry count, estimated
+    bytes and per-namespace quotas. Expiry uses the monotonic clock; expired
+    entries are dropped on read and by `sweep_expired` via a timing wheel.
+    
+    Pattern deletes go through a KeyIndex. A whole namespace or identity
+    can also be dropped in O(1) by bumping its generation (`invalidate_epoch`);
+    entries stamped with an older generation are treated as misses.
     """
     
     def __init__(self, config: Optional[CacheConfig] = None):
         self.config = config or CacheConfig()
         self._cache: Dict[str, CacheEntry] = {}
+        self._namespace_keys: Dict[str, "OrderedDict[str, None]"] = {}
+        self._policy = self._build_policy()
+        self._wheel = TimingWheel(tick=self.config.expiry_tick_seconds)
+        self._index = KeyIndex()
+        self._epochs: Dict[str, int] = {}
         self._stats = CacheStats()
         self._lock = asyncio.Lock()
     
+    def _build_policy(self) -> Union[LRUPolicy, TinyLFUPolicy]:
+        """Create the eviction policy selected in config."""
+        if self.config.eviction_policy == EvictionPolicy.TINY_LFU:
+            return TinyLFUPolicy(
+                self.config.max_size,
+                self.config.tiny_lfu_window_ratio
+            )
+        return LRUPolicy()
+    
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         async with self._lock:
             entry = self._cache.get(key)
             
             if entry is None:
+                self._policy.on_miss(key)
                 self._stats.misses += 1
                 return None
             
-            # Check expiration
-            if datetime.utcnow() > entry.expires_at:
-                del self._cache[key]
+            # Check expiration and generation
+            if time.monotonic() > entry.deadline or entry.epoch != self._current_epoch(
+                entry.namespace, entry.identity_id
+            ):
+                self._remove_entry(key)
                 self._stats.misses += 1
                 return None
             
             entry.hits += 1
+            self._touch(key, entry)
             self._stats.hits += 1
             return entry.value
     
@@ -202,9 +668,7 @@ class InMemoryCache:
         async with self._lock:
             ttl = ttl or self.config.default_ttl
             now = datetime.utcnow()
-            
-            # Estimate size
-            size_bytes = len(json.dumps(value, default=str).encode())
+            deadline = time.monotonic() + ttl
             
             entry = CacheEntry(
                 value=value,
@@ -213,19 +677,25 @@ class InMemoryCache:
                 tier=tier,
                 namespace=namespace,
                 identity_id=identity_id,
-                size_bytes=size_bytes
+                size_bytes=estimate_size(value),
+                deadline=deadline,
+                epoch=self._current_epoch(namespace, identity_id)
             )
             
-            self._cache[key] = entry
-            self._stats.sets += 1
-            self._stats.total_size_bytes += size_bytes
-            
-            # Update namespace stats
-            ns_key = namespace.value
-            self._stats.namespaces[ns_key] = self._stats.namespaces.get(ns_key, 0) + 1
+            existing = self._cache.get(key)
+            if existing is not None and existing.namespace == namespace:
+                # Replace in place, keeping the key's recency/frequency
+                self._stats.total_size_bytes += entry.size_bytes - existing.size_bytes
+                self._cache[key] = entry
+                self._touch(key, entry)
+            else:
+                if existing is not None:
+                    self._remove_entry(key)
+                self._insert_entry(key, entry)
             
-            # Evict if over max size
-            await self._maybe_evict()
+            self._wheel.schedule(key, deadline)
+            self._stats.sets += 1
+            self._enforce_limits(namespace)
             
             return True
     
@@ -233,9 +703,7 @@ class InMemoryCache:
         """Delete key from cache."""
         async with self._lock:
             if key in self._cache:
-                entry = self._cache[key]
-                self._stats.total_size_bytes -= entry.size_bytes
-                del self._cache[key]
+                self._remove_entry(key)
                 self._stats.deletes += 1
                 return True
             return False
@@ -243,26 +711,52 @@ class InMemoryCache:
     async def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching pattern."""
         async with self._lock:
-            # Convert pattern to simple matching
-            prefix = pattern.replace("*", "")
-            keys_to_delete = [
-                k for k in self._cache.keys()
-                if k.startswith(prefix)
-            ]
+            keys_to_delete = self._index.match(pattern)
             
             for key in keys_to_delete:
-                entry = self._cache[key]
-                self._stats.total_size_bytes -= entry.size_bytes
-                del self._cache[key]
+                self._remove_entry(key)
                 self._stats.deletes += 1
             
             return len(keys_to_delete)
     
+    async def invalidate_epoch(
+        self,
+        namespace: CacheNamespace,
+        identity_id: Optional[str] = None
+    ) -> int:
+        """
+        Invalidate a namespace (or one identity within it) in O(1).
+        
+        Bumps the generation counter; existing entries are not touched and
+        are discarded lazily on read, eviction or expiry.
+        
+        Returns:
+            The new generation number
+        """
+        async with self._lock:
+            epoch_key = self._epoch_key(namespace, identity_id)
+            generation = self._epochs.get(epoch_key, 0) + 1
+            self._epochs[epoch_key] = generation
+            return generation
+    
     async def exists(self, key: str) -> bool:
         """Check if key exists and is not expired."""
         value = await self.get(key)
         return value is not None
     
+    async def sweep_expired(self) -> int:
+        """Remove every entry whose TTL has passed. Returns the count."""
+        async with self._lock:
+            now = time.monotonic()
+            removed = 0
+            for key in self._wheel.advance(now):
+                entry = self._cache.get(key)
+                if entry is not None and entry.deadline <= now:
+                    self._remove_entry(key)
+                    removed += 1
+            self._stats.expirations += removed
+            return removed
+    
     async def get_stats(self) -> CacheStats:
         """Get cache statistics."""
         return self._stats
@@ -271,25 +765,261 @@ class InMemoryCache:
         """Clear all cache entries."""
         async with self._lock:
             self._cache.clear()
+            self._namespace_keys.clear()
+            self._policy.clear()
+            self._wheel.clear()
+            self._index.clear()
+            self._epochs.clear()
             self._stats = CacheStats()
     
-    async def _maybe_evict(self) -> None:
-        """Evict entries if over max size."""
-        if len(self._cache) > self.config.max_size:
-            # LRU eviction - remove oldest entries
-            entries = sorted(
-                self._cache.items(),
-                key=lambda x: x[1].created_at
-            )
-            
-            # Remove 10% of entries
-            evict_count = max(1, len(entries) // 10)
-            for key, entry in entries[:evict_count]:
-                self._stats.total_size_bytes -= entry.size_bytes
-                del self._cache[key]
+    def __len__(self) -> int:
+        return len(self._cache)
+    
+    # ==================== Bookkeeping (lock held) ====================
+    
+    @staticmethod
+    def _epoch_key(namespace: CacheNamespace, identity_id: Optional[str]) -> str:
+        if identity_id is None:
+            return namespace.value
+        return f"{namespace.value}:{identity_id}"
+    
+    def _current_epoch(
+        self,
+        namespace: CacheNamespace,
+        identity_id: Optional[str]
+    ) -> Tuple[int, int]:
+        if not self._epochs:
+            return (0, 0)
+        return (
+            self._epochs.get(namespace.value, 0),
+            self._epochs.get(self._epoch_key(namespace, identity_id), 0)
+            if identity_id is not None else 0
+        )
+    
+    def _insert_entry(self, key: str, entry: CacheEntry) -> None:
+        """Add a new entry to the map, the policy, the index and its namespace."""
+        self._cache[key] = entry
+        self._policy.on_insert(key)
+        self._index.add(key)
+        
+        ns_key = entry.namespace.value
+        ns_keys = self._namespace_keys.get(ns_key)
+        if ns_keys is None:
+            ns_keys = self._namespace_keys[ns_key] = OrderedDict()
+        ns_keys[key] = None
+        
+        self._stats.total_size_bytes += entry.size_bytes
+        self._stats.namespaces[ns_key] = len(ns_keys)
+    
+    def _remove_entry(self, key: str) -> Optional[CacheEntry]:
+        """Drop an entry from the map, the policy and its namespace."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return None
+        
+        self._policy.on_remove(key)
+        self._wheel.cancel(key)
+        self._index.remove(key)
+        
+        ns_key = entry.namespace.value
+        ns_keys = self._namespace_keys.get(ns_key)
+        if ns_keys is not None:
+            ns_keys.pop(key, None)
+            self._stats.namespaces[ns_key] = len(ns_keys)
+        
+        self._stats.total_size_bytes -= entry.size_bytes
+        return entry
+    
+    def _touch(self, key: str, entry: CacheEntry) -> None:
+        """Mark an entry as recently used."""
+        self._policy.on_access(key)
+        ns_keys = self._namespace_keys.get(entry.namespace.value)
+        if ns_keys is not None:
+            ns_keys.move_to_end(key)
+    
+    def _enforce_limits(self, namespace: CacheNamespace) -> None:
+        """Evict until namespace quota, entry count and byte budget hold."""
+        quota = self.config.namespace_quotas.get(namespace)
+        if quota is not None:
+            ns_keys = self._namespace_keys.get(namespace.value)
+            while ns_keys and len(ns_keys) > quota:
+                self._remove_entry(next(iter(ns_keys)))
+                self._stats.evictions += 1
+        
+        max_bytes = self.config.max_bytes
+        while self._cache and (
+            len(self._cache) > self.config.max_size
+            or (max_bytes is not None and self._stats.total_size_bytes > max_bytes)
+        ):
+            key, rejected = self._policy.victim()
+            if key is None:
+                break
+            self._remove_entry(key)
+            if rejected:
+                self._stats.rejections += 1
+            else:
                 self._stats.evictions += 1
 
 
+class ShardedInMemoryCache:
+    """
+    Lock-striped L1 cache.
+    
+    Keys are hashed onto N independent InMemoryCache shards, each with its
+    own lock, eviction policy and timing wheel. Concurrent readers of
+    different keys (get_thread, get_sphere, ...) no longer serialize on a
+    single lock. Size limits and namespace quotas are split evenly
+    across shards.
+    """
+    
+    def __init__(self, config: Optional[CacheConfig] = None):
+        self.config = config or CacheConfig()
+        count = max(1, self.config.l1_shards)
+        shard_config = replace(
+            self.config,
+            max_size=max(1, math.ceil(self.config.max_size / count)),
+            max_bytes=(
+                math.ceil(self.config.max_bytes / count)
+                if self.config.max_bytes is not None else None
+            ),
+            namespace_quotas={
+                ns: max(1, math.ceil(quota / count))
+                for ns, quota in self.config.namespace_quotas.items()
+            }
+        )
+        self._shards: List[InMemoryCache] = [
+            InMemoryCache(shard_config) for _ in range(count)
+        ]
+    
+    def _shard(self, key: str) -> InMemoryCache:
+        return self._shards[hash(key) % len(self._shards)]
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from the key's shard."""
+        return await self._shard(key).get(key)
+    
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        namespace: CacheNamespace = CacheNamespace.STATS,
+        tier: CacheTier = CacheTier.HOT,
+        identity_id: Optional[str] = None
+    ) -> bool:
+        """Set value in the key's shard."""
+        return await self._shard(key).set(
+            key, value,
+            ttl=ttl,
+            namespace=namespace,
+            tier=tier,
+            identity_id=identity_id
+        )
+    
+    async def delete(self, key: str) -> bool:
+        """Delete key from its shard."""
+        return await self._shard(key).delete(key)
+    
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching pattern in every shard."""
+        counts = await asyncio.gather(
+            *(shard.delete_pattern(pattern) for shard in self._shards)
+        )
+        return sum(counts)
+    
+    async def invalidate_epoch(
+        self,
+        namespace: CacheNamespace,
+        identity_id: Optional[str] = None
+    ) -> int:
+        """Bump the namespace/identity generation in every shard."""
+        generations = await asyncio.gather(
+            *(shard.invalidate_epoch(namespace, identity_id) for shard in self._shards)
+        )
+        return max(generations)
+    
+    async def exists(self, key: str) -> bool:
+        """Check if key exists and is not expired."""
+        return await self._shard(key).exists(key)
+    
+    async def sweep_expired(self) -> int:
+        """Sweep expired entries shard by shard."""
+        removed = 0
+        for shard in self._shards:
+            removed += await shard.sweep_expired()
+        return removed
+    
+    async def get_stats(self) -> CacheStats:
+        """Aggregate statistics across shards."""
+        total = CacheStats()
+        for shard in self._shards:
+            stats = await shard.get_stats()
+            total.hits += stats.hits
+            total.misses += stats.misses
+            total.sets += stats.sets
+            total.deletes += stats.deletes
+            total.evictions += stats.evictions
+            total.rejections += stats.rejections
+            total.expirations += stats.expirations
+            total.total_size_bytes += stats.total_size_bytes
+            for ns, count in stats.namespaces.items():
+                total.namespaces[ns] = total.namespaces.get(ns, 0) + count
+        return total
+    
+    async def clear(self) -> None:
+        """Clear every shard."""
+        for shard in self._shards:
+            await shard.clear()
+    
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+class ExpirySweeper:
+    """Background task that periodically sweeps expired L1 entries."""
+    
+    def __init__(
+        self,
+        cache: Union[InMemoryCache, ShardedInMemoryCache],
+        interval: float = 1.0
+    ):
+        self._cache = cache
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+    
+    async def _sweep_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self._interval)
+                removed = await self._cache.sweep_expired()
+                if removed:
+                    logger.debug(f"Cache sweep expired {removed} entries")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Cache sweep error: {e}")
+    
+    def start(self) -> None:
+        """Start sweeping (requires a running event loop)."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._sweep_loop())
+    
+    async def stop(self) -> None:
+        """Stop sweeping."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
 class CacheService:
     """
     Main cache service with Redis backend and in-memory L1 cache.
@@ -308,8 +1038,36 @@ class CacheService:
     ):
         self.redis = redis_client
         self.config = config or CacheConfig()
-        self.l1_cache = InMemoryCache(config)
+        if self.config.l1_shards > 1:
+            self.l1_cache = ShardedInMemoryCache(self.config)
+        else:
+            self.l1_cache = InMemoryCache(self.config)
+        self._sweeper = ExpirySweeper(
+            self.l1_cache,
+            interval=self.config.sweep_interval_seconds
+        )
         self._invalidation_handlers: Dict[str, List[Callable]] = {}
+        
+        # Single-flight loads keyed by cache key
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._load_stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "stale_served": 0,
+            "early_refreshes": 0,
+            "load_errors": 0,
+        }
+    
+    # ==================== Lifecycle ====================
+    
+    async def start(self) -> None:
+        """Start background L1 expiry sweeping (call on app startup)."""
+        self._sweeper.start()
+    
+    async def stop(self) -> None:
+        """Stop background tasks (call on app shutdown)."""
+        await self._sweeper.stop()
     
     # ==================== Core Operations ====================
     
@@ -335,7 +1093,21 @@ class CacheService:
             Cached value or None
         """
         key = CacheKeyBuilder.build(namespace, resource, identity_id, params)
+        value = await self._get_key(key, namespace, identity_id, use_l1)
         
+        # Unwrap values written by get_or_compute
+        if isinstance(value, dict) and value.get(_ENVELOPE_MARKER):
+            return value["value"]
+        return value
+    
+    async def _get_key(
+        self,
+        key: str,
+        namespace: CacheNamespace,
+        identity_id: Optional[UUID],
+        use_l1: bool
+    ) -> Optional[Any]:
+        """Read a raw cached value by key, L1 first then Redis."""
         # Check L1 first
         if use_l1:
             value = await self.l1_cache.get(key)
@@ -435,15 +1207,156 @@ class CacheService:
         logger.debug(f"Cache delete: {key}")
         return True
     
+    async def get_or_compute(
+        self,
+        namespace: CacheNamespace,
+        resource: str,
+        compute: Callable[[], Awaitable[Any]],
+        identity_id: Optional[UUID] = None,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[int] = None,
+        tier: CacheTier = CacheTier.HOT,
+        stale_ttl: int = 0,
+        beta: float = 1.0
+    ) -> Optional[Any]:
+        """
+        Read-through get with single-flight loading.
+        
+        Concurrent misses for the same key share one `compute()` call
+        instead of stampeding the backend. Values are stored with their
+        recompute time so hot keys are refreshed in the background shortly
+        before they expire (XFetch, probability scaled by `beta`), and
+        within `stale_ttl` seconds after expiry the old value is served
+        while a single refresh runs.
+        
+        Args:
+            namespace: Cache namespace
+            resource: Resource identifier
+            compute: Coroutine factory producing the fresh value
+            identity_id: Optional identity for scoping
+            params: Optional parameters to include in key
+            ttl: Freshness lifetime in seconds
+            tier: Cache tier (hot/warm)
+            stale_ttl: Extra seconds an expired value may be served stale
+            beta: XFetch aggressiveness (0 disables early refresh)
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        key = CacheKeyBuilder.build(namespace, resource, identity_id, params)
+        if ttl is None:
+            ttl = self.config.hot_ttl if tier == CacheTier.HOT else self.config.warm_ttl
+        
+        async def load() -> Optional[Any]:
+            started = time.monotonic()
+            value = await compute()
+            if value is not None:
+                envelope = {
+                    _ENVELOPE_MARKER: True,
+                    "value": value,
+                    "expires_at": time.time() + ttl,
+                    "delta": time.monotonic() - started,
+                }
+                await self.set(
+                    namespace, resource, envelope,
+                    identity_id=identity_id,
+                    params=params,
+                    ttl=ttl + stale_ttl,
+                    tier=tier
+                )
+            return value
+        
+        cached_value = await self._get_key(key, namespace, identity_id, use_l1=True)
+        
+        if isinstance(cached_value, dict) and cached_value.get(_ENVELOPE_MARKER):
+            now = time.time()
+            expires_at = cached_value["expires_at"]
+            
+            if now >= expires_at:
+                # Expired but within stale_ttl: serve it while one refresh runs
+                self._load_stats["stale_served"] += 1
+                self._single_flight(key, load)
+            elif beta > 0 and (
+                # XFetch: refresh early with probability rising towards expiry
+                now - cached_value["delta"] * beta * math.log(1.0 - random.random())
+                >= expires_at
+            ):
+                self._load_stats["early_refreshes"] += 1
+                self._single_flight(key, load)
+            else:
+                self._load_stats["hits"] += 1
+            return cached_value["value"]
+        
+        if cached_value is not None:
+            # Plain value written through set(); no refresh metadata
+            self._load_stats["hits"] += 1
+            return cached_value
+        
+        self._load_stats["misses"] += 1
+        task, leader = self._single_flight(key, load)
+        if not leader:
+            self._load_stats["coalesced"] += 1
+        return await asyncio.shield(task)
+    
+    def _single_flight(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any]]
+    ) -> Tuple[asyncio.Task, bool]:
+        """
+        Return the in-flight load for key, starting one if needed.
+        
+        The load runs as its own task so a cancelled caller does not
+        cancel it for the other waiters.
+        
+        Returns:
+            Tuple of (task, whether this call started it)
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            return task, False
+        
+        task = asyncio.ensure_future(load())
+        self._inflight[key] = task
+        
+        def _done(finished: asyncio.Task) -> None:
+            if self._inflight.get(key) is finished:
+                del self._inflight[key]
+            if not finished.cancelled() and finished.exception() is not None:
+                self._load_stats["load_errors"] += 1
+                logger.warning(f"Cache load failed for {key}: {finished.exception()}")
+        
+        task.add_done_callback(_done)
+        return task, True
+    
     async def invalidate_namespace(
         self,
         namespace: CacheNamespace,
-        identity_id: Optional[UUID] = None
+        identity_id: Optional[UUID] = None,
+        lazy: bool = False
     ) -> int:
-        """Invalidate all entries in a namespace."""
+        """
+        Invalidate all entries in a namespace.
+        
+        Args:
+            namespace: Cache namespace
+            identity_id: Restrict to one identity
+            lazy: Drop L1 entries in O(1) via a generation bump instead of
+                deleting them; the returned count then excludes L1 entries
+        
+        Returns:
+            Number of entries deleted
+        """
         pattern = CacheKeyBuilder.build_pattern(namespace, identity_id)
         
-        count = await self.l1_cache.delete_pattern(pattern)
+        if lazy:
+            await self.l1_cache.invalidate_epoch(
+                namespace,
+                str(identity_id) if identity_id else None
+            )
+            count = 0
+        else:
+            count = await self.l1_cache.delete_pattern(pattern)
         
         if self.redis:
             try:
@@ -626,6 +1539,30 @@ class CacheService:
             identity_id=identity_id
         )
     
+    async def get_or_compute_llm_response(
+        self,
+        prompt_hash: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+        identity_id: UUID,
+        ttl: int = 3600,
+        stale_ttl: int = 300
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached LLM response or compute it once.
+        
+        Concurrent requests for the same prompt share a single provider
+        call; recently expired responses are served while one refresh runs.
+        """
+        return await self.get_or_compute(
+            CacheNamespace.LLM,
+            f"response:{prompt_hash}",
+            compute,
+            identity_id=identity_id,
+            ttl=ttl,
+            tier=CacheTier.WARM,
+            stale_ttl=stale_ttl
+        )
+    
     # ==================== Statistics ====================
     
     async def get_stats(self) -> Dict[str, Any]:
@@ -639,10 +1576,19 @@ class CacheService:
                 "sets": l1_stats.sets,
                 "deletes": l1_stats.deletes,
                 "evictions": l1_stats.evictions,
+                "rejections": l1_stats.rejections,
+                "expirations": l1_stats.expirations,
+                "entries": len(self.l1_cache),
+                "shards": max(1, self.config.l1_shards),
+                "eviction_policy": self.config.eviction_policy.value,
                 "hit_rate": l1_stats.hit_rate,
                 "total_size_bytes": l1_stats.total_size_bytes,
                 "namespaces": l1_stats.namespaces
             },
+            "loads": {
+                **self._load_stats,
+                "in_flight": len(self._inflight)
+            },
             "redis": {
                 "connected": self.redis is not None
             }
@@ -677,11 +1623,16 @@ def cached(
     resource_key: str = "id",
     ttl: Optional[int] = None,
     tier: CacheTier = CacheTier.HOT,
-    identity_param: str = "identity_id"
+    identity_param: str = "identity_id",
+    stale_ttl: int = 0
 ):
     """
     Decorator for caching function results.
     
+    Concurrent calls that miss on the same key share one execution
+    (single-flight). With `stale_ttl`, an expired result is served for
+    that many extra seconds while a single refresh runs.
+    
     Usage:
         @cached(CacheNamespace.THREAD, resource_key="thread_id")
         async def get_thread(thread_id: UUID, identity_id: UUID) -> dict:
@@ -707,31 +1658,15 @@ def cached(
             if not resource:
                 return await func(*args, **kwargs)
             
-            # Try to get from cache
-            cached_value = await cache_service.get(
+            return await cache_service.get_or_compute(
                 namespace,
                 str(resource),
-                identity_id=identity_id
+                lambda: func(*args, **kwargs),
+                identity_id=identity_id,
+                ttl=ttl,
+                tier=tier,
+                stale_ttl=stale_ttl
             )
-            
-            if cached_value is not None:
-                return cached_value
-            
-            # Execute function
-            result = await func(*args, **kwargs)
-            
-            # Cache result
-            if result is not None:
-                await cache_service.set(
-                    namespace,
-                    str(resource),
-                    result,
-                    identity_id=identity_id,
-                    ttl=ttl,
-                    tier=tier
-                )
-            
-            return result
         
         return wrapper
     return decorator
@@ -808,11 +1743,20 @@ def init_cache_service(
 __all__ = [
     'CacheTier',
     'CacheNamespace',
+    'EvictionPolicy',
     'CacheConfig',
     'CacheEntry',
     'CacheStats',
     'CacheKeyBuilder',
+    'FrequencySketch',
+    'LRUPolicy',
+    'TinyLFUPolicy',
+    'estimate_size',
+    'TimingWheel',
+    'KeyIndex',
     'InMemoryCache',
+    'ShardedInMemoryCache',
+    'ExpirySweeper',
     'CacheService',
     'cached',
     'invalidate_on_event',
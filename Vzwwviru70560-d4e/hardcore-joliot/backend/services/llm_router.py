@@ -9,9 +9,15 @@ Features:
 - Multi-provider support (Anthropic, OpenAI, Google, Mistral, etc.)
 - Intelligent routing based on task type and requirements
 - Automatic fallback on provider failure
-- Token budget enforcement per identity/Thread
+- Token budget enforcement per identity/Thread (reserve/commit/refund ledger)
 - Cost tracking per request and per provider
 - Rate limiting per provider
+- Semantic response cache, opt-in per request (near-duplicate prompts skip the provider)
+- Exact-match response cache with single-flight loading (identical prompts share one call)
+- Token streaming with fallback before the first token
+- Latency-aware routing on observed p95, circuit breakers, hedged requests
+- Token-bucket RPM/TPM limits with prioritized waiting
+- Micro-batching of small completions and embeddings
 
 R&D COMPLIANCE:
 - Rule #1: LLM outputs are drafts - human gates for sensitive actions
@@ -21,18 +27,30 @@ R&D COMPLIANCE:
 VERSION: 1.0.0
 """
 
-from typing import Dict, Any, Optional, List, Callable, Tuple
+from typing import Dict, Any, Optional, List, Callable, Tuple, AsyncIterator, Union
 from uuid import UUID, uuid4
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from decimal import Decimal
 import asyncio
+import hashlib
+import json
 import logging
+import random
 import time
 
 from pydantic import BaseModel, Field
 
+from backend.services.cache_service import CacheService, get_cache_service
+from backend.services.semantic_cache import SemanticCache
+from backend.services.provider_health import ProviderHealth
+from backend.services.provider_limits import ProviderRateLimiter, RequestPriority
+from backend.services.micro_batcher import BatchConfig, MicroBatcher
+from backend.services.budget_ledger import (
+    BudgetLedger, BudgetLimits, BudgetExhaustedError, Reservation, create_ledger_backend
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -171,6 +189,9 @@ class ModelSpec:
     
     # Best for
     best_for: List[TaskType] = field(default_factory=list)
+    
+    # Embedding models only
+    dimensions: int = 0
 
 
 class LLMRequest(BaseModel):
@@ -207,6 +228,17 @@ class LLMRequest(BaseModel):
     # Streaming
     stream: bool = False
     
+    # Caching (opt-in: only for requests whose answer may be replayed;
+    # enables both the exact-match and the semantic response cache)
+    use_semantic_cache: bool = False
+    
+    # Hedging (None = router default)
+    hedge: Optional[bool] = None
+    
+    # Rate limiting: admission lane and max seconds to wait for capacity
+    priority: RequestPriority = RequestPriority.STANDARD
+    rate_limit_timeout: Optional[float] = 30.0
+    
     class Config:
         arbitrary_types_allowed = True
 
@@ -239,13 +271,65 @@ class LLMResponse:
     # Metadata
     created_at: datetime = field(default_factory=datetime.utcnow)
     
+    # Response cache (no provider call, budget or rate-limit slot used)
+    cache_hit: bool = False
+    cache_similarity: Optional[float] = None
+    
     # Raw response for debugging
     raw_response: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class EmbeddingResponse:
+    """Embedding of one text"""
+    embedding: List[float]
+    provider: LLMProvider
+    model: str
+    input_tokens: int
+    cost_usd: Decimal
+    batch_size: int = 1
+
+
+@dataclass
+class _EmbeddingItem:
+    """Queued embedding request"""
+    text: str
+    identity_id: str
+    thread_id: Optional[str]
+    priority: RequestPriority
+    rate_limit_timeout: Optional[float]
+    tokens: int
+    reservation: Reservation
+
+
+@dataclass
+class LLMStreamChunk:
+    """One incremental piece of a streamed completion"""
+    request_id: str
+    index: int
+    delta: str
+    
+    # Provider info
+    provider: LLMProvider
+    model: str
+    
+    # Usage so far (cumulative)
+    input_tokens: int
+    output_tokens: int
+    cost_usd: Decimal
+    
+    # Set on the last chunk only
+    finish_reason: Optional[str] = None
+    response: Optional[LLMResponse] = None
+    
+    @property
+    def is_final(self) -> bool:
+        return self.finish_reason is not None
+
+
 @dataclass
 class TokenBudget:
-    """Token budget for an identity/Thread"""
+    """Token budget for an identity/Thread (view of the budget ledger)"""
     identity_id: str
     thread_id: Optional[str] = None
     
@@ -472,6 +556,31 @@ MODEL_REGISTRY: Dict[str, ModelSpec] = {
 }
 
 
+# Embedding models (served by embed(), not by completion routing)
+EMBEDDING_MODEL_REGISTRY: Dict[str, ModelSpec] = {
+    "text-embedding-3-small": ModelSpec(
+        model_id="text-embedding-3-small",
+        provider=LLMProvider.OPENAI,
+        display_name="OpenAI Embedding 3 Small",
+        max_context_length=8191,
+        max_output_tokens=0,
+        cost_per_1k_input=Decimal("0.00002"),
+        dimensions=1536
+    ),
+    "mistral-embed": ModelSpec(
+        model_id="mistral-embed",
+        provider=LLMProvider.MISTRAL,
+        display_name="Mistral Embed",
+        max_context_length=8192,
+        max_output_tokens=0,
+        cost_per_1k_input=Decimal("0.0001"),
+        dimensions=1024
+    ),
+}
+
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+
+
 # Task to provider recommendations
 TASK_PROVIDER_RECOMMENDATIONS: Dict[TaskType, List[str]] = {
     TaskType.CHAT: ["claude-3-5-haiku-20241022", "gpt-4o-mini", "llama-3.3-70b-versatile"],
@@ -488,6 +597,31 @@ TASK_PROVIDER_RECOMMENDATIONS: Dict[TaskType, List[str]] = {
 }
 
 
+# Minimum cosine similarity for a semantic cache hit per task type.
+# None disables semantic caching (creative output should not be replayed).
+# Tasks not listed use the cache's default threshold.
+SEMANTIC_CACHE_THRESHOLDS: Dict[TaskType, Optional[float]] = {
+    TaskType.CHAT: 0.93,
+    TaskType.SUMMARIZATION: 0.96,
+    TaskType.ANALYSIS: 0.95,
+    TaskType.CLASSIFICATION: 0.90,
+    TaskType.EXTRACTION: 0.97,
+    TaskType.TRANSLATION: 0.98,
+    TaskType.CODE_GENERATION: 0.98,
+    TaskType.CODE_REVIEW: 0.98,
+    TaskType.CODE_EXPLANATION: 0.96,
+    TaskType.STRUCTURED_OUTPUT: 0.98,
+    TaskType.REASONING: 0.98,
+    TaskType.MATH: 0.99,
+    TaskType.CREATIVE_WRITING: None,
+    TaskType.BRAINSTORMING: None,
+    TaskType.VISION: None,
+    TaskType.VOICE_TO_TEXT: None,
+    TaskType.TEXT_TO_VOICE: None,
+    TaskType.IMAGE_GENERATION: None,
+}
+
+
 # =============================================================================
 # LLM ROUTER SERVICE
 # =============================================================================
@@ -499,17 +633,28 @@ class LLMRouter:
     Features:
     - Route requests to best provider based on task type
     - Automatic fallback on failure
-    - Token budget enforcement
+    - Token budget enforcement (reserved before dispatch, settled after)
     - Cost tracking
     - Rate limiting
+    - Optional exact-match and semantic response caches
+    - Live p95/error tracking with circuit breakers and hedged requests
+    - Micro-batching of small compatible requests
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        semantic_cache: Optional[SemanticCache] = None,
+        response_cache: Optional[CacheService] = None,
+        health: Optional[ProviderHealth] = None,
+        hedge_requests: bool = False,
+        batch_config: Optional[BatchConfig] = None,
+        budget_ledger: Optional[BudgetLedger] = None
+    ):
         # Provider configurations
         self._providers: Dict[LLMProvider, ProviderConfig] = {}
         
-        # Token budgets per identity
-        self._budgets: Dict[str, TokenBudget] = {}
+        # Token budgets per identity (in-process unless a shared backend is given)
+        self.budget_ledger = budget_ledger or BudgetLedger()
         
         # Request history for analytics
         self._request_history: List[Dict[str, Any]] = []
@@ -521,10 +666,29 @@ class LLMRouter:
             "total_cost_usd": Decimal("0.0"),
             "requests_per_provider": {},
             "failures_per_provider": {},
+            "semantic_cache_hits": 0,
+            "response_cache_hits": 0,
+            "hedged_requests": 0,
+            "hedge_wins": 0,
+            "batch_fallbacks": 0,
         }
         
-        # Rate limiting trackers
-        self._rate_limiters: Dict[LLMProvider, Dict[str, Any]] = {}
+        # Near-duplicate prompt cache (None = disabled)
+        self.semantic_cache = semantic_cache
+        
+        # Identical prompt cache, shared across requests (None = disabled)
+        self.response_cache = response_cache
+        
+        # Observed latency/errors and circuit breakers
+        self.health = health or ProviderHealth()
+        self.hedge_requests = hedge_requests
+        
+        # Micro-batching (complete_batched / embed)
+        self._completion_batcher = MicroBatcher(self._dispatch_completion_batch, batch_config)
+        self._embedding_batcher = MicroBatcher(self._dispatch_embedding_batch, batch_config)
+        
+        # Rate limiting (RPM + TPM token buckets per provider)
+        self._rate_limiters: Dict[LLMProvider, ProviderRateLimiter] = {}
         
         logger.info("LLMRouter initialized")
     
@@ -535,11 +699,11 @@ class LLMRouter:
     def register_provider(self, config: ProviderConfig):
         """Register a provider configuration"""
         self._providers[config.provider] = config
-        self._rate_limiters[config.provider] = {
-            "requests_this_minute": 0,
-            "tokens_this_minute": 0,
-            "minute_start": time.time()
-        }
+        self._rate_limiters[config.provider] = ProviderRateLimiter(
+            rpm=config.rate_limit_rpm,
+            tpm=config.rate_limit_tpm
+        )
+        self.health.register(config.provider.value, failure_threshold=config.max_retries)
         logger.info(f"Registered provider: {config.provider.value}")
     
     def get_available_providers(self) -> List[LLMProvider]:
@@ -568,7 +732,7 @@ class LLMRouter:
                 return model.model_id, model.provider
         
         # If specific provider requested, find best model from that provider
-        if request.preferred_provider:
+        if request.preferred_provider and self._is_provider_available(request.preferred_provider):
             model_id = self._find_best_model_for_provider(
                 request.preferred_provider,
                 request
@@ -620,8 +784,9 @@ class LLMRouter:
         if not candidates:
             return "llama-3.3-70b-versatile", LLMProvider.GROQ
         
-        # Sort by speed
-        candidates.sort(key=lambda m: m.tokens_per_second, reverse=True)
+        # Sort by observed p95 (calibrated static estimate until enough samples)
+        latencies = self._expected_latencies_ms(candidates, request)
+        candidates.sort(key=lambda m: latencies[m.model_id])
         
         return candidates[0].model_id, candidates[0].provider
     
@@ -633,18 +798,21 @@ class LLMRouter:
             return "claude-3-5-sonnet-20241022", LLMProvider.ANTHROPIC
         
         # Score each model (normalized)
+        latencies = self._expected_latencies_ms(candidates, request)
         max_quality = max(m.quality_score for m in candidates)
-        max_speed = max(m.tokens_per_second for m in candidates)
+        min_latency = min(latencies.values())
         min_cost = min(float(m.cost_per_1k_input + m.cost_per_1k_output) for m in candidates)
         
         def score_model(m: ModelSpec) -> float:
             quality_score = m.quality_score / max_quality if max_quality > 0 else 0
-            speed_score = m.tokens_per_second / max_speed if max_speed > 0 else 0
+            latency = latencies[m.model_id]
+            speed_score = min_latency / latency if latency > 0 else 1.0
             cost = float(m.cost_per_1k_input + m.cost_per_1k_output)
             cost_score = min_cost / cost if cost > 0 else 1.0
             
-            # Weights: 40% quality, 30% speed, 30% cost
-            return 0.4 * quality_score + 0.3 * speed_score + 0.3 * cost_score
+            # Weights: 40% quality, 30% speed, 30% cost; scaled by reliability
+            score = 0.4 * quality_score + 0.3 * speed_score + 0.3 * cost_score
+            return score * (1.0 - self.health.error_rate(m.model_id))
         
         candidates.sort(key=score_model, reverse=True)
         
@@ -729,6 +897,34 @@ class LLMRouter:
         valid_models.sort(key=lambda m: m.quality_score, reverse=True)
         return valid_models[0].model_id
     
+    def _expected_latencies_ms(
+        self,
+        models: List[ModelSpec],
+        request: LLMRequest
+    ) -> Dict[str, float]:
+        """
+        Expected latency per model: observed p95 where enough samples exist.
+        
+        Models without samples use their static estimate (max_tokens at the
+        advertised tokens/second), scaled by how far observed models deviate
+        from their own static estimate, so both are on the same scale.
+        """
+        static = {
+            m.model_id: request.max_tokens / max(m.tokens_per_second, 1) * 1000
+            for m in models
+        }
+        observed = {}
+        for m in models:
+            p95 = self.health.p95_ms(m.model_id)
+            if p95 is not None:
+                observed[m.model_id] = p95
+        
+        scale = 1.0
+        if observed:
+            scale = sum(observed[k] / static[k] for k in observed) / len(observed)
+        
+        return {k: observed.get(k, v * scale) for k, v in static.items()}
+    
     def _is_provider_available(self, provider: LLMProvider) -> bool:
         """Check if provider is available"""
         config = self._providers.get(provider)
@@ -738,15 +934,8 @@ class LLMRouter:
         if not config.is_available:
             return False
         
-        # Check consecutive failures
-        if config.consecutive_failures >= config.max_retries:
-            # Check if enough time has passed to retry
-            if config.last_failure:
-                cooldown = config.consecutive_failures * 60  # Progressive cooldown
-                if (datetime.utcnow() - config.last_failure).seconds < cooldown:
-                    return False
-        
-        return True
+        # Open circuit (half-open admits a limited number of probes)
+        return self.health.is_available(provider.value)
     
     # -------------------------------------------------------------------------
     # EXECUTION
@@ -757,31 +946,40 @@ class LLMRouter:
         Execute an LLM completion request.
         
         Handles routing, fallback, budget, and cost tracking.
+        Cacheable requests for an identical prompt share one call.
         """
         start_time = time.time()
         
-        # Check budget
-        if not self._check_budget(request.identity_id, request.thread_id):
-            raise BudgetExceededError(
-                f"Token budget exceeded for identity {request.identity_id}"
-            )
+        prompt_hash = self._response_cache_key(request)
+        if prompt_hash is None:
+            return await self._complete(request, start_time)
         
-        # Select model
-        model_id, provider = self.select_model(request)
+        computed: List[LLMResponse] = []
         
-        # Get model spec
-        model_spec = MODEL_REGISTRY.get(model_id)
-        if not model_spec:
-            raise ModelNotFoundError(f"Model not found: {model_id}")
+        async def compute() -> Dict[str, Any]:
+            response = await self._complete(request, start_time)
+            computed.append(response)
+            return self._response_to_cache(response)
         
-        # Check rate limit
-        if not self._check_rate_limit(provider):
-            # Try fallback provider
-            fallback = self._get_fallback_provider(request, exclude=[provider])
-            if fallback:
-                model_id, provider = fallback
-            else:
-                raise RateLimitExceededError(f"Rate limit exceeded for {provider.value}")
+        cached = await self.response_cache.get_or_compute_llm_response(
+            prompt_hash,
+            compute,
+            identity_id=request.identity_id
+        )
+        if computed:
+            return computed[0]
+        
+        self._stats["response_cache_hits"] += 1
+        return self._response_from_cache(request, cached, start_time)
+    
+    async def _complete(self, request: LLMRequest, start_time: float) -> LLMResponse:
+        """Complete a request without the exact-match response cache."""
+        # Serve near-duplicate prompts from the semantic cache
+        cached_response = self._semantic_lookup(request, start_time)
+        if cached_response is not None:
+            return cached_response
+        
+        model_id, provider, model_spec, reservation = await self._route_request(request)
         
         # Execute with retry and fallback
         last_error = None
@@ -791,20 +989,17 @@ class LLMRouter:
             attempted_providers.add(provider)
             
             try:
-                response = await self._execute_completion(
+                response = await self._execute_hedged(
                     request=request,
                     model_id=model_id,
                     provider=provider,
-                    model_spec=model_spec
+                    model_spec=model_spec,
+                    attempted_providers=attempted_providers
                 )
                 
-                # Success - update stats and return
-                self._record_success(provider, response)
-                self._update_budget(
-                    request.identity_id,
-                    request.thread_id,
-                    response.total_tokens,
-                    response.cost_usd
+                # Success - settle budget, update stats and return
+                self.budget_ledger.commit(
+                    reservation, response.total_tokens, response.cost_usd
                 )
                 
                 # Track request
@@ -814,15 +1009,19 @@ class LLMRouter:
                 
                 response.latency_ms = int((time.time() - start_time) * 1000)
                 
+                self._semantic_store(request, response)
+                
                 return response
                 
+            except asyncio.CancelledError:
+                self.budget_ledger.refund(reservation)
+                raise
             except Exception as e:
                 logger.warning(f"Provider {provider.value} failed: {e}")
-                self._record_failure(provider)
                 last_error = e
                 
                 # Try fallback
-                fallback = self._get_fallback_provider(request, exclude=attempted_providers)
+                fallback = self._next_fallback(request, attempted_providers)
                 if fallback:
                     model_id, provider = fallback
                     model_spec = MODEL_REGISTRY.get(model_id)
@@ -830,8 +1029,156 @@ class LLMRouter:
                     break
         
         # All providers failed
+        self.budget_ledger.refund(reservation)
         raise LLMRouterError(f"All providers failed. Last error: {last_error}")
     
+    async def _route_request(
+        self,
+        request: LLMRequest
+    ) -> Tuple[str, LLMProvider, ModelSpec, Reservation]:
+        """
+        Select a model, reserve budget and reserve rate-limit capacity.
+        
+        A rate-limited provider is swapped for a fallback with capacity;
+        if none has any, the request waits in its priority lane for up to
+        request.rate_limit_timeout seconds. The caller must commit or
+        refund the returned reservation.
+        
+        Returns:
+            Tuple of (model_id, provider, model_spec, reservation)
+        """
+        # Select model
+        model_id, provider = self.select_model(request)
+        
+        # Get model spec
+        model_spec = MODEL_REGISTRY.get(model_id)
+        if not model_spec:
+            raise ModelNotFoundError(f"Model not found: {model_id}")
+        
+        # Reserve budget for the worst case (prompt + max_tokens)
+        reservation = await self._reserve_budget(request, model_spec)
+        
+        # Check rate limit
+        tokens = self._estimate_request_tokens(request)
+        if not self._check_rate_limit(provider, tokens, request.priority):
+            # Try fallback provider
+            fallback = self._get_fallback_provider(request, exclude=[provider])
+            if fallback and self._check_rate_limit(fallback[1], tokens, request.priority):
+                model_id, provider = fallback
+                model_spec = MODEL_REGISTRY[model_id]
+            else:
+                try:
+                    await self._wait_rate_limit(
+                        provider, tokens, request.priority, request.rate_limit_timeout
+                    )
+                except BaseException:
+                    self.budget_ledger.refund(reservation)
+                    raise
+        
+        return model_id, provider, model_spec, reservation
+    
+    async def _timed_completion(
+        self,
+        request: LLMRequest,
+        model_id: str,
+        provider: LLMProvider,
+        model_spec: ModelSpec
+    ) -> LLMResponse:
+        """Run one provider attempt and feed its outcome to the health tracker"""
+        self.health.begin(provider.value)
+        started = time.monotonic()
+        try:
+            response = await self._execute_completion(
+                request=request,
+                model_id=model_id,
+                provider=provider,
+                model_spec=model_spec
+            )
+        except asyncio.CancelledError:
+            self.health.record_abandoned(
+                provider.value, model_id, (time.monotonic() - started) * 1000
+            )
+            self._settle_rate_limit(provider, request, 0)
+            raise
+        except Exception:
+            self._record_failure(provider, model_id, (time.monotonic() - started) * 1000)
+            self._settle_rate_limit(provider, request, 0)
+            raise
+        
+        self._record_success(provider, response, (time.monotonic() - started) * 1000)
+        self._settle_rate_limit(provider, request, response.total_tokens)
+        return response
+    
+    def _hedge_delay_ms(self, request: LLMRequest, model_id: str) -> Optional[float]:
+        """Delay before hedging: the model's observed p95, if hedging applies"""
+        hedge = self.hedge_requests if request.hedge is None else request.hedge
+        if not hedge:
+            return None
+        return self.health.p95_ms(model_id)
+    
+    async def _execute_hedged(
+        self,
+        request: LLMRequest,
+        model_id: str,
+        provider: LLMProvider,
+        model_spec: ModelSpec,
+        attempted_providers: set
+    ) -> LLMResponse:
+        """
+        Execute a completion, hedging to a second provider if it is slow.
+        
+        If the primary has not answered after its p95 latency, the same
+        request is sent to a fallback provider; the first success wins and
+        the other attempt is cancelled. Only the winner is billed.
+        """
+        primary = asyncio.create_task(
+            self._timed_completion(request, model_id, provider, model_spec)
+        )
+        
+        delay_ms = self._hedge_delay_ms(request, model_id)
+        if delay_ms is None:
+            return await primary
+        
+        try:
+            return await asyncio.wait_for(asyncio.shield(primary), delay_ms / 1000)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        
+        fallback = self._next_fallback(request, attempted_providers)
+        if fallback is None:
+            return await primary
+        
+        hedge_model_id, hedge_provider = fallback
+        attempted_providers.add(hedge_provider)
+        self._stats["hedged_requests"] += 1
+        
+        secondary = asyncio.create_task(
+            self._timed_completion(
+                request, hedge_model_id, hedge_provider, MODEL_REGISTRY[hedge_model_id]
+            )
+        )
+        
+        pending = {primary, secondary}
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is secondary:
+                            self._stats["hedge_wins"] += 1
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+    
     async def _execute_completion(
         self,
         request: LLMRequest,
@@ -851,7 +1198,16 @@ class LLMRouter:
         # Simulate some processing time
         await asyncio.sleep(0.1)
         
-        # Mock response
+        return self._mock_response(request, model_id, provider, model_spec)
+    
+    def _mock_response(
+        self,
+        request: LLMRequest,
+        model_id: str,
+        provider: LLMProvider,
+        model_spec: ModelSpec
+    ) -> LLMResponse:
+        """Mock provider output for one request"""
         input_tokens = sum(len(m.get("content", "").split()) * 1.3 for m in request.messages)
         output_tokens = min(request.max_tokens, 500)  # Mock output
         
@@ -885,65 +1241,671 @@ class LLMRouter:
         
         return None
     
+    def _next_fallback(
+        self,
+        request: LLMRequest,
+        attempted_providers: set
+    ) -> Optional[Tuple[str, LLMProvider]]:
+        """Next untried fallback that has rate-limit capacity right now"""
+        tokens = self._estimate_request_tokens(request)
+        while True:
+            fallback = self._get_fallback_provider(request, exclude=attempted_providers)
+            if fallback is None:
+                return None
+            if self._check_rate_limit(fallback[1], tokens, request.priority):
+                return fallback
+            attempted_providers.add(fallback[1])
+    
     # -------------------------------------------------------------------------
-    # BUDGET MANAGEMENT
+    # MICRO-BATCHING
     # -------------------------------------------------------------------------
     
-    def _check_budget(
-        self, 
-        identity_id: str, 
-        thread_id: Optional[str]
-    ) -> bool:
-        """Check if identity has available budget"""
-        budget = self._budgets.get(identity_id)
-        
-        if not budget:
-            # Create default budget
-            budget = TokenBudget(identity_id=identity_id, thread_id=thread_id)
-            self._budgets[identity_id] = budget
-        
-        # Check if we need to reset
-        now = datetime.utcnow()
-        if (now - budget.daily_reset_at).days >= 1:
-            budget.daily_used = 0
-            budget.daily_cost_used = Decimal("0.0")
-            budget.daily_reset_at = now
-        
-        if (now - budget.monthly_reset_at).days >= 30:
-            budget.monthly_used = 0
-            budget.monthly_cost_used = Decimal("0.0")
-            budget.monthly_reset_at = now
-        
-        # Check limits
-        if budget.daily_used >= budget.daily_limit:
-            return False
-        if budget.monthly_used >= budget.monthly_limit:
-            return False
-        if budget.daily_cost_used >= budget.daily_cost_limit:
-            return False
-        if budget.monthly_cost_used >= budget.monthly_cost_limit:
-            return False
+    async def complete_batched(self, request: LLMRequest) -> LLMResponse:
+        """
+        Like complete(), but coalesced with concurrent compatible requests.
+        
+        Requests routed to the same model and task type within the batch
+        window are sent as one provider batch call, paying routing and
+        rate-limit overhead once. Each request keeps its own budget debit
+        and response. Meant for background agent loops; a failed batch is
+        retried request by request through complete().
+        """
+        start_time = time.time()
+        
+        cached_response = self._semantic_lookup(request, start_time)
+        if cached_response is not None:
+            return cached_response
+        
+        model_id, _ = self.select_model(request)
+        model_spec = MODEL_REGISTRY.get(model_id)
+        if not model_spec:
+            raise ModelNotFoundError(f"Model not found: {model_id}")
+        
+        reservation = await self._reserve_budget(request, model_spec)
+        try:
+            return await self._completion_batcher.submit(
+                (model_id, request.task_type), (request, reservation)
+            )
+        finally:
+            # No-op once the batch settled it
+            self.budget_ledger.refund(reservation)
+    
+    async def _dispatch_completion_batch(
+        self,
+        key: Tuple[str, TaskType],
+        items: List[Tuple[LLMRequest, Reservation]]
+    ) -> List[Union[LLMResponse, BaseException]]:
+        """Send one batch of compatible completions to its provider"""
+        model_id, _ = key
+        requests = [request for request, _ in items]
+        model_spec = MODEL_REGISTRY[model_id]
+        provider = model_spec.provider
+        
+        # One rate-limit admission for the whole batch, at its best priority
+        reserved = sum(self._estimate_request_tokens(r) for r in requests)
+        lead = min(requests, key=lambda r: r.priority)
+        if not self._check_rate_limit(provider, reserved, lead.priority):
+            await self._wait_rate_limit(provider, reserved, lead.priority, lead.rate_limit_timeout)
+        
+        self.health.begin(provider.value)
+        started = time.monotonic()
+        responses = None
+        used = 0
+        try:
+            responses = await self._execute_completion_batch(
+                requests, model_id, provider, model_spec
+            )
+            used = sum(r.total_tokens for r in responses)
+        except Exception as e:
+            logger.warning(f"Batch of {len(requests)} on {provider.value} failed: {e}")
+            self._record_failure(provider, model_id, (time.monotonic() - started) * 1000)
+        finally:
+            # A failed or cancelled batch hands its TPM reservation back
+            limiter = self._rate_limiters.get(provider)
+            if limiter:
+                limiter.settle(reserved, used)
+        
+        if responses is None:
+            self._stats["batch_fallbacks"] += 1
+            # complete() reserves again for each request
+            for _, reservation in items:
+                self.budget_ledger.refund(reservation)
+            return await asyncio.gather(
+                *(self.complete(r) for r in requests),
+                return_exceptions=True
+            )
+        
+        latency_ms = (time.monotonic() - started) * 1000
+        for (request, reservation), response in zip(items, responses):
+            response.latency_ms = int(latency_ms)
+            self._record_success(provider, response, latency_ms)
+            self.budget_ledger.commit(reservation, response.total_tokens, response.cost_usd)
+            self._stats["total_requests"] += 1
+            self._stats["total_tokens"] += response.total_tokens
+            self._stats["total_cost_usd"] += response.cost_usd
+            self._semantic_store(request, response)
+        
+        return responses
+    
+    async def _execute_completion_batch(
+        self,
+        requests: List[LLMRequest],
+        model_id: str,
+        provider: LLMProvider,
+        model_spec: ModelSpec
+    ) -> List[LLMResponse]:
+        """
+        Execute several completions in one provider call.
         
-        return True
+        This is a mock implementation: one round trip for the whole batch.
+        In production, this would use the provider's batch/multi-prompt API.
+        """
+        await asyncio.sleep(0.1)
+        
+        return [
+            self._mock_response(request, model_id, provider, model_spec)
+            for request in requests
+        ]
     
-    def _update_budget(
+    async def embed(
         self,
+        text: str,
         identity_id: str,
-        thread_id: Optional[str],
-        tokens: int,
-        cost: Decimal
-    ):
-        """Update budget usage"""
-        budget = self._budgets.get(identity_id)
-        if budget:
-            budget.daily_used += tokens
-            budget.monthly_used += tokens
-            budget.daily_cost_used += cost
-            budget.monthly_cost_used += cost
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        thread_id: Optional[str] = None,
+        priority: RequestPriority = RequestPriority.BATCH,
+        rate_limit_timeout: Optional[float] = 30.0
+    ) -> EmbeddingResponse:
+        """
+        Embed one text.
+        
+        Concurrent calls for the same model are micro-batched into a single
+        provider request; each caller's budget is debited for its own text.
+        """
+        model_spec = EMBEDDING_MODEL_REGISTRY.get(model)
+        if not model_spec:
+            raise ModelNotFoundError(f"Embedding model not found: {model}")
+        if not self._is_provider_available(model_spec.provider):
+            raise ProviderNotAvailableError(
+                f"Provider not available: {model_spec.provider.value}"
+            )
+        tokens = int(len(text.split()) * 1.3) + 1
+        reservation = await self._reserve(
+            identity_id, tokens, self._estimate_cost(model_spec, tokens, 0)
+        )
+        try:
+            return await self._embedding_batcher.submit(
+                model,
+                _EmbeddingItem(
+                    text=text,
+                    identity_id=identity_id,
+                    thread_id=thread_id,
+                    priority=priority,
+                    rate_limit_timeout=rate_limit_timeout,
+                    tokens=tokens,
+                    reservation=reservation
+                )
+            )
+        finally:
+            self.budget_ledger.refund(reservation)
+    
+    async def _dispatch_embedding_batch(
+        self,
+        model_id: str,
+        items: List[_EmbeddingItem]
+    ) -> List[EmbeddingResponse]:
+        """Send one batch of texts to an embedding model"""
+        model_spec = EMBEDDING_MODEL_REGISTRY[model_id]
+        provider = model_spec.provider
+        
+        token_counts = [item.tokens for item in items]
+        reserved = sum(token_counts)
+        lead = min(items, key=lambda i: i.priority)
+        if not self._check_rate_limit(provider, reserved, lead.priority):
+            await self._wait_rate_limit(
+                provider, reserved, lead.priority, lead.rate_limit_timeout
+            )
+        
+        self.health.begin(provider.value)
+        started = time.monotonic()
+        used = 0
+        try:
+            vectors = await self._execute_embedding_batch(
+                [item.text for item in items], model_spec
+            )
+            used = reserved
+        except Exception:
+            self._record_failure(provider, model_id, (time.monotonic() - started) * 1000)
+            raise
+        finally:
+            # A failed or cancelled batch hands its TPM reservation back
+            limiter = self._rate_limiters.get(provider)
+            if limiter:
+                limiter.settle(reserved, used)
+        self.health.record_success(provider.value, model_id, (time.monotonic() - started) * 1000)
+        
+        responses = []
+        for item, tokens, vector in zip(items, token_counts, vectors):
+            cost = self._estimate_cost(model_spec, tokens, 0)
+            self.budget_ledger.commit(item.reservation, tokens, cost)
+            self._stats["total_tokens"] += tokens
+            self._stats["total_cost_usd"] += cost
+            responses.append(EmbeddingResponse(
+                embedding=vector,
+                provider=provider,
+                model=model_id,
+                input_tokens=tokens,
+                cost_usd=cost,
+                batch_size=len(items)
+            ))
+        return responses
+    
+    async def _execute_embedding_batch(
+        self,
+        texts: List[str],
+        model_spec: ModelSpec
+    ) -> List[List[float]]:
+        """
+        Embed several texts in one provider call.
+        
+        This is a mock implementation returning deterministic unit vectors.
+        """
+        await asyncio.sleep(0.05)
+        
+        vectors = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+            rng = random.Random(seed)
+            vector = [rng.gauss(0.0, 1.0) for _ in range(model_spec.dimensions)]
+            norm = sum(v * v for v in vector) ** 0.5 or 1.0
+            vectors.append([v / norm for v in vector])
+        return vectors
+    
+    # -------------------------------------------------------------------------
+    # STREAMING
+    # -------------------------------------------------------------------------
+    
+    async def stream(self, request: LLMRequest) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Execute an LLM completion request, yielding tokens as they arrive.
+        
+        Each chunk carries the cumulative usage and cost so far; the last
+        chunk has a finish_reason and the assembled LLMResponse. A provider
+        that fails before its first token is replaced by a fallback; once
+        tokens have been sent the stream cannot switch and fails instead.
+        
+        The provider is only read as fast as the consumer pulls chunks, so a
+        slow client applies backpressure all the way up. Closing the
+        generator early (client disconnect, task cancellation) stops the
+        provider stream and bills the tokens produced so far.
+        """
+        start_time = time.time()
+        
+        # A cached answer is replayed as a single final chunk
+        cached_response = self._semantic_lookup(request, start_time)
+        if cached_response is not None:
+            yield LLMStreamChunk(
+                request_id=request.request_id,
+                index=0,
+                delta=cached_response.content,
+                provider=cached_response.provider,
+                model=cached_response.model,
+                input_tokens=cached_response.input_tokens,
+                output_tokens=cached_response.output_tokens,
+                cost_usd=cached_response.cost_usd,
+                finish_reason=cached_response.finish_reason,
+                response=cached_response
+            )
+            return
+        
+        model_id, provider, model_spec, reservation = await self._route_request(request)
+        input_tokens = self._estimate_input_tokens(request)
+        
+        last_error = None
+        attempted_providers = set()
+        
+        while len(attempted_providers) < len(self._providers):
+            attempted_providers.add(provider)
+            
+            parts: List[str] = []
+            output_tokens = 0
+            finish_reason = None
+            tokens = self._execute_stream(request, model_id, provider, model_spec)
+            self.health.begin(provider.value)
+            
+            try:
+                async for delta, delta_tokens, reason in tokens:
+                    if reason is not None:
+                        finish_reason = reason
+                        break
+                    parts.append(delta)
+                    output_tokens += delta_tokens
+                    yield LLMStreamChunk(
+                        request_id=request.request_id,
+                        index=len(parts) - 1,
+                        delta=delta,
+                        provider=provider,
+                        model=model_id,
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        cost_usd=self._estimate_cost(model_spec, input_tokens, output_tokens)
+                    )
+            except (GeneratorExit, asyncio.CancelledError):
+                # Consumer went away: bill what the provider already produced
+                self._finish_stream(
+                    request, reservation, provider, model_id, model_spec, parts,
+                    input_tokens, output_tokens, "cancelled", start_time
+                )
+                raise
+            except Exception as e:
+                logger.warning(f"Provider {provider.value} stream failed: {e}")
+                self._record_failure(
+                    provider, model_id, (time.time() - start_time) * 1000
+                )
+                last_error = e
+                
+                if parts:
+                    # Tokens already reached the client; a different model
+                    # cannot continue them, so fail the stream.
+                    self._finish_stream(
+                        request, reservation, provider, model_id, model_spec, parts,
+                        input_tokens, output_tokens, "error", start_time
+                    )
+                    raise LLMRouterError(
+                        f"Provider {provider.value} failed mid-stream: {e}"
+                    ) from e
+                
+                self._settle_rate_limit(provider, request, 0)
+                fallback = self._next_fallback(request, attempted_providers)
+                if fallback:
+                    model_id, provider = fallback
+                    model_spec = MODEL_REGISTRY.get(model_id)
+                    continue
+                break
+            finally:
+                await tokens.aclose()
+            
+            response = self._finish_stream(
+                request, reservation, provider, model_id, model_spec, parts,
+                input_tokens, output_tokens, finish_reason or "stop", start_time
+            )
+            self._semantic_store(request, response)
+            
+            yield LLMStreamChunk(
+                request_id=request.request_id,
+                index=len(parts),
+                delta="",
+                provider=provider,
+                model=model_id,
+                input_tokens=response.input_tokens,
+                output_tokens=response.output_tokens,
+                cost_usd=response.cost_usd,
+                finish_reason=response.finish_reason,
+                response=response
+            )
+            return
+        
+        # All providers failed before producing a token
+        self.budget_ledger.refund(reservation)
+        raise LLMRouterError(f"All providers failed. Last error: {last_error}")
+    
+    def _finish_stream(
+        self,
+        request: LLMRequest,
+        reservation: Reservation,
+        provider: LLMProvider,
+        model_id: str,
+        model_spec: ModelSpec,
+        parts: List[str],
+        input_tokens: int,
+        output_tokens: int,
+        finish_reason: str,
+        start_time: float
+    ) -> LLMResponse:
+        """Account a finished, cancelled or broken stream like a completion."""
+        cost = self._estimate_cost(model_spec, input_tokens, output_tokens)
+        elapsed = time.time() - start_time
+        
+        response = LLMResponse(
+            request_id=request.request_id,
+            content="".join(parts),
+            finish_reason=finish_reason,
+            provider=provider,
+            model=model_id,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+            cost_usd=cost,
+            latency_ms=int(elapsed * 1000),
+            tokens_per_second=output_tokens / elapsed if elapsed > 0 else 0.0
+        )
+        
+        if finish_reason == "cancelled":
+            self.health.record_abandoned(provider.value, model_id, elapsed * 1000)
+        elif finish_reason != "error":
+            self._record_success(provider, response, elapsed * 1000)
+        self._settle_rate_limit(provider, request, response.total_tokens)
+        self.budget_ledger.commit(reservation, response.total_tokens, response.cost_usd)
+        
+        self._stats["total_requests"] += 1
+        self._stats["total_tokens"] += response.total_tokens
+        self._stats["total_cost_usd"] += response.cost_usd
+        
+        return response
+    
+    async def _execute_stream(
+        self,
+        request: LLMRequest,
+        model_id: str,
+        provider: LLMProvider,
+        model_spec: ModelSpec
+    ) -> AsyncIterator[Tuple[str, int, Optional[str]]]:
+        """
+        Stream a completion from a specific provider.
+        
+        Yields (delta, tokens, None) per token and a final
+        ("", 0, finish_reason). This is a mock implementation; in
+        production it would read the provider's SSE stream.
+        """
+        await asyncio.sleep(0.05)  # Time to first token
+        
+        content = f"[Mock response from {model_id}] This is a simulated response."
+        words = content.split(" ")
+        max_tokens = min(request.max_tokens, 500)
+        
+        for i, word in enumerate(words[:max_tokens]):
+            await asyncio.sleep(1 / model_spec.tokens_per_second)
+            yield (word if i == 0 else " " + word), 1, None
+        
+        yield "", 0, "stop" if len(words) <= max_tokens else "length"
+    
+    @staticmethod
+    def _estimate_input_tokens(request: LLMRequest) -> int:
+        """Rough prompt size (~1.3 tokens per word)"""
+        words = sum(
+            len(m.get("content", "").split())
+            for m in request.messages
+            if isinstance(m.get("content", ""), str)
+        )
+        if request.system_prompt:
+            words += len(request.system_prompt.split())
+        return int(words * 1.3)
+    
+    @classmethod
+    def _estimate_request_tokens(cls, request: LLMRequest) -> int:
+        """Tokens reserved against TPM before the real usage is known"""
+        return cls._estimate_input_tokens(request) + request.max_tokens
+    
+    # -------------------------------------------------------------------------
+    # RESPONSE CACHE
+    # -------------------------------------------------------------------------
+    
+    def _response_cache_key(self, request: LLMRequest) -> Optional[str]:
+        """Hash of everything that shapes the answer, or None if not cacheable."""
+        if self.response_cache is None or not request.use_semantic_cache:
+            return None
+        
+        prompt = json.dumps({
+            "messages": request.messages,
+            "system_prompt": request.system_prompt,
+            "task_type": request.task_type.value,
+            "strategy": request.strategy.value,
+            "provider": request.preferred_provider.value if request.preferred_provider else None,
+            "model": request.preferred_model,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "json": request.requires_json_output,
+            "functions": request.requires_function_calling,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _response_to_cache(response: LLMResponse) -> Dict[str, Any]:
+        """JSON-safe copy of a response for the response cache."""
+        return {
+            "content": response.content,
+            "finish_reason": response.finish_reason,
+            "provider": response.provider.value,
+            "model": response.model,
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens,
+            "total_tokens": response.total_tokens,
+            "tokens_per_second": response.tokens_per_second,
+        }
+    
+    @staticmethod
+    def _response_from_cache(
+        request: LLMRequest,
+        cached: Dict[str, Any],
+        start_time: float
+    ) -> LLMResponse:
+        """Rebuild a cached response for this request; it cost nothing."""
+        return LLMResponse(
+            request_id=request.request_id,
+            content=cached["content"],
+            finish_reason=cached["finish_reason"],
+            provider=LLMProvider(cached["provider"]),
+            model=cached["model"],
+            input_tokens=cached["input_tokens"],
+            output_tokens=cached["output_tokens"],
+            total_tokens=cached["total_tokens"],
+            cost_usd=Decimal("0.0"),
+            latency_ms=int((time.time() - start_time) * 1000),
+            tokens_per_second=cached["tokens_per_second"],
+            cache_hit=True,
+            cache_similarity=1.0
+        )
+    
+    # -------------------------------------------------------------------------
+    # SEMANTIC CACHE
+    # -------------------------------------------------------------------------
+    
+    @staticmethod
+    def _semantic_prompt(request: LLMRequest) -> Optional[str]:
+        """
+        The last user turn, which is what gets embedded.
+        
+        Shared context (system prompt, earlier turns) is left out so it
+        cannot make different questions look alike; it is part of the
+        exact-match scope instead.
+        """
+        if request.requires_vision or not request.messages:
+            return None
+        for message in request.messages:
+            if not isinstance(message.get("content", ""), str):
+                return None  # Multimodal content is never cached
+        
+        last = request.messages[-1]
+        if last.get("role", "user") != "user":
+            return None
+        return last.get("content") or None
+    
+    @staticmethod
+    def _semantic_scope(request: LLMRequest) -> str:
+        """Exact-match scope: task, settings and context that change the answer."""
+        context = hashlib.sha256()
+        context.update((request.system_prompt or "").encode("utf-8"))
+        for message in request.messages[:-1]:
+            context.update(b"\x00" + message.get("role", "user").encode("utf-8"))
+            context.update(b"\x00" + message.get("content", "").encode("utf-8"))
+        
+        return "|".join([
+            request.task_type.value,
+            request.preferred_provider.value if request.preferred_provider else "*",
+            request.preferred_model or "*",
+            f"t={request.temperature:g}",
+            "json" if request.requires_json_output else "text",
+            context.hexdigest()[:16],
+        ])
+    
+    def _semantic_threshold(self, request: LLMRequest) -> Optional[float]:
+        """Similarity threshold for the request, or None if not cacheable."""
+        if self.semantic_cache is None or not request.use_semantic_cache:
+            return None
+        if request.task_type in SEMANTIC_CACHE_THRESHOLDS:
+            return SEMANTIC_CACHE_THRESHOLDS[request.task_type]
+        return self.semantic_cache.default_threshold
+    
+    def _semantic_lookup(
+        self,
+        request: LLMRequest,
+        start_time: float
+    ) -> Optional[LLMResponse]:
+        """Return a cached response for a similar prompt, if any."""
+        threshold = self._semantic_threshold(request)
+        if threshold is None:
+            return None
+        prompt = self._semantic_prompt(request)
+        if not prompt:
+            return None
+        
+        found = self.semantic_cache.lookup(
+            prompt,
+            identity_id=request.identity_id,
+            task=self._semantic_scope(request),
+            threshold=threshold
+        )
+        if found is None:
+            return None
+        
+        cached, similarity = found
+        self._stats["semantic_cache_hits"] += 1
+        
+        return replace(
+            cached,
+            request_id=request.request_id,
+            cost_usd=Decimal("0.0"),
+            latency_ms=int((time.time() - start_time) * 1000),
+            created_at=datetime.utcnow(),
+            cache_hit=True,
+            cache_similarity=round(similarity, 4)
+        )
+    
+    def _semantic_store(self, request: LLMRequest, response: LLMResponse):
+        """Remember a completed response for later near-duplicate prompts."""
+        if response.finish_reason != "stop":
+            return
+        if self._semantic_threshold(request) is None:
+            return
+        prompt = self._semantic_prompt(request)
+        if not prompt:
+            return
+        
+        self.semantic_cache.store(
+            prompt,
+            replace(response, raw_response=None),
+            identity_id=request.identity_id,
+            task=self._semantic_scope(request)
+        )
+    
+    # -------------------------------------------------------------------------
+    # BUDGET MANAGEMENT
+    # -------------------------------------------------------------------------
+    
+    async def _reserve_budget(
+        self,
+        request: LLMRequest,
+        model_spec: ModelSpec
+    ) -> Reservation:
+        """Reserve the worst-case tokens and cost of a request"""
+        input_tokens = self._estimate_input_tokens(request)
+        return await self._reserve(
+            request.identity_id,
+            input_tokens + request.max_tokens,
+            self._estimate_cost(model_spec, input_tokens, request.max_tokens)
+        )
+    
+    async def _reserve(self, identity_id: str, tokens: int, cost: Decimal) -> Reservation:
+        try:
+            return await self.budget_ledger.reserve(identity_id, tokens, cost)
+        except BudgetExhaustedError as e:
+            raise BudgetExceededError(
+                f"Token budget exceeded for identity {identity_id}"
+            ) from e
     
     def get_budget(self, identity_id: str) -> Optional[TokenBudget]:
-        """Get budget for an identity"""
-        return self._budgets.get(identity_id)
+        """
+        Get budget for an identity.
+        
+        Usage is what this process committed in the current calendar day
+        and month; await budget_ledger.usage() for the figure across workers.
+        """
+        limits = self.budget_ledger.get_limits(identity_id)
+        usage = self.budget_ledger.local_usage(identity_id)
+        daily_reset_at, monthly_reset_at = self.budget_ledger.window_starts()
+        return TokenBudget(
+            identity_id=identity_id,
+            daily_limit=limits.daily_tokens,
+            monthly_limit=limits.monthly_tokens,
+            daily_used=usage["daily_tokens"],
+            monthly_used=usage["monthly_tokens"],
+            daily_cost_limit=limits.daily_cost,
+            monthly_cost_limit=limits.monthly_cost,
+            daily_cost_used=usage["daily_cost"],
+            monthly_cost_used=usage["monthly_cost"],
+            daily_reset_at=daily_reset_at,
+            monthly_reset_at=monthly_reset_at
+        )
     
     def set_budget_limits(
         self,
@@ -954,77 +1916,102 @@ class LLMRouter:
         monthly_cost_limit: Optional[Decimal] = None
     ):
         """Set budget limits for an identity"""
-        budget = self._budgets.get(identity_id)
-        if not budget:
-            budget = TokenBudget(identity_id=identity_id)
-            self._budgets[identity_id] = budget
-        
-        if daily_limit is not None:
-            budget.daily_limit = daily_limit
-        if monthly_limit is not None:
-            budget.monthly_limit = monthly_limit
-        if daily_cost_limit is not None:
-            budget.daily_cost_limit = daily_cost_limit
-        if monthly_cost_limit is not None:
-            budget.monthly_cost_limit = monthly_cost_limit
+        limits = self.budget_ledger.get_limits(identity_id)
+        self.budget_ledger.set_limits(identity_id, BudgetLimits(
+            daily_tokens=daily_limit if daily_limit is not None else limits.daily_tokens,
+            monthly_tokens=monthly_limit if monthly_limit is not None else limits.monthly_tokens,
+            daily_cost=daily_cost_limit if daily_cost_limit is not None else limits.daily_cost,
+            monthly_cost=monthly_cost_limit if monthly_cost_limit is not None else limits.monthly_cost
+        ))
     
     # -------------------------------------------------------------------------
     # RATE LIMITING
     # -------------------------------------------------------------------------
     
-    def _check_rate_limit(self, provider: LLMProvider) -> bool:
-        """Check if provider is within rate limits"""
+    def _check_rate_limit(
+        self,
+        provider: LLMProvider,
+        tokens: int = 0,
+        priority: RequestPriority = RequestPriority.STANDARD
+    ) -> bool:
+        """Reserve one request and `tokens` TPM now, without waiting"""
         limiter = self._rate_limiters.get(provider)
         if not limiter:
             return True
-        
-        config = self._providers.get(provider)
-        if not config:
-            return True
-        
-        now = time.time()
-        
-        # Reset if minute has passed
-        if now - limiter["minute_start"] >= 60:
-            limiter["requests_this_minute"] = 0
-            limiter["tokens_this_minute"] = 0
-            limiter["minute_start"] = now
-        
-        # Check limits
-        if limiter["requests_this_minute"] >= config.rate_limit_rpm:
-            return False
-        if limiter["tokens_this_minute"] >= config.rate_limit_tpm:
-            return False
-        
-        # Increment
-        limiter["requests_this_minute"] += 1
-        
-        return True
+        return limiter.try_acquire(tokens, priority)
+    
+    async def _wait_rate_limit(
+        self,
+        provider: LLMProvider,
+        tokens: int,
+        priority: RequestPriority,
+        timeout: Optional[float]
+    ):
+        """Wait for rate-limit capacity in a priority lane"""
+        limiter = self._rate_limiters.get(provider)
+        if not limiter:
+            return
+        try:
+            await limiter.acquire(tokens, priority=priority, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise RateLimitExceededError(
+                f"Rate limit exceeded for {provider.value} "
+                f"(no capacity within {timeout}s)"
+            )
+    
+    def _settle_rate_limit(
+        self,
+        provider: LLMProvider,
+        request: LLMRequest,
+        actual_tokens: int
+    ):
+        """Replace the TPM reservation of a request with its actual usage"""
+        limiter = self._rate_limiters.get(provider)
+        if limiter:
+            limiter.settle(self._estimate_request_tokens(request), actual_tokens)
     
     # -------------------------------------------------------------------------
     # HEALTH & STATS
     # -------------------------------------------------------------------------
     
-    def _record_success(self, provider: LLMProvider, response: LLMResponse):
+    def _record_success(
+        self,
+        provider: LLMProvider,
+        response: LLMResponse,
+        latency_ms: Optional[float] = None
+    ):
         """Record successful request"""
         config = self._providers.get(provider)
         if config:
             config.last_success = datetime.utcnow()
             config.consecutive_failures = 0
         
+        self.health.record_success(
+            provider.value,
+            response.model,
+            response.latency_ms if latency_ms is None else latency_ms
+        )
+        
         # Update stats
         provider_key = provider.value
         if provider_key not in self._stats["requests_per_provider"]:
             self._stats["requests_per_provider"][provider_key] = 0
         self._stats["requests_per_provider"][provider_key] += 1
     
-    def _record_failure(self, provider: LLMProvider):
+    def _record_failure(
+        self,
+        provider: LLMProvider,
+        model_id: Optional[str] = None,
+        latency_ms: float = 0.0
+    ):
         """Record failed request"""
         config = self._providers.get(provider)
         if config:
             config.last_failure = datetime.utcnow()
             config.consecutive_failures += 1
         
+        self.health.record_failure(provider.value, model_id, latency_ms)
+        
         # Update stats
         provider_key = provider.value
         if provider_key not in self._stats["failures_per_provider"]:
@@ -1047,7 +2034,20 @@ class LLMRouter:
         return {
             **self._stats,
             "available_providers": [p.value for p in self.get_available_providers()],
-            "total_budgets_tracked": len(self._budgets)
+            "total_budgets_tracked": self.budget_ledger.identities,
+            "budget_ledger": self.budget_ledger.get_stats(),
+            "semantic_cache": (
+                self.semantic_cache.get_stats() if self.semantic_cache else None
+            ),
+            "provider_health": self.health.snapshot(),
+            "rate_limits": {
+                provider.value: limiter.get_stats()
+                for provider, limiter in self._rate_limiters.items()
+            },
+            "batching": {
+                "completions": self._completion_batcher.get_stats(),
+                "embeddings": self._embedding_batcher.get_stats()
+            }
         }
     
     def get_model_info(self, model_id: str) -> Optional[Dict[str, Any]]:
@@ -1119,7 +2119,11 @@ def get_llm_router() -> LLMRouter:
     """Get or create the LLM router singleton"""
     global _llm_router
     if _llm_router is None:
-        _llm_router = LLMRouter()
+        _llm_router = LLMRouter(
+            semantic_cache=SemanticCache(),
+            response_cache=get_cache_service(),
+            budget_ledger=BudgetLedger(backend=create_ledger_backend())
+        )
         
         # Register default providers (mock configs for now)
         _llm_router.register_provider(ProviderConfig(
@@ -1176,12 +2180,18 @@ __all__ = [
     "LLMProvider",
     "LLMRequest",
     "LLMResponse",
+    "LLMStreamChunk",
+    "EmbeddingResponse",
     "TaskType",
     "RoutingStrategy",
+    "RequestPriority",
     "ProviderConfig",
     "ModelSpec",
     "TokenBudget",
     "MODEL_REGISTRY",
+    "EMBEDDING_MODEL_REGISTRY",
+    "DEFAULT_EMBEDDING_MODEL",
+    "SEMANTIC_CACHE_THRESHOLDS",
     "get_llm_router",
     "LLMRouterError",
     "BudgetExceededError",
@@ -0,0 +1,144 @@
+"""
+MICRO BATCHER
+=============
+
+Coalesces small independent async calls into batch calls.
+
+Callers submit one item and await its own result. Items with the same key
+are collected until either `max_batch_size` items are queued or the
+first one has waited `max_wait_ms`, then dispatched together through one
+batch function. Results fan back out to the individual awaiters in order.
+
+Used by the LLM Router so that agents issuing many small completions or
+embeddings pay routing, rate-limit and provider round-trip costs once per
+batch instead of once per call.
+
+VERSION: 1.0.0
+"""
+
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable, Hashable, Union
+from dataclasses import dataclass
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchConfig:
+    """Flush policy"""
+    max_batch_size: int = 16
+    max_wait_ms: float = 10.0
+
+
+# Receives (key, items); returns one result or exception per item, in order
+BatchDispatch = Callable[[Hashable, List[Any]], Awaitable[List[Union[Any, BaseException]]]]
+
+
+class MicroBatcher:
+    """
+    Size- or time-triggered batching per key.
+
+    If the dispatch function raises, every item of the batch receives that
+    exception. Awaiters cancelled before their batch is dispatched are left
+    out of it.
+    """
+
+    def __init__(self, dispatch: BatchDispatch, config: Optional[BatchConfig] = None):
+        self.dispatch = dispatch
+        self.config = config or BatchConfig()
+        self._pending: Dict[Hashable, List[Tuple[Any, asyncio.Future]]] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+        self._inflight: set = set()
+
+        # Stats
+        self.batches = 0
+        self.items = 0
+        self.size_flushes = 0
+        self.timer_flushes = 0
+
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """Queue an item and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        pending = self._pending.setdefault(key, [])
+        pending.append((item, future))
+
+        if len(pending) >= self.config.max_batch_size:
+            self.size_flushes += 1
+            self._flush(key)
+        elif len(pending) == 1:
+            self._timers[key] = loop.call_later(
+                self.config.max_wait_ms / 1000, self._on_timer, key
+            )
+
+        return await future
+
+    def _on_timer(self, key: Hashable) -> None:
+        self.timer_flushes += 1
+        self._flush(key)
+
+    def _flush(self, key: Hashable) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        items = self._pending.pop(key, None)
+        if not items:
+            return
+
+        task = asyncio.create_task(self._run(key, items))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run(self, key: Hashable, items: List[Tuple[Any, asyncio.Future]]) -> None:
+        live = [(item, future) for item, future in items if not future.done()]
+        if not live:
+            return
+
+        self.batches += 1
+        self.items += len(live)
+
+        try:
+            results = await self.dispatch(key, [item for item, _ in live])
+        except asyncio.CancelledError:
+            for _, future in live:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(live, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def flush_all(self) -> None:
+        """Dispatch everything queued and wait for in-flight batches."""
+        for key in list(self._pending):
+            self._flush(key)
+        if self._inflight:
+            await asyncio.gather(*list(self._inflight), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+            "size_flushes": self.size_flushes,
+            "timer_flushes": self.timer_flushes,
+            "queued": sum(len(items) for items in self._pending.values()),
+            "in_flight": len(self._inflight),
+        }
+
+
+__all__ = [
+    "BatchConfig",
+    "MicroBatcher",
+]
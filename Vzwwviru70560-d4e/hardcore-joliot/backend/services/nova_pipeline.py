@@ -75,6 +75,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -90,9 +91,13 @@ from backend.core.exceptions import (
     CheckpointRequiredError,
 )
 from backend.models.agent import SphereType
+from backend.services.llm_router import LLMRequest, TaskType
 
 logger = logging.getLogger(__name__)
 
+# Receives each streamed LLM chunk; awaiting it applies backpressure
+ChunkCallback = Callable[[Any], Awaitable[None]]
+
 
 # =============================================================================
 # ENUMS & TYPES
@@ -676,6 +681,86 @@ class Executor:
                 output_text=f"Execution failed: {str(e)}",
                 duration_ms=int((time.time() - start_time) * 1000),
             )
+    
+    async def execute_stream(
+        self,
+        request: NovaRequest,
+        encoding: SemanticEncoding,
+        checkpoint: CheckpointResult,
+        llm_router: Any,
+        on_chunk: ChunkCallback,
+    ) -> ExecutionResult:
+        """
+        Execute the AI operation through the LLM Router, forwarding tokens.
+        
+        Every chunk is awaited through on_chunk before the next one is read
+        from the provider. If on_chunk raises (client gone), the router
+        stream is closed and only the tokens produced so far are billed.
+        """
+        start_time = time.time()
+        
+        if checkpoint.requires_approval and not checkpoint.approved:
+            return ExecutionResult(
+                success=False,
+                output_text="Awaiting human approval",
+                duration_ms=0,
+            )
+        
+        llm_request = LLMRequest(
+            messages=[{"role": "user", "content": encoding.encoded_prompt}],
+            system_prompt=encoding.system_message,
+            task_type=TaskType.CHAT,
+            preferred_model=encoding.model,
+            max_tokens=encoding.max_tokens,
+            temperature=encoding.temperature,
+            identity_id=str(request.identity_id),
+            thread_id=str(request.thread_id) if request.thread_id else None,
+            stream=True,
+        )
+        
+        parts: List[str] = []
+        last_chunk = None
+        try:
+            async with aclosing(llm_router.stream(llm_request)) as chunks:
+                async for chunk in chunks:
+                    last_chunk = chunk
+                    if chunk.delta:
+                        parts.append(chunk.delta)
+                    await on_chunk(chunk)
+            
+            response = last_chunk.response
+            return ExecutionResult(
+                success=True,
+                output_text=response.content,
+                output_data={
+                    "processed": True,
+                    "streamed": True,
+                    "cache_hit": response.cache_hit,
+                },
+                input_tokens=response.input_tokens,
+                output_tokens=response.output_tokens,
+                total_tokens=response.total_tokens,
+                cost=float(response.cost_usd),
+                duration_ms=int((time.time() - start_time) * 1000),
+                model_used=response.model,
+                finish_reason=response.finish_reason,
+            )
+            
+        except Exception as e:
+            logger.error(f"Streaming execution failed: {e}")
+            input_tokens = last_chunk.input_tokens if last_chunk else 0
+            output_tokens = last_chunk.output_tokens if last_chunk else 0
+            return ExecutionResult(
+                success=False,
+                output_text="".join(parts) or f"Execution failed: {str(e)}",
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens,
+                cost=float(last_chunk.cost_usd) if last_chunk else 0.0,
+                duration_ms=int((time.time() - start_time) * 1000),
+                model_used=last_chunk.model if last_chunk else encoding.model,
+                finish_reason="error",
+            )
 
 
 class Auditor:
@@ -761,13 +846,20 @@ class NovaPipelineService:
         self.executor = Executor()
         self.auditor = Auditor()
     
-    async def process(self, request: NovaRequest) -> NovaPipelineResult:
+    async def process(
+        self,
+        request: NovaRequest,
+        on_chunk: Optional[ChunkCallback] = None,
+    ) -> NovaPipelineResult:
         """
         Process a request through the Nova Pipeline.
         
         Executes all 7 lanes in sequence:
         A → B → C → D → E → F → G
         
+        When request.stream is set and on_chunk is given, Lane F streams
+        the LLM output through on_chunk as it is generated.
+        
         Returns NovaPipelineResult with all lane outputs.
         
         Raises:
@@ -862,7 +954,16 @@ class NovaPipelineService:
             # =====================================================
             # LANE F: EXECUTION
             # =====================================================
-            execution = await self.executor.execute(request, encoding, checkpoint)
+            if request.stream and on_chunk is not None and self.llm_router is not None:
+                execution = await self.executor.execute_stream(
+                    request,
+                    encoding,
+                    checkpoint,
+                    llm_router=self.llm_router,
+                    on_chunk=on_chunk,
+                )
+            else:
+                execution = await self.executor.execute(request, encoding, checkpoint)
             lanes_executed.append(PipelineLane.EXECUTION.value)
             
             logger.debug(f"Lane F: Execution success={execution.success}")
@@ -1035,6 +1136,7 @@ __all__ = [
     
     # Service
     "NovaPipelineService",
+    "ChunkCallback",
     
     # Lane Handlers
     "IntentAnalyzer",
@@ -0,0 +1,305 @@
+"""
+PROVIDER HEALTH
+===============
+
+Live latency and error tracking for the LLM Router.
+
+Static model specs (advertised tokens/second) cannot see a provider that is
+slow or failing right now. This module keeps, per provider and per model:
+
+- EWMA of latency and error rate
+- A sliding window of recent latencies for p95
+- A circuit breaker per provider (closed / open / half-open)
+
+The router ranks models on observed p95 once enough samples exist, skips
+providers whose breaker is open, and uses p95 as the hedging delay.
+
+VERSION: 1.0.0
+"""
+
+from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+from collections import deque
+from enum import Enum
+import math
+import time
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"        # Traffic flows
+    OPEN = "open"            # Provider skipped until cooldown ends
+    HALF_OPEN = "half_open"  # Limited probes decide whether to close
+
+
+@dataclass
+class HealthConfig:
+    """Tuning for health tracking and circuit breakers"""
+    ewma_alpha: float = 0.2           # Weight of the newest sample
+    window_size: int = 128            # Latencies kept for percentiles
+    min_samples: int = 5              # Before observed stats are trusted
+
+    # Breaker trips on N consecutive failures or a high error rate
+    failure_threshold: int = 3
+    error_rate_threshold: float = 0.5
+
+    # Open-state cooldown doubles on each re-trip, up to the max
+    open_seconds: float = 30.0
+    max_open_seconds: float = 600.0
+    half_open_probes: int = 1
+
+
+# =============================================================================
+# LATENCY / ERROR STATS
+# =============================================================================
+
+class LatencyStats:
+    """EWMA latency and error rate plus a window for percentiles."""
+
+    __slots__ = (
+        "alpha", "samples", "ewma_latency_ms", "ewma_error_rate",
+        "_window", "_sorted",
+    )
+
+    def __init__(self, alpha: float = 0.2, window_size: int = 128):
+        self.alpha = alpha
+        self.samples = 0
+        self.ewma_latency_ms: Optional[float] = None
+        self.ewma_error_rate = 0.0
+        self._window: deque = deque(maxlen=window_size)
+        self._sorted: Optional[List[float]] = None
+
+    def record(self, latency_ms: float, ok: bool = True) -> None:
+        """Add one observation."""
+        self.samples += 1
+        if self.ewma_latency_ms is None:
+            self.ewma_latency_ms = latency_ms
+        else:
+            self.ewma_latency_ms += self.alpha * (latency_ms - self.ewma_latency_ms)
+        self.ewma_error_rate += self.alpha * ((0.0 if ok else 1.0) - self.ewma_error_rate)
+        self._window.append(latency_ms)
+        self._sorted = None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Nearest-rank percentile of the recent window (q in 0..1)."""
+        if not self._window:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._window)
+        rank = max(0, math.ceil(q * len(self._sorted)) - 1)
+        return self._sorted[rank]
+
+    @property
+    def p95_ms(self) -> Optional[float]:
+        return self.percentile(0.95)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "ewma_latency_ms": round(self.ewma_latency_ms or 0.0, 2),
+            "ewma_error_rate": round(self.ewma_error_rate, 4),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.p95_ms,
+        }
+
+
+# =============================================================================
+# CIRCUIT BREAKER
+# =============================================================================
+
+class CircuitBreaker:
+    """
+    Per-provider breaker with half-open probing.
+
+    available() is a pure check used while ranking candidates; on_dispatch()
+    is called once a request is actually sent, which is when a half-open
+    probe slot is taken.
+    """
+
+    def __init__(self, config: HealthConfig, failure_threshold: Optional[int] = None):
+        self.config = config
+        self.failure_threshold = failure_threshold or config.failure_threshold
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+
+    @property
+    def cooldown_seconds(self) -> float:
+        return min(
+            self.config.open_seconds * (2 ** max(0, self.trips - 1)),
+            self.config.max_open_seconds
+        )
+
+    def available(self, now: Optional[float] = None) -> bool:
+        """Whether a request may be sent now."""
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            now = time.monotonic() if now is None else now
+            return now - self.opened_at >= self.cooldown_seconds
+        return self.probes_in_flight < self.config.half_open_probes
+
+    def on_dispatch(self, now: Optional[float] = None) -> None:
+        """A request is being sent to the provider."""
+        if self.state == CircuitState.OPEN and self.available(now):
+            self.state = CircuitState.HALF_OPEN
+        if self.state == CircuitState.HALF_OPEN:
+            self.probes_in_flight += 1
+
+    def _release_probe(self) -> None:
+        if self.probes_in_flight:
+            self.probes_in_flight -= 1
+
+    def on_success(self) -> None:
+        self._release_probe()
+        self.consecutive_failures = 0
+        if self.state != CircuitState.CLOSED:
+            self.state = CircuitState.CLOSED
+            self.trips = 0
+
+    def on_failure(self, stats: LatencyStats, now: Optional[float] = None) -> None:
+        self._release_probe()
+        self.consecutive_failures += 1
+
+        if self.state == CircuitState.HALF_OPEN:
+            self._trip(now)
+        elif self.state == CircuitState.CLOSED and (
+            self.consecutive_failures >= self.failure_threshold
+            or (
+                stats.samples >= self.config.min_samples
+                and stats.ewma_error_rate >= self.config.error_rate_threshold
+            )
+        ):
+            self._trip(now)
+
+    def on_abandon(self) -> None:
+        """Request cancelled before an outcome (e.g. lost a hedge race)."""
+        self._release_probe()
+
+    def _trip(self, now: Optional[float]) -> None:
+        self.state = CircuitState.OPEN
+        self.trips += 1
+        self.opened_at = time.monotonic() if now is None else now
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "cooldown_seconds": self.cooldown_seconds,
+        }
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+class ProviderHealth:
+    """
+    Live health of providers and models.
+
+    Providers and models are plain string keys so the tracker stays
+    independent from the router's enums.
+    """
+
+    def __init__(self, config: Optional[HealthConfig] = None):
+        self.config = config or HealthConfig()
+        self._providers: Dict[str, LatencyStats] = {}
+        self._models: Dict[str, LatencyStats] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def _stats(self, table: Dict[str, LatencyStats], key: str) -> LatencyStats:
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = LatencyStats(self.config.ewma_alpha, self.config.window_size)
+        return stats
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            breaker = self._breakers[provider] = CircuitBreaker(self.config)
+        return breaker
+
+    def register(self, provider: str, failure_threshold: Optional[int] = None) -> None:
+        """Create (or reset) the breaker of a provider."""
+        self._breakers[provider] = CircuitBreaker(self.config, failure_threshold)
+
+    # -------------------------------------------------------------------------
+    # RECORDING
+    # -------------------------------------------------------------------------
+
+    def is_available(self, provider: str) -> bool:
+        return self.breaker(provider).available()
+
+    def begin(self, provider: str) -> None:
+        self.breaker(provider).on_dispatch()
+
+    def record_success(self, provider: str, model: str, latency_ms: float) -> None:
+        self._stats(self._providers, provider).record(latency_ms, ok=True)
+        self._stats(self._models, model).record(latency_ms, ok=True)
+        self.breaker(provider).on_success()
+
+    def record_failure(self, provider: str, model: Optional[str], latency_ms: float) -> None:
+        stats = self._stats(self._providers, provider)
+        stats.record(latency_ms, ok=False)
+        if model is not None:
+            self._stats(self._models, model).record(latency_ms, ok=False)
+        self.breaker(provider).on_failure(stats)
+
+    def record_abandoned(self, provider: str, model: str, elapsed_ms: float) -> None:
+        """
+        A request cancelled after elapsed_ms without an outcome.
+
+        Its true latency is at least elapsed_ms, so that lower bound is
+        kept as a latency sample; otherwise providers that keep losing
+        hedge races would never look slow.
+        """
+        self._stats(self._providers, provider).record(elapsed_ms, ok=True)
+        self._stats(self._models, model).record(elapsed_ms, ok=True)
+        self.breaker(provider).on_abandon()
+
+    # -------------------------------------------------------------------------
+    # QUERIES
+    # -------------------------------------------------------------------------
+
+    def model_stats(self, model: str) -> Optional[LatencyStats]:
+        """Stats of a model, or None until min_samples were observed."""
+        stats = self._models.get(model)
+        if stats is None or stats.samples < self.config.min_samples:
+            return None
+        return stats
+
+    def p95_ms(self, model: str) -> Optional[float]:
+        stats = self.model_stats(model)
+        return stats.p95_ms if stats else None
+
+    def error_rate(self, model: str) -> float:
+        stats = self.model_stats(model)
+        return stats.ewma_error_rate if stats else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "providers": {
+                name: {
+                    **(self._providers[name].to_dict() if name in self._providers else {}),
+                    "circuit": breaker.to_dict(),
+                }
+                for name, breaker in self._breakers.items()
+            },
+            "models": {name: stats.to_dict() for name, stats in self._models.items()},
+        }
+
+
+__all__ = [
+    "CircuitState",
+    "HealthConfig",
+    "LatencyStats",
+    "CircuitBreaker",
+    "ProviderHealth",
+]
@@ -0,0 +1,275 @@
+"""
+PROVIDER LIMITS
+===============
+
+Token-bucket rate limiting for LLM providers.
+
+Each provider has two buckets refilled continuously: one for requests per
+minute (RPM) and one for tokens per minute (TPM). A request is admitted
+when both can cover it. Instead of failing as soon as a fixed window is
+exhausted, callers can wait for capacity with a deadline, in priority
+lanes: interactive Nova traffic is served before batch agent traffic, and
+FIFO within a lane.
+
+Token cost is not known up front, so requests reserve an estimate
+(prompt + max_tokens) and settle() it against actual usage afterwards.
+
+VERSION: 1.0.1
+"""
+
+from typing import Dict, Any, Optional, Deque
+from dataclasses import dataclass, field
+from collections import deque
+from enum import IntEnum
+import asyncio
+import time
+
+
+# =============================================================================
+# PRIORITIES
+# =============================================================================
+
+class RequestPriority(IntEnum):
+    """Admission lanes; lower value is served first"""
+    INTERACTIVE = 0  # User waiting on the answer (Nova)
+    STANDARD = 1
+    BATCH = 2        # Background agent work
+
+
+# =============================================================================
+# TOKEN BUCKET
+# =============================================================================
+
+class TokenBucket:
+    """
+    Continuously refilled bucket.
+
+    The level may go negative when actual usage exceeds a reservation;
+    the debt is paid back by refill before new requests are admitted.
+    """
+
+    __slots__ = ("capacity", "rate", "level", "updated_at")
+
+    def __init__(self, capacity: float, per_seconds: float = 60.0):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / per_seconds
+        self.level = self.capacity
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        if now > self.updated_at:
+            self.level = min(self.capacity, self.level + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` is available (0 if it is now)."""
+        self.refill(now)
+        missing = min(amount, self.capacity) - self.level
+        if missing <= 0:
+            return 0.0
+        return missing / self.rate if self.rate > 0 else float("inf")
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+    def give(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+# =============================================================================
+# PROVIDER LIMITER
+# =============================================================================
+
+@dataclass
+class _Waiter:
+    tokens: int
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class ProviderRateLimiter:
+    """
+    RPM + TPM limiter for one provider with async, prioritized waiting.
+
+    Requests that fit are admitted without awaiting. Otherwise they join
+    their priority lane and a single pump task admits the head of the
+    highest non-empty lane as soon as both buckets can cover it, so small
+    requests cannot starve a large one queued before them.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self._lanes: Dict[RequestPriority, Deque[_Waiter]] = {
+            priority: deque() for priority in RequestPriority
+        }
+        self._wakeup = asyncio.Event()
+        self._pump: Optional[asyncio.Task] = None
+
+        # Stats
+        self.admitted = 0
+        self.waited = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+
+    # -------------------------------------------------------------------------
+    # ADMISSION
+    # -------------------------------------------------------------------------
+
+    def _wait_time(self, tokens: int, now: float) -> float:
+        return max(
+            self.requests.wait_time(1, now),
+            self.tokens.wait_time(tokens, now)
+        )
+
+    def _admit(self, tokens: int) -> None:
+        self.requests.take(1)
+        self.tokens.take(min(tokens, self.tokens.capacity))
+        self.admitted += 1
+
+    def _queued(self, up_to: RequestPriority = RequestPriority.BATCH) -> bool:
+        return any(
+            any(not w.future.done() for w in self._lanes[p])
+            for p in RequestPriority if p <= up_to
+        )
+
+    def try_acquire(
+        self,
+        tokens: int = 0,
+        priority: RequestPriority = RequestPriority.STANDARD
+    ) -> bool:
+        """Admit immediately if capacity allows and nobody at this priority or above is queued."""
+        if self._queued(priority):
+            return False
+        if self._wait_time(tokens, time.monotonic()) > 0:
+            return False
+        self._admit(tokens)
+        return True
+
+    async def acquire(
+        self,
+        tokens: int = 0,
+        priority: RequestPriority = RequestPriority.STANDARD,
+        timeout: Optional[float] = None
+    ) -> float:
+        """
+        Wait until the request fits, in priority order.
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            asyncio.TimeoutError: If not admitted within `timeout` seconds
+        """
+        if self.try_acquire(tokens, priority):
+            return 0.0
+
+        start = time.monotonic()
+        # Fail fast when even an empty queue could not admit in time
+        if timeout is not None and not self._queued() and self._wait_time(tokens, start) > timeout:
+            self.timeouts += 1
+            raise asyncio.TimeoutError()
+
+        waiter = _Waiter(tokens=tokens, future=asyncio.get_running_loop().create_future())
+        self._lanes[priority].append(waiter)
+        self._wakeup.set()
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.create_task(self._run_pump())
+
+        try:
+            await asyncio.wait_for(waiter.future, timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            # Cancelled/timed-out waiters stay in the lane as done futures
+            # and are skipped by the pump.
+            if not waiter.future.done():
+                waiter.future.cancel()
+
+        waited = time.monotonic() - start
+        self.waited += 1
+        self.total_wait_seconds += waited
+        return waited
+
+    def _head(self) -> Optional[_Waiter]:
+        for priority in RequestPriority:
+            lane = self._lanes[priority]
+            while lane and lane[0].future.done():
+                lane.popleft()
+            if lane:
+                return lane[0]
+        return None
+
+    async def _run_pump(self) -> None:
+        while True:
+            waiter = self._head()
+            if waiter is None:
+                return
+
+            delay = self._wait_time(waiter.tokens, time.monotonic())
+            if delay <= 0:
+                self._admit(waiter.tokens)
+                waiter.future.set_result(None)
+                continue
+
+            # Sleep until capacity refills, or until a new (possibly
+            # higher-priority) waiter arrives.
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    # -------------------------------------------------------------------------
+    # ACCOUNTING
+    # -------------------------------------------------------------------------
+
+    def settle(self, reserved_tokens: int, actual_tokens: int) -> None:
+        """
+        Correct a reservation with the tokens actually used.
+
+        Admission took at most the bucket capacity, so that is what the
+        reservation is compared against. A refund never lifts the bucket
+        above capacity once refill since admission is accounted for.
+        """
+        self.tokens.refill(time.monotonic())
+        delta = min(reserved_tokens, self.tokens.capacity) - actual_tokens
+        if delta > 0:
+            refund = min(delta, self.tokens.capacity - self.tokens.level)
+            if refund > 0:
+                self.tokens.give(refund)
+                if self._queued():
+                    self._wakeup.set()
+        elif delta < 0:
+            self.tokens.take(-delta)
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        self.requests.refill(now)
+        self.tokens.refill(now)
+        return {
+            "rpm": self.rpm,
+            "tpm": self.tpm,
+            "requests_available": int(self.requests.level),
+            "tokens_available": int(self.tokens.level),
+            "queued": {
+                p.name.lower(): sum(1 for w in self._lanes[p] if not w.future.done())
+                for p in RequestPriority
+            },
+            "admitted": self.admitted,
+            "waited": self.waited,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (
+                self.total_wait_seconds / self.waited * 1000 if self.waited else 0.0
+            ),
+        }
+
+
+__all__ = [
+    "RequestPriority",
+    "TokenBucket",
+    "ProviderRateLimiter",
+]
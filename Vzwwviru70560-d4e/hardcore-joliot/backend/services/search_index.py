@@ -0,0 +1,748 @@
+"""
+SEARCH INDEX
+============
+
+Local full-text index behind the global search API.
+
+Substring scans over every record cost O(records × text) per request and
+cannot rank. This index tokenizes resources once, when they are written,
+and answers queries from posting lists.
+
+Features:
+- Accent/case folding and French/English stopwords ("Rénovation" == "renovation")
+- Field-weighted BM25 ranking (title > tags > description > body)
+- Prefix expansion for partial words, trigram fallback for typos
+- Facet counts computed by intersecting posting lists
+- Incremental upsert / patch / append / remove from resource events
+- JSON snapshot on disk for warm restarts (atomic replace, background autosave),
+  one file per worker process
+
+R&D COMPLIANCE:
+- Rule #3: Documents carry an identity; queries only see their own identity's
+  documents plus shared ones (identity_id=None), and only the owning identity
+  can patch, append to or remove a document
+
+VERSION: 1.1.0
+"""
+
+from typing import Dict, Any, Optional, List, Set, Tuple, Iterable
+from dataclasses import dataclass, field, asdict, fields
+import asyncio
+import bisect
+import json
+import logging
+import math
+import os
+import re
+import time
+import unicodedata
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+SNAPSHOT_VERSION = 1
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Term frequency multiplier per field
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "tags": 2.0,
+    "description": 1.0,
+    "body": 1.0,
+}
+
+# Partial-word matches score lower than whole words
+PREFIX_WEIGHT = 0.7
+FUZZY_WEIGHT = 0.5
+MAX_EXPANSIONS = 50
+MIN_TRIGRAM_SIMILARITY = 0.4
+
+FACET_FIELDS = ("resource_type", "sphere_id", "domain_id", "tag")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from in is it of on or the to with
+au aux avec ce ces dans de des du en et la le les leur mais ou par pour
+sa se ses son sur un une
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+# =============================================================================
+# TEXT
+# =============================================================================
+
+def fold_text(text: str) -> str:
+    """Lowercase and strip accents."""
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+
+
+def tokenize(text: Optional[str], keep_stopwords: bool = False) -> List[str]:
+    """Folded word tokens, without stopwords unless asked."""
+    if not text:
+        return []
+    tokens = _TOKEN_RE.findall(fold_text(text))
+    if keep_stopwords:
+        return tokens
+    return [t for t in tokens if t not in STOPWORDS]
+
+
+def trigrams(term: str) -> Set[str]:
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# =============================================================================
+# DOCUMENTS
+# =============================================================================
+
+@dataclass
+class SearchDocument:
+    """A searchable resource."""
+    id: str
+    resource_type: str
+    title: str
+    description: Optional[str] = None
+    body: str = ""
+    tags: List[str] = field(default_factory=list)
+    sphere_id: Optional[str] = None
+    domain_id: Optional[str] = None
+    identity_id: Optional[str] = None  # None = shared with every identity
+    url: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any], **overrides) -> "SearchDocument":
+        """Build from an API record, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        values = {k: v for k, v in record.items() if k in known}
+        values.update(overrides)
+        return cls(**values)
+
+    def to_result(self) -> Dict[str, Any]:
+        """Public shape of a search hit (no body, no identity)."""
+        return {
+            "id": self.id,
+            "resource_type": self.resource_type,
+            "title": self.title,
+            "description": self.description,
+            "sphere_id": self.sphere_id,
+            "domain_id": self.domain_id,
+            "tags": list(self.tags),
+            "url": self.url,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+    def weighted_terms(self) -> Dict[str, float]:
+        """term -> field-weighted frequency."""
+        terms: Dict[str, float] = {}
+        for name, text in (
+            ("title", self.title),
+            ("tags", " ".join(self.tags)),
+            ("description", self.description),
+            ("body", self.body),
+        ):
+            weight = FIELD_WEIGHTS[name]
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + weight
+        return terms
+
+
+@dataclass
+class SearchStats:
+    """Index counters."""
+    queries: int = 0
+    suggestions: int = 0
+    upserts: int = 0
+    removals: int = 0
+    saves: int = 0
+    total_query_ms: float = 0.0
+
+    @property
+    def avg_query_ms(self) -> float:
+        return self.total_query_ms / self.queries if self.queries else 0.0
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+class SearchIndex:
+    """
+    Inverted index with BM25 ranking.
+
+    Documents are numbered internally; postings map term -> {doc: weighted tf}.
+    Facets are posting lists too (value -> set of docs), so filtering and
+    facet counting are set intersections.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.stats = SearchStats()
+        self._autosave_task: Optional[asyncio.Task] = None
+        self._save_lock = asyncio.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._docs: Dict[int, SearchDocument] = {}
+        self._numbers: Dict[str, int] = {}
+        self._next_number = 0
+
+        self._doc_terms: Dict[int, Dict[str, float]] = {}
+        self._doc_len: Dict[int, float] = {}
+        self._total_len = 0.0
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._vocabulary: List[str] = []  # sorted, for prefix expansion
+        self._trigrams: Dict[str, Set[str]] = {}
+
+        self._facets: Dict[str, Dict[Any, Set[int]]] = {name: {} for name in FACET_FIELDS}
+
+        # Autocomplete: term -> suggestion keys ("doc", number) / ("tag", text)
+        self._suggest: Dict[str, Set[Tuple[str, Any]]] = {}
+
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._numbers
+
+    def get(self, doc_id: str) -> Optional[SearchDocument]:
+        number = self._numbers.get(doc_id)
+        return self._docs.get(number) if number is not None else None
+
+    # -------------------------------------------------------------------------
+    # WRITES
+    # -------------------------------------------------------------------------
+
+    def upsert(self, doc: SearchDocument) -> None:
+        """Index a document, replacing any previous version."""
+        number = self._numbers.get(doc.id)
+        if number is not None:
+            self._unindex(number)
+        else:
+            number = self._next_number
+            self._next_number += 1
+            self._numbers[doc.id] = number
+
+        self._index(number, doc, doc.weighted_terms())
+        self.stats.upserts += 1
+        self._dirty = True
+
+    def _owned(self, doc_id: str, identity_id: Optional[str]) -> Optional[SearchDocument]:
+        doc = self.get(doc_id)
+        if doc is None:
+            return None
+        if doc.identity_id != identity_id:
+            logger.warning(f"Search index: {identity_id} refused write to {doc_id}")
+            return None
+        return doc
+
+    def patch(self, doc_id: str, *, identity_id: Optional[str], **changes) -> bool:
+        """
+        Re-index an existing document with some fields changed.
+
+        Refused (False) unless the document belongs to identity_id.
+        """
+        doc = self._owned(doc_id, identity_id)
+        if doc is None:
+            return False
+        values = asdict(doc)
+        values.update({k: v for k, v in changes.items() if v is not None})
+        values["identity_id"] = doc.identity_id
+        self.upsert(SearchDocument(**values))
+        return True
+
+    def append(self, doc_id: str, text: str, *, identity_id: Optional[str]) -> bool:
+        """Append text to a document body (append-only resources such as threads)."""
+        doc = self._owned(doc_id, identity_id)
+        if doc is None:
+            return False
+        body = f"{doc.body}\n{text}" if doc.body else text
+        return self.patch(doc_id, identity_id=identity_id, body=body)
+
+    def remove(self, doc_id: str, *, identity_id: Optional[str]) -> bool:
+        """Drop a document. Refused (False) unless it belongs to identity_id."""
+        if self._owned(doc_id, identity_id) is None:
+            return False
+        number = self._numbers.pop(doc_id)
+        self._unindex(number)
+        self.stats.removals += 1
+        self._dirty = True
+        return True
+
+    def _index(self, number: int, doc: SearchDocument, terms: Dict[str, float]) -> None:
+        self._docs[number] = doc
+        self._doc_terms[number] = terms
+        length = sum(terms.values())
+        self._doc_len[number] = length
+        self._total_len += length
+
+        for term, tf in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._vocabulary, term)
+                for gram in trigrams(term):
+                    self._trigrams.setdefault(gram, set()).add(term)
+            postings[number] = tf
+
+        for name, value in self._facet_values(doc):
+            self._facets[name].setdefault(value, set()).add(number)
+
+        for key, text in self._suggestion_keys(number, doc):
+            for term in tokenize(text):
+                self._suggest.setdefault(term, set()).add(key)
+
+    def _unindex(self, number: int) -> None:
+        doc = self._docs.pop(number)
+        terms = self._doc_terms.pop(number)
+        self._total_len -= self._doc_len.pop(number)
+
+        for term in terms:
+            postings = self._postings[term]
+            del postings[number]
+            if not postings:
+                self._drop_term(term)
+
+        for name, value in self._facet_values(doc):
+            self._discard(self._facets[name], value, number)
+
+        for key, text in self._suggestion_keys(number, doc):
+            # Tags stay suggestible while another document carries them
+            if key[0] == "tag" and self._facets["tag"].get(key[1]):
+                continue
+            for term in tokenize(text):
+                self._discard(self._suggest, term, key)
+
+    def _drop_term(self, term: str) -> None:
+        del self._postings[term]
+        i = bisect.bisect_left(self._vocabulary, term)
+        if i < len(self._vocabulary) and self._vocabulary[i] == term:
+            del self._vocabulary[i]
+        for gram in trigrams(term):
+            self._discard(self._trigrams, gram, term)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set], key: Any, member: Any) -> None:
+        members = index.get(key)
+        if members is not None:
+            members.discard(member)
+            if not members:
+                del index[key]
+
+    @staticmethod
+    def _facet_values(doc: SearchDocument) -> Iterable[Tuple[str, Any]]:
+        yield "resource_type", doc.resource_type
+        if doc.sphere_id:
+            yield "sphere_id", doc.sphere_id
+        if doc.domain_id:
+            yield "domain_id", doc.domain_id
+        for tag in set(doc.tags):
+            yield "tag", tag
+
+    @staticmethod
+    def _suggestion_keys(number: int, doc: SearchDocument) -> Iterable[Tuple[Tuple[str, Any], str]]:
+        yield ("doc", number), doc.title
+        for tag in set(doc.tags):
+            yield ("tag", tag), tag
+
+    # -------------------------------------------------------------------------
+    # QUERIES
+    # -------------------------------------------------------------------------
+
+    def _visible(self, number: int, identity_id: Optional[str]) -> bool:
+        """An identity sees its own documents plus shared ones."""
+        owner = self._docs[number].identity_id
+        return owner is None or owner == identity_id
+
+    def _expand(self, token: str, fuzzy: bool = False) -> Dict[str, float]:
+        """
+        Index terms matching a query token, with a weight.
+
+        Exact term, else terms starting with it, else (fuzzy) terms sharing
+        enough trigrams.
+        """
+        if token in self._postings:
+            return {token: 1.0}
+
+        expansions: Dict[str, float] = {}
+        i = bisect.bisect_left(self._vocabulary, token)
+        while i < len(self._vocabulary) and len(expansions) < MAX_EXPANSIONS:
+            term = self._vocabulary[i]
+            if not term.startswith(token):
+                break
+            expansions[term] = PREFIX_WEIGHT
+            i += 1
+
+        if expansions or not fuzzy or len(token) < 3:
+            return expansions
+
+        grams = trigrams(token)
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for term in self._trigrams.get(gram, ()):
+                shared[term] = shared.get(term, 0) + 1
+        ranked = sorted(
+            (
+                (count / len(grams | trigrams(term)), term)
+                for term, count in shared.items()
+            ),
+            reverse=True,
+        )
+        return {
+            term: FUZZY_WEIGHT * similarity
+            for similarity, term in ranked[:MAX_EXPANSIONS]
+            if similarity >= MIN_TRIGRAM_SIMILARITY
+        }
+
+    def _query_tokens(self, query: str) -> List[str]:
+        # A query made only of stopwords still searches for them
+        return tokenize(query) or tokenize(query, keep_stopwords=True)
+
+    def search(
+        self,
+        query: str,
+        identity_id: Optional[str] = None,
+        resource_types: Optional[List[str]] = None,
+        sphere_ids: Optional[List[str]] = None,
+        domain_ids: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        limit: int = 20,
+        offset: int = 0,
+        fuzzy: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Ranked search. Every query word must match (whole, prefix or fuzzy).
+
+        Returns {"results", "total", "facets"}; facets count all matching
+        documents, not just the returned page.
+        """
+        started = time.perf_counter()
+        self.stats.queries += 1
+
+        scopes: List[Set[int]] = []
+        for name, values in (
+            ("resource_type", resource_types),
+            ("sphere_id", sphere_ids),
+            ("domain_id", domain_ids),
+            ("tag", tags),
+        ):
+            if values:
+                allowed: Set[int] = set()
+                for value in values:
+                    allowed |= self._facets[name].get(value, set())
+                scopes.append(allowed)
+
+        n_docs = len(self._docs)
+        avg_len = self._total_len / n_docs if n_docs else 0.0
+        scores: Dict[int, float] = {}
+        matched_terms: Set[str] = set()
+        matched: Optional[Set[int]] = None
+
+        for token in self._query_tokens(query):
+            token_scores: Dict[int, float] = {}
+            for term, weight in self._expand(token, fuzzy).items():
+                postings = self._postings[term]
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                if matched is not None and len(matched) < len(postings):
+                    candidates = ((n, postings[n]) for n in matched if n in postings)
+                else:
+                    candidates = postings.items()
+                for number, tf in candidates:
+                    if matched is not None and number not in matched:
+                        continue
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_len[number] / avg_len)
+                    score = weight * idf * tf * (BM25_K1 + 1) / (tf + norm)
+                    if score > token_scores.get(number, 0.0):
+                        token_scores[number] = score
+                matched_terms.add(term)
+
+            if matched is None:
+                matched = {
+                    n for n in token_scores
+                    if self._visible(n, identity_id) and all(n in scope for scope in scopes)
+                }
+            else:
+                matched.intersection_update(token_scores)
+            for number in matched:
+                scores[number] = scores.get(number, 0.0) + token_scores[number]
+            if not matched:
+                break
+
+        matched = matched or set()
+        ranked = sorted(matched, key=lambda n: (-scores.get(n, 0.0), n))
+        results = []
+        for number in ranked[offset:offset + limit]:
+            doc = self._docs[number]
+            result = doc.to_result()
+            result["score"] = round(scores.get(number, 0.0), 4)
+            result["highlights"] = self._highlights(doc, matched_terms)
+            results.append(result)
+
+        facets = {
+            name: {
+                value: count
+                for value, docs in self._facets[name].items()
+                if (count := len(docs & matched))
+            }
+            for name in FACET_FIELDS
+        }
+
+        self.stats.total_query_ms += (time.perf_counter() - started) * 1000
+        return {"results": results, "total": len(matched), "facets": facets}
+
+    @staticmethod
+    def _highlights(doc: SearchDocument, terms: Set[str]) -> List[str]:
+        """Original words of title/description that matched, in order."""
+        words = []
+        seen = set()
+        for text in (doc.title, doc.description or ""):
+            for word in re.findall(r"\w+", text):
+                folded = fold_text(word)
+                if folded in terms and folded not in seen:
+                    seen.add(folded)
+                    words.append(word)
+        return words
+
+    def suggest(
+        self,
+        query: str,
+        identity_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Autocomplete: document titles first, then tags.
+
+        The last word is a prefix; with no prefix match, close spellings
+        (trigrams) are tried.
+        """
+        self.stats.suggestions += 1
+        tokens = tokenize(query, keep_stopwords=True)
+        if not tokens:
+            return []
+
+        candidates: Optional[Set[Tuple[str, Any]]] = None
+        for i, token in enumerate(tokens):
+            last = i == len(tokens) - 1
+            expansions = self._expand(token, fuzzy=last)
+            keys: Set[Tuple[str, Any]] = set()
+            for term in expansions:
+                keys |= self._suggest.get(term, set())
+            if not keys and not last and token in STOPWORDS:
+                continue
+            candidates = keys if candidates is None else candidates & keys
+            if not candidates:
+                return []
+
+        titles = sorted(
+            key[1] for key in candidates
+            if key[0] == "doc" and self._visible(key[1], identity_id)
+        )
+        tag_names = sorted(
+            key[1] for key in candidates
+            if key[0] == "tag" and any(
+                self._visible(n, identity_id) for n in self._facets["tag"].get(key[1], ())
+            )
+        )
+
+        suggestions = []
+        seen = set()
+        for number in titles:
+            doc = self._docs[number]
+            if doc.title not in seen:
+                seen.add(doc.title)
+                suggestions.append({"text": doc.title, "type": doc.resource_type, "id": doc.id})
+        for tag in tag_names:
+            if tag not in seen:
+                seen.add(tag)
+                suggestions.append({"text": tag, "type": "tag", "id": None})
+        return suggestions[:limit]
+
+    # -------------------------------------------------------------------------
+    # PERSISTENCE
+    # -------------------------------------------------------------------------
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {
+            "version": SNAPSHOT_VERSION,
+            "documents": [
+                {"doc": asdict(self._docs[number]), "terms": self._doc_terms[number]}
+                for number in sorted(self._docs)
+            ],
+        }
+
+    @staticmethod
+    def _write(path: str, snapshot: Dict[str, Any]) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def save(self, path: Optional[str] = None) -> bool:
+        """Write a snapshot (atomic replace). False when no path is configured."""
+        path = path or self.path
+        if not path:
+            return False
+        self._write(path, self._snapshot())
+        self._dirty = False
+        self.stats.saves += 1
+        return True
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """
+        Warm start from a snapshot: stored term weights are reused, nothing
+        is re-tokenized. Returns False if there is no usable snapshot.
+        """
+        path = path or self.path
+        if not path or not os.path.exists(path):
+            return False
+        try:
+            with open(path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Search index snapshot unreadable ({path}): {e}")
+            return False
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.info(f"Search index snapshot version mismatch ({path}), ignoring")
+            return False
+
+        self._reset()
+        for entry in snapshot["documents"]:
+            doc = SearchDocument(**entry["doc"])
+            number = self._next_number
+            self._next_number += 1
+            self._numbers[doc.id] = number
+            self._index(number, doc, entry["terms"])
+
+        logger.info(f"Search index loaded: {len(self)} documents from {path}")
+        return True
+
+    async def save_if_dirty(self) -> bool:
+        """Snapshot in the loop, write in a thread (one write at a time)."""
+        async with self._save_lock:
+            if not self._dirty or not self.path:
+                return False
+            snapshot = self._snapshot()
+            self._dirty = False
+            try:
+                await asyncio.to_thread(self._write, self.path, snapshot)
+            except OSError as e:
+                self._dirty = True
+                logger.error(f"Search index save failed: {e}")
+                return False
+            self.stats.saves += 1
+            return True
+
+    def start_autosave(self, interval_s: float = 30.0) -> None:
+        """Persist changes periodically (idempotent; needs a running loop)."""
+        if self._autosave_task is not None or not self.path:
+            return
+        self._autosave_task = asyncio.get_running_loop().create_task(self._autosave_loop(interval_s))
+
+    async def stop_autosave(self) -> None:
+        if self._autosave_task:
+            self._autosave_task.cancel()
+            try:
+                await self._autosave_task
+            except asyncio.CancelledError:
+                pass
+            self._autosave_task = None
+        await self.save_if_dirty()
+
+    async def _autosave_loop(self, interval_s: float) -> None:
+        while True:
+            await asyncio.sleep(interval_s)
+            # A write in progress completes even if autosave is stopped
+            await asyncio.shield(self.save_if_dirty())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "documents": len(self._docs),
+            "terms": len(self._postings),
+            "queries": self.stats.queries,
+            "suggestions": self.stats.suggestions,
+            "upserts": self.stats.upserts,
+            "removals": self.stats.removals,
+            "saves": self.stats.saves,
+            "avg_query_ms": round(self.stats.avg_query_ms, 3),
+            "dirty": self._dirty,
+        }
+
+
+# =============================================================================
+# GLOBAL INSTANCE
+# =============================================================================
+
+_search_index: Optional[SearchIndex] = None
+_snapshot_locks: List[Any] = []  # Held open for the life of the process
+
+
+def claim_snapshot_path(path: str, max_slots: int = 64) -> Optional[str]:
+    """
+    Snapshot file owned by this process.
+
+    Each worker locks the first free slot (search_index.0.json,
+    search_index.1.json, ...), so workers never overwrite each other's
+    snapshot and a restarted worker warm-starts from a slot left behind.
+    """
+    root, ext = os.path.splitext(path)
+    if fcntl is None:
+        return f"{root}.{os.getpid()}{ext}"
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    for slot in range(max_slots):
+        candidate = f"{root}.{slot}{ext}"
+        lock = open(f"{candidate}.lock", "a")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            continue
+        _snapshot_locks.append(lock)
+        return candidate
+
+    logger.warning(f"No free search index snapshot slot for {path}; persistence disabled")
+    return None
+
+
+def get_search_index() -> SearchIndex:
+    """
+    Process-wide index, persisted to this worker's snapshot slot of
+    SEARCH_INDEX_PATH ("" disables persistence). The app lifespan loads the
+    snapshot and runs autosave.
+    """
+    global _search_index
+    if _search_index is None:
+        path = os.getenv("SEARCH_INDEX_PATH", "data/search_index.json")
+        _search_index = SearchIndex(path=claim_snapshot_path(path) if path else None)
+    return _search_index
+
+
+__all__ = [
+    "SearchDocument",
+    "SearchIndex",
+    "SearchStats",
+    "fold_text",
+    "tokenize",
+    "claim_snapshot_path",
+    "get_search_index",
+]
@@ -0,0 +1,440 @@
+"""
+SEMANTIC CACHE
+==============
+
+Embedding-keyed response cache for the LLM Router.
+
+Exact prompt hashes almost never match for conversational traffic: the same
+question arrives rephrased, re-cased or with different punctuation. This
+cache embeds each normalized prompt into a sparse vector and serves a stored
+response when a new prompt is close enough (cosine similarity) to one seen
+before, within the same identity and task scope.
+
+Features:
+- Local embeddings only (hashing trick by default, pluggable embedder)
+- Inverted feature index, so lookups only score prompts sharing features
+- Per-scope similarity thresholds and TTL
+- Term guard: prompts differing in a negation, a number or a content word
+  (other than a spelling variant) never match, however close the vectors
+- Bounded memory with LRU eviction per scope
+
+R&D COMPLIANCE:
+- Rule #3: Entries are scoped by identity and never shared across identities
+- Rule #6: Hits are reported back to the caller for traceability
+
+VERSION: 1.1.0
+"""
+
+from typing import Dict, Any, Optional, List, Tuple, Protocol
+from dataclasses import dataclass, field
+from collections import OrderedDict
+import hashlib
+import logging
+import math
+import re
+import time
+import unicodedata
+import zlib
+
+logger = logging.getLogger(__name__)
+
+
+# Sparse embedding: feature index -> weight (L2-normalized)
+SparseVector = Dict[int, float]
+
+
+# =============================================================================
+# EMBEDDERS
+# =============================================================================
+
+class Embedder(Protocol):
+    """Anything that maps text to a normalized sparse vector."""
+
+    def embed(self, text: str) -> SparseVector:
+        ...
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_TERM_RE = re.compile(r"[a-z0-9']+")
+
+# Function words that may differ between two phrasings of one question
+STOPWORDS = frozenset("""
+a an the is are was were be been being am of to in on at for with by from
+and or but it its this that these those there what whats which who whom
+how why when where do does did can could would should will shall may
+might please me my i you your we our they their he she his her us them
+le la les l un une des du de d et ou est sont ce cet cette ces qui que
+quoi quel quelle quels quelles comment pourquoi quand je tu il elle nous
+vous ils elles mon ma mes ton ta tes son sa ses au aux en y s c
+""".split())
+
+# Words that flip or change the answer; they must match exactly
+NEGATIONS = frozenset("""
+not no never none nor neither without cannot cant dont doesnt didnt isnt
+arent wasnt werent wont wouldnt shouldnt couldnt hasnt havent hadnt
+ne pas jamais aucun aucune sans non rien ni
+""".split())
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, strip accents and collapse whitespace."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.lower().split())
+
+
+class HashingEmbedder:
+    """
+    Feature-hashing embedder (no model, no network).
+
+    Features are word unigrams, word bigrams and character trigrams, hashed
+    with a stable CRC32 into `dimensions` buckets with a sign bit to reduce
+    collision bias. The result is L2-normalized so a dot product is the
+    cosine similarity.
+    """
+
+    def __init__(
+        self,
+        dimensions: int = 1 << 18,
+        word_weight: float = 1.0,
+        bigram_weight: float = 0.7,
+        char_weight: float = 0.3
+    ):
+        self.dimensions = dimensions
+        self.word_weight = word_weight
+        self.bigram_weight = bigram_weight
+        self.char_weight = char_weight
+
+    def _add(self, vector: SparseVector, feature: str, weight: float) -> None:
+        h = zlib.crc32(feature.encode("utf-8"))
+        index = h % self.dimensions
+        sign = 1.0 if (h >> 31) & 1 else -1.0
+        vector[index] = vector.get(index, 0.0) + sign * weight
+
+    def embed(self, text: str) -> SparseVector:
+        tokens = _TOKEN_RE.findall(normalize_text(text))
+        vector: SparseVector = {}
+
+        for token in tokens:
+            self._add(vector, "w:" + token, self.word_weight)
+            padded = f" {token} "
+            for i in range(len(padded) - 2):
+                self._add(vector, "c:" + padded[i:i + 3], self.char_weight)
+
+        for first, second in zip(tokens, tokens[1:]):
+            self._add(vector, f"b:{first} {second}", self.bigram_weight)
+
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        if norm == 0:
+            return {}
+        return {i: w / norm for i, w in vector.items() if w != 0.0}
+
+
+def content_terms(text: str) -> frozenset:
+    """Non-stopword terms of a normalized prompt (apostrophes folded)."""
+    terms = (t.replace("'", "") for t in _TERM_RE.findall(text))
+    return frozenset(t for t in terms if t and t not in STOPWORDS)
+
+
+def _trigrams(term: str) -> set:
+    padded = f" {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _spelling_variant(term: str, others: frozenset) -> bool:
+    """True if `others` holds a near spelling of `term` (summarize/summarise)."""
+    grams = _trigrams(term)
+    for other in others:
+        if term[:3] != other[:3]:
+            continue
+        other_grams = _trigrams(other)
+        if len(grams & other_grams) / len(grams | other_grams) >= 0.5:
+            return True
+    return False
+
+
+def terms_compatible(a: frozenset, b: frozenset) -> bool:
+    """
+    Whether two prompts may share an answer despite differing terms.
+
+    Negations and numbers must match exactly, and every other term present
+    in only one prompt needs a spelling variant in the other.
+    """
+    only_a, only_b = a - b, b - a
+    for term in only_a | only_b:
+        if term in NEGATIONS or any(ch.isdigit() for ch in term):
+            return False
+    return (
+        all(_spelling_variant(t, only_b) for t in only_a)
+        and all(_spelling_variant(t, only_a) for t in only_b)
+    )
+
+
+def cosine(a: SparseVector, b: SparseVector) -> float:
+    """Dot product of two normalized sparse vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b[i] for i, w in a.items() if i in b)
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+@dataclass
+class SemanticCacheEntry:
+    """A cached response and the prompt embedding it answers."""
+    entry_id: int
+    scope: Tuple[str, str]
+    prompt_hash: str
+    vector: SparseVector
+    terms: frozenset
+    value: Any
+    expires_at: float  # time.monotonic()
+    hits: int = 0
+
+
+@dataclass
+class SemanticCacheStats:
+    """Semantic cache counters."""
+    lookups: int = 0
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        hits = self.exact_hits + self.semantic_hits
+        return (hits / self.lookups * 100) if self.lookups else 0.0
+
+
+@dataclass
+class _Scope:
+    """Entries of one (identity, task) scope with their inverted index."""
+    entries: "OrderedDict[int, SemanticCacheEntry]" = field(default_factory=OrderedDict)
+    by_hash: Dict[str, int] = field(default_factory=dict)
+    postings: Dict[int, set] = field(default_factory=dict)
+
+
+class SemanticCache:
+    """
+    Similarity-keyed cache of responses.
+
+    Lookups first try an exact match on the normalized prompt hash, then
+    score the entries sharing the prompt's strongest features and return
+    the best one above the scope threshold whose terms are compatible
+    (see terms_compatible).
+    """
+
+    # Only the heaviest features of a prompt are posted/probed; this keeps
+    # posting lists short without hurting recall for near-duplicates.
+    PROBE_FEATURES = 32
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        default_threshold: float = 0.92,
+        ttl_seconds: int = 3600,
+        max_entries_per_scope: int = 1000
+    ):
+        self.embedder = embedder or HashingEmbedder()
+        self.default_threshold = default_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_scope = max_entries_per_scope
+        self._scopes: Dict[Tuple[str, str], _Scope] = {}
+        self._next_id = 0
+        self.stats = SemanticCacheStats()
+
+    @staticmethod
+    def _hash(normalized: str) -> str:
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _probe_features(self, vector: SparseVector) -> List[int]:
+        if len(vector) <= self.PROBE_FEATURES:
+            return list(vector)
+        return sorted(vector, key=lambda i: abs(vector[i]), reverse=True)[:self.PROBE_FEATURES]
+
+    def lookup(
+        self,
+        prompt: str,
+        identity_id: str,
+        task: str,
+        threshold: Optional[float] = None
+    ) -> Optional[Tuple[Any, float]]:
+        """
+        Find a cached response for a similar prompt.
+
+        Returns:
+            Tuple of (value, similarity) or None
+        """
+        self.stats.lookups += 1
+        scope = self._scopes.get((identity_id, task))
+        if scope is None:
+            self.stats.misses += 1
+            return None
+
+        now = time.monotonic()
+        normalized = normalize_text(prompt)
+
+        entry_id = scope.by_hash.get(self._hash(normalized))
+        if entry_id is not None:
+            entry = scope.entries[entry_id]
+            if entry.expires_at > now:
+                return self._hit(scope, entry, 1.0, exact=True)
+            self._remove(scope, entry)
+            self.stats.expirations += 1
+
+        vector = self.embedder.embed(normalized)
+        if not vector:
+            self.stats.misses += 1
+            return None
+
+        candidates: set = set()
+        for feature in self._probe_features(vector):
+            posting = scope.postings.get(feature)
+            if posting:
+                candidates.update(posting)
+
+        terms = content_terms(normalized)
+        threshold = self.default_threshold if threshold is None else threshold
+        best: Optional[SemanticCacheEntry] = None
+        best_score = threshold
+        expired: List[SemanticCacheEntry] = []
+
+        for candidate_id in candidates:
+            entry = scope.entries[candidate_id]
+            if entry.expires_at <= now:
+                expired.append(entry)
+                continue
+            score = cosine(vector, entry.vector)
+            if score >= best_score and terms_compatible(terms, entry.terms):
+                best, best_score = entry, score
+
+        for entry in expired:
+            self._remove(scope, entry)
+            self.stats.expirations += 1
+        if not scope.entries:
+            del self._scopes[(identity_id, task)]
+
+        if best is None:
+            self.stats.misses += 1
+            return None
+        return self._hit(scope, best, best_score, exact=False)
+
+    def _hit(
+        self,
+        scope: _Scope,
+        entry: SemanticCacheEntry,
+        similarity: float,
+        exact: bool
+    ) -> Tuple[Any, float]:
+        entry.hits += 1
+        scope.entries.move_to_end(entry.entry_id)
+        if exact:
+            self.stats.exact_hits += 1
+        else:
+            self.stats.semantic_hits += 1
+        return entry.value, similarity
+
+    def store(
+        self,
+        prompt: str,
+        value: Any,
+        identity_id: str,
+        task: str,
+        ttl_seconds: Optional[int] = None
+    ) -> None:
+        """Cache a response for a prompt within an (identity, task) scope."""
+        normalized = normalize_text(prompt)
+        vector = self.embedder.embed(normalized)
+        if not vector:
+            return
+
+        key = (identity_id, task)
+        scope = self._scopes.get(key)
+        if scope is None:
+            scope = self._scopes[key] = _Scope()
+
+        prompt_hash = self._hash(normalized)
+        previous = scope.by_hash.get(prompt_hash)
+        if previous is not None:
+            self._remove(scope, scope.entries[previous])
+
+        self._next_id += 1
+        entry = SemanticCacheEntry(
+            entry_id=self._next_id,
+            scope=key,
+            prompt_hash=prompt_hash,
+            vector=vector,
+            terms=content_terms(normalized),
+            value=value,
+            expires_at=time.monotonic() + (ttl_seconds or self.ttl_seconds)
+        )
+
+        scope.entries[entry.entry_id] = entry
+        scope.by_hash[prompt_hash] = entry.entry_id
+        for feature in self._probe_features(vector):
+            scope.postings.setdefault(feature, set()).add(entry.entry_id)
+        self.stats.stores += 1
+
+        while len(scope.entries) > self.max_entries_per_scope:
+            oldest = next(iter(scope.entries.values()))
+            self._remove(scope, oldest)
+            self.stats.evictions += 1
+
+    def _remove(self, scope: _Scope, entry: SemanticCacheEntry) -> None:
+        scope.entries.pop(entry.entry_id, None)
+        if scope.by_hash.get(entry.prompt_hash) == entry.entry_id:
+            del scope.by_hash[entry.prompt_hash]
+        for feature in self._probe_features(entry.vector):
+            posting = scope.postings.get(feature)
+            if posting is not None:
+                posting.discard(entry.entry_id)
+                if not posting:
+                    del scope.postings[feature]
+
+    def invalidate(self, identity_id: Optional[str] = None) -> int:
+        """Drop all entries, or only those of one identity."""
+        if identity_id is None:
+            count = sum(len(s.entries) for s in self._scopes.values())
+            self._scopes.clear()
+            return count
+
+        count = 0
+        for key in [k for k in self._scopes if k[0] == identity_id]:
+            count += len(self._scopes.pop(key).entries)
+        return count
+
+    def __len__(self) -> int:
+        return sum(len(s.entries) for s in self._scopes.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "entries": len(self),
+            "scopes": len(self._scopes),
+            "lookups": self.stats.lookups,
+            "exact_hits": self.stats.exact_hits,
+            "semantic_hits": self.stats.semantic_hits,
+            "misses": self.stats.misses,
+            "stores": self.stats.stores,
+            "evictions": self.stats.evictions,
+            "expirations": self.stats.expirations,
+            "hit_rate": self.stats.hit_rate,
+        }
+
+
+__all__ = [
+    "Embedder",
+    "HashingEmbedder",
+    "SemanticCache",
+    "SemanticCacheEntry",
+    "SemanticCacheStats",
+    "normalize_text",
+    "content_terms",
+    "terms_compatible",
+    "cosine",
+]
@@ -25,6 +25,7 @@ import logging
 from sqlalchemy import select, update, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from backend.core.exceptions import (
     NotFoundError,
@@ -117,31 +118,28 @@ class ThreadService:
         self.db.add(thread)
         await self.db.flush()
         
-        # Create the founding event (thread.created)
-        event = await self._append_event(
-            thread_id=thread_id,
-            event_type=ThreadEventType.THREAD_CREATED,
-            payload={
-                "founding_intent": request.founding_intent,
-                "title": request.title,
-                "type": request.thread_type.value,
-                "visibility": request.visibility.value,
-                "tags": request.tags,
-                "parent_thread_id": request.parent_thread_id,
+        # Create the founding events (thread.created, then intent.declared)
+        await self._append_events(thread_id, [
+            {
+                "event_type": ThreadEventType.THREAD_CREATED,
+                "payload": {
+                    "founding_intent": request.founding_intent,
+                    "title": request.title,
+                    "type": request.thread_type.value,
+                    "visibility": request.visibility.value,
+                    "tags": request.tags,
+                    "parent_thread_id": request.parent_thread_id,
+                },
+                "summary": f"Thread created: {request.title or request.founding_intent[:50]}",
             },
-            summary=f"Thread created: {request.title or request.founding_intent[:50]}",
-        )
-        
-        # Also create the intent.declared event
-        await self._append_event(
-            thread_id=thread_id,
-            event_type=ThreadEventType.INTENT_DECLARED,
-            payload={
-                "intent": request.founding_intent,
+            {
+                "event_type": ThreadEventType.INTENT_DECLARED,
+                "payload": {
+                    "intent": request.founding_intent,
+                },
+                "summary": "Founding intent declared",
             },
-            summary="Founding intent declared",
-            parent_event_id=event.id,
-        )
+        ])
         
         # Update sphere thread count
         await self._increment_sphere_thread_count(request.sphere_id)
@@ -400,6 +398,43 @@ class ThreadService:
         
         return EventResponse.model_validate(event)
     
+    async def append_events(
+        self,
+        thread_id: str,
+        requests: List[EventCreate],
+    ) -> List[EventResponse]:
+        """
+        Append several events to a thread in one go.
+        
+        Sequence numbers are reserved with a single counter update and
+        each event's parent is the one before it. Same checkpoint rules
+        as append_event: one sensitive event rejects the whole batch.
+        """
+        await self._get_thread_with_check(thread_id)
+        
+        for request in requests:
+            if self._requires_checkpoint(request.event_type):
+                raise CheckpointRequiredError(
+                    checkpoint_id=str(uuid4()),
+                    checkpoint_type="governance",
+                    reason=f"Event type {request.event_type.value} requires approval",
+                    thread_id=thread_id,
+                )
+        
+        events = await self._append_events(thread_id, [
+            {
+                "event_type": ThreadEventType(request.event_type.value),
+                "payload": request.payload,
+                "summary": request.summary,
+                "source": request.source,
+            }
+            for request in requests
+        ])
+        
+        await self.db.commit()
+        
+        return [EventResponse.model_validate(e) for e in events]
+    
     async def get_events(
         self,
         thread_id: str,
@@ -801,7 +836,10 @@ class ThreadService:
         thread = result.scalar_one_or_none()
         
         if not thread:
-            raise ThreadNotFoundError(thread_id=thread_id)
+            raise ThreadNotFoundError(
+                message=f"Thread not found: {thread_id}",
+                details={"thread_id": thread_id},
+            )
         
         if thread.identity_id != self.identity_id:
             raise IdentityBoundaryError(
@@ -866,55 +904,104 @@ class ThreadService:
         
         This is THE critical operation - events are NEVER modified.
         """
-        # Get next sequence number
-        result = await self.db.execute(
-            select(func.coalesce(func.max(ThreadEvent.sequence_number), 0))
-            .where(ThreadEvent.thread_id == thread_id)
-        )
-        current_max = result.scalar() or 0
-        next_sequence = current_max + 1
-        
-        # If no parent specified, use the previous event
-        if parent_event_id is None and current_max > 0:
-            prev_result = await self.db.execute(
-                select(ThreadEvent.id)
-                .where(
-                    and_(
-                        ThreadEvent.thread_id == thread_id,
-                        ThreadEvent.sequence_number == current_max,
-                    )
-                )
-            )
-            parent_event_id = prev_result.scalar()
-        
-        # Create event
-        event = ThreadEvent(
-            id=str(uuid4()),
-            thread_id=thread_id,
-            sequence_number=next_sequence,
-            parent_event_id=parent_event_id,
-            event_type=event_type,
-            payload=payload,
-            summary=summary,
-            source=source,
-            agent_id=agent_id,
-            created_by=self.user_id,
-        )
+        events = await self._append_events(thread_id, [{
+            "event_type": event_type,
+            "payload": payload,
+            "summary": summary,
+            "source": source,
+            "parent_event_id": parent_event_id,
+            "agent_id": agent_id,
+        }])
+        return events[0]
+    
+    async def _append_events(
+        self,
+        thread_id: str,
+        specs: List[dict],
+    ) -> List[ThreadEvent]:
+        """
+        CORE: Append immutable events to a thread.
+        
+        Each spec holds the _append_event arguments. One UPDATE ... RETURNING
+        on the locked thread row reserves the sequence range, bumps the
+        counters and swaps in the new head event, handing back the previous
+        head as parent - so concurrent appends serialize on the row instead
+        of racing on max(sequence_number). The events are inserted together
+        at the next flush.
+        """
+        if not specs:
+            return []
         
-        self.db.add(event)
+        count = len(specs)
+        event_ids = [str(uuid4()) for _ in specs]
+        now = datetime.utcnow()
         
-        # Update thread counters
-        await self.db.execute(
-            update(Thread)
+        # Lock the row before reading the head, so the head returned is
+        # the one this update replaces
+        head = (
+            select(Thread.id, Thread.last_event_id)
             .where(Thread.id == thread_id)
+            .with_for_update()
+            .cte("head")
+        )
+        result = await self.db.execute(
+            update(Thread)
+            .where(Thread.id == head.c.id)
             .values(
-                event_count=Thread.event_count + 1,
-                last_event_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                last_sequence_number=Thread.last_sequence_number + count,
+                last_event_id=event_ids[-1],
+                event_count=Thread.event_count + count,
+                last_event_at=now,
+                updated_at=now,
+            )
+            .returning(
+                Thread.last_sequence_number,
+                Thread.event_count,
+                head.c.last_event_id,
             )
+            .execution_options(synchronize_session=False)
         )
+        row = result.one_or_none()
+        
+        if row is None:
+            raise ThreadNotFoundError(
+                message=f"Thread not found: {thread_id}",
+                details={"thread_id": thread_id},
+            )
+        
+        last_sequence, event_count, previous_event_id = row
+        
+        # Keep a loaded Thread in step without marking it dirty
+        thread = self.db.identity_map.get(self.db.identity_key(Thread, thread_id))
+        if thread is not None:
+            set_committed_value(thread, "last_sequence_number", last_sequence)
+            set_committed_value(thread, "last_event_id", event_ids[-1])
+            set_committed_value(thread, "event_count", event_count)
+            set_committed_value(thread, "last_event_at", now)
+            set_committed_value(thread, "updated_at", now)
+        
+        # Create events, each chained to the previous one unless a parent is given
+        events = []
+        first_sequence = last_sequence - count + 1
+        for offset, (event_id, spec) in enumerate(zip(event_ids, specs)):
+            event = ThreadEvent(
+                id=event_id,
+                thread_id=thread_id,
+                sequence_number=first_sequence + offset,
+                parent_event_id=spec.get("parent_event_id") or previous_event_id,
+                event_type=spec["event_type"],
+                payload=spec["payload"],
+                summary=spec.get("summary"),
+                source=spec.get("source", "user"),
+                agent_id=spec.get("agent_id"),
+                created_by=self.user_id,
+            )
+            events.append(event)
+            previous_event_id = event_id
+        
+        self.db.add_all(events)
         
-        return event
+        return events
     
     def _requires_checkpoint(self, event_type: ThreadEventType) -> bool:
         """Check if event type requires governance checkpoint."""
@@ -17,14 +17,19 @@ import json
 import logging
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
 from uuid import uuid4
 
 from fastapi import WebSocket, WebSocketDisconnect
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+
+from backend.services.llm_router import LLMRequest, get_llm_router
 
 logger = logging.getLogger(__name__)
 
+# Max queued stream messages per connection before the producer waits
+STREAM_BUFFER_SIZE = 64
+
 
 # ============================================================================
 # EVENT TYPES
@@ -61,6 +66,8 @@ class EventType(str, Enum):
     NOVA_RESPONSE = "nova.response"
     NOVA_THINKING = "nova.thinking"
     NOVA_COMPLETE = "nova.complete"
+    NOVA_PROMPT = "nova.prompt"
+    NOVA_ERROR = "nova.error"
     
     # Notifications
     NOTIFICATION = "notification"
@@ -106,6 +113,119 @@ class Connection(BaseModel):
         arbitrary_types_allowed = True
 
 
+# ============================================================================
+# STREAM CHANNEL
+# ============================================================================
+
+class StreamClosedError(Exception):
+    """All connections of a stream's user went away."""
+    pass
+
+
+class StreamChannel:
+    """
+    Token stream to every connection of one user.
+    
+    Each connection gets its own bounded buffer and writer task, so one slow
+    socket never blocks the others' sends, and send() waits only while a
+    buffer is full. That wait is the backpressure: the LLM stream is not read
+    further until the client catches up. When the last connection drops,
+    send() raises StreamClosedError so the producer can stop generating.
+    """
+    
+    def __init__(
+        self,
+        manager: "ConnectionManager",
+        user_id: str,
+        conversation_id: str,
+        buffer_size: int = STREAM_BUFFER_SIZE,
+    ):
+        self.manager = manager
+        self.user_id = user_id
+        self.conversation_id = conversation_id
+        self._buffers: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        
+        for websocket in list(manager._connections.get(user_id, [])):
+            buffer: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+            self._buffers[websocket] = buffer
+            self._writers[websocket] = asyncio.create_task(
+                self._write(websocket, buffer)
+            )
+    
+    @property
+    def closed(self) -> bool:
+        """True once no connection is left to receive the stream."""
+        return not any(
+            self._is_live(ws) for ws in self._writers
+        )
+    
+    def _is_live(self, websocket: WebSocket) -> bool:
+        return (
+            not self._writers[websocket].done()
+            and websocket in self.manager._connections.get(self.user_id, ())
+        )
+    
+    async def _write(self, websocket: WebSocket, buffer: asyncio.Queue):
+        while True:
+            message = await buffer.get()
+            if message is None:
+                return
+            try:
+                await websocket.send_text(message)
+            except Exception as e:
+                logger.warning(f"Stream to {self.user_id} failed: {e}")
+                await self.manager.disconnect(websocket, self.user_id)
+                return
+    
+    async def send(self, chunk: Any):
+        """
+        Queue an LLM stream chunk for all live connections.
+        
+        Raises:
+            StreamClosedError: If the user has no live connection left
+        """
+        live = [ws for ws in self._writers if self._is_live(ws)]
+        if not live:
+            raise StreamClosedError(f"No live connection for {self.user_id}")
+        
+        is_complete = getattr(chunk, "finish_reason", None) is not None
+        message = WSMessage(
+            event=EventType.NOVA_COMPLETE if is_complete else EventType.NOVA_RESPONSE,
+            data={
+                "conversation_id": self.conversation_id,
+                "chunk": getattr(chunk, "delta", chunk),
+                "index": getattr(chunk, "index", None),
+                "output_tokens": getattr(chunk, "output_tokens", None),
+                "finish_reason": getattr(chunk, "finish_reason", None),
+                "complete": is_complete,
+            }
+        ).to_json()
+        
+        for websocket in live:
+            put = asyncio.ensure_future(self._buffers[websocket].put(message))
+            # Stop waiting on a buffer whose writer died meanwhile
+            await asyncio.wait(
+                {put, self._writers[websocket]},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not put.done():
+                put.cancel()
+    
+    async def close(self):
+        """Flush remaining messages and stop the writers."""
+        for websocket, writer in self._writers.items():
+            if not writer.done():
+                await self._buffers[websocket].put(None)
+        if self._writers:
+            await asyncio.gather(*self._writers.values(), return_exceptions=True)
+    
+    def abort(self):
+        """Drop queued messages and stop the writers immediately."""
+        for writer in self._writers.values():
+            writer.cancel()
+
+
 # ============================================================================
 # CONNECTION MANAGER
 # ============================================================================
@@ -130,6 +250,8 @@ class ConnectionManager:
         self._rooms: Dict[str, Set[str]] = {}
         # Event handlers
         self._handlers: Dict[EventType, List[Callable]] = {}
+        # Running LLM streams (kept referenced until done)
+        self._streams: Set[asyncio.Task] = set()
         # Lock for thread safety
         self._lock = asyncio.Lock()
     
@@ -382,6 +504,84 @@ class ConnectionManager:
             }
         ))
     
+    def open_stream(
+        self,
+        user_id: str,
+        conversation_id: str,
+        buffer_size: int = STREAM_BUFFER_SIZE,
+    ) -> StreamChannel:
+        """Open a buffered token stream to all connections of a user."""
+        return StreamChannel(self, user_id, conversation_id, buffer_size)
+    
+    async def stream_llm_completion(
+        self,
+        user_id: str,
+        conversation_id: str,
+        chunks: AsyncIterator[Any],
+        buffer_size: int = STREAM_BUFFER_SIZE,
+    ) -> Optional[Any]:
+        """
+        Forward an LLMRouter.stream() to the user token by token.
+        
+        The router stream is closed as soon as the user disconnects, so
+        generation (and billing) stops with it.
+        
+        Returns:
+            The final chunk, or None if the stream was cut short
+        """
+        channel = self.open_stream(user_id, conversation_id, buffer_size)
+        final = None
+        try:
+            async for chunk in chunks:
+                await channel.send(chunk)
+                if getattr(chunk, "finish_reason", None) is not None:
+                    final = chunk
+        except StreamClosedError:
+            logger.info(f"Stream {conversation_id} cancelled: {user_id} disconnected")
+            channel.abort()
+            return None
+        except BaseException:
+            channel.abort()
+            raise
+        finally:
+            await chunks.aclose()
+        
+        await channel.close()
+        return final
+    
+    def start_llm_stream(
+        self,
+        user_id: str,
+        conversation_id: str,
+        request: LLMRequest,
+        llm_router: Any = None,
+    ) -> asyncio.Task:
+        """
+        Stream a completion to the user in the background.
+        
+        The receive loop keeps running meanwhile, so pings and further
+        messages are still handled. Router errors reach the user as a
+        nova.error event.
+        """
+        llm_router = llm_router or get_llm_router()
+        
+        async def run():
+            try:
+                return await self.stream_llm_completion(
+                    user_id, conversation_id, llm_router.stream(request)
+                )
+            except Exception as e:
+                logger.error(f"Stream {conversation_id} failed for {user_id}: {e}")
+                await self.send_to_user(user_id, WSMessage(
+                    event=EventType.NOVA_ERROR,
+                    data={"conversation_id": conversation_id, "error": str(e)},
+                ))
+        
+        task = asyncio.create_task(run())
+        self._streams.add(task)
+        task.add_done_callback(self._streams.discard)
+        return task
+    
     async def notify_nova_thinking(self, user_id: str, conversation_id: str):
         """Notify that Nova is processing."""
         await self.send_to_user(user_id, WSMessage(
@@ -430,10 +630,29 @@ ws_manager = ConnectionManager()
 # WEBSOCKET HANDLER
 # ============================================================================
 
+def _prompt_request(user_id: str, conversation_id: str, payload: Dict[str, Any]) -> LLMRequest:
+    """Build a streaming LLMRequest from a nova.prompt payload."""
+    fields = {
+        key: payload[key]
+        for key in ("messages", "system_prompt", "task_type", "max_tokens", "temperature", "sphere_id")
+        if key in payload
+    }
+    if "messages" not in fields and "prompt" in payload:
+        fields["messages"] = [{"role": "user", "content": payload["prompt"]}]
+    
+    return LLMRequest(
+        **fields,
+        identity_id=user_id,
+        thread_id=conversation_id,
+        stream=True,
+    )
+
+
 async def websocket_handler(
     websocket: WebSocket,
     user_id: str,
     manager: ConnectionManager = ws_manager,
+    llm_router: Any = None,
 ):
     """
     Main WebSocket handler.
@@ -442,6 +661,8 @@ async def websocket_handler(
     - Connect with user_id
     - Send/receive JSON messages
     - Handle events based on type
+    - nova.prompt streams an LLM completion back as nova.response chunks
+      and a final nova.complete; it stops when the user disconnects
     """
     connection_id = await manager.connect(websocket, user_id)
     
@@ -477,6 +698,19 @@ async def websocket_handler(
                         data={"status": "synced", "timestamp": datetime.utcnow().isoformat()}
                     ))
                 
+                # Handle LLM prompt
+                elif event == EventType.NOVA_PROMPT.value:
+                    conversation_id = payload.get("conversation_id") or str(uuid4())
+                    try:
+                        request = _prompt_request(user_id, conversation_id, payload)
+                    except ValidationError as e:
+                        await manager.send_to_user(user_id, WSMessage(
+                            event=EventType.NOVA_ERROR,
+                            data={"conversation_id": conversation_id, "error": str(e)},
+                        ))
+                    else:
+                        manager.start_llm_stream(user_id, conversation_id, request, llm_router)
+                
             except json.JSONDecodeError:
                 logger.warning(f"Invalid JSON from {user_id}: {data[:100]}")
                 
@@ -19,6 +19,19 @@ from unittest.mock import MagicMock, AsyncMock, patch
 from contextlib import asynccontextmanager
 import json
 import os
+import sys
+from pathlib import Path
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CHEMINS D'IMPORT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Les tests importent depuis la racine backend/ (app, services, tests, ...);
+# certains modules importent leurs voisins via backend.*, d'où le parent aussi.
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+for _path in (str(BACKEND_DIR.parent), str(BACKEND_DIR)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURATION ASYNC
@@ -0,0 +1,200 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+AT·OM GRAPH INDEX — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for the in-memory CSR snapshot of the causal graph:
+- Level traversal (strongest link, filters, fan-out)
+- Bidirectional shortest path
+- Incremental link/node events and compaction
+- Freshness / DB fallback signals
+"""
+
+import pytest
+from uuid import uuid4
+
+from app.services.atom_graph_index import AtomGraphIndex, IndexedNode
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def ids():
+    """Nodes A..F."""
+    return {name: uuid4() for name in "ABCDEF"}
+
+
+def build_index(ids, links, signatures=(), **kwargs) -> AtomGraphIndex:
+    index = AtomGraphIndex(**kwargs)
+    index._build(
+        [IndexedNode(node_id, name, "PHYSICAL", "Industrial") for name, node_id in ids.items()],
+        [(ids[a], ids[b], link_type, strength, 0.5) for a, b, link_type, strength in links],
+        [(ids[name], numeric, confidence) for name, numeric, confidence in signatures],
+    )
+    return index
+
+
+@pytest.fixture
+def index(ids):
+    """
+    A → B (TECH 0.9), A → C (BIO 0.4), B → D (TECH 0.8), C → D (SOCIAL 0.95),
+    D → E (TECH 0.7)
+    """
+    return build_index(ids, [
+        ("A", "B", "TECH", 0.9),
+        ("A", "C", "BIO", 0.4),
+        ("B", "D", "TECH", 0.8),
+        ("C", "D", "SOCIAL", 0.95),
+        ("D", "E", "TECH", 0.7),
+    ])
+
+
+def names(ids, levels):
+    by_id = {node_id: name for name, node_id in ids.items()}
+    return [sorted(by_id[hit.node_id] for hit in level) for level in levels]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TRAVERSAL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestLevels:
+    """Level-by-level BFS over the snapshot."""
+
+    def test_forward_levels(self, index, ids):
+        levels = list(index.levels(ids["A"], "forward", 3))
+        assert names(ids, levels) == [["B", "C"], ["D"], ["E"]]
+
+    def test_strongest_link_wins(self, index, ids):
+        _, (d_hit,), _ = index.levels(ids["A"], "forward", 3)
+        assert d_hit.link_type == "SOCIAL"
+        assert d_hit.link_strength == 0.95
+        assert d_hit.path == [ids["A"], ids["C"], ids["D"]]
+        assert d_hit.node.name == "D"
+
+    def test_backward_levels(self, index, ids):
+        levels = list(index.levels(ids["E"], "backward", 5))
+        assert names(ids, levels) == [["D"], ["B", "C"], ["A"]]
+
+    def test_depth_bound(self, index, ids):
+        assert names(ids, index.levels(ids["A"], "forward", 1)) == [["B", "C"]]
+
+    def test_min_strength_and_link_types(self, index, ids):
+        assert names(ids, index.levels(ids["A"], "forward", 3, min_strength=0.5)) == [
+            ["B"], ["D"], ["E"]
+        ]
+        assert names(ids, index.levels(ids["A"], "forward", 3, link_types=["TECH"])) == [
+            ["B"], ["D"], ["E"]
+        ]
+
+    def test_fanout_keeps_strongest(self, index, ids):
+        assert names(ids, index.levels(ids["A"], "forward", 1, max_fanout=1)) == [["B"]]
+
+    def test_unknown_start(self, index):
+        assert list(index.levels(uuid4(), "forward", 3)) == []
+
+
+class TestShortestPath:
+    """Bidirectional BFS."""
+
+    def test_path_found(self, index, ids):
+        path = index.shortest_path(ids["A"], ids["E"])
+        assert path[0] == ids["A"] and path[-1] == ids["E"]
+        assert len(path) == 4
+
+    def test_no_path_against_direction(self, index, ids):
+        assert index.shortest_path(ids["E"], ids["A"]) is None
+
+    def test_isolated_node(self, index, ids):
+        assert index.shortest_path(ids["A"], ids["F"]) is None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# INCREMENTAL EVENTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestEvents:
+    """Deltas applied between snapshot loads."""
+
+    def test_link_added(self, index, ids):
+        index.on_link_added(ids["E"], ids["F"], "ECO", 0.6)
+        assert index.shortest_path(ids["A"], ids["F"]) is not None
+        assert index.is_fresh()
+
+    def test_added_link_respects_fanout_order(self, index, ids):
+        index.on_link_added(ids["A"], ids["F"], "ECO", 0.99)
+        assert names(ids, index.levels(ids["A"], "forward", 1, max_fanout=1)) == [["F"]]
+
+    def test_link_removed(self, index, ids):
+        index.on_link_removed(ids["C"], ids["D"], "SOCIAL")
+        _, (d_hit,), _ = index.levels(ids["A"], "forward", 3)
+        assert d_hit.link_type == "TECH"
+        assert d_hit.path == [ids["A"], ids["B"], ids["D"]]
+
+    def test_node_removed(self, index, ids):
+        index.on_node_removed(ids["D"])
+        assert names(ids, index.levels(ids["A"], "forward", 3)) == [["B", "C"]]
+        assert index.get_node(ids["D"]) is None
+        assert index.shortest_path(ids["A"], ids["E"]) is None
+
+    def test_node_created_then_linked(self, index, ids):
+        new_id = uuid4()
+        index.on_node_upserted(new_id, "Railway", "PHYSICAL", "Industrial")
+        index.on_link_added(ids["E"], new_id, "TECH", 0.8)
+        levels = list(index.levels(ids["A"], "forward", 4))
+        assert levels[-1][0].node.name == "Railway"
+
+    def test_unknown_node_marks_stale(self, index, ids):
+        index.on_link_added(ids["A"], uuid4(), "TECH", 0.5)
+        assert not index.is_fresh()
+
+    def test_compaction_preserves_graph(self, ids):
+        index = build_index(ids, [("A", "B", "TECH", 0.9)], compact_threshold=3)
+        index.on_link_added(ids["B"], ids["C"], "BIO", 0.7)
+        index.on_link_added(ids["C"], ids["D"], "BIO", 0.6)
+        index.on_link_removed(ids["A"], ids["B"])
+        index.on_link_added(ids["A"], ids["B"], "ECO", 0.5)
+
+        assert index.get_stats()["delta_size"] == 1
+        levels = list(index.levels(ids["A"], "forward", 3))
+        assert names(ids, levels) == [["B"], ["C"], ["D"]]
+        assert levels[0][0].link_type == "ECO"
+
+    def test_events_ignored_before_load(self, ids):
+        index = AtomGraphIndex()
+        index.on_link_added(ids["A"], ids["B"], "TECH")
+        assert not index.is_loaded
+        assert not index.is_fresh()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HARMONICS & FRESHNESS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestHarmonicsAndFreshness:
+    """Harmonic lookup and staleness."""
+
+    def test_find_by_harmonic(self, ids):
+        index = build_index(ids, [], [
+            ("A", {"base_frequency": 444}, 0.2),
+            ("B", {"base_frequency": 444}, 0.3),
+            ("C", {"base_frequency": 999}, 0.2),
+        ])
+        found = index.find_by_harmonic(444)
+        assert [node.name for node, _ in found] == ["A", "B"]
+        assert index.find_by_harmonic(444, limit=1)[0][1] == 0.2
+
+        index.on_node_removed(ids["A"])
+        assert [node.name for node, _ in index.find_by_harmonic(444)] == ["B"]
+
+    def test_max_age(self, ids):
+        index = build_index(ids, [], max_age_s=0.0)
+        index._loaded_at -= 1
+        assert not index.is_fresh()
+
+    def test_mark_stale(self, index):
+        assert index.is_fresh()
+        index.mark_stale("test")
+        assert not index.is_fresh()
@@ -0,0 +1,328 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+AT·OM GRAPH TRAVERSAL — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for level-by-level traversal of the causal graph:
+- One link query and one node query per BFS level
+- Depth limit, cycles, empty frontier, max_results
+- Strongest link per discovered node, paths from the start node
+- Grouped link queries (IN chunks, fan-out ranking)
+- LEVEL and RECURSIVE agree on PostgreSQL
+
+The PostgreSQL tests run when TEST_DATABASE_URL points to a scratch
+database (postgresql+asyncpg://...); its atom_nodes, atom_causal_links and
+atom_harmonic_signatures tables are dropped and recreated.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.dialects import postgresql
+
+from app.services import atom_traversal
+from app.services.atom_traversal import AtomGraphTraversal, TraversalMode
+
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+requires_postgres = [
+    pytest.mark.database,
+    pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set (PostgreSQL required)"),
+]
+
+# The traversal queries app.models.atom_mapping, whose tables clash with the
+# legacy app.models.atom_models on the shared metadata
+requires_atom_mapping = pytest.mark.skipif(
+    "app.models.atom_models" in sys.modules,
+    reason="app.models.atom_models already defines the AT·OM tables",
+)
+
+# A → B (TECH 0.9), A → C (BIO 0.4), B → D (TECH 0.8), C → D (SOCIAL 0.95),
+# D → E (TECH 0.7), and two cycles: D → B (BIO 0.3), E → A (TECH 0.5)
+LINKS = [
+    ("A", "B", "TECH", 0.9),
+    ("A", "C", "BIO", 0.4),
+    ("B", "D", "TECH", 0.8),
+    ("C", "D", "SOCIAL", 0.95),
+    ("D", "E", "TECH", 0.7),
+    ("D", "B", "BIO", 0.3),
+    ("E", "A", "TECH", 0.5),
+]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def ids():
+    """Nodes A..F (F is isolated)."""
+    return {name: uuid4() for name in "ABCDEF"}
+
+
+class GraphTraversal(AtomGraphTraversal):
+    """Traversal over an in-memory link table, recording each grouped query."""
+
+    def __init__(self, ids, links=LINKS, missing=(), **kwargs):
+        super().__init__(db=MagicMock(), **kwargs)
+        self.ids = ids
+        self.links = [(ids[a], ids[b], link_type, strength) for a, b, link_type, strength in links]
+        self.missing = {ids[name] for name in missing}
+        self.link_queries = []
+        self.node_queries = []
+
+    async def fetch_links(self, frontier, direction, link_types=None, min_strength=0.0):
+        frontier = list(frontier)
+        self.link_queries.append(frontier)
+        rows = []
+        for trigger_id, result_id, link_type, strength in self.links:
+            source, target = (result_id, trigger_id) if direction == "backward" else (trigger_id, result_id)
+            if source not in frontier or strength < min_strength:
+                continue
+            if link_types and link_type not in link_types:
+                continue
+            rows.append(SimpleNamespace(
+                source_id=source, target_id=target, link_type=link_type,
+                strength=strength, confidence=0.5,
+            ))
+        return rows
+
+    async def fetch_nodes(self, node_ids):
+        node_ids = list(node_ids)
+        self.node_queries.append(node_ids)
+        by_id = {node_id: name for name, node_id in self.ids.items()}
+        return {node_id: by_id[node_id] for node_id in node_ids if node_id not in self.missing}
+
+
+async def levels(traversal, start, direction="forward", depth=5, **kwargs):
+    return [level async for level in traversal.stream(start, direction, depth, **kwargs)]
+
+
+def names(ids, levels):
+    by_id = {node_id: name for name, node_id in ids.items()}
+    return [sorted(by_id[hit.node_id] for hit in level) for level in levels]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LEVELS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestBatchedLevels:
+    """BFS with one grouped query per level."""
+
+    async def test_one_link_and_node_query_per_level(self, ids):
+        traversal = GraphTraversal(ids)
+
+        result = await levels(traversal, ids["A"], depth=2)
+
+        assert names(ids, result) == [["B", "C"], ["D"]]
+        assert traversal.link_queries == [[ids["A"]], [ids["B"], ids["C"]]]
+        assert len(traversal.node_queries) == 2
+
+    async def test_cycles_not_revisited(self, ids):
+        traversal = GraphTraversal(ids)
+
+        result = await levels(traversal, ids["A"], depth=10)
+
+        # E → A and D → B point back into visited nodes
+        assert names(ids, result) == [["B", "C"], ["D"], ["E"]]
+        assert all(hit.node_id != ids["A"] for level in result for hit in level)
+
+    async def test_empty_frontier_stops_early(self, ids):
+        traversal = GraphTraversal(ids)
+
+        await levels(traversal, ids["A"], depth=10)
+
+        # Levels 1-3, then E's only link leads back to A: nothing new, stop
+        assert len(traversal.link_queries) == 4
+        assert len(traversal.node_queries) == 3
+
+    async def test_isolated_start(self, ids):
+        traversal = GraphTraversal(ids)
+
+        assert await levels(traversal, ids["F"]) == []
+        assert traversal.link_queries == [[ids["F"]]]
+        assert traversal.node_queries == []
+
+    async def test_zero_depth_is_free(self, ids):
+        traversal = GraphTraversal(ids)
+
+        assert await levels(traversal, ids["A"], depth=0) == []
+        assert traversal.link_queries == []
+
+    async def test_strongest_link_and_path(self, ids):
+        traversal = GraphTraversal(ids)
+
+        _, (d_hit,), (e_hit,) = await levels(traversal, ids["A"])
+
+        assert (d_hit.link_type, d_hit.link_strength, d_hit.distance) == ("SOCIAL", 0.95, 2)
+        assert d_hit.path == [ids["A"], ids["C"], ids["D"]]
+        assert e_hit.path == [ids["A"], ids["C"], ids["D"], ids["E"]]
+
+    async def test_level_sorted_by_strength(self, ids):
+        (first,) = await levels(GraphTraversal(ids), ids["A"], depth=1)
+
+        assert [hit.link_strength for hit in first] == [0.9, 0.4]
+
+    async def test_backward(self, ids):
+        result = await levels(GraphTraversal(ids), ids["E"], "backward")
+
+        assert names(ids, result) == [["D"], ["B", "C"], ["A"]]
+
+    async def test_filters(self, ids):
+        traversal = GraphTraversal(ids)
+
+        result = await levels(traversal, ids["A"], link_types=["TECH"], min_strength=0.75)
+
+        assert names(ids, result) == [["B"], ["D"]]
+
+    async def test_missing_node_still_expanded(self, ids):
+        result = await levels(GraphTraversal(ids, missing="D"), ids["A"])
+
+        # D's row is gone but its links still lead to E
+        assert names(ids, result) == [["B", "C"], ["E"]]
+        assert result[1][0].distance == 3
+
+    async def test_max_results_stops_querying(self, ids):
+        traversal = GraphTraversal(ids, max_results=2)
+
+        result = await traversal.traverse(ids["A"], "forward", 5)
+
+        assert len(result) == 2
+        assert len(traversal.link_queries) == 1
+
+    async def test_recursive_falls_back_without_postgres(self, ids):
+        traversal = GraphTraversal(ids, mode=TraversalMode.RECURSIVE)
+
+        result = await levels(traversal, ids["A"], depth=2)
+
+        assert names(ids, result) == [["B", "C"], ["D"]]
+        assert len(traversal.link_queries) == 2
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# QUERIES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestFetchLinks:
+    """Grouped link queries."""
+
+    pytestmark = requires_atom_mapping
+
+    @pytest.fixture
+    def db(self):
+        db = MagicMock()
+        result = MagicMock()
+        result.all.return_value = []
+        db.execute = AsyncMock(return_value=result)
+        return db
+
+    def sql(self, db, call=-1):
+        statement = db.execute.await_args_list[call].args[0]
+        return str(statement.compile(dialect=postgresql.dialect()))
+
+    async def test_frontier_split_into_chunks(self, db, monkeypatch):
+        monkeypatch.setattr(atom_traversal, "IN_CHUNK_SIZE", 2)
+
+        await AtomGraphTraversal(db).fetch_links([uuid4() for _ in range(5)], "forward")
+
+        assert db.execute.await_count == 3
+
+    async def test_direction_picks_columns(self, db):
+        await AtomGraphTraversal(db).fetch_links([uuid4()], "backward")
+
+        sql = self.sql(db)
+        assert "atom_causal_links.result_id AS source_id" in sql
+        assert "atom_causal_links.result_id IN" in sql
+
+    async def test_fanout_ranks_per_source(self, db):
+        await AtomGraphTraversal(db, max_fanout=3).fetch_links([uuid4()], "forward")
+
+        sql = self.sql(db)
+        assert "row_number() OVER (PARTITION BY atom_causal_links.trigger_id" in sql
+        assert "ORDER BY atom_causal_links.strength DESC" in sql
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# POSTGRESQL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestPostgres:
+    """LEVEL and RECURSIVE against real tables."""
+
+    pytestmark = [*requires_postgres, requires_atom_mapping]
+
+    @pytest.fixture
+    async def engine(self, ids):
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        from app.models.atom_mapping import ATOMNode, AtomHarmonicSignature, atom_causal_links
+
+        tables = [ATOMNode.__table__, atom_causal_links, AtomHarmonicSignature.__table__]
+        engine = create_async_engine(TEST_DATABASE_URL)
+        async with engine.begin() as conn:
+            # Table by table: a metadata-wide drop also drops shared enum types
+            for table in reversed(tables):
+                await conn.run_sync(table.drop, checkfirst=True)
+            for table in tables:
+                await conn.run_sync(table.create)
+            owner = uuid4()
+            await conn.execute(insert(ATOMNode.__table__), [
+                {"id": node_id, "name": name, "created_by": owner} for name, node_id in ids.items()
+            ])
+            await conn.execute(insert(atom_causal_links), [
+                {"trigger_id": ids[a], "result_id": ids[b], "link_type": link_type,
+                 "strength": strength, "confidence": 0.5, "created_by": owner}
+                for a, b, link_type, strength in LINKS
+            ])
+        yield engine
+        await engine.dispose()
+
+    @pytest.fixture
+    async def db(self, engine):
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        queries = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: queries.append(args[2]))
+        async with AsyncSession(engine) as db:
+            db.queries = queries
+            yield db
+
+    @pytest.mark.parametrize("mode", list(TraversalMode))
+    async def test_modes_agree(self, db, ids, mode):
+        result = await levels(AtomGraphTraversal(db, mode=mode), ids["A"], depth=10)
+
+        assert names(ids, result) == [["B", "C"], ["D"], ["E"]]
+        (d_hit,) = result[1]
+        assert d_hit.path == [ids["A"], ids["C"], ids["D"]]
+        assert d_hit.link_strength == pytest.approx(0.95)
+        assert d_hit.node.name == "D"
+
+    async def test_level_query_count(self, db, ids):
+        await levels(AtomGraphTraversal(db), ids["A"], depth=10)
+
+        # 3 levels x (links + nodes), then the empty fourth frontier
+        assert len(db.queries) == 7
+
+    async def test_recursive_query_count(self, db, ids):
+        await levels(AtomGraphTraversal(db, mode=TraversalMode.RECURSIVE), ids["A"], depth=10)
+
+        assert len(db.queries) == 2
+
+    @pytest.mark.parametrize("mode", list(TraversalMode))
+    async def test_fanout_and_depth(self, db, ids, mode):
+        traversal = AtomGraphTraversal(db, mode=mode, max_fanout=1)
+
+        result = await levels(traversal, ids["A"], depth=2)
+
+        assert names(ids, result) == [["B"], ["D"]]
+
+    @pytest.mark.parametrize("mode", list(TraversalMode))
+    async def test_isolated_start(self, db, ids, mode):
+        assert await levels(AtomGraphTraversal(db, mode=mode), ids["F"]) == []
@@ -0,0 +1,217 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+BUDGET LEDGER — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for the LLM Router's token/cost budget ledger:
+- Reserve / commit / refund against leased slices
+- Limits are never overshot, even by concurrent reservations
+- Reservations settle against their own window after a rollover
+- Local usage of past windows is dropped
+- Backend selection and Redis Cluster key layout
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from services.budget_ledger import (
+    BudgetExhaustedError,
+    BudgetLedger,
+    BudgetLimits,
+    InMemoryLedgerBackend,
+    LedgerBackend,
+    RedisLedgerBackend,
+    SQLLedgerBackend,
+    create_ledger_backend,
+)
+
+
+MARCH = ("D:2025-03-31", "M:2025-03")
+APRIL = ("D:2025-04-01", "M:2025-04")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def backend():
+    return InMemoryLedgerBackend()
+
+
+@pytest.fixture
+def window():
+    return {"periods": MARCH}
+
+
+@pytest.fixture
+def ledger(backend, window, monkeypatch):
+    ledger = BudgetLedger(
+        backend=backend,
+        default_limits=BudgetLimits(
+            daily_tokens=1000, monthly_tokens=5000,
+            daily_cost=Decimal("1.0"), monthly_cost=Decimal("5.0"),
+        ),
+        lease_fraction=0.1,
+    )
+    monkeypatch.setattr(ledger, "periods", lambda now=None: window["periods"])
+    return ledger
+
+
+def allocated(backend, period, identity_id="user-1"):
+    """(allocated tokens, allocated micros) of a window"""
+    row = backend._rows.get((identity_id, period), [0, 0, 0, 0])
+    return row[0], row[1]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RESERVE / COMMIT / REFUND
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestReserveCommit:
+    """Reservations and their settlement."""
+
+    async def test_commit_returns_overestimate_to_lease(self, ledger):
+        reservation = await ledger.reserve("user-1", 100, Decimal("0.01"))
+        lease = ledger._leases["user-1"]
+        before = lease.tokens
+
+        ledger.commit(reservation, 60, Decimal("0.006"))
+
+        assert lease.tokens == before + 40
+        assert ledger.local_usage("user-1")["daily_tokens"] == 60
+        assert ledger.local_usage("user-1")["daily_cost"] == Decimal("0.006")
+
+    async def test_commit_is_idempotent(self, ledger):
+        reservation = await ledger.reserve("user-1", 100, Decimal("0.01"))
+        ledger.commit(reservation, 60, Decimal("0.006"))
+        ledger.commit(reservation, 60, Decimal("0.006"))
+
+        assert ledger.local_usage("user-1")["daily_tokens"] == 60
+
+    async def test_refund_records_nothing(self, ledger):
+        reservation = await ledger.reserve("user-1", 100, Decimal("0.01"))
+        ledger.refund(reservation)
+
+        assert ledger.local_usage("user-1")["daily_tokens"] == 0
+        await ledger.stop()
+        assert allocated(ledger.backend, MARCH[0]) == (0, 0)
+
+    async def test_exhausted_budget_rejected(self, ledger):
+        await ledger.reserve("user-1", 900, Decimal("0.1"))
+
+        with pytest.raises(BudgetExhaustedError):
+            await ledger.reserve("user-1", 200, Decimal("0.1"))
+        assert ledger.stats["rejections"] == 1
+
+    async def test_concurrent_reservations_never_overshoot(self, ledger):
+        results = await asyncio.gather(
+            *(ledger.reserve("user-1", 30, Decimal("0.001")) for _ in range(50)),
+            return_exceptions=True,
+        )
+        granted = [r for r in results if not isinstance(r, Exception)]
+
+        assert len(granted) == 1000 // 30
+        assert allocated(ledger.backend, MARCH[0])[0] <= 1000
+
+    async def test_stop_returns_unused_slices(self, ledger, backend):
+        reservation = await ledger.reserve("user-1", 100, Decimal("0.01"))
+        ledger.commit(reservation, 70, Decimal("0.007"))
+        await ledger.stop()
+
+        assert allocated(backend, MARCH[0]) == (70, 7000)
+        assert await backend.usage("user-1", MARCH[1]) == (70, 7000)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ROLLOVER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestRollover:
+    """A reservation made before a rollover settles against its own window."""
+
+    async def _reserve_then_roll(self, ledger, window):
+        reservation = await ledger.reserve("user-1", 100, Decimal("0.01"))
+        window["periods"] = APRIL
+        # First April request hands the March slice back
+        ledger.refund(await ledger.reserve("user-1", 10, Decimal("0.001")))
+        return reservation
+
+    async def test_commit_releases_old_window_reservation(self, ledger, backend, window):
+        reservation = await self._reserve_then_roll(ledger, window)
+        ledger.commit(reservation, 30, Decimal("0.003"))
+        await ledger.flush()
+
+        assert allocated(backend, MARCH[0]) == (30, 3000)
+        assert allocated(backend, MARCH[1]) == (30, 3000)
+        assert await backend.usage("user-1", MARCH[1]) == (30, 3000)
+        assert await backend.usage("user-1", APRIL[1]) == (0, 0)
+
+    async def test_refund_after_rollover_frees_old_window(self, ledger, backend, window):
+        reservation = await self._reserve_then_roll(ledger, window)
+        ledger.refund(reservation)
+        await ledger.flush()
+
+        assert allocated(backend, MARCH[1]) == (0, 0)
+
+    async def test_overshoot_after_rollover_is_allocated(self, ledger, backend, window):
+        reservation = await self._reserve_then_roll(ledger, window)
+        ledger.commit(reservation, 150, Decimal("0.015"))
+        await ledger.flush()
+
+        assert allocated(backend, MARCH[1]) == (150, 15000)
+
+    async def test_new_window_not_charged(self, ledger, backend, window):
+        reservation = await self._reserve_then_roll(ledger, window)
+        ledger.commit(reservation, 30, Decimal("0.003"))
+        await ledger.stop()
+
+        assert allocated(backend, APRIL[1]) == (0, 0)
+
+    async def test_local_usage_drops_past_windows(self, ledger, window):
+        march = await ledger.reserve("user-1", 100, Decimal("0.01"))
+        ledger.commit(march, 40, Decimal("0.004"))
+        window["periods"] = APRIL
+        ledger.commit(await ledger.reserve("user-2", 10, Decimal("0.001")), 10, Decimal("0.001"))
+
+        assert {period for _, period in ledger._local_usage} == set(APRIL)
+        assert ledger.local_usage("user-1")["monthly_tokens"] == 0
+
+    async def test_late_commit_not_kept_locally(self, ledger, backend, window):
+        reservation = await self._reserve_then_roll(ledger, window)
+        ledger.commit(reservation, 30, Decimal("0.003"))
+        await ledger.flush()
+
+        assert {period for _, period in ledger._local_usage} <= set(APRIL)
+        assert await backend.usage("user-1", MARCH[1]) == (30, 3000)
+
+
+class TestBackend:
+    """Backend contract."""
+
+    def test_backend_is_abstract(self):
+        with pytest.raises(TypeError):
+            LedgerBackend()
+
+    @pytest.mark.parametrize("name, cls", [
+        ("memory", InMemoryLedgerBackend),
+        ("sql", SQLLedgerBackend),
+        ("redis", RedisLedgerBackend),
+    ])
+    def test_backend_from_env(self, monkeypatch, name, cls):
+        monkeypatch.setenv("LLM_BUDGET_BACKEND", name.upper())
+        assert type(create_ledger_backend()) is cls
+
+    def test_default_and_unknown_backend(self, monkeypatch):
+        monkeypatch.delenv("LLM_BUDGET_BACKEND", raising=False)
+        assert type(create_ledger_backend()) is InMemoryLedgerBackend
+        with pytest.raises(ValueError):
+            create_ledger_backend("etcd")
+
+    def test_redis_keys_share_a_cluster_slot(self):
+        backend = RedisLedgerBackend()
+        keys = [backend._key("user-1", period) for period in MARCH]
+
+        assert keys == ["chenu:llm_budget:{user-1}:D:2025-03-31", "chenu:llm_budget:{user-1}:M:2025-03"]
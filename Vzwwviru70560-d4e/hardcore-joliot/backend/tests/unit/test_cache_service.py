@@ -0,0 +1,627 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+CACHE SERVICE — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for the L1 in-memory cache:
+- Count-Min frequency sketch (saturation, aging)
+- LRU and W-TinyLFU eviction, byte budget and namespace quotas
+- Timing-wheel expiry on the monotonic clock, sharded L1, background sweeper
+- Single-flight get_or_compute, stale-while-revalidate and XFetch refresh
+- Indexed pattern invalidation and O(1) epoch invalidation
+"""
+
+import asyncio
+import types
+
+import pytest
+
+from services import cache_service
+from services.cache_service import (
+    CacheConfig,
+    CacheNamespace,
+    CacheService,
+    EvictionPolicy,
+    FrequencySketch,
+    InMemoryCache,
+    KeyIndex,
+    ShardedInMemoryCache,
+    TimingWheel,
+    TinyLFUPolicy,
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=1000.0)
+    clock.monotonic = lambda: clock.now
+    clock.time = lambda: clock.now
+    monkeypatch.setattr(cache_service, "time", clock)
+    return clock
+
+
+def lru(max_size: int = 3, **kwargs) -> InMemoryCache:
+    return InMemoryCache(CacheConfig(max_size=max_size, **kwargs))
+
+
+def tiny_lfu(max_size: int = 100, **kwargs) -> InMemoryCache:
+    return InMemoryCache(CacheConfig(
+        max_size=max_size, eviction_policy=EvictionPolicy.TINY_LFU, **kwargs
+    ))
+
+
+async def present(cache, keys):
+    return [key for key in keys if await cache.get(key) is not None]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FREQUENCY SKETCH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestFrequencySketch:
+    """Approximate recent popularity."""
+
+    def test_counts(self):
+        sketch = FrequencySketch(100)
+        for _ in range(3):
+            sketch.increment("a")
+
+        assert sketch.frequency("a") == 3
+        assert sketch.frequency("never-seen") == 0
+
+    def test_saturates(self):
+        sketch = FrequencySketch(100)
+        for _ in range(50):
+            sketch.increment("a")
+
+        assert sketch.frequency("a") == FrequencySketch.MAX_COUNT
+
+    def test_aging_halves_counts(self):
+        sketch = FrequencySketch(16)
+        for _ in range(8):
+            sketch.increment("hot")
+        # The 160th increment (10 x capacity) triggers the reset
+        for _ in range(160 - 8):
+            sketch.increment("cold")
+
+        assert sketch.frequency("hot") == 4
+
+    def test_clear(self):
+        sketch = FrequencySketch(16)
+        sketch.increment("a")
+        sketch.clear()
+
+        assert sketch.frequency("a") == 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EVICTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestLRU:
+    """Least recently used entry goes first."""
+
+    async def test_evicts_least_recently_used(self, clock):
+        cache = lru()
+        for key in "abc":
+            await cache.set(key, key)
+        await cache.get("a")
+        await cache.set("d", "d")
+
+        assert await present(cache, "abcd") == ["a", "c", "d"]
+        assert (await cache.get_stats()).evictions == 1
+
+    async def test_overwrite_keeps_size_and_refreshes_recency(self, clock):
+        cache = lru()
+        for key in "abc":
+            await cache.set(key, key)
+        await cache.set("a", "again")
+        await cache.set("d", "d")
+
+        assert len(cache) == 3
+        assert await cache.get("a") == "again"
+        assert await cache.get("b") is None
+
+    async def test_byte_budget(self, clock):
+        cache = lru(max_size=100, max_bytes=3000)
+        for n in range(10):
+            await cache.set(f"k{n}", "x" * 1000)
+
+        stats = await cache.get_stats()
+        assert stats.total_size_bytes <= 3000
+        assert len(cache) < 10
+        assert await cache.get("k9") is not None
+
+    async def test_namespace_quota(self, clock):
+        cache = lru(max_size=100, namespace_quotas={CacheNamespace.LLM: 2})
+        for n in range(5):
+            await cache.set(f"llm{n}", n, namespace=CacheNamespace.LLM)
+        await cache.set("thread", 1, namespace=CacheNamespace.THREAD)
+
+        assert await present(cache, [f"llm{n}" for n in range(5)]) == ["llm3", "llm4"]
+        assert (await cache.get_stats()).namespaces == {"llm": 2, "thread": 1}
+
+    async def test_size_accounting_returns_to_zero(self, clock):
+        cache = lru(max_size=2)
+        for n in range(5):
+            await cache.set(f"k{n}", [n] * 10)
+        await cache.delete("k3")
+        await cache.delete("k4")
+
+        assert (await cache.get_stats()).total_size_bytes == 0
+
+
+class TestTinyLFU:
+    """Frequency-gated admission keeps the hot set."""
+
+    async def test_scan_does_not_flush_hot_set(self, clock):
+        cache = tiny_lfu()
+        hot = [f"hot{n}" for n in range(100)]
+        for key in hot:
+            await cache.set(key, key)
+        for _ in range(3):
+            await present(cache, hot)
+
+        for n in range(1000):
+            await cache.set(f"scan{n}", n)
+
+        # Sketch collisions can let a few scan keys in; LRU keeps none
+        assert len(await present(cache, hot)) >= 80
+        assert (await cache.get_stats()).rejections > 0
+
+    async def test_plain_lru_is_flushed_by_scan(self, clock):
+        cache = lru(max_size=100)
+        hot = [f"hot{n}" for n in range(100)]
+        for key in hot:
+            await cache.set(key, key)
+        for _ in range(3):
+            await present(cache, hot)
+
+        for n in range(1000):
+            await cache.set(f"scan{n}", n)
+
+        assert await present(cache, hot) == []
+
+    async def test_popular_newcomer_admitted(self, clock):
+        cache = tiny_lfu(max_size=10, tiny_lfu_window_ratio=0.1)
+        for n in range(10):
+            await cache.set(f"k{n}", n)
+
+        # Misses count towards the newcomer's frequency
+        for _ in range(5):
+            await cache.get("new")
+        await cache.set("new", "value")
+        await cache.set("push", "value")
+
+        assert await cache.get("new") == "value"
+
+    def test_victim_is_refused_candidate_when_less_popular(self):
+        policy = TinyLFUPolicy(capacity=2, window_ratio=0.5)
+        policy.on_insert("old")
+        policy.on_access("old")
+        policy.on_insert("once")
+        policy.on_insert("new")
+
+        assert policy.victim() == ("once", True)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EXPIRY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestTimingWheel:
+    """Keys come due on the tick after their deadline, never before."""
+
+    def wheel(self):
+        return TimingWheel(tick=1.0, slots=4, levels=3, now=0.0)
+
+    def test_due_at_deadline(self):
+        wheel = self.wheel()
+        wheel.schedule("a", 2.5)
+        wheel.schedule("b", 3.0)
+
+        assert wheel.advance(2.0) == []
+        assert sorted(wheel.advance(3.0)) == ["a", "b"]
+        assert len(wheel) == 0
+
+    @pytest.mark.parametrize("deadline", [5.0, 17.0, 63.0, 200.0])
+    def test_cascades_from_coarse_levels(self, deadline):
+        wheel = self.wheel()
+        wheel.schedule("k", deadline)
+
+        assert wheel.advance(deadline - 1) == []
+        assert wheel.advance(deadline) == ["k"]
+
+    def test_cancel(self):
+        wheel = self.wheel()
+        wheel.schedule("k", 2.0)
+        wheel.cancel("k")
+
+        assert wheel.advance(10.0) == []
+
+    def test_reschedule_later(self):
+        wheel = self.wheel()
+        wheel.schedule("k", 2.0)
+        wheel.schedule("k", 9.0)
+
+        assert wheel.advance(8.0) == []
+        assert wheel.advance(9.0) == ["k"]
+
+    def test_past_deadline_due_next_tick(self):
+        wheel = self.wheel()
+        wheel.advance(5.0)
+        wheel.schedule("k", 1.0)
+
+        assert wheel.advance(6.0) == ["k"]
+
+
+class TestExpiry:
+    """TTLs follow the monotonic clock."""
+
+    async def test_expired_entry_is_a_miss(self, clock):
+        cache = lru()
+        await cache.set("k", "v", ttl=10)
+
+        clock.now += 10
+        assert await cache.get("k") == "v"
+        clock.now += 0.5
+        assert await cache.get("k") is None
+        assert len(cache) == 0
+
+    async def test_sweep_removes_only_expired(self, clock):
+        cache = lru(max_size=100)
+        for n in range(10):
+            await cache.set(f"short{n}", n, ttl=5)
+        await cache.set("long", 1, ttl=60)
+
+        clock.now += 6
+        assert await cache.sweep_expired() == 10
+        assert len(cache) == 1
+        assert (await cache.get_stats()).expirations == 10
+
+    async def test_refreshed_entry_survives_old_deadline(self, clock):
+        cache = lru()
+        await cache.set("k", 1, ttl=5)
+        clock.now += 4
+        await cache.set("k", 2, ttl=5)
+
+        clock.now += 2
+        assert await cache.sweep_expired() == 0
+        assert await cache.get("k") == 2
+
+
+class TestSharded:
+    """Lock-striped L1."""
+
+    @pytest.fixture
+    def sharded(self, clock):
+        return ShardedInMemoryCache(CacheConfig(
+            l1_shards=4, max_size=400, namespace_quotas={CacheNamespace.LLM: 8}
+        ))
+
+    def test_limits_split_across_shards(self, sharded):
+        for shard in sharded._shards:
+            assert shard.config.max_size == 100
+            assert shard.config.namespace_quotas == {CacheNamespace.LLM: 2}
+
+    async def test_operations_route_to_key_shard(self, sharded):
+        for n in range(20):
+            await sharded.set(f"chenu:thread:u1:t{n}", n, ttl=5, namespace=CacheNamespace.THREAD)
+
+        assert len(sharded) == 20
+        assert sum(len(shard) > 0 for shard in sharded._shards) > 1
+        assert await sharded.get("chenu:thread:u1:t3") == 3
+        assert await sharded.delete("chenu:thread:u1:t3")
+        assert await sharded.delete_pattern("chenu:thread:u1:*") == 19
+
+    async def test_sweep_and_stats_cover_every_shard(self, sharded, clock):
+        for n in range(20):
+            await sharded.set(f"k{n}", n, ttl=5)
+        await sharded.get("k1")
+
+        clock.now += 6
+        assert await sharded.sweep_expired() == 20
+        stats = await sharded.get_stats()
+        assert (stats.sets, stats.hits, stats.expirations) == (20, 1, 20)
+
+    def test_service_uses_sharded_cache(self):
+        service = CacheService(config=CacheConfig(l1_shards=4))
+        assert isinstance(service.l1_cache, ShardedInMemoryCache)
+
+
+class TestSweeper:
+    """CacheService.start()/stop() run the background sweep."""
+
+    async def test_sweeps_in_background(self, clock):
+        service = CacheService(config=CacheConfig(sweep_interval_seconds=0.01))
+        await service.l1_cache.set("k", "v", ttl=5)
+        await service.start()
+        try:
+            clock.now += 6
+            for _ in range(100):
+                if not len(service.l1_cache):
+                    break
+                await asyncio.sleep(0.01)
+            assert len(service.l1_cache) == 0
+        finally:
+            await service.stop()
+
+        assert not service._sweeper.running
+
+    async def test_start_is_idempotent(self):
+        service = CacheService()
+        await service.start()
+        task = service._sweeper._task
+        await service.start()
+
+        assert service._sweeper._task is task
+        await service.stop()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LOADING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Loader:
+    """Compute function that counts calls and can block or fail."""
+
+    def __init__(self, clock=None, duration=0.0, error=None):
+        self.clock = clock
+        self.duration = duration
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.clock is not None:
+            self.clock.now += self.duration
+        if self.error:
+            raise self.error
+        return f"v{self.calls}"
+
+
+@pytest.fixture
+def service(clock):
+    return CacheService()
+
+
+@pytest.fixture
+def rand(monkeypatch):
+    rand = types.SimpleNamespace(value=0.5)
+    monkeypatch.setattr(cache_service, "random", types.SimpleNamespace(random=lambda: rand.value))
+    return rand
+
+
+def load(service, loader, **kwargs):
+    kwargs.setdefault("ttl", 10)
+    return service.get_or_compute(CacheNamespace.THREAD, "t1", loader, identity_id="u1", **kwargs)
+
+
+class TestSingleFlight:
+    """Concurrent misses share one load."""
+
+    async def test_concurrent_misses_coalesce(self, service):
+        loader = Loader()
+        loader.release.clear()
+        waiters = [asyncio.create_task(load(service, loader)) for _ in range(10)]
+        await asyncio.sleep(0)
+        loader.release.set()
+
+        assert await asyncio.gather(*waiters) == ["v1"] * 10
+        assert loader.calls == 1
+        assert service._load_stats["coalesced"] == 9
+        assert service._inflight == {}
+
+    async def test_hit_after_load(self, service):
+        loader = Loader()
+        await load(service, loader)
+
+        assert await load(service, loader) == "v1"
+        assert await service.get(CacheNamespace.THREAD, "t1", identity_id="u1") == "v1"
+        assert loader.calls == 1
+
+    async def test_cancelled_caller_does_not_cancel_load(self, service):
+        loader = Loader()
+        loader.release.clear()
+        first = asyncio.create_task(load(service, loader))
+        second = asyncio.create_task(load(service, loader))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        loader.release.set()
+
+        assert await second == "v1"
+        assert loader.calls == 1
+
+    async def test_error_reaches_waiters_and_is_not_cached(self, service):
+        failing = Loader(error=RuntimeError("db down"))
+        failing.release.clear()
+        waiters = [asyncio.create_task(load(service, failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        failing.release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert failing.calls == 1
+        assert service._load_stats["load_errors"] == 1
+
+        assert await load(service, Loader()) == "v1"
+
+
+class TestRefresh:
+    """Stale-while-revalidate and probabilistic early refresh."""
+
+    async def test_stale_value_served_while_one_refresh_runs(self, service, clock):
+        loader = Loader()
+        await load(service, loader, stale_ttl=30)
+
+        clock.now += 15
+        loader.release.clear()
+        stale = await asyncio.gather(*(load(service, loader, stale_ttl=30) for _ in range(5)))
+        assert stale == ["v1"] * 5
+        assert loader.calls == 2
+        assert service._load_stats["stale_served"] == 5
+
+        loader.release.set()
+        await asyncio.sleep(0)
+        assert await load(service, loader, stale_ttl=30) == "v2"
+
+    async def test_past_stale_window_waits_for_load(self, service, clock):
+        loader = Loader()
+        await load(service, loader, stale_ttl=30)
+
+        clock.now += 41
+        assert await load(service, loader, stale_ttl=30) == "v2"
+        assert service._load_stats["misses"] == 2
+
+    async def test_xfetch_refreshes_early_near_expiry(self, service, clock, rand):
+        loader = Loader(clock, duration=2.0)
+        await load(service, loader)
+
+        # -2s * ln(1 - 0.99) is about 9.2s ahead of now, past the expiry
+        rand.value = 0.99
+        clock.now += 5
+        assert await load(service, loader) == "v1"
+        await asyncio.sleep(0)
+
+        assert loader.calls == 2
+        assert service._load_stats["early_refreshes"] == 1
+
+    async def test_xfetch_leaves_fresh_values_alone(self, service, clock, rand):
+        loader = Loader(clock, duration=2.0)
+        await load(service, loader)
+
+        rand.value = 0.5  # about 1.4s ahead
+        clock.now += 5
+        assert await load(service, loader) == "v1"
+        assert loader.calls == 1
+
+    async def test_beta_zero_disables_early_refresh(self, service, clock, rand):
+        loader = Loader(clock, duration=2.0)
+        await load(service, loader, beta=0)
+
+        rand.value = 0.999999
+        clock.now += 9
+        await load(service, loader, beta=0)
+        assert loader.calls == 1
+
+    async def test_beta_zero_still_refreshes_stale_values(self, service, clock):
+        loader = Loader()
+        await load(service, loader, stale_ttl=30, beta=0)
+
+        clock.now += 15
+        assert await load(service, loader, stale_ttl=30, beta=0) == "v1"
+        await asyncio.sleep(0)
+
+        assert loader.calls == 2
+        assert service._load_stats["stale_served"] == 1
+        assert await load(service, loader, stale_ttl=30, beta=0) == "v2"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# INVALIDATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestKeyIndex:
+    """Pattern lookups walk the literal key segments."""
+
+    @pytest.fixture
+    def index(self):
+        index = KeyIndex()
+        for key in [
+            "chenu:thread:u1:t1", "chenu:thread:u1:t2:abc", "chenu:thread:u2:t1",
+            "chenu:sphere:u1:s1", "legacy-key",
+        ]:
+            index.add(key)
+        return index
+
+    @pytest.mark.parametrize("pattern,expected", [
+        ("chenu:thread:*:*", ["chenu:thread:u1:t1", "chenu:thread:u1:t2:abc", "chenu:thread:u2:t1"]),
+        ("chenu:thread:u1:*", ["chenu:thread:u1:t1", "chenu:thread:u1:t2:abc"]),
+        ("chenu:*:u1:*", ["chenu:sphere:u1:s1", "chenu:thread:u1:t1", "chenu:thread:u1:t2:abc"]),
+        ("chenu:thread:u3:*", []),
+        ("legacy*", ["legacy-key"]),
+        ("*:t1", ["chenu:thread:u1:t1", "chenu:thread:u2:t1"]),
+    ])
+    def test_match(self, index, pattern, expected):
+        assert sorted(index.match(pattern)) == expected
+
+    def test_remove_prunes_empty_branches(self, index):
+        index.remove("chenu:sphere:u1:s1")
+        index.remove("chenu:thread:u2:t1")
+        index.remove("legacy-key")
+
+        assert "sphere" not in index._root
+        assert "u2" not in index._root["thread"]
+        assert sorted(index.match("*")) == ["chenu:thread:u1:t1", "chenu:thread:u1:t2:abc"]
+
+
+class TestInvalidation:
+    """Pattern deletes and generation bumps."""
+
+    @pytest.fixture
+    async def filled(self, service):
+        for identity in ("u1", "u2"):
+            for resource in ("t1", "t2"):
+                await service.set(CacheNamespace.THREAD, resource, resource, identity_id=identity)
+        await service.set(CacheNamespace.SPHERE, "s1", "s1", identity_id="u1")
+        return service
+
+    async def values(self, service):
+        return {
+            (ns.value, identity, resource): await service.get(ns, resource, identity_id=identity)
+            for ns, resource in [
+                (CacheNamespace.THREAD, "t1"), (CacheNamespace.THREAD, "t2"), (CacheNamespace.SPHERE, "s1"),
+            ]
+            for identity in ("u1", "u2")
+        }
+
+    def live(self, values):
+        return sorted(key for key, value in values.items() if value is not None)
+
+    async def test_pattern_delete_for_identity(self, filled):
+        assert await filled.invalidate_namespace(CacheNamespace.THREAD, identity_id="u1") == 2
+
+        assert self.live(await self.values(filled)) == [
+            ("sphere", "u1", "s1"), ("thread", "u2", "t1"), ("thread", "u2", "t2"),
+        ]
+
+    async def test_pattern_delete_whole_namespace(self, filled):
+        assert await filled.invalidate_namespace(CacheNamespace.THREAD) == 4
+
+        assert self.live(await self.values(filled)) == [("sphere", "u1", "s1")]
+        assert len(filled.l1_cache) == 1
+
+    async def test_lazy_identity_epoch(self, filled):
+        assert await filled.invalidate_namespace(CacheNamespace.THREAD, identity_id="u1", lazy=True) == 0
+
+        assert self.live(await self.values(filled)) == [
+            ("sphere", "u1", "s1"), ("thread", "u2", "t1"), ("thread", "u2", "t2"),
+        ]
+
+    async def test_lazy_namespace_epoch(self, filled):
+        await filled.invalidate_namespace(CacheNamespace.THREAD, lazy=True)
+
+        assert self.live(await self.values(filled)) == [("sphere", "u1", "s1")]
+
+    async def test_writes_after_epoch_bump_are_visible(self, filled):
+        await filled.invalidate_namespace(CacheNamespace.THREAD, lazy=True)
+        await filled.set(CacheNamespace.THREAD, "t1", "new", identity_id="u1")
+
+        assert await filled.get(CacheNamespace.THREAD, "t1", identity_id="u1") == "new"
+
+    async def test_sharded_epoch_reaches_every_shard(self, clock):
+        service = CacheService(config=CacheConfig(l1_shards=4))
+        for n in range(20):
+            await service.set(CacheNamespace.THREAD, f"t{n}", n, identity_id="u1")
+        await service.invalidate_namespace(CacheNamespace.THREAD, lazy=True)
+
+        for n in range(20):
+            assert await service.get(CacheNamespace.THREAD, f"t{n}", identity_id="u1") is None
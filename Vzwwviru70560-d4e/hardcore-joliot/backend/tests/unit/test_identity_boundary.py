@@ -0,0 +1,233 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+IDENTITY BOUNDARY — Audit Trail Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for the identity boundary audit storage:
+- Indexed ring buffers (eviction, per-identity reads)
+- JSONL sink rotation keeps history; restore reads backwards across
+  rotated files, per record kind
+- Batched writer counts and logs dropped records
+- The middleware flushes the audit trail on app shutdown
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from middleware.identity_boundary import (
+    AuditAction,
+    AuditEntry,
+    AuditWriter,
+    IdentityBoundaryMiddleware,
+    IdentityBoundaryService,
+    JsonlAuditSink,
+    RingLog,
+    ViolationEvent,
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def sink(tmp_path):
+    return JsonlAuditSink(str(tmp_path / "audit.jsonl"))
+
+
+def entry(identity_id: str = "alice", path: str = "/threads") -> AuditEntry:
+    return AuditEntry(action=AuditAction.ACCESS_ALLOWED, identity_id=identity_id, resource_path=path)
+
+
+def record(n: int) -> dict:
+    return {"kind": "audit", "n": n}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RING LOG
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestRingLog:
+    """Fixed-capacity indexed ring buffer."""
+
+    def test_evicts_oldest(self):
+        log = RingLog(3)
+        for n in range(5):
+            log.append(n)
+
+        assert len(log) == 3
+        assert list(log) == [2, 3, 4]
+
+    def test_index_tracks_eviction(self):
+        log = RingLog(3, {"parity": lambda n: n % 2})
+        for n in range(5):
+            log.append(n)
+
+        assert log.latest(10, parity=0) == [2, 4]
+        assert log.latest(10, parity=1) == [3]
+        assert log.latest(1, parity=0) == [4]
+
+    def test_unknown_key_returns_nothing(self):
+        log = RingLog(3, {"parity": lambda n: n % 2})
+        log.append(2)
+
+        assert log.latest(10, parity=1) == []
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# JSONL SINK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestJsonlAuditSink:
+    """Rotation and restore."""
+
+    def test_rotation_keeps_every_file(self, tmp_path):
+        sink = JsonlAuditSink(str(tmp_path / "audit.jsonl"), max_bytes=10)
+        for n in range(4):
+            sink.write_batch([record(n)])
+
+        assert len(sink.rotated_files()) == 4
+        assert [r["n"] for r in sink.read_tail(100)] == [0, 1, 2, 3]
+
+    def test_read_tail_spans_files_newest_last(self, tmp_path):
+        sink = JsonlAuditSink(str(tmp_path / "audit.jsonl"), max_bytes=40)
+        for n in range(0, 10, 2):
+            sink.write_batch([record(n), record(n + 1)])
+
+        assert [r["n"] for r in sink.read_tail(3)] == [7, 8, 9]
+
+    def test_legacy_rotated_file_is_oldest(self, sink):
+        with open(f"{sink.path}.1", "w") as f:
+            f.write('{"kind":"audit","n":-1}\n')
+        sink.write_batch([record(0)])
+
+        assert [r["n"] for r in sink.read_tail(10)] == [-1, 0]
+
+    def test_torn_line_skipped(self, sink):
+        sink.write_batch([record(0)])
+        with open(sink.path, "a") as f:
+            f.write('{"kind":"au')
+
+        assert [r["n"] for r in sink.read_tail(10)] == [0]
+
+    def test_lines_split_across_read_blocks(self, sink, monkeypatch):
+        monkeypatch.setattr(JsonlAuditSink, "READ_BLOCK_BYTES", 7)
+        sink.write_batch([record(n) for n in range(5)])
+
+        assert [r["n"] for r in sink.read_tail(10)] == [0, 1, 2, 3, 4]
+        assert [r["n"] for r in sink.read_tail(2)] == [3, 4]
+
+    def test_read_tail_by_kind(self, tmp_path):
+        sink = JsonlAuditSink(str(tmp_path / "audit.jsonl"), max_bytes=60)
+        sink.write_batch([{"kind": "violation", "n": 0}])
+        for n in range(1, 6):
+            sink.write_batch([record(n)])
+
+        assert [r["n"] for r in sink.read_tail(5, kind="violation")] == [0]
+        assert [r["n"] for r in sink.read_tail(2, kind="audit")] == [4, 5]
+
+    def test_stops_before_older_files(self, tmp_path, monkeypatch):
+        sink = JsonlAuditSink(str(tmp_path / "audit.jsonl"), max_bytes=10)
+        for n in range(4):
+            sink.write_batch([record(n)])
+        opened = []
+        original = JsonlAuditSink._reverse_lines
+        monkeypatch.setattr(
+            JsonlAuditSink, "_reverse_lines",
+            lambda self, path: opened.append(path) or original(self, path),
+        )
+
+        assert [r["n"] for r in sink.read_tail(1)] == [3]
+        assert len(opened) == 2  # Empty live file, then the newest rotated one
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WRITER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestAuditWriter:
+    """Batched background writer."""
+
+    async def test_flush_writes_batches(self, sink):
+        writer = AuditWriter(sink, batch_size=2)
+        for _ in range(5):
+            writer.submit("audit", entry())
+
+        assert await writer.flush() == 5
+        assert len(sink.read_tail(10)) == 5
+        await writer.stop()
+
+    async def test_overflow_is_counted_and_logged(self, sink, caplog):
+        writer = AuditWriter(sink, max_pending=3)
+        with caplog.at_level(logging.WARNING, logger="middleware.identity_boundary"):
+            for n in range(5):
+                writer.submit("audit", entry(path=f"/r/{n}"))
+            await writer.flush()
+
+        assert writer.dropped == 2
+        assert [r["resource_path"] for r in sink.read_tail(10)] == ["/r/2", "/r/3", "/r/4"]
+        messages = [r.getMessage() for r in caplog.records]
+        assert any("Audit queue full" in m for m in messages)
+        assert any("Dropped 2 audit records" in m for m in messages)
+        await writer.stop()
+
+    async def test_failed_batch_retried(self, sink, monkeypatch):
+        def disk_full(records):
+            raise OSError("disk full")
+
+        writer = AuditWriter(sink)
+        writer.submit("audit", entry())
+        monkeypatch.setattr(sink, "write_batch", disk_full)
+
+        assert await writer.flush() == 0
+        assert writer.pending == 1 and writer.failures == 1
+
+        monkeypatch.undo()
+        assert await writer.flush() == 1
+        await writer.stop()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SERVICE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestServicePersistence:
+    """Restore at startup and flush on shutdown."""
+
+    async def test_restart_restores_history(self, sink):
+        service = IdentityBoundaryService(audit_sink=sink)
+        service.log_access(AuditAction.ACCESS_ALLOWED, "alice", "/threads", "GET")
+        await service.close()
+
+        restarted = IdentityBoundaryService(audit_sink=sink)
+        assert [e.identity_id for e in restarted.get_audit_log(identity_id="alice")] == ["alice"]
+
+    async def test_violations_survive_audit_flood(self, sink):
+        service = IdentityBoundaryService(max_audit_entries=5, max_violations=5, audit_sink=sink)
+        service._record_violation(ViolationEvent(requesting_identity="alice", target_identity="bob"))
+        for n in range(50):
+            service.log_access(AuditAction.ACCESS_ALLOWED, "alice", f"/r/{n}", "GET")
+        await service.close()
+
+        restarted = IdentityBoundaryService(max_audit_entries=5, max_violations=5, audit_sink=sink)
+        assert len(restarted.get_violations()) == 1
+        assert [e.resource_path for e in restarted.get_audit_log()] == [f"/r/{n}" for n in range(45, 50)]
+
+    def test_middleware_flushes_on_shutdown(self, sink):
+        service = IdentityBoundaryService(audit_sink=sink)
+        app = FastAPI()
+        app.add_middleware(IdentityBoundaryMiddleware, service=service)
+
+        @app.get("/health")
+        async def health():
+            return {"ok": True}
+
+        with TestClient(app) as client:
+            assert client.get("/health").status_code == 200
+            service.log_access(AuditAction.ACCESS_ALLOWED, "bob", "/threads", "GET")
+            assert sink.read_tail(10) == []
+
+        assert [r["identity_id"] for r in sink.read_tail(10)] == ["bob"]
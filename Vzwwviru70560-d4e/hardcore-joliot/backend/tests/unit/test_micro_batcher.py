@@ -0,0 +1,204 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+MICRO BATCHER — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for coalescing small LLM calls:
+- Size and timer flushes, per-key batches, error fan-out, cancelled awaiters
+- LLMRouter.embed() and complete_batched(): one provider call per batch,
+  budget and TPM reservations handed back when a batch fails or is cancelled
+"""
+
+import asyncio
+
+import pytest
+
+from services.micro_batcher import BatchConfig, MicroBatcher
+from services.llm_router import LLMProvider, LLMRequest, LLMRouter, ProviderConfig
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Recorder:
+    """Dispatch function that records its batches."""
+
+    def __init__(self, error=None):
+        self.batches = []
+        self.error = error
+
+    async def __call__(self, key, items):
+        self.batches.append((key, list(items)))
+        if self.error:
+            raise self.error
+        return [item * 10 if item >= 0 else ValueError(item) for item in items]
+
+
+@pytest.fixture
+def router():
+    router = LLMRouter(batch_config=BatchConfig(max_batch_size=4, max_wait_ms=5))
+    router.register_provider(ProviderConfig(provider=LLMProvider.OPENAI))
+    return router
+
+
+def tpm(router):
+    limiter = router._rate_limiters[LLMProvider.OPENAI]
+    limiter.tokens.refill(limiter.tokens.updated_at)
+    return limiter.tokens
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BATCHER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestMicroBatcher:
+    """Flush policy and result fan-out."""
+
+    async def test_size_flush(self):
+        dispatch = Recorder()
+        batcher = MicroBatcher(dispatch, BatchConfig(max_batch_size=3, max_wait_ms=10_000))
+
+        results = await asyncio.gather(*(batcher.submit("k", n) for n in range(3)))
+
+        assert results == [0, 10, 20]
+        assert dispatch.batches == [("k", [0, 1, 2])]
+        assert batcher.size_flushes == 1
+
+    async def test_timer_flush(self):
+        dispatch = Recorder()
+        batcher = MicroBatcher(dispatch, BatchConfig(max_batch_size=100, max_wait_ms=5))
+
+        assert await asyncio.gather(batcher.submit("k", 1), batcher.submit("k", 2)) == [10, 20]
+        assert batcher.timer_flushes == 1
+
+    async def test_keys_batched_separately(self):
+        dispatch = Recorder()
+        batcher = MicroBatcher(dispatch, BatchConfig(max_batch_size=100, max_wait_ms=5))
+
+        await asyncio.gather(batcher.submit("a", 1), batcher.submit("b", 2), batcher.submit("a", 3))
+
+        assert sorted(dispatch.batches) == [("a", [1, 3]), ("b", [2])]
+
+    async def test_per_item_exception(self):
+        batcher = MicroBatcher(Recorder(), BatchConfig(max_batch_size=2))
+
+        ok, failed = await asyncio.gather(
+            batcher.submit("k", 1), batcher.submit("k", -1), return_exceptions=True
+        )
+
+        assert ok == 10
+        assert isinstance(failed, ValueError)
+
+    async def test_dispatch_error_reaches_every_item(self):
+        batcher = MicroBatcher(Recorder(error=RuntimeError("down")), BatchConfig(max_batch_size=2))
+
+        results = await asyncio.gather(
+            batcher.submit("k", 1), batcher.submit("k", 2), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_cancelled_awaiter_left_out(self):
+        dispatch = Recorder()
+        batcher = MicroBatcher(dispatch, BatchConfig(max_batch_size=100, max_wait_ms=5))
+
+        cancelled = asyncio.create_task(batcher.submit("k", 1))
+        kept = asyncio.create_task(batcher.submit("k", 2))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await kept == 20
+        assert dispatch.batches == [("k", [2])]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EMBEDDINGS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestEmbedBatching:
+    """LLMRouter.embed() through the batcher."""
+
+    async def test_concurrent_embeds_share_one_call(self, router, monkeypatch):
+        calls = []
+        execute = router._execute_embedding_batch
+
+        async def counting(texts, model_spec):
+            calls.append(list(texts))
+            return await execute(texts, model_spec)
+
+        monkeypatch.setattr(router, "_execute_embedding_batch", counting)
+        responses = await asyncio.gather(
+            *(router.embed(f"text {n}", identity_id="user-1") for n in range(4))
+        )
+
+        assert len(calls) == 1
+        assert all(r.batch_size == 4 for r in responses)
+        assert router.budget_ledger.local_usage("user-1")["daily_tokens"] == sum(
+            r.input_tokens for r in responses
+        )
+
+    async def test_failed_batch_returns_reservations(self, router, monkeypatch):
+        async def down(texts, model_spec):
+            raise ConnectionError("provider down")
+
+        monkeypatch.setattr(router, "_execute_embedding_batch", down)
+        results = await asyncio.gather(
+            *(router.embed(f"text {n}", identity_id="user-1") for n in range(3)),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert tpm(router).level == tpm(router).capacity
+        assert router.budget_ledger.local_usage("user-1")["daily_tokens"] == 0
+
+    async def test_cancelled_batch_returns_reservations(self, router, monkeypatch):
+        started = asyncio.Event()
+
+        async def hang(texts, model_spec):
+            started.set()
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(router, "_execute_embedding_batch", hang)
+        task = asyncio.create_task(router.embed("text", identity_id="user-1"))
+        await started.wait()
+        assert tpm(router).level < tpm(router).capacity
+
+        for batch in list(router._embedding_batcher._inflight):
+            batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        assert tpm(router).level == tpm(router).capacity
+        assert router.budget_ledger.local_usage("user-1")["daily_tokens"] == 0
+
+
+class TestCompletionBatching:
+    """LLMRouter.complete_batched() through the batcher."""
+
+    async def test_cancelled_batch_returns_reservations(self, router, monkeypatch):
+        started = asyncio.Event()
+
+        async def hang(requests, model_id, provider, model_spec):
+            started.set()
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(router, "_execute_completion_batch", hang)
+        request = LLMRequest(
+            messages=[{"role": "user", "content": "Hi"}],
+            identity_id="user-1",
+            preferred_provider=LLMProvider.OPENAI
+        )
+        task = asyncio.create_task(router.complete_batched(request))
+        await started.wait()
+        assert tpm(router).level < tpm(router).capacity
+
+        for batch in list(router._completion_batcher._inflight):
+            batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        assert tpm(router).level == tpm(router).capacity
+        assert router.budget_ledger.local_usage("user-1")["daily_tokens"] == 0
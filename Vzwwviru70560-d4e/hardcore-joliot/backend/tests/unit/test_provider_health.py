@@ -0,0 +1,300 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+PROVIDER HEALTH — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for live provider health in the LLM Router:
+- EWMA latency / error rate and windowed percentiles
+- Circuit breaker: trip, cooldown with backoff, half-open probes
+- Router skips open circuits and fails over
+- Hedged requests: second provider after the primary's p95, winner billed
+"""
+
+import asyncio
+
+import pytest
+
+from services.provider_health import (
+    CircuitBreaker,
+    CircuitState,
+    HealthConfig,
+    LatencyStats,
+    ProviderHealth,
+)
+from services.llm_router import (
+    LLMProvider,
+    LLMRequest,
+    LLMRouter,
+    LLMRouterError,
+    ProviderConfig,
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+CONFIG = HealthConfig(failure_threshold=3, open_seconds=30.0, max_open_seconds=100.0, min_samples=5)
+
+
+class Providers:
+    """Replacement for _execute_completion with per-provider delay/failure."""
+
+    def __init__(self, router):
+        self.router = router
+        self.delays = {}
+        self.errors = {}
+        self.calls = []
+        self.cancelled = []
+
+    async def __call__(self, request, model_id, provider, model_spec):
+        self.calls.append(provider)
+        try:
+            await asyncio.sleep(self.delays.get(provider, 0.0))
+        except asyncio.CancelledError:
+            self.cancelled.append(provider)
+            raise
+        if provider in self.errors:
+            raise self.errors[provider]
+        return self.router._mock_response(request, model_id, provider, model_spec)
+
+
+@pytest.fixture
+def router(monkeypatch):
+    router = LLMRouter(health=ProviderHealth(CONFIG))
+    router.register_provider(ProviderConfig(provider=LLMProvider.ANTHROPIC))
+    router.register_provider(ProviderConfig(provider=LLMProvider.OPENAI))
+    router.providers = Providers(router)
+    monkeypatch.setattr(router, "_execute_completion", router.providers)
+    return router
+
+
+def request(**kwargs) -> LLMRequest:
+    kwargs.setdefault("preferred_provider", LLMProvider.ANTHROPIC)
+    return LLMRequest(messages=[{"role": "user", "content": "Hi"}], identity_id="user-1", **kwargs)
+
+
+def seed_latency(router, model_id, provider=LLMProvider.ANTHROPIC, latency_ms=10.0):
+    for _ in range(CONFIG.min_samples):
+        router.health.record_success(provider.value, model_id, latency_ms)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# STATS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestLatencyStats:
+    """EWMA and percentiles."""
+
+    def test_ewma(self):
+        stats = LatencyStats(alpha=0.5)
+        stats.record(100)
+        stats.record(200)
+        stats.record(0, ok=False)
+
+        assert stats.ewma_latency_ms == 75
+        assert stats.ewma_error_rate == 0.5
+
+    def test_nearest_rank_percentiles(self):
+        stats = LatencyStats()
+        for latency in range(1, 101):
+            stats.record(latency)
+
+        assert stats.percentile(0.5) == 50
+        assert stats.p95_ms == 95
+
+    def test_window_forgets_old_samples(self):
+        stats = LatencyStats(window_size=10)
+        for _ in range(10):
+            stats.record(1000)
+        for _ in range(10):
+            stats.record(10)
+
+        assert stats.p95_ms == 10
+        assert stats.samples == 20
+
+    def test_model_stats_need_min_samples(self):
+        health = ProviderHealth(CONFIG)
+        for _ in range(CONFIG.min_samples - 1):
+            health.record_success("anthropic", "m", 10)
+        assert health.p95_ms("m") is None
+
+        health.record_success("anthropic", "m", 10)
+        assert health.p95_ms("m") == 10
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CIRCUIT BREAKER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestCircuitBreaker:
+    """Closed -> open -> half-open -> closed."""
+
+    def trip(self, breaker, now=0.0):
+        stats = LatencyStats()
+        for _ in range(breaker.failure_threshold):
+            breaker.on_dispatch(now)
+            breaker.on_failure(stats, now)
+
+    def test_trips_on_consecutive_failures(self):
+        breaker = CircuitBreaker(CONFIG)
+        stats = LatencyStats()
+        breaker.on_failure(stats, 0.0)
+        breaker.on_failure(stats, 0.0)
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.on_failure(stats, 0.0)
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.available(29.9)
+        assert breaker.available(30.0)
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(CONFIG)
+        stats = LatencyStats()
+        breaker.on_failure(stats, 0.0)
+        breaker.on_failure(stats, 0.0)
+        breaker.on_success()
+        breaker.on_failure(stats, 0.0)
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_trips_on_error_rate(self):
+        breaker = CircuitBreaker(CONFIG, failure_threshold=100)
+        stats = LatencyStats(alpha=0.5)
+        for ok in (True, False, True, False, False):
+            stats.record(10, ok=ok)
+            if ok:
+                breaker.on_success()
+            else:
+                breaker.on_failure(stats, 0.0)
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_admits_one_probe(self):
+        breaker = CircuitBreaker(CONFIG)
+        self.trip(breaker)
+
+        breaker.on_dispatch(30.0)
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert not breaker.available(30.0)
+
+        breaker.on_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.trips == 0
+
+    def test_failed_probe_doubles_cooldown(self):
+        breaker = CircuitBreaker(CONFIG)
+        self.trip(breaker)
+
+        breaker.on_dispatch(30.0)
+        breaker.on_failure(LatencyStats(), 30.0)
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.cooldown_seconds == 60
+        assert not breaker.available(89.9)
+        assert breaker.available(90.0)
+
+    def test_cooldown_capped(self):
+        breaker = CircuitBreaker(CONFIG)
+        breaker.trips = 10
+
+        assert breaker.cooldown_seconds == CONFIG.max_open_seconds
+
+    def test_abandoned_probe_frees_slot(self):
+        breaker = CircuitBreaker(CONFIG)
+        self.trip(breaker)
+        breaker.on_dispatch(30.0)
+
+        breaker.on_abandon()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.available(30.0)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ROUTER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestRouterFailover:
+    """The router feeds and honours the breakers."""
+
+    async def test_open_circuit_is_skipped(self, router):
+        router.providers.errors[LLMProvider.ANTHROPIC] = ConnectionError("down")
+        for _ in range(CONFIG.failure_threshold):
+            response = await router.complete(request())
+            assert response.provider == LLMProvider.OPENAI
+
+        assert router.health.breaker("anthropic").state == CircuitState.OPEN
+        router.providers.calls.clear()
+
+        response = await router.complete(request())
+        assert response.provider == LLMProvider.OPENAI
+        assert router.providers.calls == [LLMProvider.OPENAI]
+
+    async def test_all_open_fails(self, router):
+        for provider in (LLMProvider.ANTHROPIC, LLMProvider.OPENAI):
+            router.providers.errors[provider] = ConnectionError("down")
+
+        with pytest.raises(LLMRouterError):
+            await router.complete(request())
+        assert router.budget_ledger.local_usage("user-1")["daily_tokens"] == 0
+
+
+class TestHedging:
+    """A slow primary is raced against a fallback after its p95."""
+
+    @pytest.fixture
+    def model_id(self, router):
+        model_id, _ = router.select_model(request())
+        seed_latency(router, model_id)
+        return model_id
+
+    async def test_hedge_wins_when_primary_slow(self, router, model_id):
+        router.providers.delays[LLMProvider.ANTHROPIC] = 5.0
+
+        response = await router.complete(request(hedge=True))
+        await asyncio.sleep(0)
+
+        assert response.provider == LLMProvider.OPENAI
+        assert router.providers.cancelled == [LLMProvider.ANTHROPIC]
+        assert router.get_stats()["hedged_requests"] == 1
+        assert router.get_stats()["hedge_wins"] == 1
+        assert router.budget_ledger.local_usage("user-1")["daily_tokens"] == response.total_tokens
+
+    async def test_abandoned_primary_counts_as_slow(self, router, model_id):
+        router.providers.delays[LLMProvider.ANTHROPIC] = 5.0
+
+        await router.complete(request(hedge=True))
+        await asyncio.sleep(0)
+
+        assert router.health.model_stats(model_id).samples == CONFIG.min_samples + 1
+        assert router.health.model_stats(model_id).percentile(1.0) > 10
+
+    async def test_fast_primary_not_hedged(self, router, model_id):
+        response = await router.complete(request(hedge=True))
+
+        assert response.provider == LLMProvider.ANTHROPIC
+        assert router.providers.calls == [LLMProvider.ANTHROPIC]
+        assert router.get_stats()["hedged_requests"] == 0
+
+    async def test_hedge_failure_falls_back_to_primary(self, router, model_id):
+        router.providers.delays[LLMProvider.ANTHROPIC] = 0.1
+        router.providers.errors[LLMProvider.OPENAI] = ConnectionError("down")
+
+        response = await router.complete(request(hedge=True))
+
+        assert response.provider == LLMProvider.ANTHROPIC
+        assert router.get_stats()["hedge_wins"] == 0
+
+    async def test_no_hedge_without_samples(self, router):
+        router.providers.delays[LLMProvider.ANTHROPIC] = 0.05
+
+        response = await router.complete(request(hedge=True))
+
+        assert response.provider == LLMProvider.ANTHROPIC
+        assert router.get_stats()["hedged_requests"] == 0
+
+    async def test_hedging_is_opt_in(self, router, model_id):
+        router.providers.delays[LLMProvider.ANTHROPIC] = 0.05
+
+        await router.complete(request())
+
+        assert router.get_stats()["hedged_requests"] == 0
@@ -0,0 +1,182 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+PROVIDER LIMITS — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for the LLM provider RPM/TPM token buckets:
+- Continuous refill and wait times
+- Immediate admission, waiting with a deadline, priority lanes
+- Settling reservations against actual usage
+"""
+
+import asyncio
+import types
+
+import pytest
+
+from services import provider_limits
+from services.provider_limits import ProviderRateLimiter, RequestPriority, TokenBucket
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=1000.0)
+    clock.monotonic = lambda: clock.now
+    monkeypatch.setattr(provider_limits, "time", clock)
+    return clock
+
+
+def fast_limiter(rpm: int = 2, tpm: int = 1000, per_seconds: float = 0.1) -> ProviderRateLimiter:
+    """Limiter whose buckets refill in per_seconds instead of a minute."""
+    limiter = ProviderRateLimiter(rpm=rpm, tpm=tpm)
+    limiter.requests = TokenBucket(rpm, per_seconds)
+    limiter.tokens = TokenBucket(tpm, per_seconds)
+    return limiter
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TOKEN BUCKET
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestTokenBucket:
+    """Continuous refill."""
+
+    def test_refill_is_capped(self, clock):
+        bucket = TokenBucket(60)
+        bucket.take(60)
+
+        bucket.refill(clock.now + 30)
+        assert bucket.level == pytest.approx(30)
+        bucket.refill(clock.now + 600)
+        assert bucket.level == 60
+
+    def test_wait_time(self, clock):
+        bucket = TokenBucket(60)
+        bucket.take(60)
+
+        assert bucket.wait_time(10, clock.now) == pytest.approx(10)
+        assert bucket.wait_time(0, clock.now) == 0
+
+    def test_oversized_request_waits_for_full_bucket(self, clock):
+        bucket = TokenBucket(60)
+        bucket.take(30)
+
+        assert bucket.wait_time(1000, clock.now) == pytest.approx(30)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ADMISSION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestAdmission:
+    """try_acquire / acquire."""
+
+    def test_both_buckets_must_cover(self, clock):
+        limiter = ProviderRateLimiter(rpm=2, tpm=100)
+
+        assert limiter.try_acquire(60)
+        assert not limiter.try_acquire(60)
+        assert limiter.try_acquire(40)
+        assert not limiter.try_acquire(0)
+
+    async def test_acquire_fails_fast_past_deadline(self, clock):
+        limiter = ProviderRateLimiter(rpm=1, tpm=100)
+        limiter.try_acquire(10)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await limiter.acquire(10, timeout=1.0)
+        assert limiter.timeouts == 1
+
+    async def test_acquire_waits_for_refill(self):
+        limiter = fast_limiter(rpm=1)
+        assert limiter.try_acquire(10)
+
+        waited = await limiter.acquire(10, timeout=2.0)
+        assert waited > 0
+        assert limiter.waited == 1
+
+    async def test_interactive_served_before_batch(self):
+        limiter = fast_limiter(rpm=1, per_seconds=0.05)
+        limiter.try_acquire(0)
+        order = []
+
+        async def request(priority):
+            await limiter.acquire(0, priority=priority, timeout=2.0)
+            order.append(priority)
+
+        batch = asyncio.create_task(request(RequestPriority.BATCH))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request(RequestPriority.INTERACTIVE))
+        await asyncio.gather(batch, interactive)
+
+        assert order == [RequestPriority.INTERACTIVE, RequestPriority.BATCH]
+
+    async def test_no_jumping_ahead_of_queue(self):
+        limiter = fast_limiter(rpm=1)
+        limiter.try_acquire(0)
+        waiter = asyncio.create_task(limiter.acquire(0, timeout=2.0))
+        await asyncio.sleep(0)
+
+        assert not limiter.try_acquire(0, RequestPriority.STANDARD)
+        await waiter
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SETTLE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestSettle:
+    """Reservations corrected with actual usage."""
+
+    def test_overestimate_refunded(self, clock):
+        limiter = ProviderRateLimiter(rpm=10, tpm=1000)
+        limiter.try_acquire(500)
+
+        limiter.settle(500, 200)
+        assert limiter.tokens.level == pytest.approx(800)
+
+    def test_refund_never_exceeds_capacity(self, clock):
+        limiter = ProviderRateLimiter(rpm=10, tpm=1000)
+        limiter.try_acquire(500)
+
+        # Bucket refilled completely before the request finished
+        clock.now += 60
+        limiter.settle(500, 0)
+        assert limiter.tokens.level == 1000
+
+    def test_refund_capped_by_refill(self, clock):
+        limiter = ProviderRateLimiter(rpm=10, tpm=1000)
+        limiter.try_acquire(500)
+
+        clock.now += 12  # 200 tokens refilled
+        limiter.settle(500, 100)
+        assert limiter.tokens.level == 1000
+
+    def test_underestimate_becomes_debt(self, clock):
+        limiter = ProviderRateLimiter(rpm=10, tpm=1000)
+        limiter.try_acquire(900)
+
+        limiter.settle(900, 1200)
+        assert limiter.tokens.level == pytest.approx(-200)
+        assert not limiter.try_acquire(1)
+
+    def test_oversized_reservation_settles_against_capacity(self, clock):
+        limiter = ProviderRateLimiter(rpm=10, tpm=1000)
+        limiter.try_acquire(5000)  # Only the capacity was taken
+        assert limiter.tokens.level == 0
+
+        limiter.settle(5000, 1200)
+        assert limiter.tokens.level == pytest.approx(-200)
+
+    async def test_refund_wakes_queued_request(self):
+        limiter = fast_limiter(tpm=100, per_seconds=60.0)
+        limiter.try_acquire(100)
+        waiter = asyncio.create_task(limiter.acquire(50, timeout=60.0))
+        await asyncio.sleep(0.01)
+
+        limiter.settle(100, 40)
+        await asyncio.wait_for(waiter, 0.5)
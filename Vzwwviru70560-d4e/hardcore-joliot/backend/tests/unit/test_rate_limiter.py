@@ -0,0 +1,305 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+RATE LIMITER — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for the rate limiting middleware:
+- GCRA, sliding window counter and sliding log against a controlled clock
+- All-or-nothing checks: denied requests consume no quota
+- Non-positive limits and windows rejected when a rule is built
+- Bounded in-memory state
+- The Redis Lua script (fakeredis) agrees with the in-memory algorithms
+"""
+
+import types
+
+import fakeredis
+import pytest
+
+from middleware import rate_limiter
+from middleware.rate_limiter import (
+    InMemoryStorage,
+    RateLimiter,
+    RateLimitRule,
+    RateLimitSpec,
+    RateLimitStorage,
+    RateLimitStrategy,
+    RedisStorage,
+)
+
+
+# Aligned on every window used below
+T0 = 6_000_000.0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=T0)
+    clock.time = lambda: clock.now
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+@pytest.fixture
+async def limiter():
+    limiter = RateLimiter(InMemoryStorage())
+    yield limiter
+    await limiter.close()
+
+
+@pytest.fixture
+async def redis_limiter():
+    limiter = RateLimiter(RedisStorage(client=fakeredis.FakeAsyncRedis()))
+    yield limiter
+    await limiter.close()
+
+
+def rule(strategy, limit=3, window=60, **kwargs):
+    return RateLimitRule(name="t", limit=limit, window_seconds=window, strategy=strategy, **kwargs)
+
+
+async def allowed(limiter, count, identifier="u1"):
+    """How many of count consecutive requests were allowed"""
+    return sum([(await limiter.check("t", identifier)).allowed for _ in range(count)])
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# GCRA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestGCRA:
+    """One timestamp of state, smooth refill."""
+
+    async def test_burst_then_refill_one_interval(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.GCRA, limit=3, window=60))
+        assert await allowed(limiter, 3) == 3
+
+        denied = await limiter.check("t", "u1")
+        assert not denied.allowed
+        assert denied.retry_after == 20
+
+        clock.now += 20
+        assert await allowed(limiter, 2) == 1
+
+    async def test_denials_do_not_push_back_retry(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.GCRA, limit=3, window=60))
+        await allowed(limiter, 3)
+
+        for _ in range(10):
+            assert (await limiter.check("t", "u1")).retry_after == 20
+        clock.now += 20
+        assert (await limiter.check("t", "u1")).allowed
+
+    async def test_token_bucket_maps_to_gcra(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.TOKEN_BUCKET, limit=2, window=10))
+        assert await allowed(limiter, 3) == 2
+        clock.now += 5
+        assert await allowed(limiter, 1) == 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SLIDING WINDOWS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestSlidingWindow:
+    """Weighted two-window counter."""
+
+    async def test_previous_window_is_weighted(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.SLIDING_WINDOW, limit=10, window=60))
+        assert await allowed(limiter, 11) == 10
+
+        # Halfway through the next window, half of the previous count remains
+        clock.now += 90
+        assert await allowed(limiter, 10) == 5
+
+    async def test_retry_after_is_when_a_slot_frees(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.SLIDING_WINDOW, limit=10, window=60))
+        await allowed(limiter, 10)
+
+        retry = (await limiter.check("t", "u1")).retry_after
+        clock.now += retry - 1
+        assert not (await limiter.check("t", "u1")).allowed
+        clock.now += 1
+        assert (await limiter.check("t", "u1")).allowed
+
+    async def test_old_windows_forgotten(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.SLIDING_WINDOW, limit=10, window=60))
+        await allowed(limiter, 10)
+        clock.now += 120
+        assert await allowed(limiter, 10) == 10
+
+
+class TestSlidingLog:
+    """Exact log, bounded by the limit."""
+
+    async def test_exact_expiry(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.SLIDING_WINDOW_LOG, limit=3, window=10))
+        for _ in range(3):
+            assert (await limiter.check("t", "u1")).allowed
+            clock.now += 1
+
+        clock.now = T0 + 9.9
+        assert not (await limiter.check("t", "u1")).allowed
+        clock.now = T0 + 10.01
+        assert (await limiter.check("t", "u1")).allowed
+
+    async def test_log_bounded_by_limit(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.SLIDING_WINDOW_LOG, limit=3, window=10))
+        await allowed(limiter, 50)
+
+        entry = limiter._storage._shards[limiter._storage._shard("t:{u1}")]["t:{u1}"]
+        assert len(entry.requests) == 3
+
+
+class TestFixedWindow:
+    """Counter reset at the window edge."""
+
+    async def test_resets(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.FIXED_WINDOW, limit=2, window=10))
+        assert await allowed(limiter, 3) == 2
+        clock.now += 10
+        assert await allowed(limiter, 3) == 2
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ALL OR NOTHING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestAllOrNothing:
+    """A denied request is not recorded against any limit."""
+
+    async def test_burst_denial_keeps_main_quota(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.FIXED_WINDOW, limit=10, window=60, burst_limit=2, burst_window=1))
+        assert await allowed(limiter, 5) == 2
+
+        clock.now += 1
+        result = await limiter.check("t", "u1")
+        assert result.allowed
+        assert result.remaining == 7
+
+    async def test_check_many_denial_consumes_nothing(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.FIXED_WINDOW, limit=1, window=60))
+        await limiter.check("t", "u1")
+
+        results = await limiter.check_many([("t", "u2", None), ("t", "u1", None)])
+        assert [r.allowed for r in results] == [True, False]
+        assert (await limiter.check("t", "u2")).allowed
+
+    async def test_peek_does_not_consume(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.GCRA, limit=1, window=60))
+        for _ in range(3):
+            assert (await limiter.check("t", "u1", consume=False)).allowed
+        assert (await limiter.check("t", "u1")).allowed
+
+    async def test_reset_clears_burst_key(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.FIXED_WINDOW, limit=10, window=60, burst_limit=1, burst_window=60))
+        await limiter.check("t", "u1")
+        await limiter.reset("t", "u1")
+
+        assert len(limiter._storage) == 0
+        assert (await limiter.check("t", "u1")).allowed
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VALIDATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestValidation:
+    """Limits the algorithms would divide by are rejected up front."""
+
+    @pytest.mark.parametrize("strategy", list(RateLimitStrategy))
+    @pytest.mark.parametrize("limit, window", [(0, 60), (-1, 60), (3, 0), (3, -5)])
+    def test_rule_rejects_non_positive(self, strategy, limit, window):
+        with pytest.raises(ValueError):
+            rule(strategy, limit=limit, window=window)
+
+    def test_burst_rejects_non_positive(self):
+        with pytest.raises(ValueError, match="burst"):
+            rule(RateLimitStrategy.GCRA, burst_limit=-1)
+        with pytest.raises(ValueError, match="burst"):
+            rule(RateLimitStrategy.GCRA, burst_limit=2, burst_window=-1)
+
+    def test_spec_rejects_non_positive(self):
+        with pytest.raises(ValueError, match="positive limit"):
+            RateLimitSpec("k", RateLimitStrategy.GCRA, 0, 60)
+        with pytest.raises(ValueError, match="positive window"):
+            RateLimitSpec("k", RateLimitStrategy.GCRA, 3, 0)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# STORAGE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestInMemoryStorage:
+    """Bounded state."""
+
+    async def test_expired_entries_swept(self, limiter, clock):
+        limiter.add_rule(rule(RateLimitStrategy.GCRA, limit=10, window=60))
+        for n in range(100):
+            await limiter.check("t", f"u{n}")
+        assert len(limiter._storage) == 100
+
+        clock.now += 61
+        assert await limiter._storage.cleanup_expired() == 100
+        assert len(limiter._storage) == 0
+
+    def test_storage_is_abstract(self):
+        with pytest.raises(TypeError):
+            RateLimitStorage()
+
+
+class TestRedisStorage:
+    """The Lua script mirrors the in-memory algorithms."""
+
+    @pytest.mark.parametrize("strategy", [
+        RateLimitStrategy.GCRA,
+        RateLimitStrategy.SLIDING_WINDOW,
+        RateLimitStrategy.SLIDING_WINDOW_LOG,
+        RateLimitStrategy.FIXED_WINDOW,
+    ])
+    async def test_matches_in_memory(self, redis_limiter, limiter, strategy):
+        for target in (redis_limiter, limiter):
+            target.add_rule(rule(strategy, limit=5, window=3600, burst_limit=3, burst_window=3600))
+
+        for _ in range(6):
+            expected = await limiter.check("t", "u1")
+            got = await redis_limiter.check("t", "u1")
+            assert (got.allowed, got.remaining) == (expected.allowed, expected.remaining)
+
+    async def test_keys_share_hash_tag_and_expire(self, redis_limiter):
+        redis_limiter.add_rule(rule(RateLimitStrategy.GCRA, limit=5, window=60, burst_limit=2, burst_window=1))
+        await redis_limiter.check("t", "user:42")
+
+        client = redis_limiter._storage._client
+        keys = sorted(await client.keys())
+        assert keys == [b"ratelimit:t:{user:42}", b"ratelimit:t:{user:42}:burst"]
+        for key in keys:
+            assert 0 < await client.pttl(key) <= 60_000
+
+    async def test_check_many_across_slots_consumes_nothing_on_denial(self, redis_limiter):
+        redis_limiter.add_rule(rule(RateLimitStrategy.FIXED_WINDOW, limit=1, window=60))
+        await redis_limiter.check("t", "u1")
+
+        results = await redis_limiter.check_many([("t", "u2", None), ("t", "u1", None)])
+        assert [r.allowed for r in results] == [True, False]
+        assert (await redis_limiter.check("t", "u2")).allowed
+
+    async def test_check_many_across_slots_consumes_all(self, redis_limiter):
+        redis_limiter.add_rule(rule(RateLimitStrategy.FIXED_WINDOW, limit=1, window=60))
+
+        results = await redis_limiter.check_many([("t", "u1", None), ("t", "u2", None)])
+        assert all(r.allowed and r.remaining == 0 for r in results)
+        assert not (await redis_limiter.check("t", "u1")).allowed
+        assert not (await redis_limiter.check("t", "u2")).allowed
+
+    async def test_reset(self, redis_limiter):
+        redis_limiter.add_rule(rule(RateLimitStrategy.GCRA, limit=1, window=60, burst_limit=1, burst_window=60))
+        await redis_limiter.check("t", "u1")
+        await redis_limiter.reset("t", "u1")
+
+        assert await redis_limiter._storage._client.keys() == []
+        assert (await redis_limiter.check("t", "u1")).allowed
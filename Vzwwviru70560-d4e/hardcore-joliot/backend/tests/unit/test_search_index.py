@@ -0,0 +1,173 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+SEARCH INDEX — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for the local BM25 search index:
+- Folding, ranking, prefix and typo matching, facets
+- Identity scoping of reads and ownership of writes
+- Snapshots (round trip, one slot per process)
+"""
+
+import pytest
+
+from services.search_index import (
+    SearchDocument,
+    SearchIndex,
+    claim_snapshot_path,
+    fold_text,
+    tokenize,
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.upsert(SearchDocument(
+        id="ds_1", resource_type="dataspace", title="Rénovation Cuisine",
+        description="Projet de rénovation complète", tags=["construction"],
+        sphere_id="business",
+    ))
+    index.upsert(SearchDocument(
+        id="doc_1", resource_type="document", title="Budget prévisionnel",
+        description="Budget de la rénovation", tags=["finance"],
+        sphere_id="business",
+    ))
+    index.upsert(SearchDocument(
+        id="th_alice", resource_type="thread", title="Private planning",
+        body="kitchen renovation notes", identity_id="alice", sphere_id="personal",
+    ))
+    index.upsert(SearchDocument(
+        id="th_bob", resource_type="thread", title="Bob planning",
+        identity_id="bob", sphere_id="personal",
+    ))
+    return index
+
+
+def ids(found):
+    return [result["id"] for result in found["results"]]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEXT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestText:
+    """Folding and tokenization."""
+
+    def test_fold_accents_and_case(self):
+        assert fold_text("Rénovation ÉTÉ") == "renovation ete"
+
+    def test_stopwords_removed(self):
+        assert tokenize("Le budget de la maison") == ["budget", "maison"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SEARCH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestSearch:
+    """Ranking, matching and facets."""
+
+    def test_title_outranks_description(self, index):
+        assert ids(index.search("renovation")) == ["ds_1", "doc_1"]
+
+    def test_prefix_and_typo(self, index):
+        assert ids(index.search("renov")) == ["ds_1", "doc_1"]
+        assert ids(index.search("renovaton")) == ["ds_1", "doc_1"]
+        assert ids(index.search("renovaton", fuzzy=False)) == []
+
+    def test_all_words_must_match(self, index):
+        assert ids(index.search("budget renovation")) == ["doc_1"]
+
+    def test_filters_and_facets(self, index):
+        found = index.search("renovation", resource_types=["document"])
+        assert ids(found) == ["doc_1"]
+        assert found["facets"]["resource_type"] == {"document": 1}
+
+    def test_pagination(self, index):
+        found = index.search("renovation", limit=1, offset=1)
+        assert ids(found) == ["doc_1"]
+        assert found["total"] == 2
+
+    def test_suggest(self, index):
+        suggestions = index.suggest("budg")
+        assert suggestions[0] == {"text": "Budget prévisionnel", "type": "document", "id": "doc_1"}
+
+
+class TestIdentityScope:
+    """Documents are visible to their identity, shared ones to everyone."""
+
+    def test_private_document_hidden_from_others(self, index):
+        assert ids(index.search("planning", identity_id="alice")) == ["th_alice"]
+        assert ids(index.search("planning", identity_id="bob")) == ["th_bob"]
+        assert ids(index.search("planning")) == []
+
+    def test_shared_documents_visible_to_all(self, index):
+        assert ids(index.search("budget", identity_id="alice")) == ["doc_1"]
+
+    def test_suggestions_scoped(self, index):
+        assert index.suggest("private", identity_id="bob") == []
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WRITES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestOwnership:
+    """Only the owning identity can change a document."""
+
+    def test_owner_can_patch_and_append(self, index):
+        assert index.patch("th_alice", identity_id="alice", title="Holiday planning")
+        assert index.append("th_alice", "book flights", identity_id="alice")
+        assert ids(index.search("flights", identity_id="alice")) == ["th_alice"]
+        assert index.get("th_alice").title == "Holiday planning"
+
+    def test_other_identity_refused(self, index):
+        assert not index.patch("th_alice", identity_id="bob", title="Hijacked")
+        assert not index.append("th_alice", "injected", identity_id="bob")
+        assert not index.remove("th_alice", identity_id="bob")
+        assert index.get("th_alice").title == "Private planning"
+        assert ids(index.search("injected", identity_id="alice")) == []
+
+    def test_shared_document_not_writable_by_users(self, index):
+        assert not index.patch("ds_1", identity_id="alice", title="Retitled")
+        assert index.get("ds_1").title == "Rénovation Cuisine"
+
+    def test_patch_cannot_change_owner(self, index):
+        index.patch("th_alice", identity_id="alice", title="Mine")
+        assert index.get("th_alice").identity_id == "alice"
+
+    def test_remove(self, index):
+        assert index.remove("th_alice", identity_id="alice")
+        assert "th_alice" not in index
+        assert ids(index.search("kitchen", identity_id="alice")) == []
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PERSISTENCE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestPersistence:
+    """Snapshots."""
+
+    def test_round_trip(self, index, tmp_path):
+        path = str(tmp_path / "index.json")
+        assert index.save(path)
+
+        loaded = SearchIndex(path=path)
+        assert loaded.load()
+        assert len(loaded) == len(index)
+        assert ids(loaded.search("renovation")) == ids(index.search("renovation"))
+        assert ids(loaded.search("planning", identity_id="alice")) == ["th_alice"]
+
+    def test_each_process_slot_is_distinct(self, tmp_path):
+        base = str(tmp_path / "search_index.json")
+        first = claim_snapshot_path(base)
+        second = claim_snapshot_path(base)
+        assert first.endswith("search_index.0.json")
+        assert second.endswith("search_index.1.json")
@@ -0,0 +1,219 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+SEARCH ROUTES — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for the search index hooks in the threads / dataspaces routers:
+- Ownership comes from the resource store, not the per-worker index
+- Writes are refused (HTTP 403) on another identity's resource, and
+  resources missing from the store are not found (HTTP 404)
+- Index updates only happen for the owner
+- Archived resources leave the index
+- The app lifespan loads, seeds, autosaves and flushes the index
+"""
+
+import uuid
+
+import pytest
+from fastapi import FastAPI, Header
+from fastapi.testclient import TestClient
+from typing import Optional
+
+from config import get_db
+from routers import dataspaces, search, threads
+from routers.auth import get_current_user
+import services.search_index as search_index
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _user_from_header(x_user: Optional[str] = Header(None)):
+    return {"id": x_user} if x_user else None
+
+
+@pytest.fixture
+def index(monkeypatch):
+    index = search_index.SearchIndex()
+    monkeypatch.setattr(search_index, "_search_index", index)
+    return index
+
+
+class FakeStore:
+    """Session double remembering the owner of each inserted row."""
+
+    def __init__(self):
+        self.owners = {}
+
+    async def execute(self, statement):
+        values = statement.compile().params
+        self.owners[values["id"]] = values["user_id"]
+
+    async def scalar(self, statement):
+        (resource_id,) = statement.compile().params.values()
+        return self.owners.get(resource_id)
+
+
+@pytest.fixture
+def store():
+    return FakeStore()
+
+
+@pytest.fixture
+def client(index, store):
+    app = FastAPI()
+    app.include_router(threads.router, prefix="/threads")
+    app.include_router(dataspaces.router, prefix="/dataspaces")
+    app.include_router(search.router, prefix="/search")
+    app.dependency_overrides[get_current_user] = _user_from_header
+    app.dependency_overrides[get_db] = lambda: store
+    return TestClient(app)
+
+
+ALICE = {"X-User": "alice"}
+BOB = {"X-User": "bob"}
+
+
+@pytest.fixture
+def alice_thread(client):
+    response = client.post("/threads", headers=ALICE, json={
+        "title": "Kitchen renovation",
+        "founding_intent": "Plan the kitchen works",
+        "sphere_id": "personal",
+    })
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+def search_ids(client, query, headers):
+    response = client.get("/search", params={"q": query}, headers=headers)
+    return [result["id"] for result in response.json()["data"]["results"]]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# THREADS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestThreadRoutes:
+    """Thread writes and the index."""
+
+    def test_created_thread_searchable_by_owner_only(self, client, alice_thread):
+        assert search_ids(client, "kitchen", ALICE) == [alice_thread]
+        assert search_ids(client, "kitchen", BOB) == []
+
+    def test_created_thread_recorded_in_store(self, store, alice_thread):
+        assert store.owners == {alice_thread: "alice"}
+
+    def test_other_identity_cannot_retitle(self, client, index, alice_thread):
+        response = client.patch(f"/threads/{alice_thread}", headers=BOB, json={"title": "Hijacked"})
+        assert response.status_code == 403
+        assert index.get(alice_thread).title == "Kitchen renovation"
+
+    def test_other_identity_cannot_inject_events(self, client, alice_thread):
+        response = client.post(f"/threads/{alice_thread}/events", headers=BOB, json={
+            "event_type": "message",
+            "content": "injected phishing link",
+        })
+        assert response.status_code == 403
+        assert search_ids(client, "phishing", ALICE) == []
+
+    def test_owner_events_are_searchable(self, client, alice_thread):
+        response = client.post(f"/threads/{alice_thread}/events", headers=ALICE, json={
+            "event_type": "message",
+            "content": "order the countertop",
+        })
+        assert response.status_code == 200
+        assert search_ids(client, "countertop", ALICE) == [alice_thread]
+
+    def test_store_owner_checked_when_index_misses(self, client, index, store):
+        # Created through another worker: this worker's index never saw it
+        thread_id = str(uuid.uuid4())
+        store.owners[thread_id] = "bob"
+
+        response = client.patch(f"/threads/{thread_id}", headers=ALICE, json={"title": "Hijacked"})
+        assert response.status_code == 403
+        assert thread_id not in index
+
+    @pytest.mark.parametrize("thread_id", [str(uuid.uuid4()), "not-a-uuid"])
+    def test_unknown_thread_not_found(self, client, thread_id):
+        response = client.post(f"/threads/{thread_id}/events", headers=ALICE, json={
+            "event_type": "message",
+            "content": "hello",
+        })
+        assert response.status_code == 404
+
+    def test_archive_removes_from_index(self, client, index, alice_thread):
+        assert client.post(f"/threads/{alice_thread}/archive", headers=BOB).status_code == 403
+        assert alice_thread in index
+
+        assert client.post(f"/threads/{alice_thread}/archive", headers=ALICE).status_code == 200
+        assert alice_thread not in index
+        assert search_ids(client, "kitchen", ALICE) == []
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# DATASPACES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestDataSpaceRoutes:
+    """DataSpace writes and the index."""
+
+    def test_shared_seeded_dataspace_cannot_be_retitled(self, client, index):
+        search.start_search_index()  # Seeds the shared mock records
+        response = client.patch("/dataspaces/ds_001", headers=ALICE, json={"name": "Retitled"})
+        assert response.status_code == 404
+        assert index.get("ds_001").title != "Retitled"
+
+    def test_owner_can_update(self, client, index):
+        created = client.post("/dataspaces", headers=ALICE, json={
+            "name": "Garden",
+            "dataspace_type": "project",
+        })
+        assert created.status_code == 200
+        dataspace_id = created.json()["data"]["id"]
+
+        assert client.patch(f"/dataspaces/{dataspace_id}", headers=BOB, json={"name": "Bob's"}).status_code == 403
+        assert client.patch(f"/dataspaces/{dataspace_id}", headers=ALICE, json={"name": "Orchard"}).status_code == 200
+        assert index.get(dataspace_id).title == "Orchard"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LIFESPAN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestIndexLifespan:
+    """start_search_index / stop_search_index, run by the app lifespan."""
+
+    @pytest.fixture
+    def index(self, monkeypatch, tmp_path):
+        index = search_index.SearchIndex(path=str(tmp_path / "search_index.json"))
+        monkeypatch.setattr(search_index, "_search_index", index)
+        return index
+
+    async def test_start_loads_seeds_and_autosaves(self, index):
+        saved = search_index.SearchIndex(path=index.path)
+        saved.upsert(search_index.SearchDocument(id="th_1", resource_type="thread", title="Warm start"))
+        saved.save()
+
+        search.start_search_index()
+        try:
+            assert "th_1" in index
+            assert all(item["id"] in index for item in search.MOCK_SEARCH_RESULTS)
+            assert index._autosave_task is not None
+        finally:
+            await search.stop_search_index()
+
+    async def test_stop_flushes_pending_changes(self, index):
+        search.start_search_index()
+        index.upsert(search_index.SearchDocument(id="th_2", resource_type="thread", title="Unsaved"))
+
+        await search.stop_search_index()
+
+        assert index._autosave_task is None
+        reloaded = search_index.SearchIndex(path=index.path)
+        assert reloaded.load() and "th_2" in reloaded
+
+    def test_requests_do_not_start_autosave(self, client, index):
+        client.get("/search", params={"q": "kitchen"}, headers=ALICE)
+        assert index._autosave_task is None
@@ -0,0 +1,256 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+SEMANTIC CACHE — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for the LLM Router's near-duplicate response cache:
+- Rephrasings hit, near-miss prompts (negation, swapped entities) do not
+- Only the last user turn is embedded; context belongs to the scope
+- Caching is opt-in per request
+- Exact-match response cache: identical prompts share one provider call
+"""
+
+import asyncio
+
+import pytest
+
+from services.semantic_cache import SemanticCache, content_terms, terms_compatible
+from services.cache_service import CacheService
+from services.llm_router import LLMProvider, LLMRequest, LLMRouter, ProviderConfig, TaskType
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def cache():
+    return SemanticCache()
+
+
+def request(question: str, **kwargs) -> LLMRequest:
+    kwargs.setdefault("system_prompt", "You are a helpful geography assistant. " * 20)
+    return LLMRequest(
+        messages=[{"role": "user", "content": question}],
+        identity_id="user-1",
+        use_semantic_cache=True,
+        **kwargs
+    )
+
+
+def store_and_lookup(cache, stored: LLMRequest, probe: LLMRequest, threshold: float):
+    cache.store(
+        LLMRouter._semantic_prompt(stored),
+        "cached answer",
+        identity_id=stored.identity_id,
+        task=LLMRouter._semantic_scope(stored),
+    )
+    return cache.lookup(
+        LLMRouter._semantic_prompt(probe),
+        identity_id=probe.identity_id,
+        task=LLMRouter._semantic_scope(probe),
+        threshold=threshold,
+    )
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# NEAR MISSES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestNearMisses:
+    """Prompts that look alike but need a different answer."""
+
+    @pytest.mark.parametrize("stored,probe", [
+        ("What is the capital of France?", "What is the capital of Germany?"),
+        ("Who wrote Hamlet?", "Who wrote Macbeth?"),
+        ("Translate hello to French", "Translate hello to Spanish"),
+    ])
+    def test_swapped_entity_misses(self, cache, stored, probe):
+        assert store_and_lookup(cache, request(stored), request(probe), 0.93) is None
+
+    @pytest.mark.parametrize("stored,probe", [
+        ("Should we approve this expense report?", "Should we not approve this expense report?"),
+        ("approve", "not approve"),
+        ("The customer is satisfied with the delivery", "The customer isn't satisfied with the delivery"),
+    ])
+    def test_negation_misses(self, cache, stored, probe):
+        stored_request = request(stored, task_type=TaskType.CLASSIFICATION)
+        probe_request = request(probe, task_type=TaskType.CLASSIFICATION)
+        assert store_and_lookup(cache, stored_request, probe_request, 0.90) is None
+
+    def test_number_change_misses(self, cache):
+        assert store_and_lookup(
+            cache,
+            request("How many days are in 2024?"),
+            request("How many days are in 2023?"),
+            0.5,
+        ) is None
+
+    def test_long_shared_context_does_not_mask_difference(self, cache):
+        context = "Background: " + "the quarterly report covers revenue and costs. " * 30
+        stored = request(context + "Is revenue up?")
+        probe = request(context + "Is revenue not up?")
+        assert store_and_lookup(cache, stored, probe, 0.5) is None
+
+    def test_guard_rejects_even_at_low_threshold(self):
+        assert not terms_compatible(content_terms("capital of france"), content_terms("capital of germany"))
+        assert not terms_compatible(content_terms("i approve"), content_terms("i do not approve"))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HITS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestHits:
+    """Rephrasings of the same question."""
+
+    def test_exact_repeat_hits(self, cache):
+        found = store_and_lookup(cache, request("What is the capital of France?"),
+                                 request("what is the capital of  France?"), 0.93)
+        assert found == ("cached answer", 1.0)
+
+    def test_spelling_variant_hits(self, cache):
+        found = store_and_lookup(
+            cache,
+            request("Please summarize this article about climate change"),
+            request("Summarise this article about climate change"),
+            0.7,
+        )
+        assert found is not None and found[0] == "cached answer"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SCOPE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestScope:
+    """What separates otherwise identical prompts."""
+
+    def test_only_last_user_turn_is_embedded(self):
+        req = LLMRequest(
+            messages=[
+                {"role": "user", "content": "Hi"},
+                {"role": "assistant", "content": "Hello!"},
+                {"role": "user", "content": "What is 2 + 2?"},
+            ],
+            system_prompt="Be brief.",
+            identity_id="user-1",
+        )
+        assert LLMRouter._semantic_prompt(req) == "What is 2 + 2?"
+
+    def test_not_cacheable_when_last_turn_is_not_user(self):
+        req = LLMRequest(messages=[{"role": "assistant", "content": "Hi"}], identity_id="u")
+        assert LLMRouter._semantic_prompt(req) is None
+
+    @pytest.mark.parametrize("change", [
+        {"system_prompt": "You answer in French."},
+        {"temperature": 0.0},
+        {"preferred_model": "gpt-4o"},
+        {"requires_json_output": True},
+    ])
+    def test_settings_change_scope(self, change):
+        base = request("What is the capital of France?")
+        other = request("What is the capital of France?", **change)
+        assert LLMRouter._semantic_scope(base) != LLMRouter._semantic_scope(other)
+
+    def test_earlier_turns_change_scope(self):
+        first = LLMRequest(messages=[
+            {"role": "user", "content": "Talk about Python the language"},
+            {"role": "user", "content": "Tell me more"},
+        ], identity_id="u")
+        second = LLMRequest(messages=[
+            {"role": "user", "content": "Talk about pythons the snakes"},
+            {"role": "user", "content": "Tell me more"},
+        ], identity_id="u")
+        assert LLMRouter._semantic_scope(first) != LLMRouter._semantic_scope(second)
+
+    def test_identity_isolation(self, cache):
+        stored = request("What is the capital of France?")
+        probe = request("What is the capital of France?")
+        probe.identity_id = "user-2"
+        assert store_and_lookup(cache, stored, probe, 0.93) is None
+
+
+class TestOptIn:
+    """The cache is never consulted unless the request asks for it."""
+
+    def test_disabled_by_default(self):
+        router = LLMRouter(semantic_cache=SemanticCache())
+        req = LLMRequest(messages=[{"role": "user", "content": "Hi"}], identity_id="u")
+        assert req.use_semantic_cache is False
+        assert router._semantic_threshold(req) is None
+
+    def test_enabled_per_request(self):
+        router = LLMRouter(semantic_cache=SemanticCache())
+        assert router._semantic_threshold(request("Hi")) == 0.93
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RESPONSE CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestResponseCache:
+    """LLMRouter.complete() through CacheService.get_or_compute_llm_response()."""
+
+    @pytest.fixture
+    def router(self, monkeypatch):
+        router = LLMRouter(response_cache=CacheService())
+        router.register_provider(ProviderConfig(provider=LLMProvider.ANTHROPIC))
+        router.calls = 0
+        execute = router._execute_completion
+
+        async def counting(*args, **kwargs):
+            router.calls += 1
+            return await execute(*args, **kwargs)
+
+        monkeypatch.setattr(router, "_execute_completion", counting)
+        return router
+
+    async def test_concurrent_identical_prompts_share_one_call(self, router):
+        responses = await asyncio.gather(*(router.complete(request("Hi")) for _ in range(5)))
+
+        assert router.calls == 1
+        assert sum(not r.cache_hit for r in responses) == 1
+        assert len({r.content for r in responses}) == 1
+        assert all(r.cost_usd == 0 for r in responses if r.cache_hit)
+
+    async def test_repeat_served_from_cache(self, router):
+        first = await router.complete(request("Hi"))
+        second = await router.complete(request("Hi"))
+
+        assert router.calls == 1
+        assert second.cache_hit and second.cache_similarity == 1.0
+        assert second.request_id != first.request_id
+        assert router.get_stats()["response_cache_hits"] == 1
+
+    async def test_budget_charged_once(self, router):
+        first = await router.complete(request("Hi"))
+        await router.complete(request("Hi"))
+
+        assert router.budget_ledger.local_usage("user-1")["daily_tokens"] == first.total_tokens
+
+    @pytest.mark.parametrize("change", [
+        {"max_tokens": 10},
+        {"temperature": 0.1},
+        {"system_prompt": "Be terse."},
+    ])
+    async def test_settings_change_key(self, router, change):
+        await router.complete(request("Hi"))
+        await router.complete(request("Hi", **change))
+
+        assert router.calls == 2
+
+    async def test_identity_isolation(self, router):
+        await router.complete(request("Hi"))
+        other = request("Hi")
+        other.identity_id = "user-2"
+
+        assert not (await router.complete(other)).cache_hit
+        assert router.calls == 2
+
+    async def test_opt_in(self, router):
+        req = LLMRequest(messages=[{"role": "user", "content": "Hi"}], identity_id="u")
+        await router.complete(req)
+        await router.complete(req)
+
+        assert router.calls == 2
@@ -0,0 +1,265 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+SYNAPTIC GRAPH — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for edge dispatch between modules:
+- (source, trigger) index: only matching edges fire
+- Concurrent fan-out bounded by max_concurrency, results in edge order
+- Handler errors surface after the other edges finish
+- Loop detection per cascade (ContextVar), not across independent fires
+- Per-edge latency histograms
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.synaptic.synaptic_graph import (
+    EdgeAction,
+    EdgeTrigger,
+    LatencyHistogram,
+    ModuleID,
+    Priority,
+    StabilityGuard,
+    SynapticGraph,
+)
+# Relative imports reach core/ from api/, so the routes load as a backend module
+from backend.api.routes import synaptic_routes
+
+
+A = ModuleID.MOD_01_OPA
+B = ModuleID.MOD_03_CAUSAL
+C = ModuleID.MOD_04_WORLDENGINE
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def graph():
+    return SynapticGraph()
+
+
+def connect(graph, source, target, trigger, handler=None, guard=None):
+    """Add an edge whose action calls the named handler."""
+    return graph.add_edge(
+        source=source,
+        target=target,
+        priority=Priority.P2,
+        trigger=EdgeTrigger(trigger, ""),
+        action=EdgeAction(f"act_{trigger}", "", handler=handler),
+        stability_guard=guard or StabilityGuard(enabled=False),
+    )
+
+
+class Tracker:
+    """Handler factory recording concurrency."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    def handler(self, result, delay=0.02, error=None):
+        async def handle(event):
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            try:
+                await asyncio.sleep(delay)
+                if error:
+                    raise error
+                return result
+            finally:
+                self.running -= 1
+        return handle
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# DISPATCH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestDispatch:
+    """fire_trigger through the (source, trigger) index."""
+
+    async def test_only_matching_edges_fire(self, graph):
+        fired = []
+
+        async def handle(event):
+            fired.append((event.source, event.target, event.trigger_name))
+            return event.target
+
+        graph.register_handler("h", handle)
+        connect(graph, A, B, "Ping", "h")
+        connect(graph, A, C, "Ping", "h")
+        connect(graph, A, C, "Other", "h")
+        connect(graph, B, C, "Ping", "h")
+
+        assert await graph.fire_trigger(A, "Ping") == [B, C]
+        assert sorted(fired) == [(A, B, "Ping"), (A, C, "Ping")]
+
+    async def test_unknown_trigger(self, graph):
+        assert await graph.fire_trigger(A, "Nope") == []
+
+    async def test_payload_and_listeners(self, graph):
+        seen = []
+
+        async def listener(event):
+            seen.append(event.payload)
+
+        async def broken(event):
+            raise RuntimeError("listener down")
+
+        graph.add_listener(listener)
+        graph.add_listener(broken)
+        graph.register_handler("h", Tracker().handler("done"))
+        connect(graph, A, B, "Ping", "h")
+
+        assert await graph.fire_trigger(A, "Ping", {"x": 1}) == ["done"]
+        assert seen == [{"x": 1}]
+
+    async def test_cooldown_blocks_refire(self, graph):
+        graph.register_handler("h", Tracker().handler("done", delay=0))
+        edge = connect(graph, A, B, "Ping", "h", guard=StabilityGuard(cooldown_seconds=60))
+
+        assert await graph.fire_edge(edge.edge_id) == "done"
+        assert await graph.fire_edge(edge.edge_id) is None
+        assert edge.fire_count == 1
+
+
+class TestFanOut:
+    """Concurrent edges, bounded."""
+
+    async def test_edges_run_concurrently_in_order(self, graph):
+        tracker = Tracker()
+        for n in range(4):
+            graph.register_handler(f"h{n}", tracker.handler(n, delay=0.05 * (4 - n)))
+            connect(graph, A, B, "Ping", f"h{n}")
+
+        assert await graph.fire_trigger(A, "Ping") == [0, 1, 2, 3]
+        assert tracker.peak == 4
+
+    async def test_concurrency_bounded(self):
+        graph = SynapticGraph(max_concurrency=2)
+        tracker = Tracker()
+        graph.register_handler("h", tracker.handler("ok"))
+        for _ in range(6):
+            connect(graph, A, B, "Ping", "h")
+
+        assert await graph.fire_trigger(A, "Ping") == ["ok"] * 6
+        assert tracker.peak == 2
+
+    async def test_error_raised_after_other_edges_finish(self, graph):
+        tracker = Tracker()
+        graph.register_handler("bad", tracker.handler(None, delay=0, error=ValueError("boom")))
+        graph.register_handler("slow", tracker.handler("ok", delay=0.05))
+        connect(graph, A, B, "Ping", "bad")
+        slow = connect(graph, A, C, "Ping", "slow")
+
+        with pytest.raises(ValueError):
+            await graph.fire_trigger(A, "Ping")
+        assert slow.latency.count == 1
+        assert tracker.running == 0
+        assert graph.get_graph_summary()["active_paths"] == []
+
+
+class TestLoops:
+    """A cascade may not revisit a path; independent fires may share one."""
+
+    async def test_cascade_back_to_same_path_is_cut(self, graph):
+        calls = []
+
+        async def a_to_b(event):
+            calls.append("a->b")
+            return await graph.fire_trigger(B, "Back")
+
+        async def b_to_a(event):
+            calls.append("b->a")
+            return await graph.fire_trigger(A, "Ping")
+
+        graph.register_handler("a_to_b", a_to_b)
+        graph.register_handler("b_to_a", b_to_a)
+        connect(graph, A, B, "Ping", "a_to_b")
+        connect(graph, B, A, "Back", "b_to_a")
+
+        assert await graph.fire_trigger(A, "Ping") == [[[]]]
+        assert calls == ["a->b", "b->a"]
+
+    async def test_each_fanned_out_branch_tracks_its_own_cascade(self, graph):
+        calls = []
+
+        async def again(event):
+            calls.append(event.target)
+            return await graph.fire_trigger(A, "Ping")
+
+        graph.register_handler("again", again)
+        connect(graph, A, B, "Ping", "again")
+        connect(graph, A, C, "Ping", "again")
+
+        # A->B may still take A->C once (and vice versa), then both paths repeat
+        assert await graph.fire_trigger(A, "Ping") == [[[]], [[]]]
+        assert sorted(calls) == [B, B, C, C]
+
+    async def test_concurrent_fires_of_one_path_are_not_loops(self, graph):
+        graph.register_handler("h", Tracker().handler("ok"))
+        edge = connect(graph, A, B, "Ping", "h")
+
+        results = await asyncio.gather(*(graph.fire_edge(edge.edge_id) for _ in range(3)))
+
+        assert results == ["ok"] * 3
+        assert edge.fire_count == 3
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LATENCY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestLatency:
+    """Fixed-bucket histograms per edge."""
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for ms in [0.5] * 90 + [40] * 9 + [7000]:
+            histogram.observe(ms)
+
+        assert histogram.percentile(0.5) == 1
+        assert histogram.percentile(0.95) == 50
+        assert histogram.percentile(1.0) == 7000
+        assert histogram.to_dict()["buckets"]["10000"] == 1
+
+    def test_last_bucket_reports_max(self):
+        histogram = LatencyHistogram()
+        histogram.observe(25_000)
+
+        assert histogram.percentile(0.5) == 25_000
+        assert histogram.to_dict()["buckets"]["+inf"] == 1
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(0.5) is None
+
+    async def test_stats_sorted_slowest_first(self, graph):
+        tracker = Tracker()
+        graph.register_handler("fast", tracker.handler("f", delay=0))
+        graph.register_handler("slow", tracker.handler("s", delay=0.03))
+        connect(graph, A, B, "Fast", "fast")
+        connect(graph, A, C, "Slow", "slow")
+
+        await graph.fire_trigger(A, "Fast")
+        await graph.fire_trigger(A, "Slow")
+        stats = graph.get_latency_stats()
+
+        assert [s["trigger"] for s in stats] == ["Slow", "Fast"]
+        assert stats[0]["p95_ms"] >= 25
+
+    def test_latency_route(self, graph, monkeypatch):
+        monkeypatch.setattr(synaptic_routes, "get_synaptic_graph", lambda: graph)
+        app = FastAPI()
+        app.include_router(synaptic_routes.router)
+
+        with TestClient(app) as client:
+            response = client.get("/api/v2/synaptic/graph/latency")
+
+        assert response.status_code == 200
+        assert response.json() == {"total": 0, "edges": []}
@@ -0,0 +1,335 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+THREAD SERVICE — Event Log Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for atomic event appends (ThreadService._append_events):
+- One UPDATE ... RETURNING over a FOR UPDATE lock of the thread row
+- Contiguous sequence numbers and a single parent chain
+- Concurrent appends serialize on the row (PostgreSQL)
+- The backend-level ThreadService raises the same ThreadNotFoundError
+- Migration v80_003 backfills the head columns (PostgreSQL)
+
+The PostgreSQL tests run when TEST_DATABASE_URL points to a scratch
+database (postgresql+asyncpg://...); its threads, thread_events and
+spheres tables are dropped and recreated.
+"""
+
+import asyncio
+import importlib.util
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from app.core.database import Base
+from app.core.exceptions import ThreadNotFoundError
+from app.models.sphere import Sphere, SphereType
+from app.models.thread import Thread, ThreadEvent, ThreadEventType
+from app.services.thread_service import ThreadService
+
+# Relationship targets of Thread / Sphere, needed to configure the mappers
+import app.models.governance  # noqa: F401
+import app.models.user  # noqa: F401
+
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+requires_postgres = [
+    pytest.mark.database,
+    pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set (PostgreSQL required)"),
+]
+
+MIGRATION = Path(__file__).parents[2] / "alembic" / "versions" / "v80_003_thread_event_head.py"
+
+TABLES = [Sphere.__table__, Thread.__table__, ThreadEvent.__table__]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def spec(n: int = 0, **kwargs) -> dict:
+    return {
+        "event_type": ThreadEventType.INTENT_DECLARED,
+        "payload": {"n": n},
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def fake_db():
+    """Session double returning a fixed RETURNING row."""
+    db = MagicMock()
+    result = MagicMock()
+    result.one_or_none.return_value = (7, 7, "previous-head")
+    db.execute = AsyncMock(return_value=result)
+    db.identity_map = {}
+    db.identity_key = lambda cls, ident: (cls, ident)
+    return db
+
+
+def compiled(db) -> str:
+    statement = db.execute.await_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+async def engine():
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync: Base.metadata.drop_all(sync, tables=TABLES))
+        await conn.run_sync(lambda sync: Base.metadata.create_all(sync, tables=TABLES))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def sessions(engine):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest.fixture
+async def thread_id(sessions):
+    identity_id = uuid4()
+    async with sessions() as db:
+        sphere = Sphere(
+            identity_id=identity_id, sphere_type=SphereType.PERSONAL,
+            name="Personal", slug="personal", icon="P", color="blue",
+        )
+        db.add(sphere)
+        await db.flush()
+        thread = Thread(
+            identity_id=identity_id, sphere_id=sphere.id,
+            founding_intent="Test the event log", created_by=uuid4(),
+        )
+        db.add(thread)
+        await db.commit()
+        return thread.id
+
+
+def service(db) -> ThreadService:
+    return ThreadService(db, identity_id=str(uuid4()), user_id=str(uuid4()))
+
+
+async def append(sessions, thread_id, count=1):
+    async with sessions() as db:
+        events = await service(db)._append_events(str(thread_id), [spec(n) for n in range(count)])
+        await db.commit()
+        return events
+
+
+async def load_events(sessions, thread_id):
+    async with sessions() as db:
+        result = await db.execute(
+            select(ThreadEvent)
+            .where(ThreadEvent.thread_id == thread_id)
+            .order_by(ThreadEvent.sequence_number)
+        )
+        return result.scalars().all()
+
+
+def assert_single_chain(events):
+    assert [e.sequence_number for e in events] == list(range(1, len(events) + 1))
+    assert events[0].parent_event_id is None
+    for previous, event in zip(events, events[1:]):
+        assert event.parent_event_id == previous.id
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# STATEMENT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestAppendStatement:
+    """One round trip: locked UPDATE ... RETURNING on the thread row."""
+
+    async def test_single_locked_update_returning(self, fake_db):
+        await service(fake_db)._append_events("t1", [spec(0), spec(1)])
+
+        sql = compiled(fake_db)
+        assert fake_db.execute.await_count == 1
+        assert sql.startswith("WITH head AS")
+        assert "FOR UPDATE" in sql
+        assert "last_sequence_number=(threads.last_sequence_number +" in sql
+        assert "FROM head WHERE threads.id = head.id" in sql
+        assert "RETURNING threads.last_sequence_number, threads.event_count, head.last_event_id" in sql
+
+    async def test_events_take_reserved_range_and_chain(self, fake_db):
+        first, second = await service(fake_db)._append_events("t1", [spec(0), spec(1)])
+
+        assert (first.sequence_number, second.sequence_number) == (6, 7)
+        assert first.parent_event_id == "previous-head"
+        assert second.parent_event_id == first.id
+        params = fake_db.execute.await_args.args[0].compile().params
+        assert params["last_event_id"] == second.id
+        fake_db.add_all.assert_called_once_with([first, second])
+
+    async def test_explicit_parent_kept(self, fake_db):
+        (event,) = await service(fake_db)._append_events("t1", [spec(parent_event_id="other")])
+
+        assert event.parent_event_id == "other"
+
+    async def test_missing_thread(self, fake_db):
+        fake_db.execute.return_value.one_or_none.return_value = None
+
+        with pytest.raises(ThreadNotFoundError):
+            await service(fake_db)._append_events("t1", [spec()])
+        fake_db.add_all.assert_not_called()
+
+    async def test_empty_batch_is_free(self, fake_db):
+        assert await service(fake_db)._append_events("t1", []) == []
+        fake_db.execute.assert_not_awaited()
+
+
+class TestBackendThreadService:
+    """services.thread_service reports missing threads the same way."""
+
+    @pytest.fixture
+    def backend_service(self, fake_db):
+        # Needs the deployment's config package alongside backend/
+        module = pytest.importorskip("services.thread_service")
+        fake_db.execute.return_value.one_or_none.return_value = None
+        fake_db.execute.return_value.scalar_one_or_none.return_value = None
+        return module, module.ThreadService(fake_db, identity_id=str(uuid4()), user_id=str(uuid4()))
+
+    async def test_append_to_missing_thread(self, backend_service, fake_db):
+        module, backend = backend_service
+
+        with pytest.raises(module.ThreadNotFoundError) as raised:
+            await backend._append_events("t1", [spec()])
+        assert raised.value.details == {"thread_id": "t1"}
+        fake_db.add_all.assert_not_called()
+
+    async def test_get_missing_thread(self, backend_service):
+        module, backend = backend_service
+
+        with pytest.raises(module.ThreadNotFoundError, match="Thread not found: t1"):
+            await backend._get_thread_with_check("t1")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# POSTGRESQL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestAppendPostgres:
+    """Against a real thread row."""
+
+    pytestmark = requires_postgres
+
+    async def test_appends_extend_one_chain(self, sessions, thread_id):
+        await append(sessions, thread_id, count=2)
+        await append(sessions, thread_id)
+
+        events = await load_events(sessions, thread_id)
+        assert_single_chain(events)
+        async with sessions() as db:
+            thread = await db.get(Thread, thread_id)
+        assert (thread.last_sequence_number, thread.event_count) == (3, 3)
+        assert thread.last_event_id == events[-1].id
+
+    async def test_concurrent_appends_serialize(self, sessions, thread_id):
+        await asyncio.gather(*(append(sessions, thread_id, count=1 + n % 3) for n in range(12)))
+
+        events = await load_events(sessions, thread_id)
+        assert len(events) == sum(1 + n % 3 for n in range(12))
+        assert_single_chain(events)
+
+    async def test_second_append_waits_for_row_lock(self, sessions, thread_id):
+        async with sessions() as first:
+            await service(first)._append_events(str(thread_id), [spec()])
+
+            waiting = asyncio.create_task(append(sessions, thread_id))
+            done, _ = await asyncio.wait({waiting}, timeout=0.3)
+            assert not done
+
+            await first.commit()
+            (event,) = await waiting
+
+        assert event.sequence_number == 2
+
+    async def test_loaded_thread_kept_in_step(self, sessions, thread_id):
+        async with sessions() as db:
+            thread = await db.get(Thread, thread_id)
+            events = await service(db)._append_events(str(thread_id), [spec(0), spec(1)])
+
+            assert thread.event_count == 2
+            assert thread.last_event_id == events[-1].id
+            assert thread not in db.dirty
+            await db.commit()
+
+    async def test_missing_thread(self, sessions, thread_id):
+        async with sessions() as db:
+            with pytest.raises(ThreadNotFoundError):
+                await service(db)._append_events(str(uuid4()), [spec()])
+
+
+class TestMigration:
+    """v80_003 adds and backfills the head columns."""
+
+    pytestmark = requires_postgres
+
+    def migration(self):
+        module_spec = importlib.util.spec_from_file_location("v80_003", MIGRATION)
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+        return module
+
+    async def run(self, engine, step):
+        from alembic.migration import MigrationContext
+        from alembic.operations import Operations
+
+        def migrate(sync_conn):
+            with Operations.context(MigrationContext.configure(sync_conn)):
+                step()
+
+        async with engine.begin() as conn:
+            await conn.run_sync(migrate)
+
+    async def columns(self, engine):
+        async with engine.connect() as conn:
+            result = await conn.execute(text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_name = 'threads' AND column_name LIKE 'last_%'"
+            ))
+            return sorted(result.scalars())
+
+    async def test_upgrade_backfills_and_downgrade_drops(self, engine, sessions, thread_id):
+        await append(sessions, thread_id, count=3)
+        empty_thread = await self.empty_thread(sessions, thread_id)
+        migration = self.migration()
+
+        await self.run(engine, migration.downgrade)
+        assert await self.columns(engine) == ["last_event_at"]
+
+        await self.run(engine, migration.upgrade)
+        events = await load_events(sessions, thread_id)
+        async with engine.connect() as conn:
+            result = await conn.execute(text(
+                "SELECT id::text, last_sequence_number, last_event_id::text FROM threads"
+            ))
+            rows = {id_: (sequence, head) for id_, sequence, head in result}
+
+        assert rows[thread_id] == (3, events[-1].id)
+        assert rows[empty_thread] == (0, None)
+
+        await self.run(engine, migration.downgrade)
+        assert await self.columns(engine) == ["last_event_at"]
+
+    async def empty_thread(self, sessions, thread_id) -> str:
+        async with sessions() as db:
+            source = await db.get(Thread, thread_id)
+            thread = Thread(
+                identity_id=source.identity_id, sphere_id=source.sphere_id,
+                founding_intent="No events yet", created_by=source.created_by,
+            )
+            db.add(thread)
+            await db.commit()
+            return thread.id
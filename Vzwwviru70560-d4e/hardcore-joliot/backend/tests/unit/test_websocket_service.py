@@ -0,0 +1,218 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+WEBSOCKET SERVICE — LLM Streaming Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for token streaming over the Nova WebSocket:
+- nova.prompt streams chunks, then nova.complete
+- A disconnect stops the router stream
+- Invalid prompts and router failures come back as nova.error
+- The Nova /ws endpoint refuses connections without an access token
+"""
+
+import asyncio
+import json
+import threading
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from services import websocket_service
+from services.llm_router import LLMProvider, LLMStreamChunk
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class FakeRouter:
+    """Yields the given tokens (forever when tokens is None)."""
+
+    def __init__(self, tokens=None, delay=0.0, error=None):
+        self.tokens = tokens
+        self.delay = delay
+        self.error = error
+        self.requests = []
+        self.closed = threading.Event()
+        self.produced = 0
+
+    def chunk(self, request, delta, finish_reason=None):
+        return LLMStreamChunk(
+            request_id=request.request_id,
+            index=self.produced,
+            delta=delta,
+            provider=LLMProvider.ANTHROPIC,
+            model="test-model",
+            input_tokens=3,
+            output_tokens=self.produced,
+            cost_usd=Decimal("0"),
+            finish_reason=finish_reason,
+        )
+
+    async def stream(self, request):
+        self.requests.append(request)
+        try:
+            if self.error:
+                raise self.error
+            while self.tokens is None or self.produced < len(self.tokens):
+                await asyncio.sleep(self.delay)
+                delta = f"t{self.produced}" if self.tokens is None else self.tokens[self.produced]
+                yield self.chunk(request, delta)
+                self.produced += 1
+            yield self.chunk(request, "", finish_reason="stop")
+        finally:
+            self.closed.set()
+
+
+@pytest.fixture
+def manager():
+    return websocket_service.ws_manager
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    def install(fake):
+        monkeypatch.setattr(websocket_service, "get_llm_router", lambda: fake)
+        return fake
+    return install
+
+
+@pytest.fixture
+def client(manager):
+    app = FastAPI()
+
+    @app.websocket("/nova/ws")
+    async def nova_websocket(websocket: WebSocket):
+        await websocket_service.websocket_handler(websocket, "alice", manager)
+
+    with TestClient(app) as client:
+        yield client
+
+
+def ws_url():
+    return "/nova/ws"
+
+
+def prompt(websocket, text="Hello", **data):
+    websocket.send_text(json.dumps({
+        "event": "nova.prompt",
+        "data": {"conversation_id": "conv-1", "prompt": text, **data},
+    }))
+
+
+def receive(websocket):
+    return json.loads(websocket.receive_text())
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# STREAMING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestPromptStreaming:
+    """nova.prompt over the Nova WebSocket."""
+
+    def test_streams_tokens_then_complete(self, client, llm):
+        fake = llm(FakeRouter(["Bon", "jour", "!"]))
+
+        with client.websocket_connect(ws_url()) as websocket:
+            assert receive(websocket)["event"] == "connected"
+            prompt(websocket)
+
+            messages = [receive(websocket) for _ in range(4)]
+
+        assert [m["event"] for m in messages] == ["nova.response"] * 3 + ["nova.complete"]
+        assert [m["data"]["chunk"] for m in messages[:3]] == ["Bon", "jour", "!"]
+        assert messages[-1]["data"]["finish_reason"] == "stop"
+        assert {m["data"]["conversation_id"] for m in messages} == {"conv-1"}
+
+        request = fake.requests[0]
+        assert request.identity_id == "alice"
+        assert request.thread_id == "conv-1"
+        assert request.stream is True
+        assert request.messages == [{"role": "user", "content": "Hello"}]
+
+    def test_disconnect_stops_router_stream(self, client, llm, manager):
+        fake = llm(FakeRouter(delay=0.01))
+
+        with client.websocket_connect(ws_url()) as websocket:
+            receive(websocket)
+            prompt(websocket)
+            for _ in range(3):
+                assert receive(websocket)["event"] == "nova.response"
+
+        assert fake.closed.wait(5)
+        produced = fake.produced
+        assert not manager.is_user_connected("alice")
+
+        # Nothing more is generated once the stream is closed
+        threading.Event().wait(0.1)
+        assert fake.produced == produced
+
+    def test_receive_loop_runs_during_stream(self, client, llm):
+        llm(FakeRouter(delay=0.01))
+
+        with client.websocket_connect(ws_url()) as websocket:
+            receive(websocket)
+            prompt(websocket)
+            assert receive(websocket)["event"] == "nova.response"
+            websocket.send_text(json.dumps({"event": "ping"}))
+
+            while receive(websocket)["event"] != "pong":
+                pass
+            assert receive(websocket)["event"] == "nova.response"
+
+
+class TestPromptErrors:
+    """Failures are reported on the socket."""
+
+    def test_invalid_prompt(self, client, llm):
+        fake = llm(FakeRouter(["x"]))
+
+        with client.websocket_connect(ws_url()) as websocket:
+            receive(websocket)
+            websocket.send_text(json.dumps({"event": "nova.prompt", "data": {"max_tokens": 5}}))
+            message = receive(websocket)
+
+        assert message["event"] == "nova.error"
+        assert fake.requests == []
+
+    def test_router_failure(self, client, llm):
+        llm(FakeRouter(error=RuntimeError("budget exhausted")))
+
+        with client.websocket_connect(ws_url()) as websocket:
+            receive(websocket)
+            prompt(websocket)
+            message = receive(websocket)
+
+        assert message["event"] == "nova.error"
+        assert message["data"] == {"conversation_id": "conv-1", "error": "budget exhausted"}
+
+
+class TestAuth:
+    """The Nova /ws endpoint (app.routers.nova) needs an access token."""
+
+    @pytest.fixture
+    def app_client(self):
+        pytest.importorskip("jose")
+        from app.core.security import create_access_token
+        from app.routers import nova
+
+        app = FastAPI()
+        app.include_router(nova.router, prefix="/api/v2/nova")
+        with TestClient(app) as client:
+            client.token = create_access_token("alice", "identity-1")
+            yield client
+
+    @pytest.mark.parametrize("query", ["", "?token=garbage"])
+    def test_refused_without_token(self, app_client, query):
+        with pytest.raises(WebSocketDisconnect) as excinfo:
+            with app_client.websocket_connect(f"/api/v2/nova/ws{query}") as websocket:
+                websocket.receive_text()
+        assert excinfo.value.code == 1008
+
+    def test_access_token_connects(self, app_client):
+        with app_client.websocket_connect(f"/api/v2/nova/ws?token={app_client.token}") as websocket:
+            assert receive(websocket)["event"] == "connected"
@@ -0,0 +1,254 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+YELLOW PAGES — Test Suite
+═══════════════════════════════════════════════════════════════════════════════
+
+Tests for the synaptic service registry:
+- Routing to the authority module or a fallback provider
+- Provider selection, ejection after failures and health-check recovery
+- Admission queue (waiting for a slot, deadline, queue bound)
+- Execute route: timeout is clamped, unknown tags are rejected
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.synaptic.synaptic_graph import ModuleID
+from core.synaptic.yellow_pages import (
+    MAX_CONSECUTIVE_FAILURES,
+    FallbackService,
+    NeedTag,
+    SelectionPolicy,
+    ServiceHandler,
+    YellowPages,
+)
+# Relative imports reach core/ from api/, so the routes load as a backend module
+from backend.api.routes import synaptic_routes
+
+
+TAG = NeedTag.SIMULATE_SCENARIO
+MODULE = ModuleID.MOD_04_WORLDENGINE
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIXTURES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class StubHandler(ServiceHandler):
+    """Handler with a configurable outcome and duration."""
+
+    def __init__(self, service_id: str, ok: bool = True, delay: float = 0.0, healthy: bool = True):
+        self._service_id = service_id
+        self.ok = ok
+        self.delay = delay
+        self.healthy = healthy
+        self.calls = 0
+
+    @property
+    def service_id(self) -> str:
+        return self._service_id
+
+    async def execute(self, request):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"status": "completed" if self.ok else "error", "service_id": self._service_id}
+
+    async def health_check(self) -> bool:
+        return self.healthy
+
+
+def provider(service_id: str, max_concurrent: int = 10) -> FallbackService:
+    return FallbackService(
+        service_id=service_id, name=service_id, description="", max_concurrent=max_concurrent
+    )
+
+
+@pytest.fixture
+def pages():
+    """Registry whose TAG goes to fallback providers a and b."""
+    pages = YellowPages(policy=SelectionPolicy.LEAST_OUTSTANDING, queue_timeout_s=1.0)
+    pages.register(TAG, MODULE, provider("svc_a"), providers=[provider("svc_b")])
+    pages.set_module_status(MODULE, False)
+    pages.register_handler("svc_a", StubHandler("svc_a"))
+    pages.register_handler("svc_b", StubHandler("svc_b"))
+    return pages
+
+
+def providers(pages):
+    return {p.service_id: p for p in pages.lookup(TAG).providers}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ROUTING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestRouting:
+    """Module first, then fallback providers."""
+
+    def test_authority_module_preferred(self, pages):
+        pages.set_module_status(MODULE, True)
+        decision = pages.route(TAG)
+
+        assert decision.is_module
+        assert decision.routed_to == MODULE.value
+
+    def test_fallback_when_module_down(self, pages):
+        decision = pages.route(TAG)
+
+        assert not decision.is_module
+        assert decision.routed_to in ("svc_a", "svc_b")
+        assert decision.reason == "Module unavailable, routed to fallback service"
+
+    def test_unknown_need(self, pages):
+        decision = pages.route(NeedTag.TASK_EXECUTE)
+
+        assert decision.routed_to == "unknown"
+        assert decision.reason == "No entry found for need tag"
+
+    def test_no_eligible_provider(self, pages):
+        for p in providers(pages).values():
+            p.is_healthy = False
+
+        assert pages.route(TAG).routed_to == "none"
+
+    def test_least_outstanding_picks_idle_provider(self, pages):
+        providers(pages)["svc_a"].current_load = 3
+
+        assert pages.select_provider(pages.lookup(TAG)).service_id == "svc_b"
+
+    def test_power_of_two_skips_loaded_provider(self, pages):
+        pages.policy = SelectionPolicy.POWER_OF_TWO
+        providers(pages)["svc_b"].current_load = 5
+
+        picks = {pages.select_provider(pages.lookup(TAG)).service_id for _ in range(20)}
+        assert picks == {"svc_a"}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HEALTH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestHealth:
+    """Ejection and recovery."""
+
+    async def test_ejected_after_consecutive_failures(self, pages):
+        pages.register_handler("svc_a", StubHandler("svc_a", ok=False))
+        providers(pages)["svc_b"].is_available = False
+
+        for _ in range(MAX_CONSECUTIVE_FAILURES):
+            await pages.execute(TAG, {})
+
+        svc_a = providers(pages)["svc_a"]
+        assert not svc_a.is_healthy
+        assert svc_a.error_count == MAX_CONSECUTIVE_FAILURES
+        assert pages.route(TAG).routed_to == "none"
+
+    async def test_probe_restores_provider(self, pages):
+        svc_a = providers(pages)["svc_a"]
+        svc_a.is_healthy = False
+        svc_a.consecutive_failures = MAX_CONSECUTIVE_FAILURES
+
+        results = await pages.probe_health()
+
+        assert results["svc_a"] is True
+        assert svc_a.is_healthy and svc_a.consecutive_failures == 0
+        assert svc_a.last_health_check is not None
+
+    async def test_probe_marks_unhealthy(self, pages):
+        pages.register_handler("svc_b", StubHandler("svc_b", healthy=False))
+        await pages.probe_health()
+
+        assert not providers(pages)["svc_b"].is_healthy
+
+    async def test_start_and_stop(self, pages):
+        pages.start_health_checks(interval_s=0.01)
+        assert pages.get_stats()["health_checks_running"]
+
+        await pages.stop_health_checks()
+        assert not pages.get_stats()["health_checks_running"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ADMISSION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestAdmission:
+    """Requests wait for a slot when every provider is busy."""
+
+    @pytest.fixture
+    def single_slot(self, pages):
+        providers(pages)["svc_b"].is_available = False
+        providers(pages)["svc_a"].max_concurrent = 1
+        pages.register_handler("svc_a", StubHandler("svc_a", delay=0.05))
+        return pages
+
+    async def test_queued_request_runs_when_slot_frees(self, single_slot):
+        first, second = await asyncio.gather(
+            single_slot.execute(TAG, {}), single_slot.execute(TAG, {})
+        )
+
+        assert first["status"] == second["status"] == "completed"
+        assert max(first["queued_ms"], second["queued_ms"]) > 0
+        assert providers(single_slot)["svc_a"].current_load == 0
+
+    async def test_deadline_exceeded(self, single_slot):
+        busy = asyncio.create_task(single_slot.execute(TAG, {}))
+        await asyncio.sleep(0)
+        result = await single_slot.execute(TAG, {}, timeout_s=0.01)
+        await busy
+
+        assert result["status"] == "error"
+        assert result["error"] == "Deadline exceeded waiting for a provider slot"
+        assert single_slot.queue_depth(TAG) == 0
+
+    async def test_queue_bound(self, single_slot):
+        single_slot.max_queued = 1
+        busy = asyncio.create_task(single_slot.execute(TAG, {}))
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(single_slot.execute(TAG, {}))
+        await asyncio.sleep(0)
+
+        result = await single_slot.execute(TAG, {})
+        await asyncio.gather(busy, waiting)
+
+        assert result["error"] == "Admission queue full"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ROUTES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TestExecuteRoute:
+    """POST /yellowpages/execute."""
+
+    @pytest.fixture
+    def app(self, pages, monkeypatch):
+        monkeypatch.setattr(synaptic_routes, "get_yellow_pages", lambda: pages)
+        app = FastAPI()
+        app.include_router(synaptic_routes.router)
+        return app
+
+    def test_timeout_is_clamped(self, app, pages, monkeypatch):
+        seen = {}
+
+        async def execute(tag, payload, timeout_s=None):
+            seen["timeout_s"] = timeout_s
+            return {"status": "completed"}
+
+        monkeypatch.setattr(pages, "execute", execute)
+        with TestClient(app) as client:
+            response = client.post("/api/v2/synaptic/yellowpages/execute", json={
+                "need_tag": TAG.value, "timeout_s": 3600,
+            })
+
+        assert response.status_code == 200
+        assert seen["timeout_s"] == synaptic_routes.MAX_EXECUTE_TIMEOUT_S
+
+    def test_unknown_tag_rejected(self, app):
+        with TestClient(app) as client:
+            response = client.post("/api/v2/synaptic/yellowpages/execute", json={"need_tag": "#Nope"})
+
+        assert response.status_code == 400
@@ -80,7 +80,19 @@ from .core import (
     # Engine
     WorldEngine,
     RuleExecutor,
+    ScenarioRunner,
     create_simple_simulation,
+    # Compiled kernel
+    CompiledPlan,
+    TickKernel,
+    KernelResult,
+    # Hash chain
+    ChainIndex,
+    ChainVerifier,
+    verify_artifact_file,
+    # Columnar states
+    ColumnarStates,
+    StateRow,
 )
 
 # Scenarios
@@ -95,6 +107,9 @@ from .workers import (
     Worker,
     WorkerPool,
     WorkerManager,
+    ProcessBackend,
+    QueueBackend,
+    serve_queue,
 )
 
 # Temporal
@@ -135,7 +150,16 @@ __all__ = [
     # Core Engine
     "WorldEngine",
     "RuleExecutor",
+    "ScenarioRunner",
     "create_simple_simulation",
+    "CompiledPlan",
+    "TickKernel",
+    "KernelResult",
+    "ChainIndex",
+    "ChainVerifier",
+    "verify_artifact_file",
+    "ColumnarStates",
+    "StateRow",
     # Scenarios
     "ScenarioManager",
     "ScenarioComparison",
@@ -144,6 +168,9 @@ __all__ = [
     "Worker",
     "WorkerPool",
     "WorkerManager",
+    "ProcessBackend",
+    "QueueBackend",
+    "serve_queue",
     # Temporal
     "TemporalIterator",
     "TemporalRange",
@@ -13,11 +13,19 @@ from .models import (
     WorkerStatus,
     TimeUnit,
 )
-from .engine import WorldEngine, RuleExecutor, create_simple_simulation
+from .engine import WorldEngine, RuleExecutor, ScenarioRunner, create_simple_simulation
+from .progress import TaskCancelled, report_progress
+from .kernel import CompiledPlan, TickKernel, KernelResult
+from .chain import ChainIndex, ChainVerifier, verify_artifact_file
+from .columnar import ColumnarStates, StateRow
 
 __all__ = [
     "Slot", "WorldState", "CausalRule", "Scenario", "Simulation",
     "SimulationArtifact", "SimulationConfig", "SimulationStatus",
     "ScenarioType", "WorkerTask", "WorkerStatus", "TimeUnit",
-    "WorldEngine", "RuleExecutor", "create_simple_simulation",
+    "WorldEngine", "RuleExecutor", "ScenarioRunner", "create_simple_simulation",
+    "TaskCancelled", "report_progress",
+    "CompiledPlan", "TickKernel", "KernelResult",
+    "ChainIndex", "ChainVerifier", "verify_artifact_file",
+    "ColumnarStates", "StateRow",
 ]
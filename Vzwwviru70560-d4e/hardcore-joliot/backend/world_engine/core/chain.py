@@ -0,0 +1,394 @@
+"""
+============================================================================
+CHE·NU™ V69 — WORLDENGINE HASH CHAIN
+============================================================================
+Version: 1.1.0
+Purpose: Canonical state hashing, O(log n) chain index, streaming verifier
+Principle: Appends hash each state once; verification never reloads everything
+============================================================================
+
+State hashes are versioned (WorldState.hash_version):
+- v1: SHA-256 over a sorted JSON dump (states recorded before v2)
+- v2: SHA-256 over a canonical binary encoding (length-prefixed strings,
+  big-endian float64 values in slot-name order)
+New states use v2; v1 states still verify. WorldState memoizes its hash.
+
+ChainIndex keeps, per artifact:
+- a Fenwick tree of broken links, updated in O(log n) per appended state
+- a Merkle log (mountain range) over state hashes, giving a root that
+  commits to the whole run plus O(log n) inclusion proofs
+The index only serves incremental appends: verify_chain recomputes every
+hash from state content instead of trusting what was indexed.
+
+ChainVerifier checks a stream of states in constant memory (plus log n
+Merkle peaks), e.g. an artifact read line by line from a JSONL file.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+import hashlib
+import json
+import struct
+
+
+HASH_VERSION = b"chenu.worldstate.v2\x00"
+
+# WorldState.hash_version values
+STATE_HASH_V1 = 1
+STATE_HASH_V2 = 2
+STATE_HASH_VERSION = STATE_HASH_V2
+
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+# ============================================================================
+# CANONICAL HASHING
+# ============================================================================
+
+def _encode_str(value: Optional[str]) -> bytes:
+    if value is None:
+        return b"\xff\xff\xff\xff"
+    data = value.encode("utf-8")
+    return struct.pack(">I", len(data)) + data
+
+
+def canonical_state_bytes(
+    simulation_id: str,
+    scenario_id: str,
+    tick: int,
+    values: Dict[str, float],
+    previous_state_hash: Optional[str],
+) -> bytes:
+    """Canonical binary (v2) form of the hashed part of a WorldState"""
+    names = sorted(values)
+    parts = [
+        HASH_VERSION,
+        _encode_str(simulation_id),
+        _encode_str(scenario_id),
+        struct.pack(">qI", tick, len(names)),
+    ]
+    parts.extend(_encode_str(name) for name in names)
+    parts.append(struct.pack(f">{len(names)}d", *(values[name] for name in names)))
+    parts.append(_encode_str(previous_state_hash))
+    return b"".join(parts)
+
+
+def hash_state(
+    simulation_id: str,
+    scenario_id: str,
+    tick: int,
+    values: Dict[str, float],
+    previous_state_hash: Optional[str],
+    version: int = STATE_HASH_VERSION,
+) -> str:
+    """Hex SHA-256 of a state in the given hash format version"""
+    if version == STATE_HASH_V2:
+        data = canonical_state_bytes(
+            simulation_id, scenario_id, tick, values, previous_state_hash
+        )
+    elif version == STATE_HASH_V1:
+        data = json.dumps({
+            "simulation_id": simulation_id,
+            "scenario_id": scenario_id,
+            "tick": tick,
+            "slots": values,
+            "previous_state_hash": previous_state_hash,
+        }, sort_keys=True).encode()
+    else:
+        raise ValueError(f"Unknown state hash version: {version}")
+    return hashlib.sha256(data).hexdigest()
+
+
+# ============================================================================
+# MERKLE LOG
+# ============================================================================
+
+def _leaf(state_hash: str) -> bytes:
+    return hashlib.sha256(_LEAF + bytes.fromhex(state_hash)).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE + left + right).digest()
+
+
+def _bag(peaks: List[bytes]) -> bytes:
+    """Root of a list of peaks: H(p0, H(p1, ... pn))"""
+    acc = peaks[-1]
+    for peak in reversed(peaks[:-1]):
+        acc = _node(peak, acc)
+    return acc
+
+
+@dataclass
+class MerkleProof:
+    """Inclusion proof of one state hash in a Merkle log root"""
+    index: int
+    size: int
+    path: List[Tuple[bool, str]]   # (sibling is left, sibling hash), leaf -> peak
+    left_peaks: List[str]          # peaks left of ours, left -> right
+    right_bag: Optional[str]       # bagged peaks right of ours
+
+    def verify(self, state_hash: str, root: str) -> bool:
+        acc = _leaf(state_hash)
+        for is_left, sibling in self.path:
+            acc = _node(bytes.fromhex(sibling), acc) if is_left else _node(acc, bytes.fromhex(sibling))
+        if self.right_bag is not None:
+            acc = _node(acc, bytes.fromhex(self.right_bag))
+        for peak in reversed(self.left_peaks):
+            acc = _node(bytes.fromhex(peak), acc)
+        return acc.hex() == root
+
+
+class MerkleLog:
+    """
+    Append-only Merkle mountain range.
+
+    levels[h][i] hashes leaves [i * 2^h, (i + 1) * 2^h). Appending hashes
+    at most log2(n) new nodes; the root bags the current peaks.
+    """
+
+    def __init__(self):
+        self.levels: List[List[bytes]] = [[]]
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def append(self, state_hash: str) -> None:
+        node = _leaf(state_hash)
+        level = 0
+        while True:
+            nodes = self.levels[level]
+            nodes.append(node)
+            if len(nodes) % 2:
+                return
+            node = _node(nodes[-2], nodes[-1])
+            level += 1
+            if level == len(self.levels):
+                self.levels.append([])
+
+    def _peaks(self) -> List[Tuple[int, int]]:
+        """(level, index) of peaks, left to right"""
+        peaks = []
+        remaining = len(self)
+        offset = 0
+        for level in range(len(self.levels) - 1, -1, -1):
+            width = 1 << level
+            if remaining >= width:
+                peaks.append((level, offset // width))
+                offset += width
+                remaining -= width
+        return peaks
+
+    def root(self) -> Optional[str]:
+        if not len(self):
+            return None
+        return _bag([self.levels[h][i] for h, i in self._peaks()]).hex()
+
+    def proof(self, index: int) -> MerkleProof:
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        peaks = self._peaks()
+        start = 0
+        for position, (level, peak_index) in enumerate(peaks):
+            if index < start + (1 << level):
+                break
+            start += 1 << level
+
+        path = []
+        node_index = index
+        for h in range(level):
+            sibling = node_index ^ 1
+            path.append((sibling < node_index, self.levels[h][sibling].hex()))
+            node_index //= 2
+
+        right = [self.levels[h][i] for h, i in peaks[position + 1:]]
+        return MerkleProof(
+            index=index,
+            size=len(self),
+            path=path,
+            left_peaks=[self.levels[h][i].hex() for h, i in peaks[:position]],
+            right_bag=_bag(right).hex() if right else None,
+        )
+
+
+# ============================================================================
+# CHAIN INDEX
+# ============================================================================
+
+class ChainIndex:
+    """
+    Broken-link Fenwick tree + Merkle log over an artifact's states.
+
+    Link i (i >= 1) is broken when state i's previous_state_hash is not
+    state i-1's hash. Appending and window queries are O(log n).
+    """
+
+    def __init__(self):
+        self._tree: List[int] = [0]      # 1-based Fenwick tree
+        self._last_hash: Optional[str] = None
+        self.merkle = MerkleLog()
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def _prefix(self, i: int) -> int:
+        """Broken links among states [0, i)"""
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i &= i - 1
+        return total
+
+    def append(self, state_hash: str, previous_state_hash: Optional[str]) -> bool:
+        """Index the next state; returns whether its link is intact."""
+        ok = len(self) == 0 or previous_state_hash == self._last_hash
+        n = len(self) + 1
+        lowbit = n & -n
+        # Node n covers states (n - lowbit, n]: sum the earlier part of it
+        self._tree.append((0 if ok else 1) + self._prefix(n - 1) - self._prefix(n - lowbit))
+        self._last_hash = state_hash
+        self.merkle.append(state_hash)
+        return ok
+
+    def broken_links(self, start: int = 0, end: Optional[int] = None) -> int:
+        """Broken links inside states[start:end] (links to states before start excluded)"""
+        end = len(self) if end is None else min(end, len(self))
+        if end - start < 2:
+            return 0
+        return self._prefix(end) - self._prefix(start + 1)
+
+    @property
+    def root(self) -> Optional[str]:
+        return self.merkle.root()
+
+
+# ============================================================================
+# STREAMING VERIFIER
+# ============================================================================
+
+@dataclass
+class ChainVerification:
+    """Outcome of a streaming verification"""
+    valid: bool
+    states: int = 0
+    first_invalid_index: Optional[int] = None
+    reason: Optional[str] = None
+    initial_state_hash: Optional[str] = None
+    final_state_hash: Optional[str] = None
+    merkle_root: Optional[str] = None
+
+
+class ChainVerifier:
+    """
+    Incremental verifier fed one state (dict or WorldState) at a time.
+
+    Recomputes every hash from the state's content, so tampered slot
+    values are caught even when the stored hashes were left untouched.
+    Dicts without hash_version were written before versioning (v1).
+    Keeps only the previous hash and the Merkle peaks in memory.
+    """
+
+    def __init__(self):
+        self.result = ChainVerification(valid=True)
+        self._merkle = MerkleLog()
+
+    def feed(self, state: Union[Dict[str, Any], Any]) -> bool:
+        if isinstance(state, dict):
+            fields = state
+            values = {name: slot["value"] for name, slot in state.get("slots", {}).items()}
+        else:
+            # state_hash is a property (the memo), not in the instance dict
+            fields = {**state.__dict__, "state_hash": state.state_hash}
+            values = {name: slot.value for name, slot in state.slots.items()}
+
+        computed = hash_state(
+            fields["simulation_id"],
+            fields.get("scenario_id", "baseline"),
+            fields.get("tick", 0),
+            values,
+            fields.get("previous_state_hash"),
+            fields.get("hash_version", STATE_HASH_V1),
+        )
+        index = self.result.states
+        result = self.result
+
+        if result.valid:
+            stored = fields.get("state_hash")
+            if stored is not None and stored != computed:
+                self._fail(index, "state hash does not match state content")
+            elif index > 0 and fields.get("previous_state_hash") != result.final_state_hash:
+                self._fail(index, "broken link to previous state")
+
+        if index == 0:
+            result.initial_state_hash = computed
+        result.final_state_hash = computed
+        result.states += 1
+        self._merkle.append(computed)
+        result.merkle_root = self._merkle.root()
+        return result.valid
+
+    def _fail(self, index: int, reason: str) -> None:
+        self.result.valid = False
+        self.result.first_invalid_index = index
+        self.result.reason = reason
+
+    def finish(self, header: Optional[Dict[str, Any]] = None) -> ChainVerification:
+        """Check the totals an artifact header claims against what was streamed"""
+        result = self.result
+        if header and result.valid:
+            expected = {
+                "total_ticks": result.states,
+                "initial_state_hash": result.initial_state_hash,
+                "final_state_hash": result.final_state_hash,
+                "merkle_root": result.merkle_root,
+            }
+            for key, value in expected.items():
+                if header.get(key) is not None and header[key] != value:
+                    result.valid = False
+                    result.reason = f"header {key} does not match states"
+                    break
+        return result
+
+
+def verify_jsonl(lines: Iterable[Union[str, bytes]]) -> ChainVerification:
+    """
+    Verify an artifact in JSONL form (see SimulationArtifact.write_jsonl).
+
+    The first line is the artifact header, each following line one state.
+    """
+    verifier = ChainVerifier()
+    header: Optional[Dict[str, Any]] = None
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if header is None:
+            header = record
+            continue
+        verifier.feed(record)
+    return verifier.finish(header)
+
+
+def verify_artifact_file(path: str) -> ChainVerification:
+    """Stream-verify an artifact JSONL file without loading it whole."""
+    with open(path, "rb") as f:
+        return verify_jsonl(f)
+
+
+__all__ = [
+    "HASH_VERSION",
+    "STATE_HASH_V1",
+    "STATE_HASH_V2",
+    "STATE_HASH_VERSION",
+    "canonical_state_bytes",
+    "hash_state",
+    "MerkleLog",
+    "MerkleProof",
+    "ChainIndex",
+    "ChainVerification",
+    "ChainVerifier",
+    "verify_jsonl",
+    "verify_artifact_file",
+]
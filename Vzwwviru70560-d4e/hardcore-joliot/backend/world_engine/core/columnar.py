@@ -0,0 +1,493 @@
+"""
+============================================================================
+CHE·NU™ V69 — WORLDENGINE COLUMNAR STATES
+============================================================================
+Version: 1.0.0
+Purpose: Memory-compact, columnar storage of an artifact's states
+Principle: Store what changed, materialize WorldStates only on demand
+============================================================================
+
+A WorldState per tick costs a pydantic object plus one Slot object per
+slot. ColumnarStates keeps the same information as flat arrays:
+
+    per row (tick)   tick, timestamp, created_at, ids, previous hash, hash version,
+                     event range into a shared event log
+    per slot         name, first row, constant metadata (unit, type,
+                     confidence, provenance, bounds, slot_id)
+    deltas           CSR by row: (slot, value, previous_value, tick,
+                     timestamp) for every slot whose Slot changed
+    keyframes        full slot rows every `keyframe_interval` rows
+
+Streaming (iter_rows) replays deltas; random access (row, state) starts
+from the nearest keyframe. Slot metadata is taken from a slot's first
+appearance and slots can be added but not removed, as in WorldEngine.
+
+On disk the store is a directory of .npy arrays plus meta.json, loaded
+with np.load(mmap_mode="r") so nothing is read until it is used.
+"""
+
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+import json
+import math
+import os
+
+try:
+    import numpy as np
+except ImportError:  # Columnar storage is optional
+    np = None
+
+from .chain import hash_state
+
+
+NUMPY_AVAILABLE = np is not None
+
+DEFAULT_KEYFRAME_INTERVAL = 64
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Slot fields kept once per slot
+_SLOT_METADATA = (
+    "slot_id", "unit", "slot_type", "confidence", "provenance", "min_value", "max_value",
+)
+
+# name -> array typecode of the growable per-row / per-delta buffers
+_ROW_ARRAYS = {
+    "ticks": "q",
+    "timestamps": "d",
+    "created_at": "q",
+    "synthetic": "b",
+    "hash_versions": "b",
+    "event_start": "q",
+    "event_end": "q",
+}
+_DELTA_ARRAYS = {
+    "delta_ptr": "q",
+    "delta_cols": "q",
+    "delta_values": "d",
+    "delta_previous": "d",
+    "delta_ticks": "q",
+    "delta_timestamps": "d",
+}
+_KEYFRAME_ARRAYS = {
+    "kf_ptr": "q",
+    "kf_values": "d",
+    "kf_previous": "d",
+    "kf_ticks": "q",
+    "kf_timestamps": "d",
+}
+_ROW_STRINGS = ("state_ids", "previous_state_ids", "previous_state_hashes")
+
+# Every array of a saved store
+ARRAY_NAMES = (*_ROW_ARRAYS, *_DELTA_ARRAYS, *_KEYFRAME_ARRAYS, *_ROW_STRINGS)
+
+
+class StateRow(NamedTuple):
+    """One tick of an artifact without Slot/WorldState objects"""
+    tick: int
+    timestamp: float
+    values: Dict[str, float]
+    events: List[str]
+
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _none_to_nan(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if value != value else value
+
+
+class ColumnarStates:
+    """
+    Append-only columnar store of one artifact's WorldStates.
+
+    Built with append() (in memory, array.array buffers) or opened
+    read-only with load() (memory-mapped numpy arrays).
+    """
+
+    def __init__(
+        self,
+        simulation_id: str,
+        scenario_id: str,
+        tenant_id: Optional[str] = None,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ):
+        if np is None:
+            raise RuntimeError("numpy is required for columnar artifact storage")
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be >= 1")
+
+        self.simulation_id = simulation_id
+        self.scenario_id = scenario_id
+        self.tenant_id = tenant_id
+        self.keyframe_interval = keyframe_interval
+
+        # Slots
+        self.slot_names: List[str] = []
+        self.slot_index: Dict[str, int] = {}
+        self.slot_metadata: List[Dict[str, Any]] = []
+        self.first_row: List[int] = []
+
+        # Rows, deltas, keyframes
+        self._arrays: Dict[str, Any] = {
+            name: array(code)
+            for name, code in {**_ROW_ARRAYS, **_DELTA_ARRAYS, **_KEYFRAME_ARRAYS}.items()
+        }
+        self._arrays["delta_ptr"].append(0)
+        self._arrays["kf_ptr"].append(0)
+        self._strings: Dict[str, List[str]] = {name: [] for name in _ROW_STRINGS}
+        self.event_log: List[str] = []
+
+        # Append state: current full row and the last appended state
+        self._current: List[List[float]] = [[], [], [], []]
+        self._last_slots: Dict[str, Any] = {}
+        self._last_events: Optional[List[str]] = None
+        self._read_only = False
+
+    def __len__(self) -> int:
+        return len(self._arrays["ticks"])
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def append(self, state: Any) -> None:
+        """Append the next WorldState"""
+        if self._read_only:
+            raise RuntimeError("columnar states loaded from disk are read-only")
+        if (state.simulation_id, state.scenario_id, state.tenant_id) != (
+            self.simulation_id, self.scenario_id, self.tenant_id
+        ):
+            raise ValueError("state belongs to another simulation or scenario")
+        if len(state.slots) < len(self.slot_names) or not all(
+            name in state.slots for name in self.slot_names
+        ):
+            raise ValueError("slots cannot be removed from a columnar artifact")
+
+        row = len(self)
+        arrays = self._arrays
+        values, previous, ticks, timestamps = self._current
+        last_slots = self._last_slots
+
+        for name, slot in state.slots.items():
+            if last_slots.get(name) is slot:
+                continue
+            col = self.slot_index.get(name)
+            if col is None:
+                col = self._add_slot(name, slot, row)
+
+            slot_previous = _none_to_nan(slot.previous_value)
+            values[col] = slot.value
+            previous[col] = slot_previous
+            ticks[col] = slot.tick
+            timestamps[col] = slot.timestamp_sim
+
+            arrays["delta_cols"].append(col)
+            arrays["delta_values"].append(slot.value)
+            arrays["delta_previous"].append(slot_previous)
+            arrays["delta_ticks"].append(slot.tick)
+            arrays["delta_timestamps"].append(slot.timestamp_sim)
+
+        arrays["delta_ptr"].append(len(arrays["delta_cols"]))
+
+        if row % self.keyframe_interval == 0:
+            arrays["kf_values"].extend(values)
+            arrays["kf_previous"].extend(previous)
+            arrays["kf_ticks"].extend(ticks)
+            arrays["kf_timestamps"].extend(timestamps)
+            arrays["kf_ptr"].append(len(arrays["kf_values"]))
+
+        arrays["ticks"].append(state.tick)
+        arrays["timestamps"].append(state.timestamp_sim)
+        arrays["created_at"].append(_to_micros(state.created_at))
+        arrays["synthetic"].append(state.synthetic)
+        arrays["hash_versions"].append(state.hash_version)
+        self._strings["state_ids"].append(state.state_id)
+        self._strings["previous_state_ids"].append(state.previous_state_id or "")
+        self._strings["previous_state_hashes"].append(state.previous_state_hash or "")
+        self._append_events(state.events)
+        self._last_slots = state.slots
+
+    def _add_slot(self, name: str, slot: Any, row: int) -> int:
+        col = len(self.slot_names)
+        self.slot_names.append(name)
+        self.slot_index[name] = col
+        self.slot_metadata.append({key: getattr(slot, key) for key in _SLOT_METADATA})
+        self.first_row.append(row)
+        for column in self._current:
+            column.append(0)
+        return col
+
+    def _append_events(self, events: List[str]) -> None:
+        """Store events as a range of the log, sharing prefixes with the previous row"""
+        arrays = self._arrays
+        log = self.event_log
+        if len(arrays["event_end"]):
+            start, end = arrays["event_start"][-1], arrays["event_end"][-1]
+        else:
+            start = end = 0
+
+        shared = end - start
+        extends = (
+            end == len(log)
+            and len(events) >= shared
+            and (events is self._last_events or events[:shared] == log[start:end])
+        )
+        if not extends:
+            start, shared = len(log), 0
+        log.extend(events[shared:])
+        arrays["event_start"].append(start)
+        arrays["event_end"].append(len(log))
+        self._last_events = events
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def _slice(self, name: str, start: int, stop: int) -> "np.ndarray":
+        data = self._arrays[name]
+        if isinstance(data, array):
+            part = data[start:stop]
+            return np.frombuffer(part, dtype=part.typecode) if len(part) else np.zeros(0)
+        return data[start:stop]
+
+    def _scalar(self, name: str, index: int) -> Any:
+        return self._arrays[name][index].item() if self._read_only else self._arrays[name][index]
+
+    def _string(self, name: str, index: int) -> Optional[str]:
+        value = str(self._strings[name][index])
+        return value or None
+
+    def _events(self, row: int) -> List[str]:
+        return list(self.event_log[self._scalar("event_start", row):self._scalar("event_end", row)])
+
+    def _full_row(self, row: int) -> Tuple["np.ndarray", ...]:
+        """(values, previous, ticks, timestamps) of a row, from its keyframe"""
+        kf = row // self.keyframe_interval
+        start, stop = self._scalar("kf_ptr", kf), self._scalar("kf_ptr", kf + 1)
+        width = len(self.slot_names)
+        columns = []
+        for name, dtype in (("kf_values", "d"), ("kf_previous", "d"), ("kf_ticks", "q"), ("kf_timestamps", "d")):
+            column = np.zeros(width, dtype=dtype)
+            column[:stop - start] = self._slice(name, start, stop)
+            columns.append(column)
+
+        for r in range(kf * self.keyframe_interval + 1, row + 1):
+            self._apply(r, columns)
+        return tuple(columns)
+
+    def _apply(self, row: int, columns: List["np.ndarray"]) -> None:
+        start, stop = self._scalar("delta_ptr", row), self._scalar("delta_ptr", row + 1)
+        if start == stop:
+            return
+        cols = self._slice("delta_cols", start, stop)
+        for column, name in zip(columns, ("delta_values", "delta_previous", "delta_ticks", "delta_timestamps")):
+            column[cols] = self._slice(name, start, stop)
+
+    def _present(self, row: int) -> int:
+        """Number of slots present at a row (slots only get added)"""
+        count = 0
+        for first in self.first_row:
+            if first > row:
+                break
+            count += 1
+        return count
+
+    def row(self, index: int) -> StateRow:
+        """Random access to one row"""
+        if index < 0:
+            index += len(self)
+        values = self._full_row(index)[0]
+        width = self._present(index)
+        return StateRow(
+            tick=self._scalar("ticks", index),
+            timestamp=self._scalar("timestamps", index),
+            values=dict(zip(self.slot_names[:width], values[:width].tolist())),
+            events=self._events(index),
+        )
+
+    def iter_rows(self, start: int = 0) -> Iterator[StateRow]:
+        """Stream rows, replaying deltas instead of materializing states"""
+        if start >= len(self):
+            return
+        values = self._full_row(start)[0]
+        width = len(self.slot_names)
+        for index in range(start, len(self)):
+            if index > start:
+                lo, hi = self._scalar("delta_ptr", index), self._scalar("delta_ptr", index + 1)
+                if hi > lo:
+                    values[self._slice("delta_cols", lo, hi)] = self._slice("delta_values", lo, hi)
+            present = self._present(index) if self.first_row and self.first_row[-1] > index else width
+            yield StateRow(
+                tick=self._scalar("ticks", index),
+                timestamp=self._scalar("timestamps", index),
+                values=dict(zip(self.slot_names[:present], values[:present].tolist())),
+                events=self._events(index),
+            )
+
+    def state(self, index: int) -> Any:
+        """Materialize one WorldState"""
+        from .models import Slot, WorldState
+
+        if index < 0:
+            index += len(self)
+        values, previous, ticks, timestamps = (c.tolist() for c in self._full_row(index))
+        slots = {}
+        for col in range(self._present(index)):
+            slot = Slot.model_construct(
+                name=self.slot_names[col],
+                value=values[col],
+                previous_value=_nan_to_none(previous[col]),
+                tick=ticks[col],
+                timestamp_sim=timestamps[col],
+                **self.slot_metadata[col],
+            )
+            slots[slot.name] = slot
+
+        return WorldState(
+            state_id=self._string("state_ids", index),
+            simulation_id=self.simulation_id,
+            scenario_id=self.scenario_id,
+            tenant_id=self.tenant_id,
+            tick=self._scalar("ticks", index),
+            timestamp_sim=self._scalar("timestamps", index),
+            slots=slots,
+            events=self._events(index),
+            previous_state_id=self._string("previous_state_ids", index),
+            previous_state_hash=self._string("previous_state_hashes", index),
+            created_at=_EPOCH + timedelta(microseconds=self._scalar("created_at", index)),
+            synthetic=bool(self._scalar("synthetic", index)),
+            hash_version=self._scalar("hash_versions", index),
+        )
+
+    def iter_states(self, start: int = 0) -> Iterator[Any]:
+        for index in range(start, len(self)):
+            yield self.state(index)
+
+    def iter_hashes(self, start: int = 0) -> Iterator[Tuple[str, Optional[str]]]:
+        """(state_hash, previous_state_hash) per row, computed from the columns"""
+        for index, row in enumerate(self.iter_rows(start), start):
+            previous_hash = self._string("previous_state_hashes", index)
+            yield hash_state(
+                self.simulation_id, self.scenario_id, row.tick, row.values, previous_hash,
+                self._scalar("hash_versions", index),
+            ), previous_hash
+
+    def slot_values(self, name: str, default: float = 0.0) -> "np.ndarray":
+        """Dense per-row series of one slot (default before it appears)"""
+        n = len(self)
+        series = np.full(n, default, dtype=np.float64)
+        cols = self._slice("delta_cols", 0, len(self._arrays["delta_cols"]))
+        hits = np.flatnonzero(cols == self.slot_index[name])
+        if not len(hits):
+            return series
+
+        # Row of every write, then the last write at or before each row
+        rows = np.searchsorted(self._slice("delta_ptr", 0, n + 1), hits, side="right") - 1
+        written = self._slice("delta_values", 0, len(cols))[hits]
+        last = np.searchsorted(rows, np.arange(n), side="right") - 1
+        mask = last >= 0
+        series[mask] = written[last[mask]]
+        return series
+
+    @property
+    def ticks(self) -> "np.ndarray":
+        return self._slice("ticks", 0, len(self))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate size of the array data"""
+        return sum(
+            len(data) * data.itemsize if isinstance(data, array) else data.nbytes
+            for data in self._arrays.values()
+        )
+
+    # ------------------------------------------------------------------
+    # Disk
+    # ------------------------------------------------------------------
+
+    def to_arrays(self) -> Tuple[Dict[str, Any], Dict[str, "np.ndarray"]]:
+        """(meta, arrays) describing the whole store, for saving or transfer"""
+        arrays = {}
+        for name, data in self._arrays.items():
+            if isinstance(data, array):
+                data = np.frombuffer(data, dtype=data.typecode).copy() if len(data) else np.zeros(0, dtype=data.typecode)
+            arrays[name] = data
+        for name, strings in self._strings.items():
+            arrays[name] = np.array(list(strings), dtype=str)
+
+        meta = {
+            "simulation_id": self.simulation_id,
+            "scenario_id": self.scenario_id,
+            "tenant_id": self.tenant_id,
+            "keyframe_interval": self.keyframe_interval,
+            "slot_names": self.slot_names,
+            "slot_metadata": self.slot_metadata,
+            "first_row": self.first_row,
+            "event_log": self.event_log,
+        }
+        return meta, arrays
+
+    @classmethod
+    def from_arrays(cls, meta: Dict[str, Any], arrays: Dict[str, "np.ndarray"]) -> "ColumnarStates":
+        """Read-only store over arrays produced by to_arrays (or memory-mapped)"""
+        store = cls(
+            meta["simulation_id"],
+            meta["scenario_id"],
+            meta["tenant_id"],
+            meta["keyframe_interval"],
+        )
+        store.slot_names = list(meta["slot_names"])
+        store.slot_index = {name: i for i, name in enumerate(store.slot_names)}
+        store.slot_metadata = meta["slot_metadata"]
+        store.first_row = list(meta["first_row"])
+        store.event_log = meta["event_log"]
+
+        for name in store._arrays:
+            store._arrays[name] = arrays[name]
+        for name in store._strings:
+            store._strings[name] = arrays[name]
+        store._read_only = True
+        return store
+
+    def save(self, path: str, header: Optional[Dict[str, Any]] = None) -> None:
+        """Write to a directory of .npy arrays + meta.json"""
+        os.makedirs(path, exist_ok=True)
+        meta, arrays = self.to_arrays()
+        for name, data in arrays.items():
+            np.save(os.path.join(path, f"{name}.npy"), data)
+
+        meta["header"] = header
+        with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, default=str)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> Tuple["ColumnarStates", Optional[Dict[str, Any]]]:
+        """Open a saved store read-only; returns (states, header)"""
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        mode = "r" if mmap else None
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode)
+            for name in ARRAY_NAMES
+        }
+        return cls.from_arrays(meta, arrays), meta.get("header")
+
+
+__all__ = [
+    "NUMPY_AVAILABLE",
+    "DEFAULT_KEYFRAME_INTERVAL",
+    "ARRAY_NAMES",
+    "StateRow",
+    "ColumnarStates",
+]
@@ -9,7 +9,7 @@ Principle: GOUVERNANCE > EXÉCUTION — Zero hallucination, full traceability
 """
 
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 import logging
 import random
 
@@ -23,7 +23,10 @@ from .models import (
     SimulationConfig,
     SimulationStatus,
     ScenarioType,
+    WorkerTask,
 )
+from .progress import report_progress
+from .kernel import CompiledPlan, KernelResult, TickKernel, NUMPY_AVAILABLE, WRITE_RULE
 
 # Import from previous phases
 import sys
@@ -34,6 +37,9 @@ from feedback import FeedbackLoopEngine, Slot as FeedbackSlot
 from feedback.loops.audited import AuditedFeedbackEngine
 from audit import AuditLog, EventType
 
+if TYPE_CHECKING:
+    from ..workers.manager import WorkerPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -361,6 +367,7 @@ class WorldEngine:
         self,
         simulation_id: str,
         scenario_ids: Optional[List[str]] = None,
+        pool: Optional["WorkerPool"] = None,
     ) -> Dict[str, SimulationArtifact]:
         """
         Run simulation for specified scenarios.
@@ -368,6 +375,8 @@ class WorldEngine:
         Args:
             simulation_id: Simulation ID
             scenario_ids: Specific scenarios to run (all if None)
+            pool: Run each scenario as a task on this worker pool
+                (e.g. a process backend for sweeps over many scenarios)
             
         Returns:
             Dict of scenario_id -> SimulationArtifact
@@ -390,9 +399,23 @@ class WorldEngine:
         
         results = {}
         
+        # Worker pool: every scenario is a task, collected in order below
+        tasks = self._submit_to_pool(sim, scenarios, pool) if pool is not None else {}
+        
+        # Compiled mode: simulate compatible scenarios together up front
+        kernel_runs = self.run_compiled(sim, scenarios) if not tasks and self._use_kernel() else {}
+        
         for scenario in scenarios:
             try:
-                artifact = self._run_scenario(sim, scenario)
+                if scenario.scenario_id in tasks:
+                    # Verified and compacted by the task already
+                    artifact = self._record_scenario(
+                        sim, scenario, pool.result(tasks[scenario.scenario_id])
+                    )
+                else:
+                    artifact = self._run_scenario(
+                        sim, scenario, kernel_runs.get(scenario.scenario_id)
+                    )
                 results[scenario.scenario_id] = artifact
                 scenario.status = SimulationStatus.COMPLETED
                 scenario.result_artifact_id = artifact.artifact_id
@@ -418,12 +441,95 @@ class WorldEngine:
         
         return results
     
+    def _submit_to_pool(
+        self,
+        simulation: Simulation,
+        scenarios: List[Scenario],
+        pool: "WorkerPool",
+    ) -> Dict[str, str]:
+        """Submit one ScenarioRunner task per scenario; returns scenario_id -> task_id"""
+        runner = ScenarioRunner(self.config, simulation, dict(self.rule_executor._rule_functions))
+        tasks = {}
+        for scenario in scenarios:
+            task = WorkerTask(
+                simulation_id=simulation.simulation_id,
+                scenario_id=scenario.scenario_id,
+                t_start=scenario.t_start,
+                t_end=scenario.t_end,
+            )
+            scenario.status = SimulationStatus.RUNNING
+            tasks[scenario.scenario_id] = pool.submit_task(task, runner)
+        return tasks
+    
+    def _use_kernel(self) -> bool:
+        """Whether run_simulation uses the compiled tick kernel"""
+        if not self.config.compiled_kernel:
+            return False
+        if not NUMPY_AVAILABLE:
+            logger.warning("compiled_kernel requested but numpy is not installed")
+            return False
+        return True
+    
+    def run_compiled(
+        self,
+        simulation: Simulation,
+        scenarios: List[Scenario],
+    ) -> Dict[str, Tuple[KernelResult, int]]:
+        """
+        Simulate scenarios with the compiled tick kernel.
+        
+        Scenarios with the same rules and time range run as columns of one
+        matrix. Groups that cannot be compiled are left out and run on the
+        object path.
+        
+        Returns:
+            Dict of scenario_id -> (KernelResult, column)
+        """
+        groups: Dict[Tuple, List[Scenario]] = {}
+        for scenario in scenarios:
+            key = (
+                tuple(r.rule_id for r in scenario.rules),
+                scenario.t_start,
+                scenario.t_end,
+            )
+            groups.setdefault(key, []).append(scenario)
+        
+        runs = {}
+        for group in groups.values():
+            try:
+                plan = CompiledPlan.compile(
+                    simulation.shared_rules + group[0].rules,
+                    [name for s in group for name in s.initial_values],
+                    self.rule_executor._rule_functions,
+                )
+                kernel = TickKernel(
+                    plan,
+                    enable_safety=self.config.enable_safety_controller,
+                    explosion_threshold=self.config.explosion_threshold,
+                    collapse_floor=self.config.collapse_floor,
+                )
+                result = kernel.run(
+                    [s.initial_values for s in group],
+                    group[0].t_start,
+                    group[0].t_end,
+                    [s.interventions for s in group],
+                )
+            except Exception as e:
+                logger.warning(f"Compiled kernel failed, using object path: {e}")
+                continue
+            
+            for column, scenario in enumerate(group):
+                runs[scenario.scenario_id] = (result, column)
+        
+        return runs
+    
     def _run_scenario(
         self,
         simulation: Simulation,
         scenario: Scenario,
+        kernel_run: Optional[Tuple[KernelResult, int]] = None,
     ) -> SimulationArtifact:
-        """Run a single scenario"""
+        """Run a single scenario (from its kernel column if given)"""
         logger.info(f"Running scenario: {scenario.scenario_id} - {scenario.name}")
         
         scenario.status = SimulationStatus.RUNNING
@@ -445,11 +551,22 @@ class WorldEngine:
         )
         artifact.add_state(state)
         
+        if kernel_run is not None:
+            for new_state in self._materialize_states(simulation, scenario, state, *kernel_run):
+                self._add_state(artifact, new_state)
+            return self._complete_scenario(simulation, scenario, artifact)
+        
         # Get rules
         rules = simulation.shared_rules + scenario.rules
         
         # Run simulation loop
+        span = max(scenario.t_end - scenario.t_start, 1)
         for tick in range(scenario.t_start + 1, scenario.t_end + 1):
+            report_progress((tick - scenario.t_start) / span)
+            
+            # The chain links recorded states, not the post-rule copy
+            recorded = state
+            
             # Apply interventions
             state = self._apply_interventions(state, scenario, tick)
             
@@ -465,11 +582,11 @@ class WorldEngine:
                 timestamp_sim=float(tick),
                 slots=state.slots,
                 events=state.events,
-                previous_state_id=state.state_id,
-                previous_state_hash=state.state_hash,
+                previous_state_id=recorded.state_id,
+                previous_state_hash=recorded.state_hash,
             )
             
-            artifact.add_state(new_state)
+            self._add_state(artifact, new_state)
             state = new_state
             
             # Check for safety (simplified)
@@ -478,9 +595,102 @@ class WorldEngine:
                     logger.warning(f"Safety check failed at tick {tick}")
                     break
         
+        return self._complete_scenario(simulation, scenario, artifact)
+    
+    def _materialize_states(
+        self,
+        simulation: Simulation,
+        scenario: Scenario,
+        state: WorldState,
+        result: KernelResult,
+        column: int,
+    ) -> Iterator[WorldState]:
+        """
+        Rebuild the per-tick WorldStates of one kernel column.
+        
+        Only slots written on a tick get a new Slot and each state links
+        to the previously recorded one, so states and chain hashes match
+        _run_scenario's loop.
+        """
+        if column in result.errors:
+            raise result.errors[column]
+        
+        names = result.plan.slot_names
+        events: List[str] = list(state.events)
+        
+        span = max(scenario.t_end - result.t_start, 1)
+        for k in range(1, result.last_tick[column] - result.t_start + 1):
+            report_progress(k / span)
+            tick = result.t_start + k
+            recorded = state
+            written = result.written[k, :, column]
+            changed = written.nonzero()[0]
+            
+            if len(changed):
+                values = result.values[k, :, column].tolist()
+                previous = result.previous[k, :, column].tolist()
+                slots = dict(state.slots)
+                for i in changed.tolist():
+                    name = names[i]
+                    slot_tick = tick - 1 if written[i] == WRITE_RULE else tick
+                    base = slots.get(name)
+                    if base is None:
+                        base = Slot(name=name, value=0, tick=state.tick)
+                    slots[name] = base.model_copy(update={
+                        "value": values[i],
+                        "previous_value": previous[i],
+                        "tick": slot_tick,
+                        "timestamp_sim": float(slot_tick),
+                    })
+                events.extend(result.events[column].get(tick, ()))
+                state = state.model_copy(update={"slots": slots})
+            
+            new_state = WorldState(
+                simulation_id=simulation.simulation_id,
+                scenario_id=scenario.scenario_id,
+                tenant_id=simulation.tenant_id,
+                tick=tick,
+                timestamp_sim=float(tick),
+                slots=state.slots,
+                events=events,
+                previous_state_id=recorded.state_id,
+                previous_state_hash=recorded.state_hash,
+            )
+            yield new_state
+            state = new_state
+        
+        if result.last_tick[column] < scenario.t_end:
+            logger.warning(f"Safety check failed at tick {result.last_tick[column]}")
+    
+    def _add_state(self, artifact: SimulationArtifact, state: WorldState) -> None:
+        """Add a state, compacting the artifact into columns when configured"""
+        artifact.add_state(state)
+        every = self.config.artifact_compact_every
+        if every and NUMPY_AVAILABLE and len(artifact.states) >= every:
+            artifact.compact(self.config.artifact_keyframe_interval)
+    
+    def _complete_scenario(
+        self,
+        simulation: Simulation,
+        scenario: Scenario,
+        artifact: SimulationArtifact,
+    ) -> SimulationArtifact:
+        """Verify, compact, store and log a finished scenario artifact"""
         # Verify chain
         artifact.verify_chain()
         
+        if self.config.artifact_compact_every and NUMPY_AVAILABLE:
+            artifact.compact(self.config.artifact_keyframe_interval)
+        
+        return self._record_scenario(simulation, scenario, artifact)
+    
+    def _record_scenario(
+        self,
+        simulation: Simulation,
+        scenario: Scenario,
+        artifact: SimulationArtifact,
+    ) -> SimulationArtifact:
+        """Store and log a completed artifact"""
         # Store artifact
         self._artifacts[artifact.artifact_id] = artifact
         
@@ -593,6 +803,44 @@ class WorldEngine:
         return sims
 
 
+# ============================================================================
+# SCENARIO RUNNER
+# ============================================================================
+
+class ScenarioRunner:
+    """
+    Worker task executor running one scenario of a simulation.
+    
+    Picklable (as long as the rule functions are), so process and queue
+    workers can rebuild a WorldEngine and run the scenario there.
+    """
+    
+    def __init__(
+        self,
+        config: SimulationConfig,
+        simulation: Simulation,
+        rule_functions: Optional[Dict[str, Callable]] = None,
+    ):
+        self.config = config
+        self.simulation = simulation
+        self.rule_functions = rule_functions or {}
+    
+    def __call__(self, task: WorkerTask) -> SimulationArtifact:
+        scenario = next(
+            (s for s in self.simulation.scenarios if s.scenario_id == task.scenario_id),
+            None,
+        )
+        if scenario is None:
+            raise ValueError(f"Scenario not found: {task.scenario_id}")
+        
+        engine = WorldEngine(self.config)
+        engine._simulations[self.simulation.simulation_id] = self.simulation
+        engine.rule_executor._rule_functions.update(self.rule_functions)
+        
+        kernel_runs = engine.run_compiled(self.simulation, [scenario]) if engine._use_kernel() else {}
+        return engine._run_scenario(self.simulation, scenario, kernel_runs.get(scenario.scenario_id))
+
+
 # ============================================================================
 # FACTORY FUNCTIONS
 # ============================================================================
@@ -0,0 +1,423 @@
+"""
+============================================================================
+CHE·NU™ V69 — WORLDENGINE TICK KERNEL
+============================================================================
+Version: 1.0.0
+Purpose: Compiled, vectorized execution of causal rules
+Principle: Same numbers as RuleExecutor, without per-tick object churn
+============================================================================
+
+The object path (RuleExecutor over WorldState/Slot) re-sorts the rules and
+copies pydantic models for every rule on every tick. The kernel lowers the
+rules once into a plan of slot indices and runs it on a dense float64
+matrix:
+
+    rows    = slots (initial slots, then rule targets)
+    columns = scenarios sharing the same rules and time range
+
+Default multiplicative rules and min/max/equality conditions are NumPy
+operations over all columns at once. Custom rule functions are called per
+column with plain floats, exactly as RuleExecutor calls them. Operations
+are applied in the same order and to the same IEEE doubles as the object
+path, so the results are bit-identical.
+
+Custom functions are called column by column on each tick. Functions that
+draw from `random` therefore see a different call order than the object
+path and should run there.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+
+try:
+    import numpy as np
+except ImportError:  # Compiled mode is optional
+    np = None
+
+from .models import CausalRule
+
+logger = logging.getLogger(__name__)
+
+NUMPY_AVAILABLE = np is not None
+
+# Who wrote a slot last within a tick (decides the Slot.tick recorded)
+WRITE_NONE = 0
+WRITE_RULE = 1
+WRITE_INTERVENTION = 2
+
+
+# ============================================================================
+# PLAN
+# ============================================================================
+
+@dataclass(frozen=True)
+class Condition:
+    """A lowered rule condition on one slot"""
+    slot: int
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    equals: Any = None
+    is_range: bool = True
+
+
+@dataclass(frozen=True)
+class RuleOp:
+    """A lowered rule: write f(sources) to target when conditions hold"""
+    rule_id: str
+    target: int
+    sources: Tuple[int, ...]
+    source_names: Tuple[str, ...]
+    conditions: Tuple[Condition, ...]
+    function: Optional[Callable[[Dict[str, float]], float]] = None
+
+    @property
+    def requires(self) -> Tuple[int, ...]:
+        """Slots that must exist for the rule to apply"""
+        return tuple(c.slot for c in self.conditions) + self.sources
+
+
+@dataclass
+class CompiledPlan:
+    """
+    Rules lowered to slot indices, in execution order.
+
+    RuleExecutor sorts by priority on every tick; the plan is sorted once
+    (with the same stable sort), so rule dependencies through shared slots
+    keep their order.
+    """
+    slot_names: List[str]
+    ops: List[RuleOp]
+    index: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def compile(
+        cls,
+        rules: Sequence[CausalRule],
+        slot_names: Sequence[str],
+        rule_functions: Optional[Dict[str, Callable]] = None,
+    ) -> "CompiledPlan":
+        """
+        Lower rules against a set of initial slot names.
+
+        Args:
+            rules: Shared + scenario rules
+            slot_names: Slots present in any initial state
+            rule_functions: rule_id -> custom function (RuleExecutor registry)
+        """
+        rule_functions = rule_functions or {}
+        names = list(dict.fromkeys(slot_names))
+        index = {name: i for i, name in enumerate(names)}
+
+        def slot(name: str) -> int:
+            if name not in index:
+                index[name] = len(names)
+                names.append(name)
+            return index[name]
+
+        ops = []
+        for rule in sorted(rules, key=lambda r: r.priority):
+            if not rule.active:
+                continue
+
+            conditions = []
+            for slot_name, condition in rule.conditions.items():
+                if isinstance(condition, dict):
+                    conditions.append(Condition(
+                        slot=slot(slot_name),
+                        min_value=condition.get("min"),
+                        max_value=condition.get("max"),
+                    ))
+                else:
+                    conditions.append(Condition(
+                        slot=slot(slot_name), equals=condition, is_range=False
+                    ))
+
+            # RuleExecutor collects sources into a dict: duplicates count once
+            source_names = tuple(dict.fromkeys(rule.source_slots))
+            ops.append(RuleOp(
+                rule_id=rule.rule_id,
+                target=slot(rule.target_slot),
+                sources=tuple(slot(name) for name in source_names),
+                source_names=source_names,
+                conditions=tuple(conditions),
+                function=rule_functions.get(rule.rule_id),
+            ))
+
+        return cls(slot_names=names, ops=ops, index=index)
+
+    @property
+    def num_slots(self) -> int:
+        return len(self.slot_names)
+
+
+# ============================================================================
+# RESULT
+# ============================================================================
+
+@dataclass
+class KernelResult:
+    """
+    Trajectories of all columns, indexed [tick offset, slot, column].
+
+    Offset 0 is the initial state. `previous` mirrors Slot.previous_value
+    of written slots, `exists` tells which slots a state has, `written`
+    which slots were written on a tick and by whom (WRITE_RULE or
+    WRITE_INTERVENTION).
+    """
+    plan: CompiledPlan
+    t_start: int
+    values: Any
+    previous: Any
+    exists: Any
+    written: Any
+    last_tick: List[int]
+    events: List[Dict[int, List[str]]]
+    errors: Dict[int, BaseException]
+
+    def column(self, name: str, column: int = 0) -> Any:
+        """Value series of one slot for one scenario (up to its last tick)."""
+        end = self.last_tick[column] - self.t_start + 1
+        return self.values[:end, self.plan.index[name], column]
+
+
+# ============================================================================
+# KERNEL
+# ============================================================================
+
+class TickKernel:
+    """
+    Runs a CompiledPlan over many scenarios as matrix columns.
+
+    Each tick mirrors WorldEngine._run_scenario: interventions, then the
+    rule ops in order, then the safety check. A column stops at the tick
+    its safety check fails (that tick is kept) or when one of its custom
+    rule functions raises.
+    """
+
+    def __init__(
+        self,
+        plan: CompiledPlan,
+        enable_safety: bool = True,
+        explosion_threshold: float = 1.35,
+        collapse_floor: float = 0.001,
+    ):
+        if np is None:
+            raise RuntimeError("numpy is required for the compiled tick kernel")
+        self.plan = plan
+        self.enable_safety = enable_safety
+        self.explosion_threshold = explosion_threshold
+        self.collapse_floor = collapse_floor
+
+    def run(
+        self,
+        initial_values: Sequence[Dict[str, float]],
+        t_start: int,
+        t_end: int,
+        interventions: Optional[Sequence[Dict[str, Dict[int, float]]]] = None,
+    ) -> KernelResult:
+        """
+        Simulate ticks t_start+1 .. t_end for every column.
+
+        Args:
+            initial_values: Initial slot values, one dict per column
+            t_start: Tick of the initial state
+            t_end: Last tick
+            interventions: slot -> {tick: value}, one dict per column
+        """
+        plan = self.plan
+        n_cols = len(initial_values)
+        n_slots = plan.num_slots
+        n_ticks = max(t_end - t_start, 0)
+
+        cur = np.zeros((n_slots, n_cols))
+        prev = np.zeros((n_slots, n_cols))
+        has_prev = np.zeros((n_slots, n_cols), dtype=bool)
+        exists = np.zeros((n_slots, n_cols), dtype=bool)
+        for col, values in enumerate(initial_values):
+            for name, value in values.items():
+                cur[plan.index[name], col] = value
+                exists[plan.index[name], col] = True
+
+        shape = (n_ticks + 1, n_slots, n_cols)
+        hist_values = np.empty(shape)
+        hist_prev = np.empty(shape)
+        hist_exists = np.empty(shape, dtype=bool)
+        hist_written = np.zeros(shape, dtype=np.int8)
+        hist_values[0], hist_prev[0], hist_exists[0] = cur, prev, exists
+
+        schedule = self._schedule(interventions or [{}] * n_cols, t_start, t_end)
+        events: List[Dict[int, List[str]]] = [{} for _ in range(n_cols)]
+
+        alive = np.ones(n_cols, dtype=bool)
+        last_tick = np.full(n_cols, t_start)
+        errors: Dict[int, BaseException] = {}
+
+        # Which columns an op may touch (alive, required slots exist) only
+        # changes when a column stops or a target slot is first created, so
+        # it is cached per op and rebuilt when `version` moves.
+        version = 0
+        scratch = np.empty((n_slots, n_cols))
+        cache: List[Optional[Tuple[int, Any, bool, bool]]] = [None] * len(plan.ops)
+
+        for k in range(1, n_ticks + 1):
+            tick = t_start + k
+            written = hist_written[k]
+
+            # 1. Interventions (only on slots that exist)
+            for slot_idx, cols, values, name in schedule.get(tick, ()):
+                hit = exists[slot_idx, cols] & alive[cols]
+                cols, values = cols[hit], values[hit]
+                if not len(cols):
+                    continue
+                prev[slot_idx, cols] = cur[slot_idx, cols]
+                has_prev[slot_idx, cols] = True
+                cur[slot_idx, cols] = values
+                written[slot_idx, cols] = WRITE_INTERVENTION
+                for col, value in zip(cols.tolist(), values.tolist()):
+                    events[col].setdefault(tick, []).append(f"intervention:{name}={value}")
+
+            # 2. Rules in plan order
+            for i, op in enumerate(plan.ops):
+                entry = cache[i]
+                if entry is None or entry[0] != version:
+                    base = alive.copy()
+                    for slot_idx in op.requires:
+                        base &= exists[slot_idx]
+                    entry = cache[i] = (
+                        version, base, bool(base.all()), bool(exists[op.target].all())
+                    )
+                _, mask, full, target_exists = entry
+
+                if op.conditions:
+                    mask = self._apply_conditions(op, cur, mask)
+                    full = bool(mask.all())
+                if not full and not mask.any():
+                    continue
+
+                if op.function is None:
+                    # Default: 1.0 * v1 * v2 ... (1.0 * v1 == v1 exactly)
+                    if op.sources:
+                        new = cur[op.sources[0]].copy()
+                        for src in op.sources[1:]:
+                            np.multiply(new, cur[src], out=new)
+                    else:
+                        new = np.ones(n_cols)
+                else:
+                    new = np.zeros(n_cols)
+                    for col in np.flatnonzero(mask).tolist():
+                        args = {
+                            name: float(cur[src, col])
+                            for name, src in zip(op.source_names, op.sources)
+                        }
+                        try:
+                            new[col] = op.function(args)
+                        except Exception as e:
+                            errors[col] = e
+                            alive[col] = False
+                            mask = mask.copy()
+                            mask[col] = False
+                            full = False
+                            version += 1
+
+                t = op.target
+                if full and target_exists:
+                    prev[t] = cur[t]
+                    cur[t] = new
+                    has_prev[t] = True
+                    written[t] = WRITE_RULE
+                else:
+                    prev[t] = np.where(mask, np.where(exists[t], cur[t], 0.0), prev[t])
+                    cur[t] = np.where(mask, new, cur[t])
+                    has_prev[t] |= mask
+                    written[t][mask] = WRITE_RULE
+                    if not target_exists and (mask & ~exists[t]).any():
+                        exists[t] |= mask
+                        version += 1
+
+            hist_values[k], hist_prev[k], hist_exists[k] = cur, prev, exists
+
+            # 3. Safety (the failing tick is kept)
+            last_tick[alive] = tick
+            if self.enable_safety:
+                unsafe = self._unsafe(cur, prev, has_prev, exists, scratch) & alive
+                if unsafe.any():
+                    alive &= ~unsafe
+                    version += 1
+
+            if not alive.any():
+                break
+
+        return KernelResult(
+            plan=plan,
+            t_start=t_start,
+            values=hist_values,
+            previous=hist_prev,
+            exists=hist_exists,
+            written=hist_written,
+            last_tick=last_tick.tolist(),
+            events=events,
+            errors=errors,
+        )
+
+    def _schedule(
+        self,
+        interventions: Sequence[Dict[str, Dict[int, float]]],
+        t_start: int,
+        t_end: int,
+    ) -> Dict[int, List[Tuple[int, Any, Any, str]]]:
+        """tick -> [(slot, columns, values, name)], in scenario dict order"""
+        by_tick: Dict[int, Dict[str, Tuple[List[int], List[float]]]] = {}
+        for col, scenario_interventions in enumerate(interventions):
+            for name, values in scenario_interventions.items():
+                if name not in self.plan.index:
+                    continue
+                for tick, value in values.items():
+                    if t_start < tick <= t_end:
+                        cols, vals = by_tick.setdefault(tick, {}).setdefault(name, ([], []))
+                        cols.append(col)
+                        vals.append(value)
+
+        return {
+            tick: [
+                (self.plan.index[name], np.array(cols, dtype=np.intp), np.array(vals, dtype=float), name)
+                for name, (cols, vals) in slots.items()
+            ]
+            for tick, slots in by_tick.items()
+        }
+
+    @staticmethod
+    def _apply_conditions(op: RuleOp, cur: Any, mask: Any) -> Any:
+        """Narrow a structural mask by the rule's value conditions"""
+        mask = mask.copy()
+        for cond in op.conditions:
+            values = cur[cond.slot]
+            if cond.is_range:
+                # RuleExecutor rejects on value < min / value > max (NaN passes)
+                if cond.min_value is not None:
+                    mask &= ~(values < cond.min_value)
+                if cond.max_value is not None:
+                    mask &= ~(values > cond.max_value)
+            elif isinstance(cond.equals, (int, float)):
+                mask &= values == cond.equals
+            else:
+                mask[:] = False
+        return mask
+
+    def _unsafe(self, cur: Any, prev: Any, has_prev: Any, exists: Any, ratio: Any) -> Any:
+        """Columns failing WorldEngine._safety_check (`ratio` is scratch space)"""
+        growing = has_prev & (prev > 0)
+        np.divide(cur, prev, out=ratio, where=growing)
+        exploded = growing & (ratio > self.explosion_threshold)
+        collapsed = cur < self.collapse_floor
+        return ((exploded | collapsed) & exists).any(axis=0)
+
+
+__all__ = [
+    "NUMPY_AVAILABLE",
+    "CompiledPlan",
+    "RuleOp",
+    "Condition",
+    "KernelResult",
+    "TickKernel",
+]
@@ -10,11 +10,13 @@ Principle: Deterministic, reproducible, governed simulations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Callable
-from pydantic import BaseModel, Field, computed_field
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Callable, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, model_validator
 import uuid
-import hashlib
-import json
+
+from .chain import ChainIndex, MerkleProof, STATE_HASH_V1, STATE_HASH_VERSION, hash_state
+from .columnar import DEFAULT_KEYFRAME_INTERVAL, ColumnarStates, StateRow
 
 
 # ============================================================================
@@ -129,6 +131,11 @@ class Slot(BaseModel):
 # WORLD STATE
 # ============================================================================
 
+# Fields covered by WorldState.state_hash
+_HASHED_FIELDS = frozenset({
+    "simulation_id", "scenario_id", "tick", "slots", "previous_state_hash", "hash_version",
+})
+
 class WorldState(BaseModel):
     """
     WorldState = Immutable snapshot of the entire simulation at tick T.
@@ -157,25 +164,54 @@ class WorldState(BaseModel):
     # Chain
     previous_state_id: Optional[str] = Field(default=None)
     previous_state_hash: Optional[str] = Field(default=None)
+    hash_version: int = Field(default=STATE_HASH_VERSION)
     
     # Metadata
     created_at: datetime = Field(default_factory=datetime.utcnow)
     synthetic: bool = Field(default=True)
     
+    # Memoized state_hash (reset when a hashed field is reassigned; edits
+    # inside `slots` are only seen by rehash / SimulationArtifact.verify_chain)
+    _hash: Optional[str] = PrivateAttr(default=None)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _legacy_hash_version(cls, data: Any) -> Any:
+        """Serialized states from before hash versioning use v1 hashes"""
+        if isinstance(data, dict) and "state_hash" in data and "hash_version" not in data:
+            data = {**data, "hash_version": STATE_HASH_V1}
+        return data
+    
     @computed_field
     @property
     def state_hash(self) -> str:
-        """Compute state hash for verification"""
-        content = {
-            "simulation_id": self.simulation_id,
-            "scenario_id": self.scenario_id,
-            "tick": self.tick,
-            "slots": {k: v.value for k, v in self.slots.items()},
-            "previous_state_hash": self.previous_state_hash,
-        }
-        return hashlib.sha256(
-            json.dumps(content, sort_keys=True).encode()
-        ).hexdigest()
+        """State hash for verification (computed once, see chain.py)"""
+        if self._hash is None:
+            self._hash = hash_state(
+                self.simulation_id,
+                self.scenario_id,
+                self.tick,
+                {k: v.value for k, v in self.slots.items()},
+                self.previous_state_hash,
+                self.hash_version,
+            )
+        return self._hash
+    
+    def rehash(self) -> str:
+        """Recompute state_hash from the current content"""
+        self._hash = None
+        return self.state_hash
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _HASHED_FIELDS:
+            self._hash = None
+        super().__setattr__(name, value)
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "WorldState":
+        copy = super().model_copy(update=update, deep=deep)
+        if update and not _HASHED_FIELDS.isdisjoint(update):
+            copy._hash = None
+        return copy
     
     def get_slot(self, name: str) -> Optional[Slot]:
         """Get slot by name"""
@@ -415,7 +451,7 @@ class SimulationArtifact(BaseModel):
     SimulationArtifact = Certified output of a simulation run.
     
     Contains:
-    - All states from the simulation
+    - All states from the simulation (optionally compacted into columns)
     - Causal chain verification
     - Signature for integrity
     """
@@ -425,7 +461,7 @@ class SimulationArtifact(BaseModel):
     scenario_id: str = Field(...)
     tenant_id: Optional[str] = Field(default=None)
     
-    # States
+    # States (not yet compacted; see compact())
     states: List[WorldState] = Field(default_factory=list)
     
     # Summary
@@ -436,6 +472,7 @@ class SimulationArtifact(BaseModel):
     # Verification
     initial_state_hash: Optional[str] = Field(default=None)
     final_state_hash: Optional[str] = Field(default=None)
+    merkle_root: Optional[str] = Field(default=None)
     chain_valid: bool = Field(default=False)
     
     # Signature
@@ -450,38 +487,201 @@ class SimulationArtifact(BaseModel):
     synthetic: bool = Field(default=True)
     seed: Optional[int] = Field(default=None)
     
+    # Broken-link tree + Merkle log over states (see chain.py)
+    _chain: Optional[ChainIndex] = PrivateAttr(default=None)
+    
+    # Compacted leading states (see columnar.py); `states` holds the rest
+    _columns: Optional[ColumnarStates] = PrivateAttr(default=None)
+    
+    @property
+    def state_count(self) -> int:
+        """Number of states, compacted or not"""
+        return len(self.states) + (len(self._columns) if self._columns is not None else 0)
+    
+    def _chain_index(self) -> ChainIndex:
+        """
+        Chain index over states, extended with any states not indexed yet.
+        
+        Artifacts loaded from disk are indexed on first use. The index
+        only serves appends and Merkle proofs: verify_chain rebuilds it
+        from recomputed hashes rather than trusting it.
+        """
+        chain = self._chain
+        if chain is None or len(chain) > self.state_count:
+            chain = self._chain = ChainIndex()
+        
+        compacted = len(self._columns) if self._columns is not None else 0
+        if len(chain) < compacted:
+            for state_hash, previous_hash in self._columns.iter_hashes(len(chain)):
+                chain.append(state_hash, previous_hash)
+        for state in self.states[len(chain) - compacted:]:
+            chain.append(state.state_hash, state.previous_state_hash)
+        return chain
+    
     def add_state(self, state: WorldState) -> None:
-        """Add state to artifact"""
+        """Add state to artifact (O(log n) chain index update)"""
         self.states.append(state)
-        self.total_ticks = len(self.states)
+        self.total_ticks = self.state_count
+        self._chain_index()
         
-        if len(self.states) == 1:
+        if self.total_ticks == 1:
             self.initial_state_hash = state.state_hash
             self.t_start = state.tick
         
         self.final_state_hash = state.state_hash
         self.t_end = state.tick
     
-    def verify_chain(self) -> bool:
-        """Verify state chain integrity"""
-        if len(self.states) < 2:
-            self.chain_valid = True
-            return True
+    def compact(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        """Move `states` into columnar storage (later states append to `states` again)"""
+        if self._columns is None:
+            self._columns = ColumnarStates(
+                self.simulation_id,
+                self.scenario_id,
+                self.tenant_id,
+                keyframe_interval=keyframe_interval,
+            )
+        self._chain_index()
+        for state in self.states:
+            self._columns.append(state)
+        self.states = []
+    
+    def iter_states(self, start: int = 0) -> Iterator[WorldState]:
+        """All states in order, materializing compacted ones lazily"""
+        compacted = len(self._columns) if self._columns is not None else 0
+        if start < compacted:
+            yield from self._columns.iter_states(start)
+        yield from self.states[max(start - compacted, 0):]
+    
+    def get_state(self, index: int) -> WorldState:
+        """Random access to one state"""
+        if index < 0:
+            index += self.state_count
+        compacted = len(self._columns) if self._columns is not None else 0
+        if index < compacted:
+            return self._columns.state(index)
+        return self.states[index - compacted]
+    
+    def iter_rows(self) -> Iterator[StateRow]:
+        """Tick, timestamp, slot values and events per state, without objects"""
+        if self._columns is not None:
+            yield from self._columns.iter_rows()
+        for state in self.states:
+            yield StateRow(
+                state.tick,
+                state.timestamp_sim,
+                {k: v.value for k, v in state.slots.items()},
+                state.events,
+            )
+    
+    def _iter_hashes(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[str, Optional[str]]]:
+        """(state_hash, previous_state_hash) of states[start:end], recomputed from content"""
+        end = self.state_count if end is None else min(end, self.state_count)
+        compacted = len(self._columns) if self._columns is not None else 0
+        if start < compacted:
+            yield from islice(self._columns.iter_hashes(start), min(end, compacted) - start)
+        for state in self.states[max(start - compacted, 0):max(end - compacted, 0)]:
+            yield state.rehash(), state.previous_state_hash
+    
+    def verify_chain(self, start: int = 0, end: Optional[int] = None) -> bool:
+        """
+        Verify state chain integrity over states[start:end].
         
-        for i in range(1, len(self.states)):
-            current = self.states[i]
-            previous = self.states[i - 1]
-            
-            if current.previous_state_hash != previous.state_hash:
-                self.chain_valid = False
-                return False
+        Every hash in the window is recomputed from state content, so
+        edited slots or links are caught even after the state was indexed.
+        Checking the whole chain also compares initial/final_state_hash,
+        replaces the chain index and records chain_valid and merkle_root.
+        """
+        chain = ChainIndex()
+        first = last = None
+        for state_hash, previous_hash in self._iter_hashes(start, end):
+            chain.append(state_hash, previous_hash)
+            first = state_hash if first is None else first
+            last = state_hash
+        valid = chain.broken_links() == 0
         
-        self.chain_valid = True
-        return True
+        if start == 0 and end is None:
+            valid = valid and all(
+                stored is None or stored == computed
+                for stored, computed in (
+                    (self.initial_state_hash, first),
+                    (self.final_state_hash, last),
+                )
+            )
+            self._chain = chain
+            self.chain_valid = valid
+            self.merkle_root = chain.root
+        return valid
+    
+    def merkle_proof(self, index: int) -> MerkleProof:
+        """Inclusion proof of state `index` against merkle_root"""
+        return self._chain_index().merkle.proof(index)
+    
+    def iter_jsonl(self) -> Iterator[str]:
+        """Header line (artifact without states), then one line per state"""
+        yield self.model_dump_json(exclude={"states"})
+        for state in self.iter_states():
+            yield state.model_dump_json()
+    
+    def write_jsonl(self, path: str) -> None:
+        """Write the artifact as JSONL, verifiable with chain.verify_artifact_file"""
+        with open(path, "w", encoding="utf-8") as f:
+            for line in self.iter_jsonl():
+                f.write(line)
+                f.write("\n")
+    
+    @classmethod
+    def read_jsonl(cls, path: str) -> "SimulationArtifact":
+        """Load an artifact written by write_jsonl"""
+        with open(path, "r", encoding="utf-8") as f:
+            artifact = cls.model_validate_json(f.readline())
+            artifact.states = [
+                WorldState.model_validate_json(line) for line in f if line.strip()
+            ]
+        return artifact
+    
+    def save_columnar(self, path: str, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        """Compact and write the artifact as a directory of .npy columns"""
+        self.compact(keyframe_interval)
+        self._columns.save(path, header=self.model_dump(mode="json", exclude={"states"}))
+    
+    @classmethod
+    def load_columnar(cls, path: str, mmap: bool = True) -> "SimulationArtifact":
+        """Open a columnar artifact; states are memory-mapped and materialized on access"""
+        columns, header = ColumnarStates.load(path, mmap=mmap)
+        artifact = cls.model_validate(header)
+        artifact._columns = columns
+        return artifact
+    
+    def export_columns(
+        self,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Compact and return (meta, arrays) for transfer; meta["header"] holds the artifact fields"""
+        self.compact(keyframe_interval)
+        meta, arrays = self._columns.to_arrays()
+        meta["header"] = self.model_dump(mode="json", exclude={"states"})
+        return meta, arrays
+    
+    @classmethod
+    def from_columns(cls, meta: Dict[str, Any], arrays: Dict[str, Any]) -> "SimulationArtifact":
+        """Rebuild an artifact from export_columns output"""
+        artifact = cls.model_validate(meta["header"])
+        artifact._columns = ColumnarStates.from_arrays(meta, arrays)
+        return artifact
+    
+    def iter_xr_states(self) -> Iterator[Dict[str, Any]]:
+        """Stream states in XR Pack format"""
+        for row in self.iter_rows():
+            yield {
+                "step": row.tick,
+                "timestamp": row.timestamp,
+                "slots": row.values,
+                "events": row.events,
+            }
     
     def to_xr_states(self) -> List[Dict[str, Any]]:
         """Convert to XR Pack format"""
-        return [s.to_dict() for s in self.states]
+        return list(self.iter_xr_states())
 
 
 # ============================================================================
@@ -494,6 +694,7 @@ class SimulationConfig(BaseModel):
     # Execution
     max_ticks: int = Field(default=10000)
     tick_timeout_seconds: float = Field(default=5.0)
+    compiled_kernel: bool = Field(default=False)  # Vectorized NumPy tick kernel
     
     # Safety
     enable_safety_controller: bool = Field(default=True)
@@ -511,4 +712,6 @@ class SimulationConfig(BaseModel):
     # Output
     generate_xr_pack: bool = Field(default=True)
     chunk_size: int = Field(default=250)
+    artifact_compact_every: int = Field(default=0)  # Columnar artifact states every N ticks (0 = off)
+    artifact_keyframe_interval: int = Field(default=64)
     sign_artifacts: bool = Field(default=True)
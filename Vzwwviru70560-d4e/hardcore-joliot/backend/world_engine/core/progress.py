@@ -0,0 +1,89 @@
+"""
+============================================================================
+CHE·NU™ V69 — WORLDENGINE TASK PROGRESS
+============================================================================
+Version: 1.0.0
+Purpose: Progress reporting and cooperative cancellation for running tasks
+Principle: The engine reports, whoever runs the task decides what it means
+============================================================================
+
+Code running inside a worker task calls report_progress(fraction). The
+worker backend that runs the task installs a reporter with
+progress_scope(); outside a task the call is a no-op. A reporter raises
+TaskCancelled when the task was cancelled, which unwinds the simulation
+at the next report.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+import time
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task that was cancelled"""
+    pass
+
+
+class ProgressReporter:
+    """
+    Throttled progress sink for one task.
+
+    Forwards a progress value when it moved by at least `min_step` or
+    `min_interval` seconds passed, and checks cancellation at most every
+    `min_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[float], None],
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        min_step: float = 0.01,
+        min_interval: float = 0.25,
+    ):
+        self.send = send
+        self.is_cancelled = is_cancelled
+        self.min_step = min_step
+        self.min_interval = min_interval
+        self._last_value = -1.0
+        self._last_time = 0.0
+
+    def __call__(self, fraction: float) -> None:
+        now = time.monotonic()
+        due = now - self._last_time >= self.min_interval
+
+        if due and self.is_cancelled is not None and self.is_cancelled():
+            raise TaskCancelled()
+
+        if due or fraction - self._last_value >= self.min_step or fraction >= 1.0:
+            self._last_value = fraction
+            self._last_time = now
+            self.send(min(max(fraction, 0.0), 1.0))
+
+
+_reporter: ContextVar[Optional[ProgressReporter]] = ContextVar("world_engine_progress", default=None)
+
+
+def report_progress(fraction: float) -> None:
+    """Report progress (0..1) of the current task; raises TaskCancelled if cancelled"""
+    reporter = _reporter.get()
+    if reporter is not None:
+        reporter(fraction)
+
+
+@contextmanager
+def progress_scope(reporter: ProgressReporter) -> Iterator[ProgressReporter]:
+    """Install a reporter for the code running in this context"""
+    token = _reporter.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _reporter.reset(token)
+
+
+__all__ = [
+    "TaskCancelled",
+    "ProgressReporter",
+    "report_progress",
+    "progress_scope",
+]
@@ -9,7 +9,7 @@ Principle: Support decision-making through scenario analysis
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import logging
 import copy
 
@@ -21,6 +21,7 @@ from ..core.models import (
     SimulationStatus,
     WorldState,
 )
+from ..core.columnar import StateRow
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,37 @@ logger = logging.getLogger(__name__)
 # SCENARIO COMPARISON
 # ============================================================================
 
+def _join_on_tick(
+    baseline_rows: Iterator[StateRow],
+    scenario_rows: Iterator[StateRow],
+) -> Iterator[Tuple[int, Dict[str, float], Dict[str, float]]]:
+    """Merge-join two tick-ordered row streams (last row wins per tick)"""
+    
+    def last_per_tick(rows: Iterator[StateRow]) -> Iterator[StateRow]:
+        previous = None
+        for row in rows:
+            if previous is not None and row.tick != previous.tick:
+                yield previous
+            previous = row
+        if previous is not None:
+            yield previous
+    
+    baseline = last_per_tick(baseline_rows)
+    scenario = last_per_tick(scenario_rows)
+    b = next(baseline, None)
+    s = next(scenario, None)
+    
+    while b is not None and s is not None:
+        if b.tick == s.tick:
+            yield b.tick, b.values, s.values
+            b = next(baseline, None)
+            s = next(scenario, None)
+        elif b.tick < s.tick:
+            b = next(baseline, None)
+        else:
+            s = next(scenario, None)
+
+
 class ScenarioComparison:
     """
     Comparison results between two scenarios.
@@ -243,6 +275,9 @@ class ScenarioManager:
         """
         Compare two scenario artifacts.
         
+        Streams both artifacts row by row (tick order), so compacted or
+        disk-backed artifacts are never materialized as WorldStates.
+        
         Args:
             baseline_artifact: Baseline artifact
             scenario_artifact: Scenario to compare
@@ -256,38 +291,24 @@ class ScenarioManager:
             scenario_id=scenario_artifact.scenario_id,
         )
         
-        # Get common ticks
-        baseline_states = {s.tick: s for s in baseline_artifact.states}
-        scenario_states = {s.tick: s for s in scenario_artifact.states}
-        
-        common_ticks = sorted(set(baseline_states.keys()) & set(scenario_states.keys()))
-        
-        if not common_ticks:
-            comparison.summary = "No common ticks found"
-            return comparison
-        
-        # Get all slot names
-        first_baseline = baseline_states[common_ticks[0]]
-        slot_names = list(first_baseline.slots.keys())
-        
-        # Initialize delta tracking
-        for slot_name in slot_names:
-            comparison.slot_deltas[slot_name] = []
-        
-        # Calculate deltas for each tick
-        for tick in common_ticks:
-            baseline_state = baseline_states[tick]
-            scenario_state = scenario_states[tick]
-            
-            tick_deltas = {}
+        # Stream both artifacts, joined on tick
+        slot_names: Optional[List[str]] = None
+        
+        for tick, baseline_values, scenario_values in _join_on_tick(
+            baseline_artifact.iter_rows(), scenario_artifact.iter_rows()
+        ):
+            # Slot names from the first common tick
+            if slot_names is None:
+                slot_names = list(baseline_values.keys())
+                for slot_name in slot_names:
+                    comparison.slot_deltas[slot_name] = []
             
             for slot_name in slot_names:
-                baseline_val = baseline_state.get_value(slot_name)
-                scenario_val = scenario_state.get_value(slot_name)
+                baseline_val = baseline_values.get(slot_name, 0.0)
+                scenario_val = scenario_values.get(slot_name, 0.0)
                 
                 delta = scenario_val - baseline_val
                 comparison.slot_deltas[slot_name].append(delta)
-                tick_deltas[slot_name] = delta
                 
                 # Check for divergence
                 if baseline_val != 0:
@@ -302,6 +323,10 @@ class ScenarioManager:
                             "relative_delta": relative_delta,
                         })
         
+        if slot_names is None:
+            comparison.summary = "No common ticks found"
+            return comparison
+        
         # Calculate summary statistics
         for slot_name, deltas in comparison.slot_deltas.items():
             if deltas:
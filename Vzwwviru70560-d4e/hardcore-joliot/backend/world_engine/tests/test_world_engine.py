@@ -7,6 +7,7 @@ Purpose: Test WorldEngine simulation orchestration
 ============================================================================
 """
 
+import json
 import pytest
 from datetime import datetime, timedelta
 
@@ -23,8 +24,26 @@ from ..core.models import (
     TimeUnit,
 )
 from ..core.engine import WorldEngine, RuleExecutor, create_simple_simulation
+from ..core.kernel import CompiledPlan
+from ..core.chain import (
+    STATE_HASH_V1,
+    ChainVerifier,
+    hash_state,
+    verify_artifact_file,
+    verify_jsonl,
+)
 from ..scenarios.manager import ScenarioManager, WhatIfAnalyzer
 from ..workers.manager import Worker, WorkerPool, WorkerManager
+from ..workers.backends import (
+    ExecutionBackend,
+    QueueBackend,
+    QueueIntegrityError,
+    _open_sealed,
+    _seal,
+    decode_artifact,
+    encode_artifact,
+    serve_queue,
+)
 from ..temporal.iterator import (
     TemporalIterator,
     TemporalRange,
@@ -126,6 +145,19 @@ class TestWorldState:
         
         assert "Risk" in new_state.slots
         assert new_state.get_value("Risk") == 0.15
+    
+    def test_state_hash_tracks_updates(self):
+        state = WorldState(
+            simulation_id="sim-001",
+            slots={"Budget": Slot(name="Budget", value=1000000)},
+        )
+        original = state.state_hash
+        
+        assert state.model_copy(update={"events": ["x"]}).state_hash == original
+        assert state.set_slot("Budget", Slot(name="Budget", value=1)).state_hash != original
+        
+        state.tick = 5
+        assert state.state_hash != original
 
 
 # ============================================================================
@@ -229,6 +261,289 @@ class TestRuleExecutor:
         assert result_slot.value == 850000
 
 
+# ============================================================================
+# COMPILED KERNEL TESTS
+# ============================================================================
+
+class TestTickKernel:
+    """Test compiled kernel against the object path"""
+    
+    def _build(self, compiled):
+        engine = WorldEngine(SimulationConfig(
+            compiled_kernel=compiled,
+            explosion_threshold=5.0,
+        ))
+        sim = engine.create_simulation("Kernel")
+        
+        for i in range(3):
+            engine.add_scenario(
+                sim.simulation_id,
+                f"Variant {i}",
+                {"Budget": 1000.0 + 37 * i, "Growth": 1.001, "Efficiency": 0.9, "Risk": 0.1 * i},
+                t_end=200,
+                interventions={"Efficiency": {50: 0.95, 120 + i: 0.8}},
+            )
+        
+        engine.add_rule(sim.simulation_id, "Grow", "Budget", ["Budget", "Growth"], priority=10)
+        engine.add_rule(sim.simulation_id, "Prod", "Production", ["Budget", "Efficiency"], priority=20)
+        engine.add_rule(
+            sim.simulation_id, "Score", "Score", ["Production", "Risk"], priority=30,
+            rule_function=lambda vals: vals["Production"] / (1 + vals["Risk"]),
+        )
+        boost = engine.add_rule(sim.simulation_id, "Boost", "Boost", ["Production"], priority=40)
+        boost.conditions = {"Risk": {"min": 0.05, "max": 0.15}}
+        
+        return engine, sim
+    
+    def test_matches_object_path(self):
+        pytest.importorskip("numpy")
+        engine, sim = self._build(compiled=False)
+        expected = engine.run_simulation(sim.simulation_id)
+        
+        engine.config.compiled_kernel = True
+        actual = engine.run_simulation(sim.simulation_id)
+        
+        for scenario_id, artifact in expected.items():
+            compiled = actual[scenario_id]
+            assert compiled.total_ticks == artifact.total_ticks
+            for a, b in zip(artifact.states, compiled.states):
+                assert a.state_hash == b.state_hash
+                assert {k: (s.value, s.previous_value) for k, s in a.slots.items()} == \
+                    {k: (s.value, s.previous_value) for k, s in b.slots.items()}
+    
+    def test_scenarios_share_one_matrix(self):
+        pytest.importorskip("numpy")
+        engine, sim = self._build(compiled=True)
+        
+        runs = engine.run_compiled(sim, sim.scenarios)
+        
+        results = {id(result) for result, _ in runs.values()}
+        assert len(runs) == 3
+        assert len(results) == 1
+        result, column = runs[sim.scenarios[1].scenario_id]
+        assert result.column("Boost", column)[-1] > 0
+        assert "Boost" not in sim.scenarios[0].initial_values
+    
+    def test_plan_is_priority_ordered(self):
+        rules = [
+            CausalRule(name="B", target_slot="B", source_slots=["A"], priority=20),
+            CausalRule(name="A", target_slot="A", source_slots=["X", "X"], priority=10),
+            CausalRule(name="Off", target_slot="C", active=False),
+        ]
+        
+        plan = CompiledPlan.compile(rules, ["X"])
+        
+        assert [op.target for op in plan.ops] == [plan.index["A"], plan.index["B"]]
+        assert plan.ops[0].sources == (plan.index["X"],)
+
+
+# ============================================================================
+# HASH CHAIN TESTS
+# ============================================================================
+
+class TestHashChain:
+    """Test artifact chain index and streaming verifier"""
+    
+    def _artifact(self, ticks=20):
+        engine, sim, scenario = create_simple_simulation(
+            name="Chain",
+            initial_values={"Budget": 1000.0, "Growth": 1.01},
+            rules=[{"name": "Grow", "target": "Budget", "sources": ["Budget", "Growth"]}],
+            t_end=ticks,
+        )
+        return engine.run_simulation(sim.simulation_id)[scenario.scenario_id]
+    
+    def test_chain_valid_with_rules(self):
+        artifact = self._artifact()
+        
+        assert artifact.chain_valid
+        assert artifact.merkle_root is not None
+        assert artifact.states[1].get_value("Budget") > 1000.0
+    
+    def test_window_verification(self):
+        artifact = self._artifact()
+        artifact.add_state(WorldState(
+            simulation_id=artifact.simulation_id,
+            tick=artifact.t_end + 1,
+            previous_state_hash="0" * 64,
+        ))
+        
+        assert not artifact.verify_chain()
+        assert artifact.verify_chain(0, artifact.total_ticks - 1)
+        assert artifact.verify_chain(artifact.total_ticks - 1)
+        assert not artifact.verify_chain(5)
+    
+    def test_merkle_proof(self):
+        artifact = self._artifact(ticks=12)
+        artifact.verify_chain()
+        
+        for i, state in enumerate(artifact.states):
+            proof = artifact.merkle_proof(i)
+            assert proof.verify(state.state_hash, artifact.merkle_root)
+        assert not artifact.merkle_proof(3).verify(artifact.states[4].state_hash, artifact.merkle_root)
+    
+    def test_jsonl_stream_verification(self, tmp_path):
+        artifact = self._artifact()
+        path = str(tmp_path / "artifact.jsonl")
+        artifact.write_jsonl(path)
+        
+        result = verify_artifact_file(path)
+        assert result.valid
+        assert result.states == artifact.total_ticks
+        assert result.merkle_root == artifact.merkle_root
+        
+        loaded = SimulationArtifact.read_jsonl(path)
+        assert loaded.verify_chain()
+        assert loaded.merkle_root == artifact.merkle_root
+        
+        lines = open(path).read().splitlines()
+        lines[8] = lines[8].replace('"value":', '"value":1', 1)
+        with open(path, "w") as f:
+            f.write("\n".join(lines))
+        
+        tampered = verify_artifact_file(path)
+        assert not tampered.valid
+        assert tampered.first_invalid_index == 7
+    
+    def test_tampered_link_detected_after_indexing(self):
+        artifact = self._artifact()
+        artifact.states[3].previous_state_hash = "deadbeef"
+        
+        assert not artifact.verify_chain()
+        assert not artifact.chain_valid
+        assert artifact.verify_chain(0, 3)
+    
+    def test_tampered_slots_detected_despite_memo(self):
+        artifact = self._artifact()
+        artifact.states[2].slots["Budget"].value = 1.0
+        assert not artifact.verify_chain()
+        
+        artifact = self._artifact()
+        artifact.states[2].slots["Extra"] = Slot(name="Extra", value=1.0)
+        assert not artifact.verify_chain()
+    
+    def test_tampered_final_state_detected(self):
+        artifact = self._artifact()
+        artifact.states[-1].slots["Budget"].value = 1.0
+        
+        assert artifact.verify_chain(0, artifact.total_ticks)
+        assert not artifact.verify_chain()
+    
+    def test_streaming_verifier_checks_state_objects(self):
+        artifact = self._artifact()
+        stale = artifact.states[4].state_hash
+        artifact.states[4].slots["Budget"].value = 1.0
+        assert artifact.states[4].state_hash == stale  # Memo not refreshed yet
+        
+        verifier = ChainVerifier()
+        for state in artifact.states:
+            verifier.feed(state)
+        result = verifier.finish()
+        assert not result.valid
+        assert result.first_invalid_index == 4
+        assert result.reason == "state hash does not match state content"
+    
+    def test_v1_hashes_still_verify(self):
+        states = []
+        previous = None
+        for tick in range(5):
+            values = {"Budget": 1000.0 + tick}
+            state_hash = hash_state("sim-v1", "baseline", tick, values, previous, STATE_HASH_V1)
+            states.append({
+                "simulation_id": "sim-v1",
+                "tick": tick,
+                "slots": {"Budget": {"name": "Budget", "value": values["Budget"]}},
+                "previous_state_hash": previous,
+                "state_hash": state_hash,
+            })
+            previous = state_hash
+        
+        artifact = SimulationArtifact.model_validate({
+            "simulation_id": "sim-v1",
+            "scenario_id": "baseline",
+            "states": states,
+            "initial_state_hash": states[0]["state_hash"],
+            "final_state_hash": previous,
+        })
+        assert artifact.states[0].hash_version == STATE_HASH_V1
+        assert artifact.states[-1].state_hash == previous
+        assert artifact.verify_chain()
+        
+        lines = [json.dumps({"simulation_id": "sim-v1"})] + [json.dumps(state) for state in states]
+        assert verify_jsonl(lines).valid
+
+
+# ============================================================================
+# COLUMNAR ARTIFACT TESTS
+# ============================================================================
+
+class TestColumnarArtifact:
+    """Test columnar (keyframe + delta) artifact storage"""
+    
+    def _run(self, **config):
+        engine = WorldEngine(SimulationConfig(explosion_threshold=5.0, **config))
+        sim = engine.create_simulation("Columnar")
+        baseline = engine.add_scenario(
+            sim.simulation_id, "Baseline", {"Budget": 1000.0, "Growth": 1.01, "Efficiency": 0.9},
+            scenario_type=ScenarioType.BASELINE, t_end=40,
+        )
+        variant = engine.add_scenario(
+            sim.simulation_id, "Variant", {"Budget": 1200.0, "Growth": 1.01, "Efficiency": 0.9},
+            t_end=40, interventions={"Efficiency": {10: 0.7}},
+        )
+        engine.add_rule(sim.simulation_id, "Grow", "Budget", ["Budget", "Growth"], priority=10)
+        engine.add_rule(sim.simulation_id, "Prod", "Production", ["Budget", "Efficiency"], priority=20)
+        artifacts = engine.run_simulation(sim.simulation_id)
+        return sim, artifacts[baseline.scenario_id], artifacts[variant.scenario_id]
+    
+    def test_compact_round_trip(self):
+        pytest.importorskip("numpy")
+        _, _, artifact = self._run()
+        dumps = [s.model_dump() for s in artifact.states]
+        xr_states = artifact.to_xr_states()
+        
+        artifact.compact(keyframe_interval=7)
+        
+        assert artifact.states == []
+        assert artifact.state_count == len(dumps)
+        assert [s.model_dump() for s in artifact.iter_states()] == dumps
+        assert artifact.get_state(23).model_dump() == dumps[23]
+        assert artifact.to_xr_states() == xr_states
+        assert artifact.verify_chain()
+    
+    def test_compare_streams_compacted(self):
+        pytest.importorskip("numpy")
+        sim, baseline, variant = self._run()
+        manager = ScenarioManager(sim)
+        expected = manager.compare_artifacts(baseline, variant)
+        
+        baseline.compact(keyframe_interval=5)
+        variant.compact(keyframe_interval=5)
+        actual = manager.compare_artifacts(baseline, variant)
+        
+        assert actual.slot_deltas == expected.slot_deltas
+        assert actual.divergence_points == expected.divergence_points
+        assert actual.summary == expected.summary
+    
+    def test_save_and_load_mmap(self, tmp_path):
+        pytest.importorskip("numpy")
+        _, _, artifact = self._run(artifact_compact_every=16, artifact_keyframe_interval=8)
+        assert artifact.states == []
+        
+        path = str(tmp_path / "artifact")
+        artifact.save_columnar(path)
+        loaded = SimulationArtifact.load_columnar(path)
+        
+        assert loaded.total_ticks == artifact.total_ticks
+        assert loaded.verify_chain()
+        assert loaded.merkle_root == artifact.merkle_root
+        assert loaded.to_xr_states() == artifact.to_xr_states()
+        assert loaded.get_state(-1).state_hash == artifact.final_state_hash
+        assert list(loaded._columns.slot_values("Production")) == [
+            row.values.get("Production", 0.0) for row in artifact.iter_rows()
+        ]
+
+
 # ============================================================================
 # SCENARIO MANAGER TESTS
 # ============================================================================
@@ -417,6 +732,161 @@ class TestWorker:
         assert task.status.value == "completed"
 
 
+class _Exploit:
+    """Pickle that creates a file when loaded"""
+    
+    def __init__(self, path):
+        self.path = path
+    
+    def __reduce__(self):
+        return (open, (self.path, "w"))
+
+
+def _sweep_simulation():
+    engine = WorldEngine(SimulationConfig(explosion_threshold=5.0))
+    sim = engine.create_simulation("Sweep")
+    for i in range(4):
+        engine.add_scenario(sim.simulation_id, f"S{i}", {"Budget": 1000.0 + 100 * i, "Growth": 1.01}, t_end=30)
+    engine.add_rule(sim.simulation_id, "Grow", "Budget", ["Budget", "Growth"])
+    return engine, sim
+
+
+class TestWorkerBackends:
+    """Test WorkerPool execution backends"""
+    
+    def _assert_same_as_local(self, pool):
+        engine, sim = _sweep_simulation()
+        expected = {k: a.final_state_hash for k, a in engine.run_simulation(sim.simulation_id).items()}
+        try:
+            artifacts = engine.run_simulation(sim.simulation_id, pool=pool)
+        finally:
+            pool.shutdown()
+        
+        assert {k: a.final_state_hash for k, a in artifacts.items()} == expected
+        assert all(a.chain_valid for a in artifacts.values())
+    
+    def test_thread_backend(self):
+        progress = []
+        pool = WorkerPool(2, on_progress=lambda task, p: progress.append(p))
+        self._assert_same_as_local(pool)
+        assert progress and max(progress) == 1.0
+    
+    def test_process_backend(self):
+        self._assert_same_as_local(WorkerPool(2, backend="process", mp_context="fork"))
+    
+    def test_queue_backend(self, tmp_path):
+        pool = WorkerPool(
+            2, backend="queue", root=str(tmp_path), mp_context="fork", poll_interval=0.01,
+        )
+        self._assert_same_as_local(pool)
+    
+    def test_pool_results_completed_once(self):
+        engine, sim = _sweep_simulation()
+        engine._complete_scenario = None  # Tasks already verified and compacted
+        pool = WorkerPool(2)
+        try:
+            artifacts = engine.run_simulation(sim.simulation_id, pool=pool)
+        finally:
+            pool.shutdown()
+        
+        assert len(artifacts) == 4
+        assert all(a.artifact_id in engine._artifacts for a in artifacts.values())
+    
+    def test_backend_is_abstract(self):
+        with pytest.raises(TypeError):
+            ExecutionBackend()
+    
+    def test_shared_memory_released_on_decode(self):
+        from multiprocessing import shared_memory
+        
+        engine, sim = _sweep_simulation()
+        artifact = next(iter(engine.run_simulation(sim.simulation_id).values()))
+        payload = encode_artifact(artifact)
+        
+        assert decode_artifact(payload).final_state_hash == artifact.final_state_hash
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=payload.shm_name)
+    
+    def test_queue_node_refuses_unsigned_task(self, tmp_path):
+        import pickle
+        from ..core.models import WorkerTask
+        
+        marker = tmp_path / "executed"
+        root = tmp_path / "queue"
+        (root / "pending").mkdir(parents=True)
+        task = WorkerTask(simulation_id="sim-001", scenario_id="scen-001")
+        forged = b"\0" * 32 + pickle.dumps(_Exploit(str(marker)))
+        (root / "pending" / f"{0:020d}-{task.task_id}.task").write_bytes(forged)
+        
+        assert serve_queue(str(root), key=b"secret", max_tasks=1) == 1
+        assert not marker.exists()
+        status, error = _open_sealed(b"secret", str(root / "results" / f"{task.task_id}.result"))
+        assert status == "error"
+        assert isinstance(error, QueueIntegrityError)
+    
+    def test_queue_backend_refuses_unsigned_result(self, tmp_path):
+        from ..core.models import WorkerTask
+        
+        backend = QueueBackend(root=str(tmp_path), key=b"secret", poll_interval=0.01)
+        task = WorkerTask(simulation_id="sim-001", scenario_id="scen-001")
+        future = backend.submit(task, _sweep_simulation)
+        (tmp_path / "results" / f"{task.task_id}.result").write_bytes(_seal(b"other", ("ok", None)))
+        
+        try:
+            with pytest.raises(QueueIntegrityError):
+                future.result(timeout=5)
+        finally:
+            backend.shutdown()
+    
+    def test_serve_queue_requires_key(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("WORLD_ENGINE_QUEUE_KEY", raising=False)
+        with pytest.raises(ValueError):
+            serve_queue(str(tmp_path), max_tasks=0)
+    
+    def test_retry(self):
+        from ..core.models import WorkerTask
+        
+        calls = []
+        
+        def flaky(task):
+            calls.append(task.task_id)
+            if len(calls) == 1:
+                raise RuntimeError("transient")
+            return SimulationArtifact(simulation_id=task.simulation_id, scenario_id=task.scenario_id)
+        
+        pool = WorkerPool(1, max_retries=1)
+        task = WorkerTask(simulation_id="sim-001", scenario_id="scen-001")
+        pool.submit_task(task, flaky)
+        
+        assert pool.result(task.task_id, timeout=5) is not None
+        assert len(calls) == 2
+        assert task.status.value == "completed"
+        pool.shutdown()
+    
+    def test_cancel_running_task(self):
+        import threading
+        from ..core.models import WorkerTask
+        from ..core.progress import TaskCancelled, report_progress
+        
+        started = threading.Event()
+        
+        def endless(task):
+            started.set()
+            while True:
+                report_progress(0.5)
+        
+        pool = WorkerPool(1)
+        task = WorkerTask(simulation_id="sim-001", scenario_id="scen-001")
+        pool.submit_task(task, endless)
+        started.wait(5)
+        
+        assert pool.cancel_task(task.task_id)
+        with pytest.raises(TaskCancelled):
+            pool.result(task.task_id, timeout=5)
+        assert task.error_message == "cancelled"
+        pool.shutdown()
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
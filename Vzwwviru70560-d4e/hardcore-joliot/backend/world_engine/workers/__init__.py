@@ -1,4 +1,17 @@
 """CHE·NU™ V69 — Worker Manager"""
 from .manager import Worker, WorkerPool, WorkerManager
+from .backends import (
+    ExecutionBackend,
+    ThreadBackend,
+    ProcessBackend,
+    QueueBackend,
+    QueueIntegrityError,
+    create_backend,
+    serve_queue,
+)
 
-__all__ = ["Worker", "WorkerPool", "WorkerManager"]
+__all__ = [
+    "Worker", "WorkerPool", "WorkerManager",
+    "ExecutionBackend", "ThreadBackend", "ProcessBackend", "QueueBackend",
+    "QueueIntegrityError", "create_backend", "serve_queue",
+]
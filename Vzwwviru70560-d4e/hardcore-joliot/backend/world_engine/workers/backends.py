@@ -0,0 +1,714 @@
+"""
+============================================================================
+CHE·NU™ V69 — WORKER EXECUTION BACKENDS
+============================================================================
+Version: 1.1.0
+Purpose: Pluggable execution of worker tasks (threads, processes, nodes)
+Principle: Same task contract everywhere, the backend decides where it runs
+============================================================================
+
+A backend runs `executor(task) -> SimulationArtifact` and returns a
+Future. Progress reported by the task (core.progress.report_progress) is
+forwarded to `backend.listener(task_id, progress)`; cancel(task_id)
+cancels a queued task or asks a running one to stop at its next report.
+
+    ThreadBackend    in-process thread pool (GIL-bound, the default)
+    ProcessBackend   process pool; artifacts come back as columnar
+                     arrays in one shared-memory block instead of
+                     pickled WorldState objects
+    QueueBackend     file-based task queue in a directory that any
+                     number of nodes (serve_queue) pull from; idle nodes
+                     claim the next task, so work spreads by itself,
+                     and tasks of dead nodes are re-queued after their
+                     lease expires
+
+Executors and tasks given to ProcessBackend and QueueBackend must be
+picklable (module-level functions or objects such as ScenarioRunner).
+
+Queue files are pickles behind an HMAC-SHA256 tag keyed with a secret
+shared by the backend and its nodes (QueueBackend.key, or the
+WORLD_ENGINE_QUEUE_KEY environment variable). A file whose tag does not
+match is refused before it is unpickled, so write access to the queue
+directory alone does not allow running code on a node.
+"""
+
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import hashlib
+import hmac
+import logging
+import multiprocessing
+import os
+import pickle
+import secrets
+import socket
+import tempfile
+import threading
+import time
+import uuid
+
+try:
+    import numpy as np
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Artifacts are pickled whole without numpy
+    np = None
+
+from ..core.models import SimulationArtifact, WorkerTask
+from ..core.progress import ProgressReporter, TaskCancelled, progress_scope
+
+logger = logging.getLogger(__name__)
+
+ProgressListener = Callable[[str, float], None]
+Executor = Callable[[WorkerTask], SimulationArtifact]
+
+
+# ============================================================================
+# ARTIFACT TRANSFER
+# ============================================================================
+
+@dataclass
+class ArtifactPayload:
+    """An artifact in transit between processes"""
+    meta: Optional[Dict[str, Any]] = None             # export_columns meta
+    arrays: Optional[Dict[str, Any]] = None           # inline column arrays
+    shm_name: Optional[str] = None                    # or one shared-memory block
+    layout: Optional[List[Tuple[str, str, Tuple[int, ...], int]]] = None  # name, dtype, shape, offset
+    artifact: Optional[SimulationArtifact] = None     # plain pickle (no numpy)
+
+
+def encode_artifact(artifact: SimulationArtifact, use_shared_memory: bool = True) -> ArtifactPayload:
+    """Pack an artifact as columns, in shared memory if requested"""
+    if np is None:
+        return ArtifactPayload(artifact=artifact)
+
+    meta, arrays = artifact.export_columns()
+    if not use_shared_memory:
+        return ArtifactPayload(meta=meta, arrays=arrays)
+
+    layout = []
+    size = 0
+    for name, data in arrays.items():
+        layout.append((name, data.dtype.str, data.shape, size))
+        size += (data.nbytes + 7) & ~7
+
+    # The block stays registered with the resource tracker, which
+    # ProcessBackend shares with its workers: decode_artifact unlinks and
+    # unregisters it, and a payload never decoded is freed at exit.
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        for name, dtype, shape, offset in layout:
+            view = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)
+            view[...] = arrays[name]
+            del view
+    except BaseException:
+        block.unlink()
+        raise
+    finally:
+        block.close()
+    return ArtifactPayload(meta=meta, shm_name=block.name, layout=layout)
+
+
+def decode_artifact(payload: ArtifactPayload) -> SimulationArtifact:
+    """Rebuild an artifact; shared-memory blocks are copied out and unlinked"""
+    if payload.artifact is not None:
+        return payload.artifact
+    if payload.shm_name is None:
+        return SimulationArtifact.from_columns(payload.meta, payload.arrays)
+
+    block = shared_memory.SharedMemory(name=payload.shm_name)
+    try:
+        arrays = {
+            name: np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset).copy()
+            for name, dtype, shape, offset in payload.layout
+        }
+    finally:
+        block.close()
+        block.unlink()
+    return SimulationArtifact.from_columns(payload.meta, arrays)
+
+
+# ============================================================================
+# BACKEND BASE
+# ============================================================================
+
+class ExecutionBackend(ABC):
+    """Runs worker tasks and reports their progress"""
+
+    name = "base"
+    in_process = False  # Executors run in this process (WorkerPool can use Worker objects)
+
+    def __init__(self):
+        self.listener: Optional[ProgressListener] = None
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def submit(self, task: WorkerTask, executor: Executor) -> Future:
+        """Start running `executor(task)`; the future resolves to its artifact"""
+
+    @abstractmethod
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a queued task or ask a running one to stop"""
+
+    @abstractmethod
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting tasks and release workers"""
+
+    def _notify(self, task_id: str, progress: float) -> None:
+        if self.listener is not None:
+            try:
+                self.listener(task_id, progress)
+            except Exception as e:
+                logger.warning(f"Progress listener failed for {task_id}: {e}")
+
+    def _track(self, task_id: str, future: Future) -> Future:
+        with self._lock:
+            self._futures[task_id] = future
+        future.add_done_callback(lambda _: self._untrack(task_id, future))
+        return future
+
+    def _untrack(self, task_id: str, future: Future) -> None:
+        with self._lock:
+            if self._futures.get(task_id) is future:
+                del self._futures[task_id]
+
+
+def _resolve(future: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+    """Complete a future unless it was cancelled meanwhile"""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+# ============================================================================
+# THREAD BACKEND
+# ============================================================================
+
+class ThreadBackend(ExecutionBackend):
+    """Thread pool in this process"""
+
+    name = "thread"
+    in_process = True
+
+    def __init__(self, num_workers: int = 4):
+        super().__init__()
+        self._executor = ThreadPoolExecutor(max_workers=num_workers)
+        self._cancel_events: Dict[str, threading.Event] = {}
+
+    def submit(self, task: WorkerTask, executor: Executor) -> Future:
+        cancelled = threading.Event()
+        self._cancel_events[task.task_id] = cancelled
+        future = self._executor.submit(self._run, task, executor, cancelled)
+        return self._track(task.task_id, future)
+
+    def _run(self, task: WorkerTask, executor: Executor, cancelled: threading.Event) -> SimulationArtifact:
+        reporter = ProgressReporter(lambda p: self._notify(task.task_id, p), cancelled.is_set)
+        try:
+            if cancelled.is_set():
+                raise TaskCancelled()
+            self._notify(task.task_id, 0.0)
+            with progress_scope(reporter):
+                return executor(task)
+        finally:
+            self._cancel_events.pop(task.task_id, None)
+
+    def cancel(self, task_id: str) -> bool:
+        future = self._futures.get(task_id)
+        if future is None:
+            return False
+        if future.cancel():
+            return True
+        event = self._cancel_events.get(task_id)
+        if event is not None:
+            event.set()
+        return not future.done()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+# ============================================================================
+# PROCESS BACKEND
+# ============================================================================
+
+# Per worker process: progress queue and cancel flags (set by the initializer)
+_process_state: Dict[str, Any] = {}
+
+
+def _init_process(progress_queue: Any, cancel_flags: Any) -> None:
+    _process_state["queue"] = progress_queue
+    _process_state["flags"] = cancel_flags
+
+
+def _run_in_process(executor: Executor, task: WorkerTask, slot: int, use_shared_memory: bool) -> ArtifactPayload:
+    progress_queue = _process_state["queue"]
+    flags = _process_state["flags"]
+
+    def is_cancelled() -> bool:
+        return slot >= 0 and flags[slot] == 1
+
+    if is_cancelled():
+        raise TaskCancelled()
+    progress_queue.put((task.task_id, 0.0))
+
+    reporter = ProgressReporter(lambda p: progress_queue.put((task.task_id, p)), is_cancelled)
+    with progress_scope(reporter):
+        artifact = executor(task)
+    return encode_artifact(artifact, use_shared_memory)
+
+
+class ProcessBackend(ExecutionBackend):
+    """
+    Process pool, one simulation per core.
+
+    Results travel as columnar arrays through one shared-memory block per
+    artifact; progress comes back on a multiprocessing queue and running
+    tasks are cancelled through a shared flag array.
+    """
+
+    name = "process"
+
+    def __init__(
+        self,
+        num_workers: int = 4,
+        use_shared_memory: bool = True,
+        mp_context: Optional[str] = None,
+        cancel_slots: int = 1024,
+    ):
+        super().__init__()
+        context = multiprocessing.get_context(mp_context)
+        self.use_shared_memory = use_shared_memory and np is not None
+        if self.use_shared_memory:
+            # Started before the pool so workers share it (see encode_artifact)
+            resource_tracker.ensure_running()
+        self._progress = context.Queue()
+        self._flags = context.RawArray("b", cancel_slots)
+        self._free_slots = list(range(cancel_slots))
+        self._slots: Dict[str, int] = {}
+        self._inner: Dict[str, Future] = {}
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=context,
+            initializer=_init_process,
+            initargs=(self._progress, self._flags),
+        )
+        self._listener_thread = threading.Thread(target=self._listen, daemon=True)
+        self._listener_thread.start()
+
+    def _listen(self) -> None:
+        while True:
+            message = self._progress.get()
+            if message is None:
+                return
+            self._notify(*message)
+
+    def submit(self, task: WorkerTask, executor: Executor) -> Future:
+        with self._lock:
+            slot = self._free_slots.pop() if self._free_slots else -1
+        if slot >= 0:
+            self._flags[slot] = 0
+            self._slots[task.task_id] = slot
+
+        outer: Future = Future()
+        inner = self._executor.submit(_run_in_process, executor, task, slot, self.use_shared_memory)
+        self._inner[task.task_id] = inner
+        inner.add_done_callback(lambda f: self._complete(task.task_id, f, outer))
+        return self._track(task.task_id, outer)
+
+    def _complete(self, task_id: str, inner: Future, outer: Future) -> None:
+        with self._lock:
+            slot = self._slots.pop(task_id, -1)
+            if slot >= 0:
+                self._free_slots.append(slot)
+        self._inner.pop(task_id, None)
+
+        if inner.cancelled():
+            outer.cancel()
+            return
+        error = inner.exception()
+        if error is not None:
+            _resolve(outer, error=error)
+            return
+        try:
+            _resolve(outer, decode_artifact(inner.result()))
+        except Exception as e:
+            _resolve(outer, error=e)
+
+    def cancel(self, task_id: str) -> bool:
+        inner = self._inner.get(task_id)
+        if inner is None:
+            return False
+        if inner.cancel():
+            return True
+        slot = self._slots.get(task_id, -1)
+        if slot >= 0:
+            self._flags[slot] = 1
+        return not inner.done()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+        self._progress.put(None)
+        if wait:
+            self._listener_thread.join()
+
+
+# ============================================================================
+# QUEUE BACKEND (MULTI-NODE)
+# ============================================================================
+
+class _QueueDirs:
+    """Layout of a task queue directory"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.pending = os.path.join(root, "pending")
+        self.claimed = os.path.join(root, "claimed")
+        self.progress = os.path.join(root, "progress")
+        self.results = os.path.join(root, "results")
+        self.cancel = os.path.join(root, "cancel")
+        self.stop = os.path.join(root, "STOP")
+
+    def create(self) -> None:
+        for path in (self.pending, self.claimed, self.progress, self.results, self.cancel):
+            os.makedirs(path, exist_ok=True)
+
+
+QUEUE_KEY_ENV = "WORLD_ENGINE_QUEUE_KEY"
+
+_TAG_SIZE = hashlib.sha256().digest_size
+
+
+class QueueIntegrityError(RuntimeError):
+    """A queue file is not signed with the queue key"""
+    pass
+
+
+def _queue_key(key: Optional[Union[str, bytes]]) -> Optional[bytes]:
+    """Explicit key, else WORLD_ENGINE_QUEUE_KEY, else None"""
+    if key is None:
+        key = os.environ.get(QUEUE_KEY_ENV)
+    if isinstance(key, str):
+        key = key.encode()
+    return key or None
+
+
+def _seal(key: bytes, value: Any) -> bytes:
+    """Pickle `value` behind an HMAC-SHA256 tag"""
+    data = pickle.dumps(value)
+    return hmac.new(key, data, hashlib.sha256).digest() + data
+
+
+def _open_sealed(key: bytes, path: str) -> Any:
+    """Unpickle a file written by _seal, checking the tag first"""
+    with open(path, "rb") as f:
+        blob = f.read()
+    tag, data = blob[:_TAG_SIZE], blob[_TAG_SIZE:]
+    if not hmac.compare_digest(tag, hmac.new(key, data, hashlib.sha256).digest()):
+        raise QueueIntegrityError(f"Refusing unsigned queue file {os.path.basename(path)}")
+    return pickle.loads(data)
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _task_id_of(filename: str) -> str:
+    """Task files are named <enqueue time>-<task_id>.task"""
+    return filename.split("-", 1)[1].rsplit(".", 1)[0]
+
+
+def _claim_next(dirs: _QueueDirs) -> Optional[str]:
+    """Atomically move the oldest pending task to claimed/; None if none left"""
+    for name in sorted(os.listdir(dirs.pending)):
+        if not name.endswith(".task"):
+            continue
+        claimed = os.path.join(dirs.claimed, name)
+        try:
+            os.rename(os.path.join(dirs.pending, name), claimed)
+        except FileNotFoundError:
+            continue  # Another node got it first
+        os.utime(claimed)
+        return claimed
+    return None
+
+
+def _run_claimed(dirs: _QueueDirs, claimed: str, lease_timeout: float, key: bytes) -> None:
+    task_id = _task_id_of(os.path.basename(claimed))
+    progress_path = os.path.join(dirs.progress, task_id)
+    cancel_path = os.path.join(dirs.cancel, task_id)
+
+    def send(progress: float) -> None:
+        _atomic_write(progress_path, repr(progress).encode())
+
+    def is_cancelled() -> bool:
+        return os.path.exists(cancel_path)
+
+    # Heartbeat keeps the lease while the task runs
+    done = threading.Event()
+
+    def heartbeat() -> None:
+        while not done.wait(lease_timeout / 3):
+            try:
+                os.utime(claimed)
+            except FileNotFoundError:
+                return
+
+    beat = threading.Thread(target=heartbeat, daemon=True)
+    beat.start()
+
+    try:
+        task, executor = _open_sealed(key, claimed)
+        if is_cancelled():
+            raise TaskCancelled()
+        send(0.0)
+        with progress_scope(ProgressReporter(send, is_cancelled)):
+            artifact = executor(task)
+        outcome: Tuple[str, Any] = ("ok", encode_artifact(artifact, use_shared_memory=False))
+    except TaskCancelled:
+        outcome = ("cancelled", None)
+    except Exception as e:
+        outcome = ("error", e)
+    finally:
+        done.set()
+
+    if isinstance(outcome[1], QueueIntegrityError):
+        logger.error(str(outcome[1]))
+    try:
+        data = _seal(key, outcome)
+    except Exception:
+        data = _seal(key, ("error", RuntimeError(repr(outcome[1]))))
+    _atomic_write(os.path.join(dirs.results, f"{task_id}.result"), data)
+    try:
+        os.remove(claimed)
+    except FileNotFoundError:
+        pass
+
+
+def serve_queue(
+    root: str,
+    node_id: Optional[str] = None,
+    poll_interval: float = 0.05,
+    lease_timeout: float = 30.0,
+    max_tasks: Optional[int] = None,
+    key: Optional[Union[str, bytes]] = None,
+) -> int:
+    """
+    Run a queue node: claim and execute tasks from `root` until STOP.
+
+    Any number of nodes (processes or hosts sharing the directory) can
+    serve the same queue. `key` (or WORLD_ENGINE_QUEUE_KEY) must be the
+    backend's key. Returns the number of tasks executed.
+    """
+    key = _queue_key(key)
+    if key is None:
+        raise ValueError(f"serve_queue needs the queue key (key= or {QUEUE_KEY_ENV})")
+
+    dirs = _QueueDirs(root)
+    dirs.create()
+    node_id = node_id or f"{socket.gethostname()}-{os.getpid()}"
+    executed = 0
+
+    while not os.path.exists(dirs.stop):
+        if max_tasks is not None and executed >= max_tasks:
+            break
+        claimed = _claim_next(dirs)
+        if claimed is None:
+            time.sleep(poll_interval)
+            continue
+        logger.info(f"Node {node_id} running {os.path.basename(claimed)}")
+        _run_claimed(dirs, claimed, lease_timeout, key)
+        executed += 1
+
+    return executed
+
+
+class QueueBackend(ExecutionBackend):
+    """
+    File-based task queue served by local and/or remote nodes.
+
+    With `local_nodes` the backend starts that many serve_queue processes
+    itself; more nodes can join by running serve_queue on the same root.
+    Tasks whose node stopped heart-beating for `lease_timeout` seconds
+    go back to pending.
+
+    Queue files are signed with `key` (default: WORLD_ENGINE_QUEUE_KEY,
+    else a random key handed to the local nodes only); remote nodes
+    need the same key.
+    """
+
+    name = "queue"
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        local_nodes: int = 0,
+        lease_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+        mp_context: Optional[str] = None,
+        key: Optional[Union[str, bytes]] = None,
+    ):
+        super().__init__()
+        self.key = _queue_key(key) or secrets.token_bytes(32)
+        self.root = root or tempfile.mkdtemp(prefix="world-engine-queue-")
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self._dirs = _QueueDirs(self.root)
+        self._dirs.create()
+        if os.path.exists(self._dirs.stop):
+            os.remove(self._dirs.stop)
+
+        self._progress_seen: Dict[str, float] = {}
+        self._stopped = threading.Event()
+        self._poller = threading.Thread(target=self._poll, daemon=True)
+        self._poller.start()
+
+        context = multiprocessing.get_context(mp_context)
+        self._nodes = [
+            context.Process(
+                target=serve_queue,
+                args=(self.root, f"local-{i}", poll_interval, lease_timeout, None, self.key),
+                daemon=True,
+            )
+            for i in range(local_nodes)
+        ]
+        for node in self._nodes:
+            node.start()
+
+    def submit(self, task: WorkerTask, executor: Executor) -> Future:
+        future: Future = Future()
+        self._track(task.task_id, future)
+        name = f"{time.time_ns():020d}-{task.task_id}.task"
+        _atomic_write(os.path.join(self._dirs.pending, name), _seal(self.key, (task, executor)))
+        return future
+
+    def _poll(self) -> None:
+        last_lease_check = 0.0
+        while not self._stopped.wait(self.poll_interval):
+            with self._lock:
+                outstanding = list(self._futures.items())
+            for task_id, future in outstanding:
+                self._check(task_id, future)
+
+            now = time.monotonic()
+            if now - last_lease_check >= self.lease_timeout / 2:
+                last_lease_check = now
+                self._requeue_expired()
+
+    def _check(self, task_id: str, future: Future) -> None:
+        result_path = os.path.join(self._dirs.results, f"{task_id}.result")
+        if not os.path.exists(result_path):
+            progress_path = os.path.join(self._dirs.progress, task_id)
+            try:
+                with open(progress_path, "rb") as f:
+                    progress = float(f.read() or 0)
+            except (FileNotFoundError, ValueError):
+                return
+            if self._progress_seen.get(task_id) != progress:
+                self._progress_seen[task_id] = progress
+                self._notify(task_id, progress)
+            return
+
+        try:
+            status, value = _open_sealed(self.key, result_path)
+        except QueueIntegrityError as e:
+            logger.error(str(e))
+            status, value = "error", e
+        for path in (
+            result_path,
+            os.path.join(self._dirs.progress, task_id),
+            os.path.join(self._dirs.cancel, task_id),
+        ):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._progress_seen.pop(task_id, None)
+
+        if status == "ok":
+            try:
+                _resolve(future, decode_artifact(value))
+            except Exception as e:
+                _resolve(future, error=e)
+        elif status == "cancelled":
+            _resolve(future, error=TaskCancelled())
+        else:
+            _resolve(future, error=value)
+
+    def _requeue_expired(self) -> None:
+        """Move tasks of nodes that stopped heart-beating back to pending"""
+        cutoff = time.time() - self.lease_timeout
+        for name in os.listdir(self._dirs.claimed):
+            path = os.path.join(self._dirs.claimed, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.rename(path, os.path.join(self._dirs.pending, name))
+                    logger.warning(f"Lease expired, re-queued {name}")
+            except FileNotFoundError:
+                continue
+
+    def cancel(self, task_id: str) -> bool:
+        future = self._futures.get(task_id)
+        if future is None:
+            return False
+        for name in os.listdir(self._dirs.pending):
+            if name.endswith(f"-{task_id}.task"):
+                try:
+                    os.remove(os.path.join(self._dirs.pending, name))
+                except FileNotFoundError:
+                    break  # Claimed meanwhile: signal the node below
+                return future.cancel()
+        _atomic_write(os.path.join(self._dirs.cancel, task_id), b"")
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        _atomic_write(self._dirs.stop, b"")
+        if wait:
+            for node in self._nodes:
+                node.join()
+        self._stopped.set()
+        if wait:
+            self._poller.join()
+
+
+# ============================================================================
+# FACTORY
+# ============================================================================
+
+BACKENDS = {
+    "thread": ThreadBackend,
+    "process": ProcessBackend,
+    "queue": QueueBackend,
+}
+
+
+def create_backend(name: str, num_workers: int = 4, **options: Any) -> ExecutionBackend:
+    """Create a backend by name; queue backends start num_workers local nodes by default"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown execution backend: {name}")
+    if name == "queue":
+        options.setdefault("local_nodes", num_workers)
+        return QueueBackend(**options)
+    return BACKENDS[name](num_workers, **options)
+
+
+__all__ = [
+    "ArtifactPayload",
+    "encode_artifact",
+    "decode_artifact",
+    "ExecutionBackend",
+    "ThreadBackend",
+    "ProcessBackend",
+    "QueueBackend",
+    "QueueIntegrityError",
+    "QUEUE_KEY_ENV",
+    "serve_queue",
+    "create_backend",
+]
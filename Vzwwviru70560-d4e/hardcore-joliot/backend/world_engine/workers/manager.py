@@ -9,9 +9,11 @@ Principle: Isolated, deterministic, parallel execution
 """
 
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
-from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+from concurrent.futures import Future
 import logging
+import queue
 import threading
 import uuid
 
@@ -20,6 +22,8 @@ from ..core.models import (
     WorkerStatus,
     SimulationArtifact,
 )
+from ..core.progress import TaskCancelled
+from .backends import ExecutionBackend, create_backend
 
 logger = logging.getLogger(__name__)
 
@@ -109,17 +113,40 @@ class WorkerPool:
     """
     Pool of workers for parallel task execution.
     
-    Manages a fixed number of workers and distributes tasks.
+    Tasks run on a pluggable execution backend (threads by default,
+    processes or a multi-node queue, see backends.py). The pool adds
+    retries, cancellation and per-task progress on top.
     """
     
-    def __init__(self, num_workers: int = 4):
+    def __init__(
+        self,
+        num_workers: int = 4,
+        backend: Union[str, ExecutionBackend] = "thread",
+        max_retries: int = 0,
+        on_progress: Optional[Callable[[WorkerTask, float], None]] = None,
+        **backend_options: Any,
+    ):
         self.num_workers = num_workers
         self.workers: List[Worker] = [
             Worker(worker_id=f"worker-{i}")
             for i in range(num_workers)
         ]
-        self._executor = ThreadPoolExecutor(max_workers=num_workers)
+        self.backend = (
+            create_backend(backend, num_workers, **backend_options)
+            if isinstance(backend, str) else backend
+        )
+        self.backend.listener = self._on_progress
+        self.max_retries = max_retries
+        self.on_progress = on_progress
+        
+        self._free_workers: "queue.Queue[Worker]" = queue.Queue()
+        for worker in self.workers:
+            self._free_workers.put(worker)
+        
         self._pending_futures: Dict[str, Future] = {}
+        self._tasks: Dict[str, WorkerTask] = {}
+        self._running: Set[str] = set()
+        self._lock = threading.Lock()
     
     def submit_task(
         self,
@@ -131,24 +158,119 @@ class WorkerPool:
         
         Args:
             task: Task to execute
-            executor: Function that runs the task
+            executor: Function that runs the task (picklable for
+                process and queue backends)
             
         Returns:
             Task ID
         """
-        # Find available worker
-        worker = self._get_available_worker()
-        if worker is None:
-            raise RuntimeError("No workers available")
+        future: Future = Future()
+        with self._lock:
+            self._tasks[task.task_id] = task
+            self._pending_futures[task.task_id] = future
         
-        # Submit to thread pool
-        future = self._executor.submit(worker.execute, task, executor)
-        self._pending_futures[task.task_id] = future
+        self._attempt(task, executor, future, attempt=0)
         
-        logger.info(f"Submitted task {task.task_id} to worker {worker.worker_id}")
+        logger.info(f"Submitted task {task.task_id} to {self.backend.name} backend")
         
         return task.task_id
     
+    def _attempt(
+        self,
+        task: WorkerTask,
+        executor: Callable[[WorkerTask], SimulationArtifact],
+        future: Future,
+        attempt: int,
+    ) -> None:
+        """Run one attempt of a task on the backend"""
+        run = partial(self._run_on_worker, executor) if self.backend.in_process else executor
+        inner = self.backend.submit(task, run)
+        inner.add_done_callback(lambda f: self._on_done(task, executor, future, attempt, f))
+    
+    def _run_on_worker(
+        self,
+        executor: Callable[[WorkerTask], SimulationArtifact],
+        task: WorkerTask,
+    ) -> SimulationArtifact:
+        """In-process backends: run on a free Worker"""
+        worker = self._free_workers.get()
+        try:
+            return worker.execute(task, executor)
+        finally:
+            self._free_workers.put(worker)
+    
+    def _on_progress(self, task_id: str, progress: float) -> None:
+        task = self._tasks.get(task_id)
+        if task is None:
+            return
+        
+        with self._lock:
+            if task_id not in self._running:
+                self._running.add(task_id)
+                task.status = WorkerStatus.RUNNING
+                task.started_at = task.started_at or datetime.utcnow()
+            task.progress = progress
+        
+        if self.on_progress is not None:
+            self.on_progress(task, progress)
+    
+    def _on_done(
+        self,
+        task: WorkerTask,
+        executor: Callable[[WorkerTask], SimulationArtifact],
+        future: Future,
+        attempt: int,
+        inner: Future,
+    ) -> None:
+        """Settle an attempt: complete, retry or fail the task"""
+        with self._lock:
+            self._running.discard(task.task_id)
+        
+        error = TaskCancelled() if inner.cancelled() else inner.exception()
+        
+        if error is None:
+            artifact = inner.result()
+            task.status = WorkerStatus.COMPLETED
+            task.result_artifact_id = artifact.artifact_id
+            task.progress = 1.0
+        elif not isinstance(error, TaskCancelled) and attempt < self.max_retries and not future.done():
+            logger.warning(f"Task {task.task_id} failed ({error}), retry {attempt + 1}/{self.max_retries}")
+            task.status = WorkerStatus.IDLE
+            self._attempt(task, executor, future, attempt + 1)
+            return
+        else:
+            task.status = WorkerStatus.FAILED
+            task.error_message = "cancelled" if isinstance(error, TaskCancelled) else str(error)
+        
+        task.completed_at = datetime.utcnow()
+        with self._lock:
+            self._tasks.pop(task.task_id, None)
+        
+        if future.done():
+            return
+        if error is None:
+            future.set_result(artifact)
+        else:
+            future.set_exception(error)
+    
+    def cancel_task(self, task_id: str) -> bool:
+        """Cancel a queued task, or ask a running one to stop"""
+        if task_id not in self._pending_futures:
+            return False
+        return self.backend.cancel(task_id)
+    
+    def result(self, task_id: str, timeout: Optional[float] = None) -> SimulationArtifact:
+        """Wait for a task and return its artifact, raising its error"""
+        future = self._pending_futures.get(task_id)
+        if future is None:
+            raise KeyError(f"Unknown task: {task_id}")
+        
+        try:
+            return future.result(timeout=timeout)
+        finally:
+            if future.done():
+                self._pending_futures.pop(task_id, None)
+    
     def wait_for_task(self, task_id: str, timeout: Optional[float] = None) -> Optional[SimulationArtifact]:
         """
         Wait for a task to complete.
@@ -160,16 +282,13 @@ class WorkerPool:
         Returns:
             SimulationArtifact or None if timeout
         """
-        future = self._pending_futures.get(task_id)
-        if future is None:
+        if task_id not in self._pending_futures:
             return None
         
         try:
-            result = future.result(timeout=timeout)
-            del self._pending_futures[task_id]
-            return result
+            return self.result(task_id, timeout)
         except Exception as e:
-            logger.error(f"Task {task_id} failed: {e}")
+            logger.error(f"Task {task_id} failed: {e!r}")
             return None
     
     def wait_all(self, timeout: Optional[float] = None) -> Dict[str, Optional[SimulationArtifact]]:
@@ -186,21 +305,16 @@ class WorkerPool:
         
         return results
     
-    def _get_available_worker(self) -> Optional[Worker]:
-        """Get an available worker"""
-        for worker in self.workers:
-            if worker.is_available():
-                return worker
-        return None
-    
     def shutdown(self, wait: bool = True) -> None:
         """Shutdown the pool"""
-        self._executor.shutdown(wait=wait)
+        self.backend.shutdown(wait=wait)
     
     @property
     def available_workers(self) -> int:
         """Number of available workers"""
-        return sum(1 for w in self.workers if w.is_available())
+        if self.backend.in_process:
+            return sum(1 for w in self.workers if w.is_available())
+        return max(0, self.num_workers - len(self._running))
     
     @property
     def pending_tasks(self) -> int:
@@ -223,8 +337,13 @@ class WorkerManager:
     - Error handling
     """
     
-    def __init__(self, num_workers: int = 4):
-        self.pool = WorkerPool(num_workers)
+    def __init__(
+        self,
+        num_workers: int = 4,
+        backend: Union[str, ExecutionBackend] = "thread",
+        **pool_options: Any,
+    ):
+        self.pool = WorkerPool(num_workers, backend, **pool_options)
         self._tasks: Dict[str, WorkerTask] = {}
         self._results: Dict[str, SimulationArtifact] = {}
     
@@ -257,6 +376,10 @@ class WorkerManager:
         """Submit a task"""
         return self.pool.submit_task(task, executor)
     
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a task"""
+        return self.pool.cancel_task(task_id)
+    
     def get_task(self, task_id: str) -> Optional[WorkerTask]:
         """Get task by ID"""
         return self._tasks.get(task_id)